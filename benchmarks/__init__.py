@@ -0,0 +1 @@
+"""Curator benchmark suite, run against an in-process fake OpenSearch cluster"""
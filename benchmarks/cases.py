@@ -0,0 +1,416 @@
+"""Benchmark cases
+
+Each :py:class:`Case` times one step of a Curator run against a
+:py:class:`~.benchmarks.fakecluster.FakeCluster`: building an
+:py:class:`~.curator.indexlist.IndexList` or
+:py:class:`~.curator.snapshotlist.SnapshotList`, one filter method, a chain of
+filters through ``iterate_filters``, or the dry run of an action.
+"""
+
+from copy import deepcopy
+from curator.actions import CLASS_MAP
+from curator.indexlist import IndexList
+from curator.snapshotlist import SnapshotList
+from .fakecluster import REPOSITORY
+
+TIMESTRING = '%Y.%m.%d'
+SNAPSHOT_TIMESTRING = '%Y%m%d%H%M%S'
+
+#: ``(case name, IndexList method, keyword arguments)``
+INDEX_FILTERS = [
+    ('pattern.prefix', 'filter_by_regex', {'kind': 'prefix', 'value': 'logs-000'}),
+    ('pattern.regex', 'filter_by_regex', {'kind': 'regex', 'value': r'^logs-\d+1-'}),
+    (
+        'pattern.timestring',
+        'filter_by_regex',
+        {'kind': 'timestring', 'value': TIMESTRING},
+    ),
+    (
+        'age.name',
+        'filter_by_age',
+        {
+            'source': 'name',
+            'direction': 'older',
+            'timestring': TIMESTRING,
+            'unit': 'days',
+            'unit_count': 30,
+        },
+    ),
+    (
+        'age.creation_date',
+        'filter_by_age',
+        {
+            'source': 'creation_date',
+            'direction': 'older',
+            'unit': 'days',
+            'unit_count': 30,
+        },
+    ),
+    ('alias', 'filter_by_alias', {'aliases': ['logs-0000']}),
+    ('allocated', 'filter_allocated', {'key': 'box_type', 'value': 'cold'}),
+    ('closed', 'filter_closed', {}),
+    ('count', 'filter_by_count', {'count': 30, 'pattern': r'^(logs-\d+)-.*$'}),
+    ('empty', 'filter_empty', {}),
+    ('forcemerged', 'filter_forceMerged', {'max_num_segments': 1}),
+    ('ilm', 'filter_ilm', {}),
+    ('kibana', 'filter_kibana', {}),
+    ('none', 'filter_none', {}),
+    ('opened', 'filter_opened', {}),
+    (
+        'period',
+        'filter_period',
+        {
+            'source': 'name',
+            'range_from': -60,
+            'range_to': -30,
+            'timestring': TIMESTRING,
+            'unit': 'days',
+        },
+    ),
+    ('shards', 'filter_by_shards', {'number_of_shards': 2}),
+    ('size', 'filter_by_size', {'size_threshold': 1.0, 'size_behavior': 'total'}),
+    ('space', 'filter_by_space', {'disk_space': 100, 'use_age': True}),
+]
+
+#: ``(case name, filters)`` for :py:meth:`~.curator.indexlist.IndexList.iterate_filters`
+INDEX_CHAINS = [
+    (
+        'delete_old',
+        [
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'logs-'},
+            {
+                'filtertype': 'age',
+                'source': 'name',
+                'direction': 'older',
+                'timestring': TIMESTRING,
+                'unit': 'days',
+                'unit_count': 90,
+            },
+        ],
+    ),
+    (
+        'forcemerge_warm',
+        [
+            {
+                'filtertype': 'allocated',
+                'key': 'box_type',
+                'value': 'warm',
+                'exclude': False,
+            },
+            {'filtertype': 'closed'},
+            {'filtertype': 'forcemerged', 'max_num_segments': 1},
+        ],
+    ),
+    (
+        'keep_count',
+        [
+            {'filtertype': 'pattern', 'kind': 'regex', 'value': r'^logs-\d+-'},
+            {'filtertype': 'count', 'count': 14, 'pattern': r'^(logs-\d+)-.*$'},
+        ],
+    ),
+    (
+        'field_stats',
+        [
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'logs-0000-'},
+            {
+                'filtertype': 'age',
+                'source': 'field_stats',
+                'field': '@timestamp',
+                'stats_result': 'min_value',
+                'direction': 'older',
+                'unit': 'days',
+                'unit_count': 30,
+            },
+        ],
+    ),
+]
+
+#: ``(case name, SnapshotList method, keyword arguments)``
+SNAPSHOT_FILTERS = [
+    ('pattern.prefix', 'filter_by_regex', {'kind': 'prefix', 'value': 'curator-'}),
+    (
+        'age.name',
+        'filter_by_age',
+        {
+            'source': 'name',
+            'direction': 'older',
+            'timestring': SNAPSHOT_TIMESTRING,
+            'unit': 'days',
+            'unit_count': 7,
+        },
+    ),
+    (
+        'age.creation_date',
+        'filter_by_age',
+        {
+            'source': 'creation_date',
+            'direction': 'older',
+            'unit': 'days',
+            'unit_count': 7,
+        },
+    ),
+    ('state', 'filter_by_state', {'state': 'SUCCESS'}),
+    ('count', 'filter_by_count', {'count': 10}),
+    (
+        'period',
+        'filter_period',
+        {
+            'source': 'creation_date',
+            'range_from': -14,
+            'range_to': -7,
+            'unit': 'days',
+        },
+    ),
+    ('none', 'filter_none', {}),
+]
+
+#: ``(case name, filters)`` for
+#: :py:meth:`~.curator.snapshotlist.SnapshotList.iterate_filters`
+SNAPSHOT_CHAINS = [
+    (
+        'delete_old',
+        [
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'curator-'},
+            {'filtertype': 'state', 'state': 'SUCCESS'},
+            {
+                'filtertype': 'age',
+                'source': 'creation_date',
+                'direction': 'older',
+                'unit': 'days',
+                'unit_count': 30,
+            },
+        ],
+    ),
+]
+
+#: The indices acted on in the action dry runs
+ACTION_SELECTION = [
+    {
+        'filtertype': 'age',
+        'source': 'name',
+        'direction': 'older',
+        'timestring': TIMESTRING,
+        'unit': 'days',
+        'unit_count': 30,
+    },
+]
+#: A narrower selection for actions that make requests for every index
+ONE_FAMILY = [{'filtertype': 'pattern', 'kind': 'prefix', 'value': 'logs-0000-'}]
+
+
+class Case:
+    """
+    One timed benchmark step
+
+    :param name: The case name, e.g. ``indexlist.filter.age.name``
+    :param run: Called with the result of ``setup``. Only this call is timed
+    :param setup: Called first, with the client, to prepare the input of ``run``
+
+    :type name: str
+    :type run: callable
+    :type setup: callable
+    """
+
+    def __init__(self, name, run, setup=None):
+        self.name = name
+        self.run = run
+        self.setup = setup or (lambda client: client)
+
+
+def index_list(filters=None, **kwargs):
+    """
+    :param filters: Filters to apply after building the list
+
+    :returns: A function which builds a filtered
+        :py:class:`~.curator.indexlist.IndexList` for a client
+    """
+
+    def build(client):
+        ilo = IndexList(client, **kwargs)
+        if filters:
+            ilo.iterate_filters({'filters': deepcopy(filters)})
+        return ilo
+
+    return build
+
+
+def snapshot_list(**kwargs):
+    """
+    :returns: A function which builds a
+        :py:class:`~.curator.snapshotlist.SnapshotList` for a client
+    """
+
+    def build(client):
+        return SnapshotList(client, repository=REPOSITORY, **kwargs)
+
+    return build
+
+
+def call(method, kwargs):
+    """:returns: A function which calls ``method`` with ``kwargs`` on an object"""
+    return lambda obj: getattr(obj, method)(**deepcopy(kwargs))
+
+
+def chain(filters):
+    """:returns: A function which calls ``iterate_filters`` with ``filters``"""
+    return lambda obj: obj.iterate_filters({'filters': deepcopy(filters)})
+
+
+def dry_run(action, **kwargs):
+    """
+    :param action: A key of :py:const:`~.curator.actions.CLASS_MAP`
+    :param kwargs: Passed to the action class, after the index list, snapshot list
+        or client
+
+    :returns: A function which builds the action and calls ``do_dry_run``
+    """
+
+    def run(obj):
+        CLASS_MAP[action](obj, **kwargs).do_dry_run()
+
+    return run
+
+
+def alias_dry_run(ilo):
+    """Add the selected indices to a new alias and remove them from another"""
+    action = CLASS_MAP['alias'](name='logs-bench')
+    action.add(ilo)
+    action.do_dry_run()
+    action = CLASS_MAP['alias'](name='logs-0000')
+    action.remove(ilo)
+    action.do_dry_run()
+
+
+def action_cases():
+    """:returns: One dry run :py:class:`Case` per action"""
+    selected = index_list(ACTION_SELECTION)
+    one_family = index_list(ONE_FAMILY)
+    mounted = index_list(
+        [
+            {'filtertype': 'ilm'},
+            {
+                'filtertype': 'age',
+                'source': 'name',
+                'direction': 'older',
+                'timestring': TIMESTRING,
+                'unit': 'days',
+                'unit_count': 180,
+            },
+        ]
+    )
+    snapshots = snapshot_list()
+    return [
+        Case('action.alias', alias_dry_run, selected),
+        Case(
+            'action.allocation',
+            dry_run('allocation', key='box_type', value='cold'),
+            selected,
+        ),
+        Case('action.close', dry_run('close'), selected),
+        Case(
+            'action.cluster_routing',
+            dry_run(
+                'cluster_routing',
+                routing_type='allocation',
+                setting='enable',
+                value='all',
+            ),
+        ),
+        Case('action.cold2frozen', dry_run('cold2frozen'), mounted),
+        Case(
+            'action.convert_index_to_remote',
+            dry_run(
+                'convert_index_to_remote',
+                repository=REPOSITORY,
+                snapshot_name='bench-%Y.%m.%d',
+                remote_store_repository=REPOSITORY,
+            ),
+            one_family,
+        ),
+        Case('action.create_index', dry_run('create_index', name='logs-bench')),
+        Case(
+            'action.create_index.bulk',
+            dry_run(
+                'create_index',
+                name=[f'tenant-{num:03d}-%Y.%m.%d' for num in range(150)],
+            ),
+        ),
+        Case('action.delete_indices', dry_run('delete_indices'), selected),
+        Case('action.delete_snapshots', dry_run('delete_snapshots'), snapshots),
+        Case('action.forcemerge', dry_run('forcemerge', max_num_segments=1), selected),
+        Case(
+            'action.index_settings',
+            dry_run('index_settings', index_settings={'index': {'codec': 'best'}}),
+            selected,
+        ),
+        Case(
+            'action.index_settings.unchanged',
+            dry_run(
+                'index_settings',
+                index_settings={'index': {'number_of_replicas': 1}},
+                skip_unchanged=True,
+            ),
+            selected,
+        ),
+        Case('action.open', dry_run('open'), selected),
+        Case(
+            'action.open.waves',
+            dry_run('open', wait_for_completion=True),
+            selected,
+        ),
+        Case(
+            'action.reindex',
+            dry_run(
+                'reindex',
+                request_body={
+                    'source': {'index': 'REINDEX_SELECTION'},
+                    'dest': {'index': 'logs-bench'},
+                },
+            ),
+            one_family,
+        ),
+        Case('action.replicas', dry_run('replicas', count=2), selected),
+        Case('action.restore', dry_run('restore'), snapshots),
+        Case(
+            'action.rollover',
+            dry_run('rollover', name='logs-0000', conditions={'max_age': '1d'}),
+        ),
+        Case(
+            'action.rollover.aliases',
+            dry_run(
+                'rollover',
+                name=['logs-*'],
+                conditions={'max_age': '1h', 'max_size': '50gb'},
+            ),
+        ),
+        Case('action.shrink', dry_run('shrink'), one_family),
+        Case(
+            'action.snapshot',
+            dry_run('snapshot', repository=REPOSITORY, name='bench-%Y.%m.%d'),
+            selected,
+        ),
+    ]
+
+
+def all_cases():
+    """:returns: Every :py:class:`Case`, in the order they are run"""
+    cases = [
+        Case('indexlist.init', index_list()),
+        Case('snapshotlist.init', snapshot_list()),
+        Case('snapshotlist.init.paged', snapshot_list(page_size=100)),
+    ]
+    for name, method, kwargs in INDEX_FILTERS:
+        cases.append(
+            Case(f'indexlist.filter.{name}', call(method, kwargs), index_list())
+        )
+    for name, filters in INDEX_CHAINS:
+        cases.append(Case(f'indexlist.chain.{name}', chain(filters), index_list()))
+    for name, method, kwargs in SNAPSHOT_FILTERS:
+        cases.append(
+            Case(f'snapshotlist.filter.{name}', call(method, kwargs), snapshot_list())
+        )
+    for name, filters in SNAPSHOT_CHAINS:
+        cases.append(
+            Case(f'snapshotlist.chain.{name}', chain(filters), snapshot_list())
+        )
+    return cases + action_cases()
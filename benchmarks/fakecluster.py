@@ -0,0 +1,940 @@
+"""In-process fake OpenSearch cluster
+
+:py:class:`FakeConnection` replaces the HTTP connection of an
+:py:class:`~.opensearchpy.OpenSearch` client, so that every request is answered by a
+:py:class:`FakeCluster` instead of a server. The cluster metadata is synthesized
+from the index and snapshot numbers, which keeps the same ``indices`` count
+deterministic between runs and cheap to hold in memory, even at 200k indices.
+"""
+
+import fnmatch
+import hashlib
+import json
+import re
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from urllib.parse import unquote
+from opensearchpy import Connection
+
+#: The snapshot repository of the fake cluster
+REPOSITORY = 'bench'
+#: The fake cluster's version
+VERSION = '2.19.0'
+#: The data nodes of the fake cluster, with their ``box_type`` attribute
+NODES = {'node-0': 'hot', 'node-1': 'warm', 'node-2': 'cold'}
+#: The shard counts handed out to indices
+SHARD_COUNTS = [1, 1, 2, 3, 5]
+#: Hours between two snapshots
+SNAPSHOT_INTERVAL = 6
+
+DAY_MS = 86400 * 1000
+
+
+def split_path(path):
+    """
+    :param path: One ``filter_path`` expression, with ``\\.`` for literal dots
+
+    :type path: str
+
+    :returns: The keys of ``path``
+    :rtype: list
+    """
+    return [part.replace('\\.', '.') for part in re.split(r'(?<!\\)\.', path)]
+
+
+def key_matches(key, pattern):
+    """
+    :param key: A response key
+    :param pattern: One element of a ``filter_path`` expression
+
+    :type key: str
+    :type pattern: str
+
+    :returns: Whether ``key`` is matched by ``pattern``
+    :rtype: bool
+    """
+    if pattern == '*':
+        return True
+    if '*' in pattern:
+        return fnmatch.fnmatchcase(key, pattern)
+    return key == pattern
+
+
+def _filter(data, paths):
+    if any(not path for path in paths):
+        return data
+    if isinstance(data, list):
+        items = [_filter(item, paths) for item in data]
+        items = [item for item in items if item is not None]
+        return items or None
+    if not isinstance(data, dict):
+        return None
+    result = {}
+    for key, value in data.items():
+        subpaths = [path[1:] for path in paths if key_matches(key, path[0])]
+        if subpaths:
+            sub = _filter(value, subpaths)
+            if sub is not None:
+                result[key] = sub
+    return result or None
+
+
+def filter_response(data, filter_path):
+    """
+    Apply ``filter_path`` to ``data`` the way OpenSearch does, for the subset of the
+    syntax that Curator uses: comma-separated paths, ``*`` wildcards and ``\\.``
+    escapes.
+
+    :param data: The response body
+    :param filter_path: The ``filter_path`` request parameter
+
+    :type data: dict
+    :type filter_path: str
+
+    :returns: The filtered response body
+    :rtype: dict
+    """
+    paths = [split_path(path) for path in filter_path.split(',') if path]
+    return _filter(data, paths) or {}
+
+
+class FakeError(Exception):
+    """An error response from the fake cluster"""
+
+    def __init__(self, status, kind, reason, **extra):
+        super().__init__(reason)
+        #: The HTTP status code
+        self.status = status
+        #: The response body
+        self.body = {
+            'error': {
+                'root_cause': [{'type': kind, 'reason': reason, **extra}],
+                'type': kind,
+                'reason': reason,
+                **extra,
+            },
+            'status': status,
+        }
+
+
+def not_found(index):
+    """:returns: An ``index_not_found_exception`` for ``index``"""
+    return FakeError(
+        404,
+        'index_not_found_exception',
+        f'no such index [{index}]',
+        index=index,
+        **{'resource.type': 'index_or_alias', 'resource.id': index},
+    )
+
+
+#: ``(method, path pattern, handler name)``, matched in order
+ROUTES = [
+    ('GET', r'/', 'info'),
+    ('GET', r'/_cat/indices(?:/(?P<index>[^/]+))?', 'cat_indices'),
+    ('GET', r'/_cat/snapshots(?:/(?P<repository>[^/]+))?', 'cat_snapshots'),
+    ('GET', r'/_cat/aliases(?:/(?P<name>[^/]+))?', 'cat_aliases'),
+    ('HEAD', r'/_alias/(?P<name>[^/]+)', 'exists_alias'),
+    ('GET', r'/_alias(?:/(?P<name>[^/]+))?', 'get_alias'),
+    ('GET', r'/_aliases', 'get_alias'),
+    ('GET', r'/_cluster/health(?:/(?P<index>[^/]+))?', 'cluster_health'),
+    ('GET', r'/_cluster/settings', 'cluster_settings'),
+    (
+        'GET',
+        r'/_cluster/state(?:/(?P<metric>[^/]+)(?:/(?P<index>[^/]+))?)?',
+        'cluster_state',
+    ),
+    ('GET', r'/_nodes/stats(?:/(?P<metric>[^/]+))?', 'nodes_stats'),
+    ('GET', r'/_nodes/(?P<node_id>[^/]+)/stats(?:/(?P<metric>[^/]+))?', 'nodes_stats'),
+    ('GET', r'/_nodes(?:/(?P<node_id>[^/]+))?(?:/(?P<metric>[^/]+))?', 'nodes_info'),
+    ('GET', r'/_tasks', 'tasks'),
+    ('GET', r'/_snapshot/_status', 'snapshot_status'),
+    ('POST', r'/_snapshot/(?P<repository>[^/]+)/_verify', 'verify_repository'),
+    ('GET', r'/_snapshot(?:/(?P<repository>[^/]+))?', 'get_repository'),
+    ('GET', r'/_snapshot/(?P<repository>[^/]+)/(?P<snapshot>[^/]+)', 'get_snapshot'),
+    ('GET', r'/(?P<index>[^/]+)/_settings(?:/(?P<name>[^/]+))?', 'get_settings'),
+    ('GET', r'/_settings', 'get_settings'),
+    ('GET', r'/(?P<index>[^/]+)/_stats(?:/(?P<metric>[^/]+))?', 'index_stats'),
+    ('GET', r'/_stats(?:/(?P<metric>[^/]+))?', 'index_stats'),
+    ('GET', r'/(?P<index>[^/]+)/_segments', 'segments'),
+    ('GET', r'/(?P<index>[^/]+)/_recovery', 'recovery'),
+    ('HEAD', r'/(?P<index>[^/]+)/_alias/(?P<name>[^/]+)', 'exists_alias'),
+    ('GET', r'/(?P<index>[^/]+)/_alias(?:/(?P<name>[^/]+))?', 'get_alias'),
+    ('GET', r'/(?P<index>[^/]+)/_aliases(?:/(?P<name>[^/]+))?', 'get_alias'),
+    ('POST', r'/(?P<index>[^/]+)/_search', 'search'),
+    ('GET', r'/(?P<index>[^/]+)/_search', 'search'),
+    ('POST', r'/(?P<index>[^/]+)/_rollover(?:/(?P<new_index>[^/]+))?', 'rollover'),
+    ('HEAD', r'/(?P<index>[^/_][^/]*)', 'exists_index'),
+    ('GET', r'/(?P<index>[^/_][^/]*)', 'get_index'),
+]
+COMPILED_ROUTES = [
+    (method, re.compile(f'{pattern}$'), handler) for method, pattern, handler in ROUTES
+]
+
+
+class FakeCluster:
+    """
+    A read-only fake OpenSearch cluster with synthetic indices, aliases and
+    snapshots.
+
+    Index ``i`` belongs to family ``i % families`` and is ``i // families`` days
+    old, so there is one index per family per day, named
+    ``logs-<family>-<YYYY.MM.DD>``. Each family has an alias ``logs-<family>``
+    for all of its indices, with the newest one as the write index. Settings,
+    stats and segments are derived from a checksum of the index name:
+
+    * Every 20th index older than 30 days is closed, and every 50th is empty
+    * Indices are routed to ``box_type`` ``hot`` for 7 days, then ``warm`` until
+      they are 90 days old, then ``cold``
+    * Indices older than 7 days have been force merged to one segment per shard
+    * Indices of even families have an ISM ``lifecycle`` name. Those of odd
+      families are mounted from a snapshot after 180 days
+
+    Snapshot ``j`` is taken :py:const:`SNAPSHOT_INTERVAL` hours before snapshot
+    ``j - 1`` and holds the indices of that day.
+
+    :param indices: The number of indices
+    :param snapshots: The number of snapshots
+    :param days: Days of indices per family. The number of families follows from
+        ``indices``
+    :param latency: Seconds to sleep in every request
+    :param now: The current time. Default: the start of today, UTC
+
+    :type indices: int
+    :type snapshots: int
+    :type days: int
+    :type latency: float
+    :type now: :py:class:`~.datetime.datetime`
+    """
+
+    def __init__(self, indices=1000, snapshots=100, days=365, latency=0.0, now=None):
+        if now is None:
+            now = datetime.now(timezone.utc).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+        #: Seconds to sleep in every request
+        self.latency = latency
+        #: The current time of the cluster
+        self.now = now
+        #: The number of index families
+        self.families = max(1, -(-indices // days))
+        #: All index names, in index number order
+        self.index_names = [self._index_name(num) for num in range(indices)]
+        #: Index numbers, keyed by index name
+        self.index_numbers = {name: num for num, name in enumerate(self.index_names)}
+        #: All snapshot names, newest first
+        self.snapshot_names = [
+            (now - timedelta(hours=SNAPSHOT_INTERVAL * num)).strftime(
+                'curator-%Y%m%d%H%M%S'
+            )
+            for num in range(snapshots)
+        ]
+        #: Snapshot numbers, keyed by snapshot name
+        self.snapshot_numbers = {
+            name: num for num, name in enumerate(self.snapshot_names)
+        }
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.endpoints = {}
+
+    # Synthetic metadata
+
+    def _index_name(self, num):
+        age, family = divmod(num, self.families)
+        day = self.now - timedelta(days=age)
+        return f'logs-{family:04d}-{day:%Y.%m.%d}'
+
+    def family(self, name):
+        """:returns: The family number of index ``name``"""
+        return self.index_numbers[name] % self.families
+
+    def age(self, name):
+        """:returns: The age in days of index ``name``"""
+        return self.index_numbers[name] // self.families
+
+    @staticmethod
+    def checksum(name):
+        """:returns: A stable pseudo-random number for ``name``"""
+        return zlib.crc32(name.encode('utf-8'))
+
+    def state(self, name):
+        """:returns: ``open`` or ``close``"""
+        if self.age(name) > 30 and self.checksum(name) % 20 == 0:
+            return 'close'
+        return 'open'
+
+    def tier(self, name):
+        """:returns: The ``box_type`` of index ``name``"""
+        age = self.age(name)
+        if age <= 7:
+            return 'hot'
+        if age <= 90:
+            return 'warm'
+        return 'cold'
+
+    def creation_date(self, name):
+        """:returns: The creation date of index ``name`` in epoch milliseconds"""
+        day = self.now - timedelta(days=self.age(name))
+        return int(day.timestamp() * 1000) + self.checksum(name) % 3600000
+
+    def shards(self, name):
+        """:returns: The number of primary shards of index ``name``"""
+        return SHARD_COUNTS[self.checksum(name) % len(SHARD_COUNTS)]
+
+    def replicas(self, name):
+        """:returns: The number of replicas of index ``name``"""
+        return 0 if self.age(name) > 90 else 1
+
+    def docs(self, name):
+        """:returns: The document count of index ``name``"""
+        checksum = self.checksum(name)
+        return 0 if checksum % 50 == 1 else 1000 + checksum % 5000000
+
+    def alias(self, name):
+        """:returns: The family alias of index ``name``"""
+        return f'logs-{self.family(name):04d}'
+
+    def alias_members(self, alias):
+        """:returns: The indices of family alias ``alias``, or an empty list"""
+        match = re.fullmatch(r'logs-(\d{4})', alias)
+        if not match or int(match.group(1)) >= self.families:
+            return []
+        family = int(match.group(1))
+        return self.index_names[family :: self.families]
+
+    def aliases(self, name):
+        """:returns: The ``aliases`` of index ``name``"""
+        return {self.alias(name): {'is_write_index': self.age(name) == 0}}
+
+    def settings(self, name):
+        """:returns: The ``settings`` of index ``name``"""
+        index = {
+            'creation_date': str(self.creation_date(name)),
+            'number_of_shards': str(self.shards(name)),
+            'number_of_replicas': str(self.replicas(name)),
+            'provided_name': name,
+            'uuid': self.uuid(name),
+            'version': {'created': '136407827'},
+            'routing': {'allocation': {'require': {'box_type': self.tier(name)}}},
+        }
+        if self.family(name) % 2 == 0:
+            index['lifecycle'] = {'name': 'logs'}
+        elif self.age(name) >= 180:
+            index['store'] = {
+                'type': 'remote_snapshot',
+                'snapshot': {
+                    'snapshot_name': f'archive-{name}',
+                    'index_name': name,
+                    'repository_name': REPOSITORY,
+                },
+            }
+        if self.state(name) == 'close':
+            index['verified_before_close'] = 'true'
+        return {'index': index}
+
+    def stats(self, name):
+        """:returns: The ``primaries`` and ``total`` stats of index ``name``"""
+        docs = self.docs(name)
+        primary = docs * 640
+        shards = self.shards(name)
+        segments = shards * (1 if self.age(name) > 7 else 10)
+        copies = 1 + self.replicas(name)
+
+        def section(multiplier):
+            return {
+                'docs': {'count': docs * multiplier, 'deleted': 0},
+                'store': {'size_in_bytes': primary * multiplier},
+                'segments': {'count': segments * multiplier},
+            }
+
+        return {
+            'uuid': self.uuid(name),
+            'primaries': section(1),
+            'total': section(copies),
+        }
+
+    def segments(self, name):
+        """:returns: The ``_segments`` entry of index ``name``"""
+        per_shard = 1 if self.age(name) > 7 else 10
+        copy = {
+            'routing': {'state': 'STARTED', 'primary': True, 'node': 'node-0'},
+            'num_committed_segments': per_shard,
+            'num_search_segments': per_shard,
+            'segments': {
+                f'_{seg}': {'generation': seg, 'num_docs': 1, 'committed': True}
+                for seg in range(per_shard)
+            },
+        }
+        copies = 1 + self.replicas(name)
+        return {
+            'shards': {
+                str(shard): [copy] * copies for shard in range(self.shards(name))
+            }
+        }
+
+    def routing(self, name):
+        """:returns: The ``routing_table`` entry of index ``name``"""
+        shards = {}
+        for shard in range(self.shards(name)):
+            shards[str(shard)] = [
+                {
+                    'state': 'STARTED',
+                    'primary': copy == 0,
+                    'node': f'node-{(shard + copy) % len(NODES)}',
+                    'relocating_node': None,
+                    'shard': shard,
+                    'index': name,
+                }
+                for copy in range(1 + self.replicas(name))
+            ]
+        return {'shards': shards}
+
+    @staticmethod
+    def uuid(name):
+        """:returns: A stable UUID for index or snapshot ``name``"""
+        return hashlib.md5(name.encode('utf-8')).hexdigest()[:22]
+
+    def snapshot(self, name):
+        """:returns: The ``_snapshot`` entry of snapshot ``name``"""
+        num = self.snapshot_numbers[name]
+        start = self.now - timedelta(hours=SNAPSHOT_INTERVAL * num)
+        start_ms = int(start.timestamp() * 1000)
+        end_ms = start_ms + 60000 + self.checksum(name) % 600000
+        state = 'SUCCESS'
+        if num % 97 == 3:
+            state = 'FAILED'
+        elif num % 50 == 7:
+            state = 'PARTIAL'
+        age = num * SNAPSHOT_INTERVAL // 24
+        first = age * self.families
+        indices = self.index_names[first : first + self.families]
+        return {
+            'snapshot': name,
+            'uuid': self.uuid(name),
+            'version_id': 136407827,
+            'version': VERSION,
+            'indices': indices,
+            'data_streams': [],
+            'include_global_state': True,
+            'state': state,
+            'start_time': start.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            'start_time_in_millis': start_ms,
+            'end_time_in_millis': end_ms,
+            'duration_in_millis': end_ms - start_ms,
+            'failures': [],
+            'shards': {'total': len(indices), 'failed': 0, 'successful': len(indices)},
+        }
+
+    # Name resolution
+
+    def resolve(self, expression, expand='open', ignore_unavailable=False):
+        """
+        :param expression: A comma-separated list of index names, aliases and
+            wildcard patterns, with ``-`` exclusions
+        :param expand: The ``expand_wildcards`` states
+        :param ignore_unavailable: Skip missing names instead of raising an error
+
+        :type expression: str
+        :type expand: str
+        :type ignore_unavailable: bool
+
+        :returns: The matching index names
+        :rtype: list
+        """
+        states = set(expand.split(','))
+        if 'all' in states:
+            states = {'open', 'closed'}
+        selected = {}
+        exclusions = []
+        for part in (expression or '_all').split(','):
+            if part.startswith('-') and selected:
+                exclusions.append(fnmatch.translate(part[1:]))
+            elif part in ('_all', '*') or '*' in part:
+                pattern = (
+                    None
+                    if part in ('_all', '*')
+                    else re.compile(fnmatch.translate(part))
+                )
+                for name in self.index_names:
+                    if pattern and not pattern.match(name):
+                        continue
+                    state = 'closed' if self.state(name) == 'close' else 'open'
+                    if state in states:
+                        selected[name] = None
+            elif part in self.index_numbers:
+                selected[part] = None
+            elif self.alias_members(part):
+                selected.update(dict.fromkeys(self.alias_members(part)))
+            elif not ignore_unavailable:
+                raise not_found(part)
+        if exclusions:
+            excluded = re.compile('|'.join(exclusions))
+            return [name for name in selected if not excluded.match(name)]
+        return list(selected)
+
+    def resolve_snapshots(self, expression, ignore_unavailable=False):
+        """
+        :param expression: A comma-separated list of snapshot names or patterns
+
+        :type expression: str
+
+        :returns: The matching snapshot names
+        :rtype: list
+        """
+        selected = {}
+        for part in expression.split(','):
+            if part in ('_all', '*'):
+                selected.update(dict.fromkeys(self.snapshot_names))
+            elif '*' in part:
+                selected.update(
+                    dict.fromkeys(fnmatch.filter(self.snapshot_names, part))
+                )
+            elif part in self.snapshot_numbers:
+                selected[part] = None
+            elif not ignore_unavailable:
+                raise FakeError(
+                    404,
+                    'snapshot_missing_exception',
+                    f'[{REPOSITORY}:{part}] is missing',
+                )
+        return list(selected)
+
+    def open_only(self, names):
+        """
+        :returns: ``names``, if none of them are closed
+        :raises: An ``index_closed_exception`` for the first closed index
+        """
+        for name in names:
+            if self.state(name) == 'close':
+                raise FakeError(400, 'index_closed_exception', 'closed', index=name)
+        return names
+
+    def check_repository(self, repository):
+        """Raise a ``repository_missing_exception`` if ``repository`` is unknown"""
+        if repository not in (REPOSITORY, '_all', '*'):
+            raise FakeError(
+                404,
+                'repository_missing_exception',
+                f'[{repository}] missing',
+            )
+
+    # Request handling
+
+    def handle(self, method, url, params, body):
+        """
+        Answer one request
+
+        :param method: The HTTP method
+        :param url: The request path, without the query string
+        :param params: The query string parameters
+        :param body: The request body
+
+        :type method: str
+        :type url: str
+        :type params: dict
+        :type body: bytes
+
+        :returns: ``(status, content type, response body, handler name)``
+        :rtype: tuple
+        """
+        path = url.split('?', 1)[0]
+        # The client sends query string values as bytes
+        params = {
+            key: val.decode('utf-8') if isinstance(val, bytes) else val
+            for key, val in params.items()
+        }
+        for route_method, pattern, handler in COMPILED_ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.match(path)
+            if match:
+                break
+        else:
+            return (
+                400,
+                'application/json',
+                json.dumps(
+                    {'error': f'No fake handler for {method} {path}', 'status': 400}
+                ),
+                'unknown',
+            )
+        args = {k: unquote(v) for k, v in match.groupdict().items() if v is not None}
+        if body:
+            body = json.loads(body)
+        try:
+            status, data = getattr(self, f'do_{handler}')(params, body, **args)
+        except FakeError as err:
+            return err.status, 'application/json', json.dumps(err.body), handler
+        if method == 'HEAD':
+            return status, 'application/json', '', handler
+        if isinstance(data, str):
+            return status, 'text/plain', data, handler
+        if params.get('filter_path'):
+            data = filter_response(data, params['filter_path'])
+        return status, 'application/json', json.dumps(data), handler
+
+    def record(self, handler, seconds, size):
+        """Count one request to ``handler`` in the request statistics"""
+        with self.lock:
+            self.requests += 1
+            self.bytes += size
+            self.seconds += seconds
+            self.endpoints[handler] = self.endpoints.get(handler, 0) + 1
+
+    def reset_stats(self):
+        """
+        :returns: The request statistics since the last reset, as a dictionary
+        :rtype: dict
+        """
+        with self.lock:
+            stats = {
+                'requests': self.requests,
+                'bytes': self.bytes,
+                'fake_seconds': round(self.seconds, 6),
+                'endpoints': dict(sorted(self.endpoints.items())),
+            }
+            self.requests = 0
+            self.bytes = 0
+            self.seconds = 0.0
+            self.endpoints = {}
+        return stats
+
+    @staticmethod
+    def cat_rows(rows, params):
+        """Select the ``h`` columns of ``rows``, as JSON or as text"""
+        columns = params.get('h', '').split(',') if params.get('h') else None
+        if columns:
+            rows = [{col: row.get(col) for col in columns} for row in rows]
+        if params.get('format') == 'json':
+            return rows
+        return ''.join(
+            ' '.join(str(value) for value in row.values()) + '\n' for row in rows
+        )
+
+    # pylint: disable=unused-argument,missing-function-docstring
+
+    def do_info(self, params, body):
+        return 200, {
+            'name': 'node-0',
+            'cluster_name': 'bench',
+            'cluster_uuid': self.uuid('bench'),
+            'version': {'distribution': 'opensearch', 'number': VERSION},
+            'tagline': 'The OpenSearch Project: https://opensearch.org/',
+        }
+
+    def do_cat_indices(self, params, body, index=None):
+        expand = params.get('expand_wildcards', 'all')
+        ignore = params.get('ignore_unavailable') in ('true', True)
+        rows = []
+        for name in self.resolve(index, expand=expand, ignore_unavailable=ignore):
+            state = self.state(name)
+            stats = self.stats(name)['total']
+            primaries = self.stats(name)['primaries']
+            rows.append(
+                {
+                    'health': 'green' if state == 'open' else None,
+                    'status': state,
+                    'index': name,
+                    'uuid': self.uuid(name),
+                    'pri': str(self.shards(name)),
+                    'rep': str(self.replicas(name)),
+                    'docs.count': str(stats['docs']['count']),
+                    'store.size': str(stats['store']['size_in_bytes']),
+                    'pri.store.size': str(primaries['store']['size_in_bytes']),
+                    'creation.date': str(self.creation_date(name)),
+                }
+            )
+        return 200, self.cat_rows(rows, params)
+
+    def do_cat_aliases(self, params, body, name=None):
+        patterns = name.split(',') if name else ['*']
+        rows = []
+        for index in self.index_names:
+            alias = self.alias(index)
+            if any(fnmatch.fnmatchcase(alias, pattern) for pattern in patterns):
+                write = self.aliases(index)[alias]['is_write_index']
+                rows.append(
+                    {
+                        'alias': alias,
+                        'index': index,
+                        'is_write_index': str(write).lower(),
+                    }
+                )
+        return 200, self.cat_rows(rows, params)
+
+    def do_cat_snapshots(self, params, body, repository=REPOSITORY):
+        self.check_repository(repository)
+        rows = []
+        for name in self.snapshot_names:
+            snap = self.snapshot(name)
+            rows.append(
+                {
+                    'id': name,
+                    'status': snap['state'],
+                    'start_epoch': str(snap['start_time_in_millis'] // 1000),
+                    'end_epoch': str(snap['end_time_in_millis'] // 1000),
+                    'duration': f"{snap['duration_in_millis'] // 1000}s",
+                    'indices': str(len(snap['indices'])),
+                    'successful_shards': str(snap['shards']['successful']),
+                    'failed_shards': '0',
+                    'total_shards': str(snap['shards']['total']),
+                }
+            )
+        return 200, self.cat_rows(rows, params)
+
+    def do_exists_alias(self, params, body, name, index=None):
+        members = set(self.alias_members(name))
+        if index:
+            members &= set(self.resolve(index, ignore_unavailable=True))
+        return (200 if members else 404), None
+
+    def do_get_alias(self, params, body, index=None, name=None):
+        indices = self.resolve(index, expand='all') if index else None
+        if name:
+            wanted = set(name.split(','))
+            members = {}
+            for alias in wanted:
+                for member in self.alias_members(alias):
+                    members[member] = alias
+            if indices is not None:
+                members = {key: val for key, val in members.items() if key in indices}
+            if not members:
+                raise FakeError(404, 'aliases_not_found_exception', 'alias missing')
+            return 200, {
+                member: {'aliases': {alias: self.aliases(member)[alias]}}
+                for member, alias in members.items()
+            }
+        if indices is None:
+            indices = self.index_names
+        return 200, {member: {'aliases': self.aliases(member)} for member in indices}
+
+    def do_cluster_health(self, params, body, index=None):
+        return 200, {
+            'cluster_name': 'bench',
+            'status': 'green',
+            'timed_out': False,
+            'number_of_nodes': len(NODES),
+            'number_of_data_nodes': len(NODES),
+            'active_shards': 0,
+            'relocating_shards': 0,
+            'initializing_shards': 0,
+            'unassigned_shards': 0,
+        }
+
+    def do_cluster_settings(self, params, body):
+        return 200, {'persistent': {}, 'transient': {}}
+
+    def do_cluster_state(self, params, body, metric=None, index=None):
+        data = {'cluster_name': 'bench'}
+        if index is not None or (metric and 'routing_table' in metric):
+            data['routing_table'] = {
+                'indices': {
+                    name: self.routing(name)
+                    for name in self.resolve(index or '_all', expand='all')
+                }
+            }
+        if metric and 'metadata' in metric:
+            data['metadata'] = {
+                'indices': {
+                    name: {
+                        'state': self.state(name),
+                        'settings': self.settings(name),
+                        'aliases': list(self.aliases(name)),
+                    }
+                    for name in self.resolve(index or '_all', expand='all')
+                }
+            }
+        return 200, data
+
+    def node(self, node_id):
+        """:returns: The ``_nodes`` entry of ``node_id``"""
+        return {
+            'name': node_id,
+            'host': '127.0.0.1',
+            'version': VERSION,
+            'roles': ['cluster_manager', 'data', 'ingest'],
+            'attributes': {'box_type': NODES[node_id]},
+        }
+
+    def node_ids(self, node_id):
+        """:returns: The node IDs matched by ``node_id``"""
+        if node_id in (None, '_all', '_local', '_master', '_cluster_manager'):
+            return list(NODES) if node_id in (None, '_all') else ['node-0']
+        return [node for node in node_id.split(',') if node in NODES]
+
+    def do_nodes_info(self, params, body, node_id=None, metric=None):
+        return 200, {
+            'cluster_name': 'bench',
+            'nodes': {node: self.node(node) for node in self.node_ids(node_id)},
+        }
+
+    def do_nodes_stats(self, params, body, node_id=None, metric=None):
+        disk = 1024**4
+        return 200, {
+            'cluster_name': 'bench',
+            'nodes': {
+                node: {
+                    'name': node,
+                    'roles': self.node(node)['roles'],
+                    'fs': {
+                        'total': {
+                            'total_in_bytes': disk,
+                            'free_in_bytes': disk // 2,
+                            'available_in_bytes': disk // 2,
+                        },
+                        'data': [{'path': '/data', 'available_in_bytes': disk // 2}],
+                    },
+                }
+                for node in self.node_ids(node_id)
+            },
+        }
+
+    def do_tasks(self, params, body):
+        return 200, {'nodes': {}}
+
+    def do_snapshot_status(self, params, body):
+        return 200, {'snapshots': []}
+
+    def do_verify_repository(self, params, body, repository):
+        self.check_repository(repository)
+        return 200, {'nodes': {node: {'name': node} for node in NODES}}
+
+    def do_get_repository(self, params, body, repository=REPOSITORY):
+        self.check_repository(repository)
+        return 200, {REPOSITORY: {'type': 'fs', 'settings': {'location': '/snapshots'}}}
+
+    def do_get_snapshot(self, params, body, repository, snapshot):
+        self.check_repository(repository)
+        ignore = params.get('ignore_unavailable') in ('true', True)
+        names = self.resolve_snapshots(snapshot, ignore_unavailable=ignore)
+        return 200, {'snapshots': [self.snapshot(name) for name in names]}
+
+    def do_get_settings(self, params, body, index='_all', name=None):
+        return 200, {
+            idx: {'settings': self.settings(idx)}
+            for idx in self.resolve(index, expand='all')
+        }
+
+    def do_index_stats(self, params, body, index='_all', metric=None):
+        names = self.resolve(index, expand='open')
+        return 200, {
+            '_shards': {'total': len(names), 'successful': len(names), 'failed': 0},
+            'indices': {name: self.stats(name) for name in self.open_only(names)},
+        }
+
+    def do_segments(self, params, body, index):
+        names = self.open_only(self.resolve(index))
+        return 200, {
+            '_shards': {'total': len(names), 'successful': len(names), 'failed': 0},
+            'indices': {name: self.segments(name) for name in names},
+        }
+
+    def do_recovery(self, params, body, index):
+        return 200, {
+            name: {
+                'shards': [
+                    {'stage': 'DONE', 'id': shard} for shard in range(self.shards(name))
+                ]
+            }
+            for name in self.resolve(index)
+        }
+
+    def do_search(self, params, body, index):
+        names = self.open_only(self.resolve(index))
+        aggs = {}
+        for agg in (body or {}).get('aggs', {}):
+            aggs[agg] = {'value': None}
+        docs = sum(self.docs(name) for name in names)
+        if docs:
+            low = min(self.creation_date(name) for name in names)
+            high = max(self.creation_date(name) for name in names) + DAY_MS - 1
+            if 'min' in aggs:
+                aggs['min'] = {'value': float(low)}
+            if 'max' in aggs:
+                aggs['max'] = {'value': float(high)}
+        return 200, {
+            'took': 1,
+            'timed_out': False,
+            'hits': {'total': {'value': docs, 'relation': 'eq'}, 'hits': []},
+            'aggregations': aggs,
+        }
+
+    def do_rollover(self, params, body, index, new_index=None):
+        members = self.alias_members(index)
+        if not members:
+            raise FakeError(400, 'illegal_argument_exception', 'not an alias')
+        conditions = (body or {}).get('conditions', {})
+        return 200, {
+            'acknowledged': False,
+            'shards_acknowledged': False,
+            'old_index': members[0],
+            'new_index': new_index or f'{members[0]}-000002',
+            'rolled_over': False,
+            'dry_run': True,
+            'conditions': {f'[{key}: {val}]': False for key, val in conditions.items()},
+        }
+
+    def do_exists_index(self, params, body, index):
+        try:
+            self.resolve(index)
+        except FakeError:
+            return 404, None
+        return 200, None
+
+    def do_get_index(self, params, body, index):
+        return 200, {
+            name: {
+                'aliases': self.aliases(name),
+                'mappings': {'properties': {'@timestamp': {'type': 'date'}}},
+                'settings': self.settings(name),
+            }
+            for name in self.resolve(index, expand='all')
+        }
+
+
+class FakeConnection(Connection):
+    """
+    A :py:class:`~.opensearchpy.Connection` which sends every request to a
+    :py:class:`FakeCluster`, after sleeping for its ``latency``
+
+    :param cluster: The fake cluster
+
+    :type cluster: :py:class:`FakeCluster`
+    """
+
+    def __init__(self, host='localhost', port=None, cluster=None, **kwargs):
+        super().__init__(host=host, port=port, **kwargs)
+        #: The fake cluster which answers the requests
+        self.cluster = cluster
+
+    def perform_request(
+        self,
+        method,
+        url,
+        params=None,
+        body=None,
+        timeout=None,
+        ignore=(),
+        headers=None,
+    ):
+        start = time.perf_counter()
+        if self.cluster.latency:
+            time.sleep(self.cluster.latency)
+        handled = time.perf_counter()
+        status, content_type, raw, handler = self.cluster.handle(
+            method, url, params or {}, body
+        )
+        self.cluster.record(handler, time.perf_counter() - handled, len(raw))
+        duration = time.perf_counter() - start
+        if not 200 <= status < 300 and status not in ignore:
+            self.log_request_fail(method, url, url, body, duration, status, raw)
+            self._raise_error(status, raw, content_type)
+        self.log_request_success(method, url, url, body, status, raw, duration)
+        return status, {'content-type': content_type}, raw
+
+    def close(self):
+        """Nothing to close"""
@@ -0,0 +1,203 @@
+"""Run the benchmark suite and write the results as JSON
+
+Usage::
+
+    python -m benchmarks.run --indices 10000 --latency 2 --output results.json
+"""
+
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+import click
+import opensearchpy
+from opensearchpy import OpenSearch
+from curator._version import __version__
+from .cases import all_cases
+from .fakecluster import FakeCluster, FakeConnection
+
+#: The format version of the results file
+RESULTS_FORMAT = 1
+
+
+def fake_client(cluster):
+    """
+    :param cluster: The fake cluster
+
+    :type cluster: :py:class:`~.benchmarks.fakecluster.FakeCluster`
+
+    :returns: A client whose requests are answered by ``cluster``
+    :rtype: :py:class:`~.opensearchpy.OpenSearch`
+    """
+    return OpenSearch(
+        hosts=[{'host': 'fake', 'port': 9200}],
+        connection_class=FakeConnection,
+        cluster=cluster,
+        max_retries=0,
+    )
+
+
+def run_case(case, client, cluster, repeat=1, memory=False):
+    """
+    Run ``case`` ``repeat`` times, each time after a fresh ``setup``
+
+    :param case: The benchmark case
+    :param client: The fake client
+    :param cluster: The fake cluster behind ``client``
+    :param repeat: How many times to run ``case``
+    :param memory: Also record the peak memory allocated while running ``case``
+
+    :type case: :py:class:`~.benchmarks.cases.Case`
+    :type client: :py:class:`~.opensearchpy.OpenSearch`
+    :type cluster: :py:class:`~.benchmarks.fakecluster.FakeCluster`
+    :type repeat: int
+    :type memory: bool
+
+    :returns: The result of ``case``. ``seconds`` is the fastest run, and the
+        request counts are those of the last run
+    :rtype: dict
+    """
+    result = {'name': case.name, 'seconds': None, 'runs': []}
+    for _ in range(repeat):
+        try:
+            target = case.setup(client)
+            cluster.reset_stats()
+            if memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            case.run(target)
+            elapsed = time.perf_counter() - start
+        except Exception as err:  # pylint: disable=broad-except
+            result['error'] = f'{type(err).__name__}: {err}'
+            break
+        finally:
+            if memory and tracemalloc.is_tracing():
+                result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        result['runs'].append(round(elapsed, 6))
+        result.update(cluster.reset_stats())
+    if result['runs']:
+        result['seconds'] = min(result['runs'])
+    return result
+
+
+@click.command(context_settings={'help_option_names': ['-h', '--help']})
+@click.option(
+    '--indices',
+    type=click.IntRange(1, 200000),
+    default=1000,
+    show_default=True,
+    help='Number of indices in the fake cluster',
+)
+@click.option(
+    '--snapshots',
+    type=click.IntRange(0, 100000),
+    default=200,
+    show_default=True,
+    help='Number of snapshots in the fake cluster',
+)
+@click.option(
+    '--days',
+    type=click.IntRange(1, 10000),
+    default=365,
+    show_default=True,
+    help='Days of daily indices per index family',
+)
+@click.option(
+    '--latency',
+    type=click.FloatRange(0),
+    default=0.0,
+    show_default=True,
+    help='Milliseconds added to every request',
+)
+@click.option(
+    '--repeat',
+    type=click.IntRange(1, 100),
+    default=1,
+    show_default=True,
+    help='Runs per case. The fastest is reported',
+)
+@click.option(
+    '--only',
+    multiple=True,
+    help='Only run cases whose name starts with this. Can be repeated',
+)
+@click.option(
+    '--memory',
+    is_flag=True,
+    help='Record the peak memory allocated in each case (slower)',
+)
+@click.option(
+    '--loglevel',
+    type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']),
+    default='INFO',
+    show_default=True,
+    help='Curator log level. Records are formatted, then discarded',
+)
+@click.option(
+    '--output',
+    type=click.Path(dir_okay=False, writable=True),
+    default='-',
+    show_default=True,
+    help='Results file',
+)
+def run(indices, snapshots, days, latency, repeat, only, memory, loglevel, output):
+    """Benchmark Curator against a fake cluster of INDICES indices"""
+    # pylint: disable=too-many-arguments,too-many-locals
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(
+            logging.Formatter('%(asctime)s %(levelname)-9s %(name)s %(message)s')
+        )
+        root = logging.getLogger()
+        root.addHandler(handler)
+        root.setLevel(loglevel)
+        cluster = FakeCluster(
+            indices=indices, snapshots=snapshots, days=days, latency=latency / 1000
+        )
+        client = fake_client(cluster)
+        results = []
+        for case in all_cases():
+            if only and not case.name.startswith(tuple(only)):
+                continue
+            result = run_case(case, client, cluster, repeat=repeat, memory=memory)
+            click.echo(
+                f"{case.name:45} {result['seconds'] or 0:10.4f}s "
+                f"{result.get('requests', 0):8} requests "
+                f"{result.get('error', '')}",
+                err=True,
+            )
+            results.append(result)
+        root.removeHandler(handler)
+    payload = {
+        'format': RESULTS_FORMAT,
+        'started': datetime.now(timezone.utc).isoformat(),
+        'curator': __version__,
+        'opensearch_py': '.'.join(str(num) for num in opensearchpy.VERSION),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cluster': {
+            'indices': indices,
+            'snapshots': snapshots,
+            'days': days,
+            'families': cluster.families,
+            'latency_ms': latency,
+        },
+        'repeat': repeat,
+        'results': results,
+    }
+    if output == '-':
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        with open(output, 'w', encoding='utf-8') as fhandle:
+            json.dump(payload, fhandle, indent=2)
+
+
+if __name__ == '__main__':
+    # pylint: disable=no-value-for-parameter
+    run()
@@ -1,12 +1,15 @@
 """Alias action"""
 
+import json
 import logging
+from opensearchpy.exceptions import NotFoundError
 
 # pylint: disable=import-error
+from curator.defaults.settings import ALIAS_BATCH_BYTES
 from curator.exceptions import ActionError, MissingArgument, NoIndices
 from curator.helpers.date_ops import parse_date_pattern, parse_datemath
 from curator.helpers.testers import verify_index_list
-from curator.helpers.utils import report_failure
+from curator.helpers.utils import chunk_index_list, report_failure, to_csv
 
 
 class Alias:
@@ -111,9 +114,7 @@ class Alias:
 
             # Re-raise the exceptions.NoIndices so it will behave as before
             raise NoIndices('No indices to remove from alias') from exc
-        aliases = self.client.indices.get_alias(
-            params={'expand_wildcards': 'open,closed'}
-        )
+        aliases = self.get_aliases(ilo.working_list())
         for index in ilo.working_list():
             if index in aliases:
                 self.loggit.debug('Index %s in get_aliases output', index)
@@ -132,6 +133,52 @@ class Alias:
                         self.name,
                     )
 
+    def get_aliases(self, indices):
+        """
+        Get the :py:attr:`name` alias of each of ``indices``, one
+        :py:func:`~.curator.helpers.utils.chunk_index_list` chunk at a time.
+
+        :param indices: The index names to check
+
+        :type indices: list
+
+        :returns: The :py:meth:`~.opensearchpy.client.IndicesClient.get_alias`
+            output for the indices in ``indices`` that have the alias
+        :rtype: dict
+        """
+        aliases = {}
+        for chunk in chunk_index_list(indices):
+            try:
+                aliases.update(
+                    self.client.indices.get_alias(
+                        index=to_csv(chunk),
+                        name=self.name,
+                        params={'expand_wildcards': 'open,closed'},
+                    )
+                )
+            except NotFoundError:
+                self.loggit.debug('No index in this chunk has alias %s', self.name)
+        return aliases
+
+    def batches(self):
+        """
+        Split :py:attr:`actions` into batches of at most
+        :py:const:`~.curator.defaults.settings.ALIAS_BATCH_BYTES` when serialized,
+        keeping their order.
+
+        :rtype: list
+        """
+        batches = [[]]
+        size = 0
+        for action in self.actions:
+            action_size = len(json.dumps(action)) + 1
+            if batches[-1] and size + action_size > ALIAS_BATCH_BYTES:
+                batches.append([])
+                size = 0
+            batches[-1].append(action)
+            size += action_size
+        return batches
+
     def check_actions(self):
         """
         :returns: :py:attr:`actions` for use with the
@@ -168,8 +215,17 @@ class Alias:
         """
         self.loggit.info('Updating aliases...')
         self.loggit.info('Alias actions: %s', self.actions)
+        batches = self.batches()
+        if len(batches) > 1:
+            self.loggit.warning(
+                '%s alias actions are too large for one request, and will be sent in '
+                '%s requests. The change is not atomic across requests.',
+                len(self.actions),
+                len(batches),
+            )
         try:
-            self.client.indices.update_aliases(body={'actions': self.actions})
+            for batch in batches:
+                self.client.indices.update_aliases(body={'actions': batch})
         # pylint: disable=broad-except
         except Exception as err:
             report_failure(err)
@@ -1,24 +1,37 @@
 """Close index action class"""
 
 import logging
+import time
 import warnings
 from opensearchpy.exceptions import OpenSearchWarning
+from curator.exceptions import FailedExecution
 from curator.helpers.testers import verify_index_list
-from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
+from curator.helpers.utils import (
+    chunk_index_list,
+    report_failure,
+    run_concurrently,
+    show_dry_run,
+    to_csv,
+)
+from opensearch_client.tracing import TRACER
 
 
 class Close:
     """Close Action Class"""
 
-    def __init__(self, ilo, delete_aliases=False, skip_flush=False):
+    def __init__(self, ilo, delete_aliases=False, skip_flush=False, concurrency=1):
         """
         :param ilo: An IndexList Object
         :param delete_aliases: Delete any associated aliases before closing indices.
         :param skip_flush: Do not flush indices before closing.
+        :param concurrency: How many flush or close requests to have in flight at
+            once. Above ``1``, the indices are closed in phases: every alias is
+            removed with one request, then every chunk is flushed, then closed.
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type delete_aliases: bool
         :type skip_flush: bool
+        :type concurrency: int
         """
         verify_index_list(ilo)
         #: The :py:class:`~.curator.indexlist.IndexList` object passed from
@@ -28,6 +41,8 @@ class Close:
         self.delete_aliases = delete_aliases
         #: The value passed as ``skip_flush``
         self.skip_flush = skip_flush
+        #: The value passed as ``concurrency``
+        self.concurrency = concurrency
         #: The :py:class:`~.opensearchpy.OpenSearch` client object derived from
         #: :py:attr:`index_list`
         self.client = ilo.client
@@ -39,6 +54,93 @@ class Close:
             self.index_list, 'close', **{'delete_aliases': self.delete_aliases}
         )
 
+    def remove_aliases(self):
+        """
+        Remove every alias from the indices in :py:attr:`index_list` with one
+        :py:meth:`~.elasticsearch.client.IndicesClient.update_aliases` request,
+        using the aliases the :py:class:`~.curator.indexlist.IndexList` already
+        resolved. A failure is logged, and closing goes on, as it does one chunk at
+        a time.
+        """
+        self.index_list.resolve_names()
+        selected = set(self.index_list.indices)
+        actions = []
+        for alias, members in sorted(self.index_list.alias_indices.items()):
+            indices = [index for index in members if index in selected]
+            if indices:
+                actions.append({'remove': {'indices': indices, 'alias': alias}})
+        self.loggit.info(
+            'Deleting %s aliases from indices before closing.', len(actions)
+        )
+        if not actions:
+            return
+        try:
+            self.client.indices.update_aliases(body={'actions': actions})
+        # pylint: disable=broad-except
+        except Exception as err:
+            self.loggit.warning('Unable to delete aliases.  Exception: %s', err)
+
+    def run_chunks(self, func, chunks, **kwargs):
+        """
+        Call ``func`` for each of ``chunks``, with at most :py:attr:`concurrency`
+        requests in flight.
+
+        :param func: The client method to call with ``index`` and ``kwargs``
+        :param chunks: The index name chunks
+
+        :type func: callable
+        :type chunks: list
+
+        :returns: The chunks that succeeded, and the error for each that failed, by
+            its CSV index list
+        :rtype: tuple
+        """
+        done, failed = run_concurrently(
+            lambda chunk: func(index=to_csv(chunk), **kwargs), chunks, self.concurrency
+        )
+        return [chunk for chunk, _ in done], {
+            to_csv(chunk): err for chunk, err in failed
+        }
+
+    def close_all(self):
+        """
+        Close the indices in :py:attr:`index_list` in phases: remove their aliases
+        if :py:attr:`delete_aliases`, flush every chunk unless :py:attr:`skip_flush`,
+        then close every chunk that flushed. Each phase has at most
+        :py:attr:`concurrency` requests in flight, and its duration is logged.
+        """
+        chunks = chunk_index_list(self.index_list.indices)
+        failed = {}
+        timings = []
+        phases = [('close', self.client.indices.close, {})]
+        if not self.skip_flush:
+            phases.insert(0, ('flush', self.client.indices.flush, {'force': True}))
+        if self.delete_aliases:
+            start = time.monotonic()
+            with TRACER.span('close.aliases'):
+                self.remove_aliases()
+            timings.append(('aliases', time.monotonic() - start))
+        # See do_action for why this warning is ignored
+        warnings.filterwarnings("ignore", category=OpenSearchWarning)
+        for phase, func, kwargs in phases:
+            start = time.monotonic()
+            with TRACER.span(f'close.{phase}', chunks=len(chunks)):
+                chunks, errors = self.run_chunks(
+                    func, chunks, ignore_unavailable=True, **kwargs
+                )
+            timings.append((phase, time.monotonic() - start))
+            for csv, err in errors.items():
+                self.loggit.error('Unable to %s indices %s: %s', phase, csv, err)
+            failed.update(errors)
+        self.loggit.info(
+            'Close phases: %s',
+            ', '.join(f'{phase} {seconds:.2f}s' for phase, seconds in timings),
+        )
+        if failed:
+            raise FailedExecution(
+                f'Unable to close {len(failed)} chunks of indices: {sorted(failed)}'
+            )
+
     def do_action(self):
         """
         :py:meth:`~.elasticsearch.client.IndicesClient.close` open indices in
@@ -51,6 +153,9 @@ class Close:
             len(self.index_list.indices),
             self.index_list.indices,
         )
+        if self.concurrency > 1:
+            self.close_all()
+            return
         try:
             index_lists = chunk_index_list(self.index_list.indices)
             for lst in index_lists:
@@ -5,28 +5,46 @@ import logging
 # pylint: disable=import-error, broad-except
 from opensearchpy.exceptions import RequestError
 from curator.exceptions import ConfigurationError, FailedExecution
-from curator.helpers.date_ops import parse_date_pattern
-from curator.helpers.utils import report_failure
+from curator.helpers.date_ops import parse_date_pattern, parse_datemath
+from curator.helpers.getters import get_existing_indices
+from curator.helpers.utils import report_failure, run_concurrently
+
+#: The errors OpenSearch returns when the index to create already exists
+ALREADY_EXISTS = [
+    "index_already_exists_exception",
+    "resource_already_exists_exception",
+]
 
 
 class CreateIndex:
     """Create Index Action Class"""
 
-    def __init__(self, client, name=None, extra_settings=None, ignore_existing=False):
+    def __init__(
+        self,
+        client,
+        name=None,
+        extra_settings=None,
+        ignore_existing=False,
+        concurrency=4,
+    ):
         """
         :param client: A client connection object
-        :param name: A name, which can contain :py:func:`time.strftime` strings
+        :param name: A name, which can contain :py:func:`time.strftime` strings. A
+            list of names creates each index that does not exist yet.
         :param extra_settings: The `settings` and `mappings` for the index. For
             more information see `the create indices documentation
             </https://www.elastic.co/guide/en/elasticsearch/reference/8.6/indices-create-index.html>`_.
         :param ignore_existing: If an index already exists, and this setting is
             ``True``, ignore the 400 error that results in a
             ``resource_already_exists_exception`` and return that it was successful.
+        :param concurrency: With a list of names, how many create requests to have
+            in flight at once
 
         :type client: :py:class:`~.opensearchpy.OpenSearch`
-        :type name: str
+        :type name: str or list
         :type extra_settings: dict
         :type ignore_existing: bool
+        :type concurrency: int
         """
         if extra_settings is None:
             extra_settings = {}
@@ -34,10 +52,25 @@ class CreateIndex:
             raise ConfigurationError('Value for "name" not provided.')
         #: The :py:func:`~.curator.helpers.date_ops.parse_date_pattern` rendered
         #: version of what was passed as ``name``.
-        self.name = parse_date_pattern(name)
+        self.name = None
+        #: With a list of names, each name rendered by
+        #: :py:func:`~.curator.helpers.date_ops.parse_date_pattern` and
+        #: :py:func:`~.curator.helpers.date_ops.parse_datemath`, without duplicates.
+        #: Otherwise ``None``.
+        self.names = None
+        if isinstance(name, list):
+            self.names = list(
+                dict.fromkeys(
+                    parse_datemath(client, parse_date_pattern(item)) for item in name
+                )
+            )
+        else:
+            self.name = parse_date_pattern(name)
         #: Extracted from the action definition, it should be a boolean informing
         #: whether to ignore the error if the index already exists.
         self.ignore_existing = ignore_existing
+        #: Object attribute that gets the value of param ``concurrency``.
+        self.concurrency = concurrency
         #: An :py:class:`~.opensearchpy.OpenSearch` client object
         self.client = client
         #: Any extra settings for the index, like aliases, mappings, or settings.
@@ -58,29 +91,105 @@ class CreateIndex:
             self.settings = extra_settings.pop('settings')
         self.loggit = logging.getLogger('curator.actions.create_index')
 
+    def body(self):
+        """
+        :returns: The create index request body, from :py:attr:`aliases`,
+            :py:attr:`mappings`, :py:attr:`settings` and :py:attr:`extra_settings`
+        :rtype: dict
+        """
+        body = {}
+        if self.settings is not None:
+            body['settings'] = self.settings
+        if self.mappings is not None:
+            body['mappings'] = self.mappings
+        if self.aliases is not None:
+            body['aliases'] = self.aliases
+        if self.extra_settings:
+            body.update(self.extra_settings)
+        return body
+
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
         self.loggit.info('DRY-RUN MODE.  No changes will be made.')
+        if self.names is not None:
+            existing = get_existing_indices(self.client, self.names)
+            for name in self.names:
+                state = ' (already exists)' if name in existing else ''
+                self.loggit.info(
+                    'DRY-RUN: create_index "%s"%s with arguments: %s',
+                    name,
+                    state,
+                    self.extra_settings,
+                )
+            return
         msg = (
             f'DRY-RUN: create_index "{self.name}" with arguments: {self.extra_settings}'
         )
         self.loggit.info(msg)
 
+    def create_all(self):
+        """
+        Create each index in :py:attr:`names` that does not exist yet, with at most
+        :py:attr:`concurrency` requests in flight, and log how many were created,
+        already existed or failed.
+
+        :returns: The ``created``, ``existing`` and ``failed`` index names
+        :rtype: dict
+        """
+        body = self.body()
+        existing = get_existing_indices(self.client, self.names)
+        result = {'created': [], 'existing': [], 'failed': {}}
+        done, failed = run_concurrently(
+            lambda name: self.client.indices.create(index=name, body=body or None),
+            [name for name in self.names if name not in existing],
+            self.concurrency,
+        )
+        created = [name for name, _ in done]
+        errors = dict(failed)
+        for name in self.names:
+            if name in existing:
+                result['existing'].append(name)
+            elif name in created:
+                result['created'].append(name)
+            elif isinstance(errors[name], RequestError):
+                if errors[name].error in ALREADY_EXISTS:
+                    result['existing'].append(name)
+                else:
+                    result['failed'][name] = errors[name].error
+            else:
+                result['failed'][name] = errors[name]
+        self.loggit.info(
+            'Created %s, already existing %s, failed %s of %s indices',
+            len(result['created']),
+            len(result['existing']),
+            len(result['failed']),
+            len(self.names),
+        )
+        for name, err in result['failed'].items():
+            self.loggit.error('Unable to create index "%s". Error: %s', name, err)
+        return result
+
     def do_action(self):
         """
         :py:meth:`~.elasticsearch.client.IndicesClient.create` index identified
         by :py:attr:`name` with values from :py:attr:`aliases`, :py:attr:`mappings`,
-        and :py:attr:`settings`
+        and :py:attr:`settings`, or each index in :py:attr:`names` that does not
+        exist yet
         """
-        body = {}
-        if self.settings is not None:
-            body['settings'] = self.settings
-        if self.mappings is not None:
-            body['mappings'] = self.mappings
-        if self.aliases is not None:
-            body['aliases'] = self.aliases
-        if self.extra_settings:
-            body.update(self.extra_settings)
+        if self.names is not None:
+            result = self.create_all()
+            if result['failed']:
+                raise FailedExecution(
+                    f'Unable to create indices {sorted(result["failed"])}'
+                )
+            if result['existing']:
+                if not self.ignore_existing:
+                    raise FailedExecution(
+                        f'Indices {result["existing"]} already exist.'
+                    )
+                self.loggit.warning('Indices %s already exist.', result['existing'])
+            return
+        body = self.body()
         msg = f'Creating index "{self.name}" with settings: {body}'
         self.loggit.info(msg)
         try:
@@ -90,11 +199,7 @@ class CreateIndex:
             )
         # Most likely error is a 400, `resource_already_exists_exception`
         except RequestError as err:
-            match_list = [
-                "index_already_exists_exception",
-                "resource_already_exists_exception",
-            ]
-            if err.error in match_list:
+            if err.error in ALREADY_EXISTS:
                 if self.ignore_existing:
                     self.loggit.warning('Index %s already exists.', self.name)
                 else:
@@ -4,6 +4,7 @@ import logging
 
 # pylint: disable=import-error
 from curator.helpers.getters import get_indices
+from curator.helpers.logsampler import LogSampler
 from curator.helpers.testers import verify_index_list
 from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
 
@@ -71,12 +72,18 @@ class DeleteIndices:
         """
         working_list = chunk_list
         for count in range(1, 4):  # Try 3 times
+            # Always leave a record of what was deleted
+            self.loggit.info(
+                '---deleting %s indices: %s', len(working_list), to_csv(working_list)
+            )
+            sampler = LogSampler(self.loggit, 'delete_indices', noun='indices')
             for i in working_list:
-                self.loggit.info("---deleting index %s", i)
+                sampler.done('---deleting index %s', i)
             self.client.indices.delete(
                 index=to_csv(working_list), master_timeout=self.master_timeout
             )
-            result = [i for i in working_list if i in get_indices(self.client)]
+            remaining = set(get_indices(self.client))
+            result = [i for i in working_list if i in remaining]
             if self._verify_result(result, count):
                 return
             working_list = result
@@ -6,6 +6,45 @@ import logging
 from curator.exceptions import ActionError, ConfigurationError, MissingArgument
 from curator.helpers.testers import verify_index_list
 from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
+from opensearch_client.tracing import TRACER
+
+
+def flatten(settings, prefix=''):
+    """
+    :param settings: Nested index settings, e.g. ``{'index': {'blocks': {...}}}``
+    :param prefix: The dotted path of ``settings`` itself
+
+    :type settings: dict
+    :type prefix: str
+
+    :returns: Each leaf value of ``settings`` by its dotted path, e.g.
+        ``{'index.blocks.write': True}``
+    :rtype: dict
+    """
+    flat = {}
+    for key, value in settings.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{path}.'))
+        else:
+            flat[path] = value
+    return flat
+
+
+def as_setting(value):
+    """
+    :param value: A setting value from an action file
+
+    :returns: ``value`` as OpenSearch returns it from the get settings API: a
+        string, a list of strings or ``None``
+    """
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (list, tuple)):
+        return [as_setting(item) for item in value]
+    if value is None:
+        return None
+    return str(value)
 
 
 class IndexSettings:
@@ -17,6 +56,7 @@ class IndexSettings:
         index_settings=None,
         ignore_unavailable=False,
         preserve_existing=False,
+        skip_unchanged=False,
     ):
         """
         :param ilo: An IndexList Object
@@ -27,11 +67,15 @@ class IndexSettings:
         :param preserve_existing: Whether to update existing settings. If set to
             ``True``, existing settings on an index remain unchanged. The default
             is ``False``
+        :param skip_unchanged: Whether to compare the current settings of every
+            index first, and only update the indices that differ, grouped by the
+            settings they need
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type index_settings: dict
         :type ignore_unavailable: bool
         :type preserve_existing: bool
+        :type skip_unchanged: bool
         """
         if index_settings is None:
             index_settings = {}
@@ -50,6 +94,8 @@ class IndexSettings:
         self.ignore_unavailable = ignore_unavailable
         #: Object attribute that gets the value of param ``preserve_existing``.
         self.preserve_existing = preserve_existing
+        #: Object attribute that gets the value of param ``skip_unchanged``.
+        self.skip_unchanged = skip_unchanged
 
         self.loggit = logging.getLogger('curator.actions.index_settings')
         self._body_check()
@@ -119,9 +165,95 @@ class IndexSettings:
                 )
                 self.loggit.warning(msg)
 
+    def get_changes(self):
+        """
+        Get the current value of each setting in :py:attr:`body` for every index in
+        :py:attr:`index_list`, one chunk of indices at a time, and compare them.
+        A setting an index does not have always differs. With
+        :py:attr:`preserve_existing`, only those do.
+
+        :returns: The indices that need each distinct set of changes, as
+            ``(settings, indices)`` pairs, where ``settings`` maps dotted setting
+            names to values, and the indices that need no change
+        :rtype: tuple
+        """
+        wanted = flatten(self.body)
+        filter_path = ','.join(f'*.settings.{path}' for path in wanted)
+        current = {}
+        for lst in chunk_index_list(self.index_list.indices):
+            response = self.client.indices.get_settings(
+                index=to_csv(lst),
+                filter_path=filter_path,
+                ignore_unavailable=self.ignore_unavailable,
+            )
+            for index, data in (response or {}).items():
+                current[index] = flatten(data.get('settings', {}))
+        groups = {}
+        unchanged = []
+        for index in self.index_list.indices:
+            have = current.get(index, {})
+            changes = tuple(
+                path
+                for path, value in wanted.items()
+                if path not in have
+                or (not self.preserve_existing and have[path] != as_setting(value))
+            )
+            if changes:
+                groups.setdefault(changes, []).append(index)
+            else:
+                unchanged.append(index)
+        changes = [
+            ({path: wanted[path] for path in paths}, indices)
+            for paths, indices in groups.items()
+        ]
+        return changes, unchanged
+
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
-        show_dry_run(self.index_list, 'indexsettings', **self.body)
+        if not self.skip_unchanged:
+            show_dry_run(self.index_list, 'indexsettings', **self.body)
+            return
+        self.loggit.info('DRY-RUN MODE.  No changes will be made.')
+        changes, unchanged = self.get_changes()
+        for settings, indices in changes:
+            self.loggit.info(
+                'DRY-RUN: indexsettings: %s with %s', to_csv(indices), settings
+            )
+        self.loggit.info(
+            'DRY-RUN: indexsettings: %s of %s indices already have the settings',
+            len(unchanged),
+            len(self.index_list.indices),
+        )
+
+    def apply_changes(self):
+        """
+        Update only the indices in :py:attr:`index_list` whose settings differ from
+        :py:attr:`body`, with one
+        :py:meth:`~.elasticsearch.client.IndicesClient.put_settings` call per chunk
+        of indices that need the same changes. The indices that need no change are
+        removed from :py:attr:`index_list`, so that they are not counted as acted
+        on.
+        """
+        changes, unchanged = self.get_changes()
+        self.loggit.info(
+            'Skipping %s of %s indices that already have the settings',
+            len(unchanged),
+            len(self.index_list.indices),
+        )
+        TRACER.current_span().set_attribute('items.unchanged', len(unchanged))
+        self.index_list.indices = [index for _, indices in changes for index in indices]
+        for settings, indices in changes:
+            self.loggit.info(
+                'Applying %s to %s indices: %s', settings, len(indices), indices
+            )
+            for lst in chunk_index_list(indices):
+                response = self.client.indices.put_settings(
+                    index=to_csv(lst),
+                    body=settings,
+                    ignore_unavailable=self.ignore_unavailable,
+                    preserve_existing=self.preserve_existing,
+                )
+                self.loggit.debug('PUT SETTINGS RESPONSE: %s', response)
 
     def do_action(self):
         """
@@ -132,6 +264,13 @@ class IndexSettings:
         # Ensure that the open indices filter applied in _settings_check()
         # didn't result in an empty list (or otherwise empty)
         self.index_list.empty_list_check()
+        if self.skip_unchanged:
+            try:
+                self.apply_changes()
+            # pylint: disable=broad-except
+            except Exception as err:
+                report_failure(err)
+            return
         msg = (
             f'Applying index settings to {len(self.index_list.indices)} indices: '
             f'{self.index_list.indices}'
@@ -1,18 +1,43 @@
 """Open index action class"""
 
 import logging
+from time import monotonic
+from curator.defaults.settings import INITIAL_PRIMARIES_RECOVERIES
 from curator.helpers.testers import verify_index_list
 from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
+from curator.helpers.waiters import wait_for_it
+from opensearch_client.tracing import TRACER
+
+#: The cluster setting that limits how many primaries a node recovers at once
+INITIAL_PRIMARIES = 'cluster.routing.allocation.node_initial_primaries_recoveries'
 
 
 class Open:
     """Open Action Class"""
 
-    def __init__(self, ilo):
+    def __init__(
+        self,
+        ilo,
+        wait_for_completion=False,
+        wait_interval=3,
+        max_wait=-1,
+        wave_size=None,
+    ):
         """
         :param ilo: An IndexList Object
+        :param wait_for_completion: Wait until the opened indices are ``green``
+            before returning. The indices are opened in waves of as many primary
+            shards as the cluster recovers at once, unless ``wave_size`` is set.
+        :param wait_interval: Seconds to wait between completion checks.
+        :param max_wait: Maximum number of seconds to ``wait_for_completion``
+        :param wave_size: Open at most this many indices at a time, and wait for
+            each wave to be ``green`` before opening the next
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
+        :type wait_for_completion: bool
+        :type wait_interval: int
+        :type max_wait: int
+        :type wave_size: int
         """
         verify_index_list(ilo)
         #: The :py:class:`~.curator.indexlist.IndexList` object passed from
@@ -21,16 +46,140 @@ class Open:
         #: The :py:class:`~.opensearchpy.OpenSearch` client object derived from
         #: :py:attr:`index_list`
         self.client = ilo.client
+        #: Object attribute that gets the value of param ``wait_for_completion``.
+        self.wfc = wait_for_completion
+        #: Object attribute that gets the value of param ``wait_interval``.
+        self.wait_interval = wait_interval
+        #: Object attribute that gets the value of param ``max_wait``.
+        self.max_wait = max_wait
+        #: Object attribute that gets the value of param ``wave_size``.
+        self.wave_size = wave_size
         self.loggit = logging.getLogger('curator.actions.open')
 
+    def recovery_capacity(self):
+        """
+        :returns: How many primary shards the cluster recovers from local disk at
+            once: the number of data nodes times the
+            ``cluster.routing.allocation.node_initial_primaries_recoveries``
+            setting
+        :rtype: int
+        """
+        settings = self.client.cluster.get_settings(
+            flat_settings=True, filter_path='persistent,transient'
+        )
+        per_node = INITIAL_PRIMARIES_RECOVERIES
+        # Transient settings take precedence over persistent ones
+        for scope in ['persistent', 'transient']:
+            per_node = int(settings.get(scope, {}).get(INITIAL_PRIMARIES, per_node))
+        health = self.client.cluster.health(filter_path='number_of_data_nodes')
+        nodes = max(health.get('number_of_data_nodes', 1), 1)
+        self.loggit.debug(
+            '%s data nodes recover %s primaries each at once', nodes, per_node
+        )
+        return nodes * per_node
+
+    def shards(self, index, replicas=False):
+        """
+        :param index: The index name
+        :param replicas: Whether to count replica shards too
+
+        :type index: str
+        :type replicas: bool
+
+        :returns: The number of shards of ``index``
+        :rtype: int
+        """
+        info = self.index_list.index_info[index]
+        shards = int(info['number_of_shards'])
+        if replicas:
+            shards *= 1 + int(info['number_of_replicas'])
+        return shards
+
+    def waves(self):
+        """
+        Split :py:attr:`index_list` into waves of at most :py:attr:`wave_size`
+        indices or, with :py:attr:`wfc` and no ``wave_size``, of at most
+        :py:meth:`recovery_capacity` primary shards. Otherwise, there is one wave.
+
+        :returns: The indices of each wave
+        :rtype: list
+        """
+        indices = self.index_list.indices
+        if self.wave_size:
+            return [
+                indices[pos : pos + self.wave_size]
+                for pos in range(0, len(indices), self.wave_size)
+            ]
+        if not self.wfc:
+            return [indices]
+        capacity = self.recovery_capacity()
+        self.index_list.get_index_settings()
+        waves = [[]]
+        shards = 0
+        for index in indices:
+            count = self.shards(index)
+            if waves[-1] and shards + count > capacity:
+                waves.append([])
+                shards = 0
+            waves[-1].append(index)
+            shards += count
+        return waves
+
+    def open_wave(self, indices, wait=True):
+        """
+        :py:meth:`~.elasticsearch.client.IndicesClient.open` ``indices``, one chunk
+        at a time and, if ``wait``, wait until they are ``green`` and log how many
+        shards they recovered per second.
+
+        :param indices: The indices to open
+        :param wait: Whether to wait for the indices
+
+        :type indices: list
+        :type wait: bool
+
+        :returns: How many shards were recovered, and in how many seconds
+        :rtype: tuple
+        """
+        start = monotonic()
+        for lst in chunk_index_list(indices):
+            self.client.indices.open(index=to_csv(lst))
+        if not wait:
+            return 0, monotonic() - start
+        wait_for_it(
+            self.client,
+            'open',
+            index_list=indices,
+            wait_interval=self.wait_interval,
+            max_wait=self.max_wait,
+        )
+        shards = sum(self.shards(index, replicas=True) for index in indices)
+        seconds = monotonic() - start
+        self.loggit.info(
+            'Opened %s indices, %s shards in %.1f seconds (%.1f shards/s)',
+            len(indices),
+            shards,
+            seconds,
+            shards / seconds if seconds > 0 else 0,
+        )
+        return shards, seconds
+
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
         show_dry_run(self.index_list, 'open')
+        waves = self.waves()
+        if len(waves) > 1:
+            self.loggit.info(
+                'DRY-RUN: open: %s indices in %s waves of at most %s indices',
+                len(self.index_list.indices),
+                len(waves),
+                max(len(wave) for wave in waves),
+            )
 
     def do_action(self):
         """
         :py:meth:`~.elasticsearch.client.IndicesClient.open` indices in
-        :py:attr:`index_list`
+        :py:attr:`index_list`, in :py:meth:`waves`. Each wave but the last, and
+        the last with :py:attr:`wfc`, is waited on before going on.
         """
         self.index_list.empty_list_check()
         msg = (
@@ -39,9 +188,30 @@ class Open:
         )
         self.loggit.info(msg)
         try:
-            index_lists = chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
-                self.client.indices.open(index=to_csv(lst))
+            waves = self.waves()
+            if len(waves) == 1 and not self.wfc:
+                self.open_wave(waves[0], wait=False)
+                return
+            # Shard counts are needed for the throughput
+            self.index_list.get_index_settings()
+            shards = seconds = 0
+            for num, indices in enumerate(waves, start=1):
+                if len(waves) > 1:
+                    self.loggit.info('Open wave %s of %s', num, len(waves))
+                with TRACER.span('open.wave', wave=num, indices=len(indices)):
+                    wave = self.open_wave(indices, wait=self.wfc or num < len(waves))
+                shards += wave[0]
+                seconds += wave[1]
+            if self.wfc and len(waves) > 1:
+                self.loggit.info(
+                    'Opened %s indices in %s waves, %s shards in %.1f seconds '
+                    '(%.1f shards/s)',
+                    len(self.index_list.indices),
+                    len(waves),
+                    shards,
+                    seconds,
+                    shards / seconds if seconds > 0 else 0,
+                )
         # pylint: disable=broad-except
         except Exception as err:
             report_failure(err)
@@ -1,11 +1,27 @@
 """Open index action class"""
 
 import logging
+import time
 from copy import deepcopy
-from curator.exceptions import ConfigurationError
+from opensearch_client.utils import ensure_list
+from curator.exceptions import ConfigurationError, FailedExecution
 from curator.helpers.date_ops import parse_date_pattern
-from curator.helpers.testers import rollable_alias, verify_client_object
-from curator.helpers.utils import report_failure
+from curator.helpers.testers import (
+    rollable_alias,
+    rollable_aliases,
+    verify_client_object,
+)
+from curator.helpers.utils import (
+    chunk_index_list,
+    parse_byte_size,
+    parse_time_value,
+    report_failure,
+    run_concurrently,
+)
+
+#: The rollover conditions that :py:meth:`Rollover.conditions_met` can evaluate
+#: from ``_cat/indices``
+LOCAL_CONDITIONS = ('max_age', 'max_docs', 'max_size')
 
 
 class Rollover:
@@ -19,11 +35,13 @@ class Rollover:
         new_index=None,
         extra_settings=None,
         wait_for_active_shards=1,
+        concurrency=4,
     ):
         """
         :param client: A client connection object
         :param name: The name of the single-index-mapped alias to test for rollover
-            conditions.
+            conditions. A list of alias names or wildcard patterns, or a single
+            pattern, rolls over every matching alias that meets ``conditions``.
         :param new_index: A new index name
         :param conditions: Conditions to test
         :param extra_settings: Must be either ``None``, or a dictionary of settings
@@ -32,13 +50,16 @@ class Rollover:
             in other places here in Curator
         :param wait_for_active_shards: The number of shards expected to be active
             before returning.
+        :param concurrency: With several aliases, how many rollover requests to
+            have in flight at once
 
         :type client: :py:class:`~.opensearchpy.OpenSearch`
-        :type name: str
+        :type name: str or list
         :type new_index: str
         :type conditions: dict
         :type extra_settings: dict or None
         :type wait_for_active_shards: int
+        :type concurrency: int
         """
         self.loggit = logging.getLogger('curator.actions.rollover')
         if not isinstance(conditions, dict):
@@ -60,8 +81,27 @@ class Rollover:
         #: Object attribute that gets the value of param ``wait_for_active_shards``.
         self.wait_for_active_shards = wait_for_active_shards
 
+        #: Object attribute that gets the value of param ``concurrency``.
+        self.concurrency = concurrency
+
         #: Object attribute that gets the value of param ``name``.
         self.name = None
+        #: With several aliases, the index each rollable alias points to, keyed by
+        #: alias. Otherwise ``None``.
+        self.targets = None
+        if isinstance(name, list) or '*' in str(name):
+            if new_index:
+                raise ConfigurationError(
+                    '"new_index" cannot be used to roll over several aliases'
+                )
+            self.targets = rollable_aliases(client, sorted(set(ensure_list(name))))
+            if not self.targets:
+                raise ValueError(
+                    f'No aliases matching {name} can be rolled over. See previous '
+                    f'logs for more details.'
+                )
+            self.loggit.debug('Rollover targets: %s', self.targets)
+            return
         # Verify that `conditions` and `settings` are good?
         # Verify that `name` is an alias, and is only mapped to one index.
         if rollable_alias(client, name):
@@ -98,12 +138,18 @@ class Rollover:
             )
             self.loggit.info(msg)
 
-    def doit(self, dry_run=False):
+    def doit(self, dry_run=False, alias=None):
         """
         This exists solely to prevent having to have duplicate code in both
         :py:meth:`do_dry_run` and :py:meth:`do_action` because
         :py:meth:`~.elasticsearch.client.IndicesClient.rollover` has its own
         ``dry_run`` flag.
+
+        :param dry_run: Only check the conditions
+        :param alias: The alias to roll over. Defaults to :py:attr:`name`
+
+        :type dry_run: bool
+        :type alias: str
         """
         payload = deepcopy(self.conditions)
         for key in ['max_docs', 'max_primary_shard_docs']:
@@ -114,24 +160,141 @@ class Rollover:
         if self.settings is not None:
             body['settings'] = self.settings
         return self.client.indices.rollover(
-            alias=self.name,
+            alias=alias or self.name,
             new_index=self.new_index,
             body=body,
             dry_run=dry_run,
             wait_for_active_shards=self.wait_for_active_shards,
         )
 
+    def index_stats(self, indices):
+        """
+        :param indices: The indices to get the stats of
+
+        :type indices: list
+
+        :returns: The creation time in seconds since the epoch, primary document
+            count and primary store size in bytes of each index, from
+            ``_cat/indices`` requests of at most one chunk of indices each
+        :rtype: dict
+        """
+        stats = {}
+        for chunk in chunk_index_list(indices):
+            for row in self.client.cat.indices(
+                index=','.join(chunk),
+                format='json',
+                bytes='b',
+                h='index,creation.date,docs.count,pri.store.size',
+            ):
+                stats[row['index']] = {
+                    key: int(row[field]) if row.get(field) is not None else None
+                    for key, field in [
+                        ('creation_date', 'creation.date'),
+                        ('docs', 'docs.count'),
+                        ('size', 'pri.store.size'),
+                    ]
+                }
+        return stats
+
+    def conditions_met(self, stats, now=None):
+        """
+        Evaluate :py:attr:`conditions` as the ``_rollover`` API would, for an index
+        with ``stats``. One condition met is enough.
+
+        :param stats: One index from :py:meth:`index_stats`
+        :param now: The current time in seconds since the epoch
+
+        :type stats: dict
+        :type now: float
+
+        :returns: Whether the conditions are met, or ``None`` if only OpenSearch
+            can tell
+        :rtype: bool
+        """
+        if not stats or any(key not in LOCAL_CONDITIONS for key in self.conditions):
+            return None
+        now = time.time() if now is None else now
+        met = False
+        try:
+            for key, value in self.conditions.items():
+                if key == 'max_age':
+                    age = now - stats['creation_date'] / 1000
+                    met = met or age >= parse_time_value(value)
+                elif key == 'max_docs':
+                    met = met or stats['docs'] >= int(value)
+                else:
+                    met = met or stats['size'] >= parse_byte_size(value)
+        except (TypeError, ValueError) as err:
+            self.loggit.debug('Unable to evaluate %s: %s', self.conditions, err)
+            return None
+        return met
+
+    def candidates(self):
+        """
+        :returns: The aliases in :py:attr:`targets` whose index meets
+            :py:attr:`conditions`, or that only OpenSearch can tell about. The
+            aliases that do not are logged.
+        :rtype: list
+        """
+        stats = self.index_stats(sorted(set(self.targets.values())))
+        now = time.time()
+        candidates = []
+        for alias, index in sorted(self.targets.items()):
+            if self.conditions_met(stats.get(index), now) is False:
+                self.loggit.info(
+                    'Rollover conditions not met. Index %s of alias %s not rolled '
+                    'over.',
+                    index,
+                    alias,
+                )
+            else:
+                candidates.append(alias)
+        self.loggit.info(
+            '%s of %s aliases may be rolled over', len(candidates), len(self.targets)
+        )
+        return candidates
+
+    def roll_all(self, dry_run=False):
+        """
+        :py:meth:`doit` for each of the :py:meth:`candidates`, with at most
+        :py:attr:`concurrency` requests in flight, and log each result.
+
+        :param dry_run: Only check the conditions
+
+        :type dry_run: bool
+        """
+        aliases = self.candidates()
+        done, failed = run_concurrently(
+            lambda alias: self.doit(dry_run, alias), aliases, self.concurrency
+        )
+        for _, result in done:
+            self.log_result(result)
+        for alias, err in failed:
+            self.loggit.error('Unable to roll over alias %s: %s', alias, err)
+        if failed:
+            raise FailedExecution(
+                f'Rollover failed for {len(failed)} of {len(aliases)} aliases: '
+                f'{sorted(alias for alias, _ in failed)}'
+            )
+
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
         self.loggit.info('DRY-RUN MODE.  No changes will be made.')
+        if self.targets is not None:
+            self.roll_all(dry_run=True)
+            return
         self.log_result(self.doit(dry_run=True))
 
     def do_action(self):
         """
         :py:meth:`~.elasticsearch.client.IndicesClient.rollover` the index
-        referenced by alias :py:attr:`name`
+        referenced by alias :py:attr:`name`, or by each alias in
+        :py:attr:`targets` that meets :py:attr:`conditions`
         """
         self.loggit.info('Performing index rollover')
+        if self.targets is not None:
+            self.roll_all()
+            return
         try:
             self.log_result(self.doit())
         # pylint: disable=broad-except
@@ -10,6 +10,7 @@ from curator.helpers.getters import (
     name_to_node_id,
     node_id_to_name,
     node_roles,
+    routing_filter_path,
 )
 from curator.helpers.testers import verify_index_list
 from curator.helpers.utils import chunk_index_list, report_failure
@@ -362,9 +363,11 @@ class Shrink:
             self.__log_action(error_msg, dry_run)
 
     def _check_all_shards(self, idx):
-        shards = self.client.cluster.state(index=idx)['routing_table']['indices'][idx][
-            'shards'
-        ]
+        shards = self.client.cluster.state(
+            index=idx,
+            metric='routing_table',
+            filter_path=routing_filter_path(idx, ['node', 'primary']),
+        )['routing_table']['indices'][idx]['shards']
         found = []
         for shardnum in shards:
             for shard_idx in range(0, len(shards[shardnum])):
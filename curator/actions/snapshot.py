@@ -4,7 +4,7 @@ import logging
 import re
 from opensearch_client.utils import ensure_list
 from curator.helpers.date_ops import parse_datemath, parse_date_pattern
-from curator.helpers.getters import get_indices
+from curator.helpers.getters import get_existing_indices
 from curator.helpers.testers import (
     repository_exists,
     snapshot_running,
@@ -293,6 +293,9 @@ class Restore(object):
         wait_interval=9,
         max_wait=-1,
         skip_repo_fs_check=True,
+        max_bytes_per_sec=None,
+        concurrent_recoveries=None,
+        wave_size=None,
     ):
         """
         :param slo: A SnapshotList object
@@ -317,6 +320,13 @@ class Restore(object):
             all cluster nodes before proceeding. Useful for shared filesystems
             where intermittent timeouts can affect validation, but won't likely
             affect snapshot success. (Default: ``True``)
+        :param max_bytes_per_sec: If set, ``indices.recovery.max_bytes_per_sec``
+            for the duration of the restore, e.g. ``500mb``
+        :param concurrent_recoveries: If set,
+            ``cluster.routing.allocation.node_concurrent_recoveries`` for the
+            duration of the restore
+        :param wave_size: If set, restore at most this many indices at a time, and
+            wait for each wave to recover before starting the next
 
         :type slo: :py:class:`~.curator.snapshotlist.SnapshotList`
         :type name: str
@@ -332,6 +342,9 @@ class Restore(object):
         :type wait_interval: int
         :type max_wait: int
         :type skip_repo_fs_check: bool
+        :type max_bytes_per_sec: str
+        :type concurrent_recoveries: int
+        :type wave_size: int
         """
         if extra_settings is None:
             extra_settings = {}
@@ -364,7 +377,7 @@ class Restore(object):
         if indices:
             self.indices = ensure_list(indices)
         else:
-            self.indices = slo.snapshot_info[self.name]['indices']
+            self.indices = slo.snapshot_indices(self.name)
         self.loggit.debug('self.indices: %s', self.indices)
         #: Object attribute that gets the value of param ``wait_for_completion``.
         self.wfc = wait_for_completion
@@ -385,6 +398,25 @@ class Restore(object):
         self.py_rename_replacement = self.rename_replacement.replace('$', '\\')
         #: Object attribute that gets the value of param ``max_wait``.
         self.skip_repo_fs_check = skip_repo_fs_check
+        #: Transient cluster settings to apply for the duration of the restore,
+        #: derived from params ``max_bytes_per_sec`` and ``concurrent_recoveries``
+        self.recovery_settings = {}
+        if max_bytes_per_sec is not None:
+            self.recovery_settings['indices.recovery.max_bytes_per_sec'] = str(
+                max_bytes_per_sec
+            )
+        if concurrent_recoveries is not None:
+            self.recovery_settings[
+                'cluster.routing.allocation.node_concurrent_recoveries'
+            ] = str(concurrent_recoveries)
+        if self.recovery_settings and not self.wfc:
+            self.loggit.warning(
+                'Cluster settings %s are reset as soon as the restore starts, '
+                'because wait_for_completion is False',
+                self.recovery_settings,
+            )
+        #: Object attribute that gets the value of param ``wave_size``.
+        self.wave_size = wave_size
 
         #: Object attribute that gets populated from other params/attributes.
         #: Deprecated, but not removed. Lazy way to keep from updating
@@ -423,46 +455,108 @@ class Restore(object):
         self.loggit.debug('REPOSITORY: %s', self.repository)
         self.loggit.debug('WAIT_FOR_COMPLETION: %s', self.wfc)
         self.loggit.debug('SKIP_REPO_FS_CHECK: %s', self.skip_repo_fs_check)
+        self.loggit.debug('RECOVERY_SETTINGS: %s', self.recovery_settings)
         self.loggit.debug('BODY: %s', self.body)
         self._get_expected_output()
 
     def _get_expected_output(self):
-        if self.indices == self.snapshot_list.snapshot_info[self.name]['indices']:
+        snapshot_indices = self.snapshot_list.snapshot_indices(self.name)
+        if self.indices == snapshot_indices:
             indices = self.indices
         else:
-            indices = multitarget_match(
-                to_csv(self.indices),
-                self.snapshot_list.snapshot_info[self.name]['indices'],
-            )
+            indices = multitarget_match(to_csv(self.indices), snapshot_indices)
+        #: The names in the snapshot of the indices to restore
+        self.source_indices = indices
         if not self.rename_pattern and not self.rename_replacement:
             self.expected_output = indices
             self.loggit.debug('Expected output: %s', indices)
             return  # Don't stick around if we're not replacing anything
         self.expected_output = []
         for index in indices:
-            self.expected_output.append(
-                re.sub(self.rename_pattern, self.py_rename_replacement, index)
-            )
+            self.expected_output.append(self._rename(index))
             msg = f'index: {index} replacement: {self.expected_output[-1]}'
             self.loggit.debug(msg)
 
+    def _rename(self, index):
+        """
+        :returns: The name ``index`` will have once restored
+        :rtype: str
+        """
+        if not self.rename_pattern and not self.rename_replacement:
+            return index
+        return re.sub(self.rename_pattern, self.py_rename_replacement, index)
+
+    def waves(self):
+        """
+        Split the restore into waves of at most :py:attr:`wave_size` indices.
+        Without a ``wave_size``, there is one wave of :py:attr:`indices`, as
+        configured.
+
+        :returns: ``(indices, expected output)`` for each wave
+        :rtype: list
+        """
+        if not self.wave_size or len(self.source_indices) <= self.wave_size:
+            return [(self.indices, self.expected_output)]
+        waves = []
+        for pos in range(0, len(self.source_indices), self.wave_size):
+            indices = self.source_indices[pos : pos + self.wave_size]
+            waves.append((indices, [self._rename(index) for index in indices]))
+        return waves
+
+    def apply_recovery_settings(self):
+        """
+        Set :py:attr:`recovery_settings` as transient cluster settings.
+
+        :returns: The transient values they replace, ``None`` where a setting was
+            not set, to hand to :py:meth:`reset_recovery_settings`
+        :rtype: dict
+        """
+        current = self.client.cluster.get_settings(
+            flat_settings=True, filter_path='transient'
+        ).get('transient', {})
+        previous = {key: current.get(key) for key in self.recovery_settings}
+        self.loggit.info(
+            'Setting %s for the restore. Previous values: %s',
+            self.recovery_settings,
+            previous,
+        )
+        self.client.cluster.put_settings(body={'transient': self.recovery_settings})
+        return previous
+
+    def reset_recovery_settings(self, previous):
+        """
+        Put back the transient cluster settings that
+        :py:meth:`apply_recovery_settings` replaced. ``None`` removes a setting.
+
+        :param previous: The transient values to put back
+
+        :type previous: dict
+        """
+        self.loggit.info('Resetting %s after the restore', previous)
+        try:
+            self.client.cluster.put_settings(body={'transient': previous})
+        except Exception as err:
+            self.loggit.error(
+                'Unable to reset cluster settings %s. Reset them manually. '
+                'Error: %s',
+                previous,
+                err,
+            )
+
     def report_state(self):
         """
         Log the state of the restore. This should only be done if
         ``wait_for_completion`` is ``True``, and only after completing the restore.
         """
-        all_indices = get_indices(self.client)
-        self.loggit.debug('All indices: %s', all_indices)
         self.loggit.debug('Expected output: %s', self.expected_output)
-        found_count = 0
+        existing = get_existing_indices(self.client, self.expected_output)
         missing = []
         for index in self.expected_output:
-            if index in all_indices:
-                found_count += 1
+            if index in existing:
                 self.loggit.info('Found restored index %s', index)
             else:
                 missing.append(index)
-        if found_count == len(self.expected_output):
+        if not missing:
             self.loggit.info('All indices appear to have been restored.')
         else:
             msg = (
@@ -489,53 +583,40 @@ class Restore(object):
             else:
                 rmsg = ''
             self.loggit.info('DRY-RUN: restore: Index %s %s', index, rmsg)
+        if self.recovery_settings:
+            self.loggit.info(
+                'DRY-RUN: restore: Transient cluster settings during the restore: %s',
+                self.recovery_settings,
+            )
+        waves = self.waves()
+        if len(waves) > 1:
+            self.loggit.info(
+                'DRY-RUN: restore: %s indices in %s waves of at most %s',
+                len(self.source_indices),
+                len(waves),
+                self.wave_size,
+            )
 
     def do_action(self):
         """
         :py:meth:`~.elasticsearch.client.SnapshotClient.restore` :py:attr:`indices` from
-        :py:attr:`name` with passed params.
+        :py:attr:`name` with passed params, in :py:meth:`waves`. Any
+        :py:attr:`recovery_settings` are in place until Curator stops waiting.
         """
         if not self.skip_repo_fs_check:
             verify_repository(self.client, self.repository)
         if snapshot_running(self.client):
             raise SnapshotInProgress('Cannot restore while a snapshot is in progress.')
+        previous = None
         try:
-            self.loggit.info(
-                'Restoring indices "%s" from snapshot: %s', self.indices, self.name
-            )
-            # Always set wait_for_completion to False. Let 'wait_for_it' do its
-            # thing if wait_for_completion is set to True. Report the task_id
-            # either way.
-            # opensearch-py 3.0: restore parameters go in body dict, wait_for_completion in params
-            restore_body = {
-                'indices': self.indices,
-                'ignore_unavailable': self.ignore_unavailable,
-                'include_aliases': self.include_aliases,
-                'include_global_state': self.include_global_state,
-                'partial': self.partial,
-            }
-            # Add optional parameters only if they have values
-            if self.rename_pattern:
-                restore_body['rename_pattern'] = self.rename_pattern
-            if self.rename_replacement:
-                restore_body['rename_replacement'] = self.rename_replacement
-            if self.index_settings:
-                restore_body['index_settings'] = self.index_settings
-
-            self.client.snapshot.restore(
-                repository=self.repository,
-                snapshot=self.name,
-                body=restore_body,
-                params={'wait_for_completion': 'false'},
-            )
+            if self.recovery_settings:
+                previous = self.apply_recovery_settings()
+            waves = self.waves()
+            for num, (indices, expected) in enumerate(waves, start=1):
+                if len(waves) > 1:
+                    self.loggit.info('Restore wave %s of %s', num, len(waves))
+                self._restore(indices, expected, first=num == 1, last=num == len(waves))
             if self.wfc:
-                wait_for_it(
-                    self.client,
-                    'restore',
-                    index_list=self.expected_output,
-                    wait_interval=self.wait_interval,
-                    max_wait=self.max_wait,
-                )
                 self.report_state()
             else:
                 msg = (
@@ -545,3 +626,57 @@ class Restore(object):
                 self.loggit.warning(msg)
         except Exception as err:
             report_failure(err)
+        finally:
+            if previous is not None:
+                self.reset_recovery_settings(previous)
+
+    def _restore(self, indices, expected, first=True, last=True):
+        """
+        Restore ``indices`` and, unless this is the ``last`` wave and
+        :py:attr:`wfc` is ``False``, wait for them to recover. The global state is
+        only restored with the ``first`` wave.
+
+        :param indices: The indices to restore
+        :param expected: Their names once restored
+        :param first: Whether this is the first wave
+        :param last: Whether this is the last wave
+
+        :type indices: list
+        :type expected: list
+        :type first: bool
+        :type last: bool
+        """
+        self.loggit.info('Restoring indices "%s" from snapshot: %s', indices, self.name)
+        # Always set wait_for_completion to False. Let 'wait_for_it' do its
+        # thing if wait_for_completion is set to True. Report the task_id
+        # either way.
+        # opensearch-py 3.0: restore parameters go in body dict, wait_for_completion in params
+        restore_body = {
+            'indices': indices,
+            'ignore_unavailable': self.ignore_unavailable,
+            'include_aliases': self.include_aliases,
+            'include_global_state': self.include_global_state and first,
+            'partial': self.partial,
+        }
+        # Add optional parameters only if they have values
+        if self.rename_pattern:
+            restore_body['rename_pattern'] = self.rename_pattern
+        if self.rename_replacement:
+            restore_body['rename_replacement'] = self.rename_replacement
+        if self.index_settings:
+            restore_body['index_settings'] = self.index_settings
+
+        self.client.snapshot.restore(
+            repository=self.repository,
+            snapshot=self.name,
+            body=restore_body,
+            params={'wait_for_completion': 'false'},
+        )
+        if self.wfc or not last:
+            wait_for_it(
+                self.client,
+                'restore',
+                index_list=expected,
+                wait_interval=self.wait_interval,
+                max_wait=self.max_wait,
+            )
@@ -1,13 +1,36 @@
 """Other Classes"""
 
+import hashlib
+import inspect
+import json
 import logging
+import os
+from functools import lru_cache
+from opensearch_client import schemacheck
 from opensearch_client.exceptions import FailedValidation
 from opensearch_client.schemacheck import password_filter
 from opensearch_client.utils import get_yaml
 from curator import IndexList, SnapshotList
+from curator._version import __version__
 from curator.actions import CLASS_MAP
+from curator.defaults import filter_elements, filtertypes, option_defaults, settings
 from curator.exceptions import ConfigurationError
+from curator.helpers import testers
 from curator.helpers.testers import validate_actions
+from curator.validators import actions, filter_functions, options
+
+#: The modules whose source determines the result of validating an action file
+SCHEMA_MODULES = (
+    actions,
+    filter_functions,
+    options,
+    filter_elements,
+    filtertypes,
+    option_defaults,
+    settings,
+    testers,
+    schemacheck,
+)
 
 # Let me tell you the story of the nearly wasted afternoon and the research that went
 # into this seemingly simple work-around. Actually, no. It's even more wasted time
@@ -17,6 +40,22 @@ from curator.helpers.testers import validate_actions
 # cleanly pass *args and **kwargs to the individual action classes of CLASS_MAP.
 
 
+@lru_cache(maxsize=None)
+def schema_hash():
+    """
+    :returns: The sha256 hex digest of the source of :py:const:`SCHEMA_MODULES`, or
+        ``None`` if the source is not available.
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    try:
+        for module in SCHEMA_MODULES:
+            digest.update(inspect.getsource(module).encode('utf-8'))
+    except (OSError, TypeError):
+        return None
+    return digest.hexdigest()
+
+
 class Wrapper:
     """Wrapper Class"""
 
@@ -46,8 +85,11 @@ class ActionsFile:
     Individual actions are :py:class:`~.curator.classdef.ActionDef` objects
     """
 
-    def __init__(self, action_file):
+    def __init__(self, action_file, cache_dir=None):
         self.logger = logging.getLogger(__name__)
+        #: The directory to read and write the validated form of ``action_file`` from
+        #: and to, if set. See :py:meth:`cache_file`
+        self.cache_dir = cache_dir
         #: The full, validated configuration from ``action_file``.
         self.fullconfig = self.get_validated(action_file)
         self.logger.debug('Action Configuration: %s', password_filter(self.fullconfig))
@@ -59,17 +101,151 @@ class ActionsFile:
 
     def get_validated(self, action_file):
         """
+        If :py:attr:`cache_dir` is set and a cached copy matching the content hash of
+        ``action_file`` exists, return it without validating again. Otherwise validate
+        and try to cache the result.
+
         :param action_file: The path to a valid YAML action configuration file
         :type action_file: str
 
         :returns: The result from passing ``action_file`` to
             :py:func:`~.curator.helpers.testers.validate_actions`
         """
+        digest = self.content_hash(action_file) if self.cache_dir else None
+        if digest:
+            cached = self.load_cached(action_file, digest)
+            if cached is not None:
+                return cached
         try:
-            return validate_actions(get_yaml(action_file))
+            validated = validate_actions(get_yaml(action_file))
         except (FailedValidation, UnboundLocalError) as err:
             self.logger.critical('Configuration Error: %s', err)
             raise ConfigurationError from err
+        if digest:
+            self.save_cached(action_file, digest, validated)
+        return validated
+
+    def content_hash(self, action_file):
+        """
+        Files using ``${VAR}`` environment variable substitution are not cached, as
+        the validated result depends on the environment and may contain secrets.
+
+        :param action_file: The path to a YAML action configuration file
+        :type action_file: str
+
+        :returns: The sha256 hex digest of the contents of ``action_file``, or ``None``
+            if it should not be cached.
+        :rtype: str
+        """
+        try:
+            with open(action_file, 'rb') as fhandle:
+                raw = fhandle.read()
+        except OSError:
+            # get_yaml will raise the appropriate error
+            return None
+        if b'${' in raw:
+            self.logger.debug('Not caching %s: uses environment variables', action_file)
+            return None
+        if schema_hash() is None:
+            self.logger.debug(
+                'Not caching %s: validator source unavailable', action_file
+            )
+            return None
+        return hashlib.sha256(raw).hexdigest()
+
+    def cache_file(self, action_file):
+        """
+        :param action_file: The path to a YAML action configuration file
+        :type action_file: str
+
+        :returns: The path of the cached, validated form of ``action_file`` in
+            :py:attr:`cache_dir`. It is named after ``action_file`` and a hash of its
+            absolute path, so that files with the same name do not share it.
+        :rtype: str
+        """
+        path = os.path.abspath(action_file)
+        pathhash = hashlib.sha256(path.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(
+            self.cache_dir, f'{os.path.basename(path)}.{pathhash}.validated.json'
+        )
+
+    def load_cached(self, action_file, digest):
+        """
+        :param action_file: The path to a YAML action configuration file
+        :type action_file: str
+        :param digest: The sha256 hex digest of the contents of ``action_file``
+        :type digest: str
+
+        :returns: The cached, validated configuration, or ``None`` if there is no
+            usable cache for ``digest``, this version of Curator and its validators.
+        :rtype: dict
+        """
+        path = self.cache_file(action_file)
+        try:
+            with open(path, 'r', encoding='utf-8') as fhandle:
+                cached = json.load(fhandle)
+            if (
+                cached['version'] != __version__
+                or cached['schema'] != schema_hash()
+                or cached['sha256'] != digest
+            ):
+                return None
+            # JSON keys are always strings, so action IDs are stored as pairs to
+            # preserve their original type and order.
+            actions = {action_id: action for action_id, action in cached['actions']}
+        except Exception:  # pylint: disable=broad-except
+            return None
+        self.logger.debug('Using cached validated configuration from %s', path)
+        return {'actions': actions}
+
+    def save_cached(self, action_file, digest, validated):
+        """
+        Write ``validated`` to :py:meth:`cache_file`, but only if it survives a round
+        trip through JSON unchanged. :py:attr:`cache_dir` is created if need be.
+        Failure to write is logged as a warning, but is not an error.
+
+        :param action_file: The path to a YAML action configuration file
+        :type action_file: str
+        :param digest: The sha256 hex digest of the contents of ``action_file``
+        :type digest: str
+        :param validated: The validated configuration
+        :type validated: dict
+
+        :rtype: None
+        """
+        path = self.cache_file(action_file)
+        payload = {
+            'version': __version__,
+            'schema': schema_hash(),
+            'sha256': digest,
+            'actions': list(validated['actions'].items()),
+        }
+        tmpfile = f'{path}.{os.getpid()}.tmp'
+        try:
+            data = json.dumps(payload)
+            check = json.loads(data)['actions']
+        except (TypeError, ValueError) as err:
+            self.logger.debug(
+                'Validated configuration cannot be cached as JSON: %s', err
+            )
+            return
+        if {action_id: action for action_id, action in check} != validated['actions']:
+            self.logger.debug('Validated configuration cannot be cached as JSON')
+            return
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            fdesc = os.open(tmpfile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fdesc, 'w', encoding='utf-8') as fhandle:
+                fhandle.write(data)
+            os.replace(tmpfile, path)
+        except OSError as err:
+            self.logger.warning(
+                'Unable to cache validated configuration in %s: %s', self.cache_dir, err
+            )
+            try:
+                os.remove(tmpfile)
+            except OSError:
+                pass
 
     def parse_actions(self, all_actions):
         """Parse the individual actions found in ``all_actions['actions']``
@@ -3,7 +3,9 @@
 import sys
 import logging
 import click
+from opensearch_client.accounting import ACCOUNTING
 from opensearch_client.defaults import OPTION_DEFAULTS
+from opensearch_client.connection import request_stats
 from opensearch_client.config import (
     cli_opts,
     context_settings,
@@ -13,12 +15,18 @@ from opensearch_client.config import (
     options_from_dict,
 )
 from opensearch_client.logging import configure_logging
+from opensearch_client.tracing import TRACER, JsonLinesExporter
 from opensearch_client.exceptions import ESClientException
 from opensearch_client.utils import option_wrapper, prune_nones
 from curator.exceptions import ClientException, ConfigurationError
 from curator.classdef import ActionsFile
 from curator.defaults.settings import (
+    CLICK_API_STATS,
+    CLICK_CACHE_DIR,
     CLICK_DRYRUN,
+    CLICK_METRICS_FILE,
+    CLICK_PROFILE,
+    CLICK_TRACE,
     VERSION_MAX,
     VERSION_MIN,
     default_config_file,
@@ -26,7 +34,14 @@ from curator.defaults.settings import (
     snapshot_actions,
 )
 from curator.exceptions import NoIndices, NoSnapshots
-from curator.helpers.testers import ilm_policy_check
+from curator.helpers.date_ops import DATEMATH
+from curator.helpers.metrics import METRICS
+from curator.helpers.profiler import profiled
+from curator.helpers.testers import (
+    ilm_policy_check,
+    ilm_policy_indices,
+    rollable_aliases,
+)
 from curator._version import __version__
 
 ONOFF = {'on': '', 'off': 'no-'}
@@ -53,6 +68,9 @@ def ilm_action_skip(client, action_def):
     logger = logging.getLogger(__name__)
     if not action_def.allow_ilm and action_def.action not in snapshot_actions():
         if action_def.action == 'rollover':
+            name = action_def.options['name']
+            if isinstance(name, list) or '*' in name:
+                return ilm_aliases_skip(client, action_def)
             if ilm_policy_check(client, action_def.options['name']):
                 logger.info(
                     'Alias %s is associated with ILM policy.',
@@ -67,6 +85,32 @@ def ilm_action_skip(client, action_def):
     return False
 
 
+def ilm_aliases_skip(client, action_def):
+    """
+    Drop the aliases whose write index is associated with an ILM policy from a
+    rollover of several aliases. ``action_def.options['name']`` becomes the list of
+    the other aliases.
+
+    :param action_def: An action object
+    :type action_def: :py:class:`~.curator.classdef.ActionDef`
+
+    :returns: ``True`` if every alias that matched is associated with an ILM policy
+    :rtype: bool
+    """
+    logger = logging.getLogger(__name__)
+    name = action_def.options['name']
+    targets = rollable_aliases(client, name if isinstance(name, list) else [name])
+    managed = ilm_policy_indices(client, sorted(set(targets.values())))
+    keep = sorted(alias for alias, index in targets.items() if index not in managed)
+    for alias in sorted(set(targets) - set(keep)):
+        logger.info('Alias %s is associated with ILM policy.', alias)
+    if targets and not keep:
+        return True
+    if len(keep) < len(targets):
+        action_def.options['name'] = keep
+    return False
+
+
 def exception_handler(action_def, err):
     """Do the grunt work with the exception
 
@@ -138,6 +182,8 @@ def process_action(client, action_def, dry_run=False):
 
     # Set up the action
     logger.debug('Running "%s"', action_def.action.upper())
+    kind = None
+    selected = 0
     if action_def.action == 'alias':
         # Special behavior for this action, as it has 2 index lists
         action_def.instantiate('action_cls', **mykwargs)
@@ -147,9 +193,11 @@ def process_action(client, action_def, dry_run=False):
         action_def.instantiate(
             'alias_removes', client, search_pattern=ptrn, include_hidden=hidn
         )
+        kind = 'indices'
         if 'remove' in action_def.action_dict:
             logger.debug('Removing indices from alias "%s"', action_def.options['name'])
             action_def.alias_removes.iterate_filters(action_def.action_dict['remove'])
+            selected += len(action_def.alias_removes.indices)
             action_def.action_cls.remove(
                 action_def.alias_removes,
                 warn_if_no_indices=action_def.options['warn_if_no_indices'],
@@ -157,6 +205,7 @@ def process_action(client, action_def, dry_run=False):
         if 'add' in action_def.action_dict:
             logger.debug('Adding indices to alias "%s"', action_def.options['name'])
             action_def.alias_adds.iterate_filters(action_def.action_dict['add'])
+            selected += len(action_def.alias_adds.indices)
             action_def.action_cls.add(
                 action_def.alias_adds,
                 warn_if_no_indices=action_def.options['warn_if_no_indices'],
@@ -165,23 +214,57 @@ def process_action(client, action_def, dry_run=False):
         action_def.instantiate('action_cls', client, **mykwargs)
     else:
         if action_def.action in ['delete_snapshots', 'restore']:
+            kind = 'snapshots'
             mykwargs.pop('repository')  # We don't need to send this value to the action
+            # Only used by the SnapshotList
+            mykwargs.pop('page_size', None)
+            mykwargs.pop('snapshot_cache', None)
             action_def.instantiate(
-                'list_obj', client, repository=action_def.options['repository']
+                'list_obj',
+                client,
+                repository=action_def.options['repository'],
+                page_size=action_def.options.get('page_size'),
+                snapshot_cache=action_def.options.get('snapshot_cache'),
             )
         else:
+            kind = 'indices'
             action_def.instantiate(
                 'list_obj', client, search_pattern=ptrn, include_hidden=hidn
             )
         action_def.list_obj.iterate_filters({'filters': action_def.filters})
+        selected = len(getattr(action_def.list_obj, kind))
         logger.debug(f'Pre Instantiation Action kwargs: {mykwargs}')
         action_def.instantiate('action_cls', action_def.list_obj, **mykwargs)
+    if kind:
+        METRICS.selected(kind, selected)
+        TRACER.current_span().set_attribute('items.selected', selected)
     # Do the action
     if dry_run:
         action_def.action_cls.do_dry_run()
     else:
         logger.debug('Doing the action here.')
         action_def.action_cls.do_action()
+    if kind:
+        # Some actions narrow their list further in do_action
+        acted = 0 if dry_run else acted_count(action_def, kind)
+        METRICS.acted(kind, acted)
+        TRACER.current_span().set_attribute('items.acted', acted)
+
+
+def acted_count(action_def, kind):
+    """
+    :param action_def: An action object, after its action was done
+    :param kind: ``indices`` or ``snapshots``
+
+    :type action_def: :py:class:`~.curator.classdef.ActionDef`
+    :type kind: str
+
+    :returns: The number of ``kind`` items the action was performed on
+    :rtype: int
+    """
+    if action_def.action == 'alias':
+        return len(action_def.action_cls.actions)
+    return len(getattr(action_def.list_obj, kind))
 
 
 def run(ctx: click.Context) -> None:
@@ -194,65 +277,140 @@ def run(ctx: click.Context) -> None:
     """
     logger = logging.getLogger(__name__)
     logger.debug('action_file: %s', ctx.params['action_file'])
-    all_actions = ActionsFile(ctx.params['action_file'])
-    for idx in sorted(list(all_actions.actions.keys())):
-        action_def = all_actions.actions[idx]
-        # Skip to next action if 'disabled'
-        if action_def.disabled:
-            logger.info(
-                'Action ID: %s: "%s" not performed because "disable_action" '
-                'is set to True',
-                idx,
-                action_def.action,
-            )
-            continue
-        logger.info('Preparing Action ID: %s, "%s"', idx, action_def.action)
-
-        # Override the timeout, if specified, otherwise use the default.
-        if action_def.timeout_override:
-            ctx.obj['configdict']['opensearch']['client'][
-                'request_timeout'
-            ] = action_def.timeout_override
+    all_actions = ActionsFile(
+        ctx.params['action_file'], cache_dir=ctx.params.get('cache_dir')
+    )
+    ACCOUNTING.reset()
+    METRICS.reset()
+    DATEMATH.reset()
+    if ctx.params.get('trace'):
+        TRACER.add_exporter(JsonLinesExporter(ctx.params['trace']))
+    try:
+        with TRACER.span(
+            'curator.run',
+            action_file=ctx.params['action_file'],
+            dry_run=ctx.params['dry_run'],
+        ):
+            for idx in sorted(list(all_actions.actions.keys())):
+                action_def = all_actions.actions[idx]
+                with ACCOUNTING.scope(action=f'{idx}:{action_def.action}'):
+                    run_action(ctx, idx, action_def)
+        logger.info('All actions completed.')
+    finally:
+        api_summary(ctx.params.get('api_stats'))
+        if ctx.params.get('metrics_file'):
+            METRICS.write(ctx.params['metrics_file'], accounting=ACCOUNTING)
+        TRACER.shutdown()
+
+
+def run_action(ctx, idx, action_def):
+    """
+    :param ctx: The Click command context
+    :param idx: The action ID
+    :param action_def: The ``action`` object
 
-        # Create a client object for each action...
-        logger.info('Creating client object and testing connection')
+    :type ctx: :py:class:`Context <click.Context>`
+    :type idx: int
+    :type action_def: :py:class:`~.curator.classdef.ActionDef`
 
-        try:
-            client = get_client(
-                configdict=ctx.obj['configdict'],
-                version_max=VERSION_MAX,
-                version_min=VERSION_MIN,
-            )
-        except (ClientException, ESClientException) as exc:
-            # No matter where logging is set to go, make sure we dump these messages to
-            # the CLI
-            click.echo('Unable to establish client connection to OpenSearch!')
-            click.echo(f'Exception: {exc}')
-            sys.exit(1)
-        except ConfigurationError as err:
-            click.echo('Invalid client configuration detected.')
-            click.echo(f'Exception: {err}')
-            sys.exit(1)
-        except Exception as other:
-            logger.debug('Fatal exception encountered: %s', other)
-            sys.exit(-1)
-
-        # Filter ILM indices unless expressly permitted
-        if ilm_action_skip(client, action_def):
-            continue
-        #
-        # Process the action
-        #
-        msg = (
-            f'Trying Action ID: {idx}, "{action_def.action}": {action_def.description}'
+    Called by :py:func:`run` for each action in the action file
+    """
+    logger = logging.getLogger(__name__)
+    # Skip to next action if 'disabled'
+    if action_def.disabled:
+        logger.info(
+            'Action ID: %s: "%s" not performed because "disable_action" '
+            'is set to True',
+            idx,
+            action_def.action,
         )
+        return
+    logger.info('Preparing Action ID: %s, "%s"', idx, action_def.action)
+
+    # Override the timeout, if specified, otherwise use the default.
+    if action_def.timeout_override:
+        ctx.obj['configdict']['opensearch']['client'][
+            'request_timeout'
+        ] = action_def.timeout_override
+
+    # Create a client object for each action...
+    logger.info('Creating client object and testing connection')
+
+    try:
+        client = get_client(
+            configdict=ctx.obj['configdict'],
+            version_max=VERSION_MAX,
+            version_min=VERSION_MIN,
+        )
+    except (ClientException, ESClientException) as exc:
+        # No matter where logging is set to go, make sure we dump these messages to
+        # the CLI
+        click.echo('Unable to establish client connection to OpenSearch!')
+        click.echo(f'Exception: {exc}')
+        sys.exit(1)
+    except ConfigurationError as err:
+        click.echo('Invalid client configuration detected.')
+        click.echo(f'Exception: {err}')
+        sys.exit(1)
+    except Exception as other:
+        logger.debug('Fatal exception encountered: %s', other)
+        sys.exit(-1)
+
+    if ctx.params.get('metrics_file') and not METRICS.cluster:
+        METRICS.cluster = client.info().get('cluster_name', '')
+
+    # Filter ILM indices unless expressly permitted
+    if ilm_action_skip(client, action_def):
+        return
+    #
+    # Process the action
+    #
+    msg = f'Trying Action ID: {idx}, "{action_def.action}": {action_def.description}'
+    profile = ctx.params.get('profile')
+    attributes = {'action.id': idx, 'action.name': action_def.action}
+    with METRICS.action(idx, action_def.action) as record, TRACER.span(
+        'action', **attributes
+    ) as span:
         try:
             logger.info(msg)
-            process_action(client, action_def, dry_run=ctx.params['dry_run'])
+            with profiled(f'{idx}-{action_def.action}', profile):
+                process_action(client, action_def, dry_run=ctx.params['dry_run'])
         except Exception as err:
+            if isinstance(err, (NoIndices, NoSnapshots)) and action_def.iel:
+                record.skipped = True
+                span.set_attribute('skipped', True)
+            else:
+                record.failed = True
+                span.set_error(f'{type(err).__name__}: {err}')
             exception_handler(action_def, err)
-        logger.info('Action ID: %s, "%s" completed.', idx, action_def.action)
-    logger.info('All actions completed.')
+    logger.info('Action ID: %s, "%s" completed.', idx, action_def.action)
+    for stats in request_stats(client):
+        logger.debug('Request timer for %s: %s', stats.pop('host'), stats)
+
+
+def api_summary(api_stats=None):
+    """
+    Log a table of the API calls made by each action and filter, from
+    :py:data:`~.opensearch_client.accounting.ACCOUNTING`, and optionally write them
+    to a JSON file. Nothing is logged if no calls were made.
+
+    :param api_stats: The path of the JSON file
+
+    :type api_stats: str
+    """
+    logger = logging.getLogger(__name__)
+    if not ACCOUNTING.rows():
+        return
+    logger.info('API calls by action and filter:')
+    for line in ACCOUNTING.summary():
+        logger.info(line)
+    if api_stats:
+        try:
+            ACCOUNTING.write_json(api_stats)
+        except OSError as err:
+            logger.error(
+                'Unable to write API call statistics to %s: %s', api_stats, err
+            )
 
 
 @click.command(
@@ -261,6 +419,11 @@ def run(ctx: click.Context) -> None:
 )
 @options_from_dict(OPTION_DEFAULTS)
 @click_opt_wrap(*cli_opts('dry-run', settings=CLICK_DRYRUN))
+@click_opt_wrap(*cli_opts('api-stats', settings=CLICK_API_STATS))
+@click_opt_wrap(*cli_opts('metrics-file', settings=CLICK_METRICS_FILE))
+@click_opt_wrap(*cli_opts('profile', settings=CLICK_PROFILE))
+@click_opt_wrap(*cli_opts('trace', settings=CLICK_TRACE))
+@click_opt_wrap(*cli_opts('cache-dir', settings=CLICK_CACHE_DIR))
 @click.argument('action_file', type=click.Path(exists=True), nargs=1)
 @click.version_option(__version__, '-v', '--version', prog_name="curator")
 @click.pass_context
@@ -285,13 +448,24 @@ def cli(
     ssl_assert_hostname,
     ssl_assert_fingerprint,
     ssl_version,
+    pool_maxsize,
+    connection_class,
+    keep_alive,
+    max_retries,
+    retry_on_timeout,
     master_only,
     skip_version_test,
     loglevel,
     logfile,
     logformat,
     blacklist,
+    logqueue,
     dry_run,
+    api_stats,
+    metrics_file,
+    profile,
+    trace,
+    cache_dir,
     action_file,
 ):
     """
@@ -78,4 +78,6 @@ def alias(
         remove=remove,
         warn_if_no_indices=warn_if_no_indices,  # alias specific kwargs
     )
-    action.do_singleton_action(dry_run=ctx.obj['dry_run'])
+    action.do_singleton_action(
+        dry_run=ctx.obj['dry_run'], profile=ctx.obj.get('profile')
+    )
@@ -93,4 +93,6 @@ def allocation(
         filter_list,
         ignore_empty_list,
     )
-    action.do_singleton_action(dry_run=ctx.obj['dry_run'])
+    action.do_singleton_action(
+        dry_run=ctx.obj['dry_run'], profile=ctx.obj.get('profile')
+    )
@@ -17,6 +17,13 @@ from curator.cli_singletons.utils import validate_filter_json
 @click.option(
     '--skip_flush', is_flag=True, help='Skip flush phase for indices to be closed'
 )
+@click.option(
+    '--concurrency',
+    type=int,
+    default=1,
+    show_default=True,
+    help='Flush and close requests in flight at once. Above 1, close in phases',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -46,6 +53,7 @@ def close(
     search_pattern,
     delete_aliases,
     skip_flush,
+    concurrency,
     ignore_empty_list,
     allow_ilm_indices,
     include_hidden,
@@ -58,6 +66,7 @@ def close(
         'search_pattern': search_pattern,
         'skip_flush': skip_flush,
         'delete_aliases': delete_aliases,
+        'concurrency': concurrency,
         'allow_ilm_indices': allow_ilm_indices,
         'include_hidden': include_hidden,
     }
@@ -70,4 +79,6 @@ def close(
         filter_list,
         ignore_empty_list,
     )
-    action.do_singleton_action(dry_run=ctx.obj['dry_run'])
+    action.do_singleton_action(
+        dry_run=ctx.obj['dry_run'], profile=ctx.obj.get('profile')
+    )
@@ -221,4 +221,6 @@ def convert_index_to_remote(
         search_pattern,
         include_hidden=include_hidden,
     )
-    action.do_singleton_action(dry_run=ctx.obj['dry_run'])
+    action.do_singleton_action(
+        dry_run=ctx.obj['dry_run'], profile=ctx.obj.get('profile')
+    )
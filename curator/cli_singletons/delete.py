@@ -47,7 +47,9 @@ def delete_indices(
         filter_list,
         ignore_empty_list,
     )
-    action.do_singleton_action(dry_run=ctx.obj['dry_run'])
+    action.do_singleton_action(
+        dry_run=ctx.obj['dry_run'], profile=ctx.obj.get('profile')
+    )
 
 
 # Snapshots
@@ -55,6 +57,16 @@ def delete_indices(
 @click.option('--repository', type=str, required=True, help='Snapshot repository name')
 @click.option('--retry_count', type=int, help='Number of times to retry (max 3)')
 @click.option('--retry_interval', type=int, help='Time in seconds between retries')
+@click.option(
+    '--page_size',
+    type=int,
+    help='List snapshots this many at a time, keeping only compact metadata',
+)
+@click.option(
+    '--snapshot_cache',
+    type=str,
+    help='Directory in which to cache the metadata of completed snapshots',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -84,6 +96,8 @@ def delete_snapshots(
     repository,
     retry_count,
     retry_interval,
+    page_size,
+    snapshot_cache,
     ignore_empty_list,
     allow_ilm_indices,
     include_hidden,
@@ -95,6 +109,8 @@ def delete_snapshots(
     manual_options = {
         'retry_count': retry_count,
         'retry_interval': retry_interval,
+        'page_size': page_size,
+        'snapshot_cache': snapshot_cache,
         'allow_ilm_indices': allow_ilm_indices,
         'include_hidden': include_hidden,
     }
@@ -108,4 +124,6 @@ def delete_snapshots(
         ignore_empty_list,
         repository=repository,
     )
-    action.do_singleton_action(dry_run=ctx.obj['dry_run'])
+    action.do_singleton_action(
+        dry_run=ctx.obj['dry_run'], profile=ctx.obj.get('profile')
+    )
@@ -74,4 +74,6 @@ def forcemerge(
         filter_list,
         ignore_empty_list,
     )
-    action.do_singleton_action(dry_run=ctx.obj['dry_run'])
+    action.do_singleton_action(
+        dry_run=ctx.obj['dry_run'], profile=ctx.obj.get('profile')
+    )
@@ -3,10 +3,12 @@
 # pylint: disable=W0718,R0902,R0912,R0913,R0914,R0917
 import logging
 import sys
+from copy import deepcopy
 from voluptuous import Schema
 from opensearch_client.builder import Builder
 from opensearch_client.exceptions import FailedValidation
 from opensearch_client.schemacheck import SchemaCheck
+from opensearch_client.tracing import TRACER
 from opensearch_client.utils import prune_nones
 from curator import IndexList, SnapshotList
 from curator.actions import (
@@ -29,6 +31,7 @@ from curator.actions import (
 )
 from curator.defaults.settings import VERSION_MAX, VERSION_MIN, snapshot_actions
 from curator.exceptions import ConfigurationError, NoIndices, NoSnapshots
+from curator.helpers.profiler import profiled
 from curator.helpers.testers import validate_filters
 from curator.validators import options
 from curator.validators.filter_functions import validfilters
@@ -100,6 +103,9 @@ class CLIAction:
         else:
             self.options = option_dict
 
+        # These only apply to the SnapshotList, not to the action
+        self.page_size = self.options.pop('page_size', None)
+        self.snapshot_cache = self.options.pop('snapshot_cache', None)
         self.search_pattern = self.options.pop('search_pattern', '*')
         self.include_hidden = self.options.pop('include_hidden', False)
 
@@ -169,7 +175,7 @@ class CLIAction:
                 'options',
                 f'{self.action} singleton action "options"',
             ).result()
-            self.options = self.prune_excluded(_)
+            self.options = self.prune_excluded(deepcopy(_))
             # Remove this after the schema check, as the action class won't need
             # it as an arg
             if self.action in ['delete_snapshots', 'restore']:
@@ -213,7 +219,12 @@ class CLIAction:
     def get_list_object(self):
         """Get either a SnapshotList or IndexList object"""
         if self.action in snapshot_actions() or self.action == 'show_snapshots':
-            self.list_object = SnapshotList(self.client, repository=self.repository)
+            self.list_object = SnapshotList(
+                self.client,
+                repository=self.repository,
+                page_size=self.page_size,
+                snapshot_cache=self.snapshot_cache,
+            )
         else:
             self.list_object = IndexList(
                 self.client,
@@ -245,23 +256,39 @@ class CLIAction:
                 fltr(self.alias[k]['ilo'], warn_if_no_indices=self.alias['wini'])
         return action_obj
 
-    def do_singleton_action(self, dry_run=False):
-        """Execute the (ostensibly) completely ready to run action"""
+    def run_action(self, dry_run=False):
+        """Build the action object and do the action, or its dry run"""
+        if self.action == 'alias':
+            action_obj = self.get_alias_obj()
+        elif self.action in ['cluster_routing', 'create_index', 'rollover']:
+            action_obj = self.action_class(self.client, **self.options)
+        else:
+            self.get_list_object()
+            self.do_filters()
+            self.logger.debug('OPTIONS = %s', self.options)
+            action_obj = self.action_class(self.list_object, **self.options)
+        if dry_run:
+            action_obj.do_dry_run()
+        else:
+            action_obj.do_action()
+
+    def do_singleton_action(self, dry_run=False, profile=None):
+        """
+        Execute the (ostensibly) completely ready to run action
+
+        :param dry_run: Only log what the action would do
+        :param profile: Write a :py:mod:`cProfile` profile of the action to this
+            directory. See :py:func:`~.curator.helpers.profiler.profiled`
+
+        :type dry_run: bool
+        :type profile: str
+        """
         self.logger.debug('Doing the singleton "%s" action here.', self.action)
         try:
-            if self.action == 'alias':
-                action_obj = self.get_alias_obj()
-            elif self.action in ['cluster_routing', 'create_index', 'rollover']:
-                action_obj = self.action_class(self.client, **self.options)
-            else:
-                self.get_list_object()
-                self.do_filters()
-                self.logger.debug('OPTIONS = %s', self.options)
-                action_obj = self.action_class(self.list_object, **self.options)
-            if dry_run:
-                action_obj.do_dry_run()
-            else:
-                action_obj.do_action()
+            with TRACER.span('action', **{'action.name': self.action}), profiled(
+                self.action, profile
+            ):
+                self.run_action(dry_run=dry_run)
         except NoIndices:  # Speficically to address #1704
             if not self.ignore:
                 self.logger.critical('No indices in list after filtering. Exiting.')
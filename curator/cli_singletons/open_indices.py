@@ -9,6 +9,17 @@ from curator.cli_singletons.utils import validate_filter_json
 @click.option(
     '--search_pattern', type=str, default='*', help='OpenSearch index search pattern'
 )
+@click.option(
+    '--wait_for_completion/--no-wait_for_completion',
+    default=False,
+    help='Wait for the opened indices to be green, opening them in waves',
+    show_default=True,
+)
+@click.option(
+    '--wave_size',
+    type=int,
+    help='Open at most this many indices at a time',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -36,6 +47,8 @@ from curator.cli_singletons.utils import validate_filter_json
 def open_indices(
     ctx,
     search_pattern,
+    wait_for_completion,
+    wave_size,
     ignore_empty_list,
     allow_ilm_indices,
     include_hidden,
@@ -51,10 +64,14 @@ def open_indices(
         ctx.obj['configdict'],
         {
             'search_pattern': search_pattern,
+            'wait_for_completion': wait_for_completion,
+            'wave_size': wave_size,
             'allow_ilm_indices': allow_ilm_indices,
             'include_hidden': include_hidden,
         },
         filter_list,
         ignore_empty_list,
     )
-    action.do_singleton_action(dry_run=ctx.obj['dry_run'])
+    action.do_singleton_action(
+        dry_run=ctx.obj['dry_run'], profile=ctx.obj.get('profile')
+    )
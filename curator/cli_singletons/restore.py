@@ -9,6 +9,16 @@ from curator.cli_singletons.utils import json_to_dict, validate_filter_json
 @click.command()
 @click.option('--repository', type=str, required=True, help='Snapshot repository')
 @click.option('--name', type=str, help='Snapshot name', required=False, default=None)
+@click.option(
+    '--page_size',
+    type=int,
+    help='List snapshots this many at a time, keeping only compact metadata',
+)
+@click.option(
+    '--snapshot_cache',
+    type=str,
+    help='Directory in which to cache the metadata of completed snapshots',
+)
 @click.option(
     '--index',
     multiple=True,
@@ -78,6 +88,21 @@ from curator.cli_singletons.utils import json_to_dict, validate_filter_json
     show_default=True,
     help='Skip repository filesystem access validation.',
 )
+@click.option(
+    '--max_bytes_per_sec',
+    type=str,
+    help='indices.recovery.max_bytes_per_sec during the restore, e.g. 500mb',
+)
+@click.option(
+    '--concurrent_recoveries',
+    type=int,
+    help='Concurrent recoveries per node during the restore',
+)
+@click.option(
+    '--wave_size',
+    type=int,
+    help='Restore at most this many indices at a time',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -106,6 +131,8 @@ def restore(
     ctx,
     repository,
     name,
+    page_size,
+    snapshot_cache,
     index,
     rename_pattern,
     rename_replacement,
@@ -118,6 +145,9 @@ def restore(
     wait_interval,
     max_wait,
     skip_repo_fs_check,
+    max_bytes_per_sec,
+    concurrent_recoveries,
+    wave_size,
     ignore_empty_list,
     allow_ilm_indices,
     include_hidden,
@@ -129,6 +159,8 @@ def restore(
     indices = list(index)
     manual_options = {
         'name': name,
+        'page_size': page_size,
+        'snapshot_cache': snapshot_cache,
         'extra_settings': extra_settings,
         'indices': indices,
         'rename_pattern': rename_pattern,
@@ -141,6 +173,9 @@ def restore(
         'wait_for_completion': wait_for_completion,
         'max_wait': max_wait,
         'wait_interval': wait_interval,
+        'max_bytes_per_sec': max_bytes_per_sec,
+        'concurrent_recoveries': concurrent_recoveries,
+        'wave_size': wave_size,
         'allow_ilm_indices': allow_ilm_indices,
         'include_hidden': include_hidden,
     }
@@ -154,4 +189,6 @@ def restore(
         ignore_empty_list,
         repository=repository,
     )
-    action.do_singleton_action(dry_run=ctx.obj['dry_run'])
+    action.do_singleton_action(
+        dry_run=ctx.obj['dry_run'], profile=ctx.obj.get('profile')
+    )
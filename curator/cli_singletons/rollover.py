@@ -8,7 +8,13 @@ from curator.cli_singletons.utils import json_to_dict
 
 # pylint: disable=line-too-long
 @click.command()
-@click.option('--name', type=str, help='Alias name', required=True)
+@click.option(
+    '--name',
+    type=str,
+    multiple=True,
+    required=True,
+    help='Alias name or wildcard pattern. (Can invoke repeatedly for several aliases)',
+)
 @click.option('--max_age', type=str, help='max_age condition value (see documentation)')
 @click.option(
     '--max_docs', type=str, help='max_docs condition value (see documentation)'
@@ -32,6 +38,13 @@ from curator.cli_singletons.utils import json_to_dict
     show_default=True,
     help='Wait for number of shards to be active before returning',
 )
+@click.option(
+    '--concurrency',
+    type=int,
+    default=4,
+    show_default=True,
+    help='Rollover requests in flight at once, with several aliases',
+)
 @click.option(
     '--allow_ilm_indices/--no-allow_ilm_indices',
     help='Allow Curator to operate on Index Lifecycle Management monitored indices.',
@@ -54,6 +67,7 @@ def rollover(
     extra_settings,
     new_index,
     wait_for_active_shards,
+    concurrency,
     allow_ilm_indices,
     include_hidden,
 ):
@@ -68,8 +82,9 @@ def rollover(
         }
     )
     manual_options = {
-        'name': name,
+        'name': name[0] if len(name) == 1 else list(name),
         'conditions': conditions,
+        'concurrency': concurrency,
         'allow_ilm_indices': allow_ilm_indices,
         'include_hidden': include_hidden,
     }
@@ -85,4 +100,6 @@ def rollover(
         new_index=new_index,
         wait_for_active_shards=wait_for_active_shards,
     )
-    action.do_singleton_action(dry_run=ctx.obj['dry_run'])
+    action.do_singleton_action(
+        dry_run=ctx.obj['dry_run'], profile=ctx.obj.get('profile')
+    )
@@ -1,13 +1,250 @@
 """Show Index/Snapshot Singletons"""
 
-from datetime import datetime
+import csv
+import io
+import json
+from datetime import datetime, timezone
 import click
 from curator.cli_singletons.object_class import CLIAction
 from curator.cli_singletons.utils import validate_filter_json
 from curator.helpers.getters import byte_size
+from curator.helpers.utils import chunk_index_list
 from curator.defaults.settings import footer
 from curator._version import __version__
 
+#: Output formats. ``text`` is aligned for reading, the others stream one row at a
+#: time.
+FORMATS = ['text', 'json', 'ndjson', 'csv']
+#: ``show_indices`` columns, and the data each needs: ``state`` from the cat API,
+#: ``stats`` from index stats, ``settings`` from index settings
+INDEX_COLUMNS = {
+    'index': None,
+    'state': 'state',
+    'size': 'stats',
+    'docs': 'stats',
+    'pri': 'settings',
+    'rep': 'settings',
+    'creation_date': 'settings',
+}
+#: ``show_snapshots`` columns
+SNAPSHOT_COLUMNS = ['snapshot', 'state', 'start_time', 'end_time', 'indices']
+#: Column titles for ``text`` output with ``--header``
+TITLES = {
+    'index': 'Index',
+    'state': 'State',
+    'size': 'Size',
+    'docs': 'Docs',
+    'pri': 'Pri',
+    'rep': 'Rep',
+    'creation_date': 'Creation Timestamp',
+    'snapshot': 'Snapshot',
+    'start_time': 'Start Time',
+    'end_time': 'End Time',
+    'indices': 'Indices',
+}
+
+
+def get_columns(value, allowed, default):
+    """
+    :param value: Comma-separated column names from ``--columns``
+    :param allowed: The column names that can be used
+    :param default: The columns to use if ``value`` is empty
+
+    :type value: str
+    :type allowed: list
+    :type default: list
+
+    :returns: The column names, in the order given
+    :rtype: list
+    """
+    if not value:
+        return default
+    columns = [col.strip() for col in value.split(',') if col.strip()]
+    unknown = [col for col in columns if col not in allowed]
+    if unknown or not columns:
+        raise click.BadParameter(
+            f'Unknown columns {unknown}. Must be from {list(allowed)}',
+            param_hint='--columns',
+        )
+    return columns
+
+
+def timestamp(epoch, as_epoch=False):
+    """
+    :param epoch: Seconds since the epoch. ``0`` or ``None`` if unknown
+    :param as_epoch: Return ``epoch`` unchanged instead of an ISO8601 string
+
+    :type epoch: int
+    :type as_epoch: bool
+
+    :returns: ``epoch``, or an ISO8601 UTC timestamp, or ``None`` if unknown
+    :rtype: int or str
+    """
+    if not epoch:
+        return None
+    if as_epoch:
+        return epoch
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def index_rows(ilo, columns, epoch=False):
+    """
+    Yield one row per index in ``ilo``, in name order. The indices are processed one
+    chunk at a time, and for each chunk only the data ``columns`` need is fetched,
+    so rows are yielded as soon as their chunk is ready.
+
+    :param ilo: The filtered index list
+    :param columns: Keys of :py:data:`INDEX_COLUMNS`
+    :param epoch: Show ``creation_date`` as epoch seconds instead of ISO8601
+
+    :type ilo: :py:class:`~.curator.indexlist.IndexList`
+    :type columns: list
+    :type epoch: bool
+
+    :returns: A :py:class:`dict` of column values per index
+    :rtype: generator
+    """
+    sources = {INDEX_COLUMNS[col] for col in columns}
+    indices = sorted(ilo.indices)
+    try:
+        for chunk in chunk_index_list(indices) if indices else []:
+            # The getters work on ilo.indices, so point it at this chunk
+            ilo.indices = chunk
+            if 'stats' in sources:
+                # This also gets the state
+                ilo.get_index_stats()
+            elif 'state' in sources:
+                ilo.get_index_state()
+            if 'settings' in sources:
+                ilo.get_index_settings()
+            for idx in list(ilo.indices):
+                info = ilo.index_info.get(idx, {})
+                values = {
+                    'index': idx,
+                    'state': info.get('state'),
+                    'size': info.get('size_in_bytes', 0),
+                    'docs': info.get('docs', 0),
+                    'pri': int(info.get('number_of_shards', 0)),
+                    'rep': int(info.get('number_of_replicas', 0)),
+                    'creation_date': timestamp(
+                        info.get('age', {}).get('creation_date'), as_epoch=epoch
+                    ),
+                }
+                yield {col: values[col] for col in columns}
+    finally:
+        ilo.indices = indices
+
+
+def snapshot_rows(slo, columns, epoch=False):
+    """
+    Yield one row per snapshot in ``slo``, in name order. The ``indices`` column, the
+    number of indices in the snapshot, is only loaded if it is requested.
+
+    :param slo: The filtered snapshot list
+    :param columns: Items of :py:data:`SNAPSHOT_COLUMNS`
+    :param epoch: Show times as epoch seconds instead of ISO8601
+
+    :type slo: :py:class:`~.curator.snapshotlist.SnapshotList`
+    :type columns: list
+    :type epoch: bool
+
+    :returns: A :py:class:`dict` of column values per snapshot
+    :rtype: generator
+    """
+    for snapshot in sorted(slo.snapshots):
+        info = slo.snapshot_info[snapshot]
+        row = {}
+        for col in columns:
+            if col == 'snapshot':
+                row[col] = snapshot
+            elif col == 'state':
+                row[col] = info.get('state')
+            elif col == 'indices':
+                row[col] = len(slo.snapshot_indices(snapshot))
+            else:
+                millis = info.get(f'{col}_in_millis')
+                row[col] = timestamp(millis // 1000 if millis else None, epoch)
+        yield row
+
+
+def text_value(column, value):
+    """:returns: ``value`` of ``column`` as shown in ``text`` output"""
+    if value is None:
+        return 'unknown'
+    if column == 'size':
+        return byte_size(value)
+    return str(value)
+
+
+def write_rows(rows, columns, fmt, header=False, epoch=False):
+    """
+    Write ``rows`` to stdout in format ``fmt``.
+
+    ``json``, ``ndjson`` and ``csv`` rows are written as they are produced.
+    ``csv`` output always starts with a header row. ``text`` output is aligned in
+    columns, so all rows are read first, unless only one column is shown.
+
+    :param rows: One :py:class:`dict` per row
+    :param columns: The column names
+    :param fmt: One of :py:data:`FORMATS`
+    :param header: Start ``text`` output with the column titles
+    :param epoch: Times are epoch seconds, which changes the ``text`` title
+
+    :type rows: iterable
+    :type columns: list
+    :type fmt: str
+    :type header: bool
+    :type epoch: bool
+    """
+    if fmt == 'json':
+        click.echo('[', nl=False)
+        sep = '\n'
+        for row in rows:
+            click.echo(sep + json.dumps(row), nl=False)
+            sep = ',\n'
+        click.echo('\n]' if sep != '\n' else ']')
+    elif fmt == 'ndjson':
+        for row in rows:
+            click.echo(json.dumps(row))
+    elif fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(['' if row[col] is None else row[col] for col in columns])
+            click.echo(buffer.getvalue(), nl=False)
+            buffer.seek(0)
+            buffer.truncate()
+        # The header, if there were no rows
+        click.echo(buffer.getvalue(), nl=False)
+    elif len(columns) == 1 and not header:
+        for row in rows:
+            click.echo(text_value(columns[0], row[columns[0]]))
+    else:
+        table = [[text_value(col, row[col]) for col in columns] for row in rows]
+        titles = [
+            col if epoch and col.endswith(('_date', '_time')) else TITLES[col]
+            for col in columns
+        ]
+        widths = [
+            max(
+                [len(line[num]) for line in table] + [len(titles[num]) if header else 0]
+            )
+            for num in range(len(columns))
+        ]
+
+        def aligned(line):
+            return ' '.join(
+                cell.ljust(widths[num]) if num == 0 else cell.rjust(widths[num])
+                for num, cell in enumerate(line)
+            ).rstrip()
+
+        if header:
+            click.secho(aligned(titles), bold=True, underline=True)
+        for line in table:
+            click.echo(aligned(line))
+
+
 # ### Indices ###
 
 
@@ -20,11 +257,27 @@ from curator._version import __version__
 )
 @click.option('--verbose', help='Show verbose output.', is_flag=True, show_default=True)
 @click.option(
-    '--header', help='Print header if --verbose', is_flag=True, show_default=True
+    '--header',
+    help='Print header if --verbose or --columns',
+    is_flag=True,
+    show_default=True,
 )
 @click.option(
     '--epoch', help='Print time as epoch if --verbose', is_flag=True, show_default=True
 )
+@click.option(
+    '--format',
+    'output_format',
+    type=click.Choice(FORMATS),
+    default='text',
+    show_default=True,
+    help='Output format',
+)
+@click.option(
+    '--columns',
+    type=str,
+    help=f'Comma-separated columns to show, from {",".join(INDEX_COLUMNS)}',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -55,6 +308,8 @@ def show_indices(
     verbose,
     header,
     epoch,
+    output_format,
+    columns,
     ignore_empty_list,
     allow_ilm_indices,
     include_hidden,
@@ -78,68 +333,13 @@ def show_indices(
     )
     action.get_list_object()
     action.do_filters()
-    indices = sorted(action.list_object.indices)
-    # Do some calculations to figure out the proper column sizes
-    allbytes = []
-    alldocs = []
-    for idx in indices:
-        # Skip indices not in index_info (filtered out or missing data)
-        if idx not in action.list_object.index_info:
-            continue
-        # Use .get() with default for OpenSearch compatibility (some system indices may not have size_in_bytes)
-        allbytes.append(
-            byte_size(action.list_object.index_info[idx].get('size_in_bytes', 0))
-        )
-        alldocs.append(str(action.list_object.index_info[idx].get('docs', 0)))
-    if epoch:
-        timeformat = '{6:>13}'
-        column = 'creation_date'
-    else:
-        timeformat = '{6:>20}'
-        column = 'Creation Timestamp'
-    formatting = (
-        '{0:' + str(len(max(indices, key=len))) + '} '
-        '{1:>5} '
-        '{2:>' + str(len(max(allbytes, key=len)) + 1) + '} '
-        '{3:>' + str(len(max(alldocs, key=len)) + 1) + '} '
-        '{4:>3} {5:>3} ' + timeformat
+    # --header only applies to --verbose or --columns output
+    header = header and (verbose or bool(columns))
+    columns = get_columns(
+        columns, INDEX_COLUMNS, list(INDEX_COLUMNS) if verbose else ['index']
     )
-    # Print the header, if both verbose and header are enabled
-    if header and verbose:
-        click.secho(
-            formatting.format('Index', 'State', 'Size', 'Docs', 'Pri', 'Rep', column),
-            bold=True,
-            underline=True,
-        )
-    # Loop through indices and print info, if verbose
-    for idx in indices:
-        data = action.list_object.index_info[idx]
-        if verbose:
-            if epoch:
-                datefield = (
-                    data['age']['creation_date']
-                    if 'creation_date' in data['age']
-                    else 0
-                )
-            else:
-                datefield = (
-                    datetime.utcfromtimestamp(data['age']['creation_date']).isoformat()
-                    if 'creation_date' in data['age']
-                    else 'unknown/closed'
-                )
-            click.echo(
-                formatting.format(
-                    idx,
-                    data['state'],
-                    byte_size(data['size_in_bytes']),
-                    data['docs'],
-                    data['number_of_shards'],
-                    data['number_of_replicas'],
-                    f'{datefield}Z',
-                )
-            )
-        else:
-            click.secho(f'{idx}')
+    rows = index_rows(action.list_object, columns, epoch=epoch)
+    write_rows(rows, columns, output_format, header=header, epoch=epoch)
 
 
 # ### Snapshots ###
@@ -150,6 +350,31 @@ def show_indices(
     epilog=footer(__version__, tail='singleton-cli.html#_show_indicessnapshots')
 )
 @click.option('--repository', type=str, required=True, help='Snapshot repository name')
+@click.option(
+    '--page_size',
+    type=int,
+    help='List snapshots this many at a time, keeping only compact metadata',
+)
+@click.option(
+    '--snapshot_cache',
+    type=str,
+    help='Directory in which to cache the metadata of completed snapshots',
+)
+@click.option('--header', help='Print header', is_flag=True, show_default=True)
+@click.option('--epoch', help='Print time as epoch', is_flag=True, show_default=True)
+@click.option(
+    '--format',
+    'output_format',
+    type=click.Choice(FORMATS),
+    default='text',
+    show_default=True,
+    help='Output format',
+)
+@click.option(
+    '--columns',
+    type=str,
+    help=f'Comma-separated columns to show, from {",".join(SNAPSHOT_COLUMNS)}',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -162,7 +387,18 @@ def show_indices(
     help='JSON string representing an array of filters.',
 )
 @click.pass_context
-def show_snapshots(ctx, repository, ignore_empty_list, filter_list):
+def show_snapshots(
+    ctx,
+    repository,
+    page_size,
+    snapshot_cache,
+    header,
+    epoch,
+    output_format,
+    columns,
+    ignore_empty_list,
+    filter_list,
+):
     """
     Show Snapshots
     """
@@ -171,12 +407,13 @@ def show_snapshots(ctx, repository, ignore_empty_list, filter_list):
     action = CLIAction(
         'show_snapshots',
         ctx.obj['configdict'],
-        {},
+        {'page_size': page_size, 'snapshot_cache': snapshot_cache},
         filter_list,
         ignore_empty_list,
         repository=repository,
     )
     action.get_list_object()
     action.do_filters()
-    for snapshot in sorted(action.list_object.snapshots):
-        click.secho(f'{snapshot}')
+    columns = get_columns(columns, SNAPSHOT_COLUMNS, ['snapshot'])
+    rows = snapshot_rows(action.list_object, columns, epoch=epoch)
+    write_rows(rows, columns, output_format, header=header, epoch=epoch)
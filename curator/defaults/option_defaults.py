@@ -31,6 +31,20 @@ def allow_ilm_indices():
     }
 
 
+def concurrency(action=None):
+    """
+    :returns:
+        {Optional('concurrency', default=defval): All(Coerce(int), Range(min=1, max=32))}
+            where ``defval`` defaults to 4, but changes to 1 if action is ``close``.
+    """
+    defval = 4
+    if action == 'close':
+        defval = 1
+    return {
+        Optional('concurrency', default=defval): All(Coerce(int), Range(min=1, max=32))
+    }
+
+
 def conditions():
     """
     :returns:
@@ -47,6 +61,19 @@ def conditions():
     }
 
 
+def concurrent_recoveries():
+    """
+    :returns:
+        {Optional('concurrent_recoveries', default=None):
+            Any(None, All(Coerce(int), Range(min=1, max=100)))}
+    """
+    return {
+        Optional('concurrent_recoveries', default=None): Any(
+            None, All(Coerce(int), Range(min=1, max=100))
+        )
+    }
+
+
 def continue_if_exception():
     """
     :returns:
@@ -287,6 +314,13 @@ def skip_if_running():
     }
 
 
+def max_bytes_per_sec():
+    """
+    :returns: {Optional('max_bytes_per_sec', default=None): Any(None, str)}
+    """
+    return {Optional('max_bytes_per_sec', default=None): Any(None, str)}
+
+
 # pylint: disable=unused-argument
 def max_wait(action):
     """
@@ -318,12 +352,15 @@ def migration_suffix():
 def name(action):
     """
     :returns: The proper name based on what action it is:
-        ``alias``, ``create_index``, ``rollover``: {Required('name'): Any(str)}
+        ``alias``: {Required('name'): Any(str)}
+        ``create_index``, ``rollover``: {Required('name'): Any(str, [str])}
         ``snapshot``: {Optional('name', default='curator-%Y%m%d%H%M%S'): Any(str)}
         ``restore``: {Optional('name'): Any(str)}
     """
-    if action in ['alias', 'create_index', 'rollover']:
+    if action == 'alias':
         return {Required('name'): Any(str)}
+    if action in ['create_index', 'rollover']:
+        return {Required('name'): Any(str, [str])}
     if action == 'snapshot':
         return {Optional('name', default='curator-%Y%m%d%H%M%S'): Any(str)}
     if action == 'restore':
@@ -376,6 +413,19 @@ def number_of_shards():
     }
 
 
+def page_size():
+    """
+    :returns:
+        {Optional('page_size', default=None):
+            Any(None, All(Coerce(int), Range(min=1, max=10000)))}
+    """
+    return {
+        Optional('page_size', default=None): Any(
+            None, All(Coerce(int), Range(min=1, max=10000))
+        )
+    }
+
+
 def partial():
     """
     :returns:
@@ -623,6 +673,19 @@ def skip_repo_fs_check():
     }
 
 
+def skip_unchanged():
+    """
+    :returns:
+        {Optional('skip_unchanged', default=False):
+            Any(bool, All(Any(str), Boolean()))}
+
+    When True, ``index_settings`` only updates the indices whose settings differ.
+    """
+    return {
+        Optional('skip_unchanged', default=False): Any(bool, All(Any(str), Boolean()))
+    }
+
+
 def slices():
     """
     :returns:
@@ -675,6 +738,17 @@ def value():
     return {Required('value', default=None): Any(None, str)}
 
 
+def wave_size():
+    """
+    :returns:
+        {Optional('wave_size', default=None):
+            Any(None, All(Coerce(int), Range(min=1)))}
+    """
+    return {
+        Optional('wave_size', default=None): Any(None, All(Coerce(int), Range(min=1)))
+    }
+
+
 def wait_for_active_shards(action):
     """
     :returns:
@@ -699,11 +773,11 @@ def wait_for_completion(action):
         {Optional('wait_for_completion', default=defval):
             Any(bool, All(Any(str), Boolean()))}
             where ``defval`` defaults to True, but changes to False if action is
-            ``allocation``, ``cluster_routing``, or ``replicas``.
+            ``allocation``, ``cluster_routing``, ``open`` or ``replicas``.
     """
     # if action in ['cold2frozen', 'reindex', 'restore', 'snapshot']:
     defval = True
-    if action in ['allocation', 'cluster_routing', 'replicas']:
+    if action in ['allocation', 'cluster_routing', 'open', 'replicas']:
         defval = False
     return {
         Optional('wait_for_completion', default=defval): Any(
@@ -850,6 +924,14 @@ def exclude_already_remote():
     }
 
 
+def snapshot_cache():
+    """
+    :returns:
+        {Optional('snapshot_cache', default=None): Any(None, str)}
+    """
+    return {Optional('snapshot_cache', default=None): Any(None, str)}
+
+
 def snapshot_name():
     """
     :returns:
@@ -10,6 +10,33 @@ CURATOR_DOCS = 'https://www.elastic.co/guide/en/elasticsearch/client/curator'
 CLICK_DRYRUN = {
     'dry-run': {'help': 'Do not perform any changes.', 'is_flag': True},
 }
+CLICK_API_STATS = {
+    'api-stats': {'help': 'Write API call statistics to this JSON file.', 'type': str},
+}
+CLICK_PROFILE = {
+    'profile': {
+        'help': 'Write a cProfile profile of each action to this directory.',
+        'type': str,
+    },
+}
+CLICK_TRACE = {
+    'trace': {
+        'help': 'Append tracing spans to this file as JSON lines.',
+        'type': str,
+    },
+}
+CLICK_CACHE_DIR = {
+    'cache-dir': {
+        'help': 'Cache validated action files in this directory.',
+        'type': str,
+    },
+}
+CLICK_METRICS_FILE = {
+    'metrics-file': {
+        'help': 'Write run metrics to this Prometheus text file.',
+        'type': str,
+    },
+}
 DATA_NODE_ROLES = ['data', 'data_content', 'data_hot', 'data_warm']
 EXCLUDE_SYSTEM = (
     '-.kibana*,-.security*,-.watch*,-.triggered_watch*,'
@@ -18,6 +45,78 @@ EXCLUDE_SYSTEM = (
 VERSION_MIN = (2, 0, 0)
 VERSION_MAX = (3, 99, 99)
 
+# Response filtering. Each value is passed as the ``filter_path`` of an API call so
+# that OpenSearch only returns the fields Curator actually reads.
+SNAPSHOT_FIELDS = [
+    'snapshot',
+    'uuid',
+    'version',
+    'indices',
+    'data_streams',
+    'include_global_state',
+    'state',
+    'start_time',
+    'start_time_in_millis',
+    'end_time',
+    'end_time_in_millis',
+    'duration_in_millis',
+]
+# The number of snapshots per request when SnapshotList gets them in pages
+SNAPSHOT_PAGE_SIZE = 500
+# The largest update_aliases request body the alias action sends, in bytes. Larger
+# sets of alias actions are split into several requests.
+ALIAS_BATCH_BYTES = 1048576
+# How many primaries each node recovers from local disk at once, as when opening an
+# index, unless cluster.routing.allocation.node_initial_primaries_recoveries is set
+INITIAL_PRIMARIES_RECOVERIES = 4
+# The only snapshot fields SnapshotList filters read, plus the uuid. Used for
+# compact records.
+SNAPSHOT_COMPACT_FIELDS = [
+    'snapshot',
+    'uuid',
+    'state',
+    'start_time_in_millis',
+    'end_time_in_millis',
+]
+FILTER_PATHS = {
+    'index_segments': 'indices.*.shards.*.num_search_segments',
+    'index_segment_stats': 'indices.*.total.segments.count',
+    'index_settings': ','.join(
+        f'*.settings.index.{field}'
+        for field in [
+            'creation_date',
+            'number_of_replicas',
+            'number_of_shards',
+            'routing',
+            'lifecycle',
+        ]
+    ),
+    'index_stats': (
+        'indices.*.total.store.size_in_bytes,indices.*.total.docs.count,'
+        'indices.*.primaries.store.size_in_bytes'
+    ),
+    'index_health': (
+        'status,active_shards,initializing_shards,unassigned_shards,relocating_shards'
+    ),
+    'node_roles': 'nodes.*.roles',
+    'recovery': ','.join(
+        f'*.shards.{field}'
+        for field in [
+            'stage',
+            'index.size.total_in_bytes',
+            'index.size.recovered_in_bytes',
+            'index.files.total',
+            'index.files.recovered',
+        ]
+    ),
+    'snapshots': ','.join(f'snapshots.{field}' for field in SNAPSHOT_FIELDS),
+    'snapshots_compact': ','.join(
+        f'snapshots.{field}' for field in SNAPSHOT_COMPACT_FIELDS
+    ),
+    'snapshot_indices': 'snapshots.snapshot,snapshots.indices',
+    'snapshot_state': 'snapshots.snapshot,snapshots.state',
+}
+
 # Click specifics
 
 
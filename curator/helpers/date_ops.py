@@ -9,6 +9,7 @@ from datetime import timedelta, datetime, timezone
 from opensearchpy.exceptions import NotFoundError
 from curator.exceptions import ConfigurationError
 from curator.defaults.settings import date_regex
+from curator.helpers import datemath as local_datemath
 
 
 class TimestringSearch:
@@ -373,13 +374,13 @@ def get_date_regex(timestring):
     """
     logger = logging.getLogger(__name__)
     prev, regex = ('', '')
+    regex_map = date_regex()
     logger.debug('Provided timestring = "%s"', timestring)
-    for idx, char in enumerate(timestring):
-        logger.debug('Current character: %s Array position: %s', char, idx)
+    for char in timestring:
         if char == '%':
             pass
-        elif char in date_regex() and prev == '%':
-            regex += r'\d{' + date_regex()[char] + '}'
+        elif char in regex_map and prev == '%':
+            regex += r'\d{' + regex_map[char] + '}'
         elif char in ['.', '-']:
             regex += "\\" + char
         else:
@@ -643,6 +644,65 @@ def parse_date_pattern(name):
     return rendered
 
 
+class DateMath:
+    """
+    Render OpenSearch date math in process with
+    :py:func:`~.curator.helpers.datemath.render`, instead of asking OpenSearch with
+    :py:func:`get_datemath` every time.
+
+    The first expression rendered locally is also rendered by OpenSearch. If the two
+    differ, OpenSearch renders every expression for the rest of the run. Expressions
+    the local renderer does not support are always rendered by OpenSearch.
+    """
+
+    def __init__(self):
+        #: Whether local rendering agreed with OpenSearch. ``None`` until the first
+        #: expression is checked. **Type:** :py:class:`bool`
+        self.verified = None
+
+    def reset(self):
+        """Check local rendering against OpenSearch again on the next expression"""
+        self.verified = None
+
+    def render(self, client, datemath):
+        """
+        :param client: A client connection object
+        :param datemath: An OpenSearch datemath string, e.g. ``{now/d}``
+
+        :type client: :py:class:`~.opensearchpy.OpenSearch`
+        :type datemath: str
+
+        :returns: The rendered ``datemath``
+        :rtype: str
+        """
+        logger = logging.getLogger(__name__)
+        if self.verified is False:
+            return get_datemath(client, datemath)
+        try:
+            rendered = local_datemath.render(datemath)
+        except ValueError as err:
+            logger.debug('Rendering %s with OpenSearch: %s', datemath, err)
+            return get_datemath(client, datemath)
+        if self.verified is None:
+            expected = get_datemath(client, datemath)
+            self.verified = rendered == expected
+            if not self.verified:
+                logger.warning(
+                    'Date math %s rendered as "%s" locally, but as "%s" by OpenSearch. '
+                    'OpenSearch will render date math for the rest of this run.',
+                    datemath,
+                    rendered,
+                    expected,
+                )
+                return expected
+        logger.debug('Rendered date math %s locally as %s', datemath, rendered)
+        return rendered
+
+
+#: The :py:class:`DateMath` used by :py:func:`parse_datemath` in the current run
+DATEMATH = DateMath()
+
+
 def parse_datemath(client, value):
     """
     Validate that ``value`` looks like proper datemath. If it passes this test, then
@@ -656,7 +716,7 @@ def parse_datemath(client, value):
     :type client: :py:class:`~.opensearchpy.OpenSearch`
     :type value: str
 
-    :returns: A datemath indexname, fully rendered by OpenSearch
+    :returns: A datemath indexname, rendered by :py:data:`DATEMATH`
     :rtype: str
     """
     logger = logging.getLogger(__name__)
@@ -682,4 +742,4 @@ def parse_datemath(client, value):
             f'Value "{value}" does not contain a valid datemath pattern.'
         ) from exc
 
-    return f'{prefix}{get_datemath(client, datemath)}{suffix}'
+    return f'{prefix}{DATEMATH.render(client, datemath)}{suffix}'
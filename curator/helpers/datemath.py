@@ -0,0 +1,287 @@
+"""Render OpenSearch date math index names in process
+
+Supports ``now`` or ``<date>||`` anchors, ``+``/``-`` arithmetic and ``/`` rounding
+in ``y``, ``M``, ``w``, ``d``, ``h``, ``H``, ``m`` and ``s`` units, numeric
+``java.time`` format patterns and fixed offset or named time zones. Anything else
+raises :py:exc:`ValueError`, so that the caller can have OpenSearch render it
+instead.
+"""
+
+import calendar
+import re
+from datetime import datetime, timedelta, timezone
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # pragma: no cover
+    ZoneInfo = None
+
+#: The format OpenSearch uses when a date math expression does not name one
+DEFAULT_FORMAT = 'uuuu.MM.dd'
+#: The supported ``java.time`` pattern letters, and the widest field for each
+FIELDS = {'y': 9, 'u': 9, 'M': 2, 'd': 2, 'D': 3, 'H': 2, 'm': 2, 's': 2, 'S': 9}
+TOKEN = re.compile(r"'(?:[^']|'')*'|([A-Za-z])\1*|[^A-Za-z']+")
+OFFSET = re.compile(r'^([+-])(\d{1,2})(?::?(\d{2}))?$')
+MATH = re.compile(r'([+-])(\d*)([yMwdhHms])|/([yMwdhHms])')
+EXPRESSION = re.compile(r'([^{}]*)(?:\{([^{}|]*)(?:\|([^{}]*))?\})?')
+SECONDS = {'h': 3600, 'H': 3600, 'm': 60, 's': 1}
+
+
+def tokenize(pattern):
+    """
+    :param pattern: A ``java.time`` format pattern, e.g. ``yyyy.MM.dd``
+
+    :type pattern: str
+
+    :returns: ``(letter, width)`` for each field and ``(None, text)`` for each
+        literal in ``pattern``
+    :rtype: list
+    """
+    tokens = []
+    consumed = 0
+    for match in TOKEN.finditer(pattern):
+        text = match.group(0)
+        consumed += len(text)
+        if match.group(1):
+            letter, width = text[0], len(text)
+            if width > FIELDS.get(letter, 0):
+                raise ValueError(f'Unsupported date format field "{text}"')
+            tokens.append((letter, width))
+        elif text.startswith("'"):
+            tokens.append((None, text[1:-1].replace("''", "'") or "'"))
+        else:
+            tokens.append((None, text))
+    if not tokens or consumed != len(pattern):
+        raise ValueError(f'Unsupported date format "{pattern}"')
+    return tokens
+
+
+def format_date(moment, tokens):
+    """
+    :param moment: The time to format
+    :param tokens: The :py:func:`tokenize` output of a format pattern
+
+    :type moment: :py:class:`~.datetime.datetime`
+    :type tokens: list
+
+    :returns: ``moment`` formatted as ``tokens`` say
+    :rtype: str
+    """
+    parts = []
+    for letter, width in tokens:
+        if letter is None:
+            parts.append(width)
+        elif letter in 'yu' and width == 2:
+            parts.append(f'{moment.year % 100:02d}')
+        elif letter == 'S':
+            parts.append(f'{moment.microsecond:06d}'[:width].ljust(width, '0'))
+        else:
+            value = {
+                'y': moment.year,
+                'u': moment.year,
+                'M': moment.month,
+                'd': moment.day,
+                'D': moment.timetuple().tm_yday,
+                'H': moment.hour,
+                'm': moment.minute,
+                's': moment.second,
+            }[letter]
+            parts.append(f'{value:0{width}d}')
+    return ''.join(parts)
+
+
+def parse_date(text, tokens, zone):
+    """
+    :param text: A date anchor, the part of an expression before ``||``
+    :param tokens: The :py:func:`tokenize` output of the format to parse it with
+    :param zone: The time zone of ``text``
+
+    :type text: str
+    :type tokens: list
+    :type zone: :py:class:`~.datetime.tzinfo`
+
+    :returns: The time in ``text``. Fields not in the format are at their minimum.
+    :rtype: :py:class:`~.datetime.datetime`
+    """
+    regex = ''
+    for letter, width in tokens:
+        if letter is None:
+            regex += re.escape(width)
+        elif letter in 'yu' and width != 2:
+            regex += rf'(?P<{letter}>\d{{{width},}})'
+        else:
+            regex += (
+                rf'(?P<{letter}>\d{{{width}}})' if width > 1 else rf'(?P<{letter}>\d+)'
+            )
+    try:
+        match = re.fullmatch(regex, text)
+    except re.error as err:
+        # A field letter repeated in the format
+        raise ValueError(f'Unsupported date format for parsing: {err}') from err
+    if not match:
+        raise ValueError(f'Date "{text}" does not match its format')
+    fields = {key: int(value) for key, value in match.groupdict().items()}
+    year = fields.get('y', fields.get('u', 1970))
+    if ('y', 2) in tokens or ('u', 2) in tokens:
+        year += 2000
+    fraction = match.groupdict().get('S', '0')
+    moment = datetime(
+        year,
+        fields.get('M', 1),
+        fields.get('d', 1),
+        fields.get('H', 0),
+        fields.get('m', 0),
+        fields.get('s', 0),
+        int(fraction[:6].ljust(6, '0')),
+        tzinfo=zone,
+    )
+    if 'D' in fields:
+        moment += timedelta(days=fields['D'] - 1)
+    return moment
+
+
+def get_zone(name):
+    """
+    :param name: A time zone: an offset such as ``-07:00``, ``Z``, ``UTC`` or a name
+        such as ``Europe/Paris``. ``None`` means UTC.
+
+    :type name: str
+
+    :rtype: :py:class:`~.datetime.tzinfo`
+    """
+    if name is None or name in ('Z', 'UTC'):
+        return timezone.utc
+    match = OFFSET.match(name)
+    if match:
+        sign, hours, minutes = match.groups()
+        offset = timedelta(hours=int(hours), minutes=int(minutes or 0))
+        return timezone(-offset if sign == '-' else offset)
+    if ZoneInfo is None:
+        raise ValueError(f'Named time zones need Python 3.9 or later: {name}')
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as err:
+        raise ValueError(f'Unknown time zone "{name}"') from err
+
+
+def add(moment, amount, unit):
+    """
+    :returns: ``moment`` plus ``amount`` ``unit`` (s). Calendar units keep the wall
+        clock time, as :py:mod:`java.time` does.
+    :rtype: :py:class:`~.datetime.datetime`
+    """
+    if unit in 'yM':
+        months = moment.month - 1 + amount * (12 if unit == 'y' else 1)
+        year, month = moment.year + months // 12, months % 12 + 1
+        day = min(moment.day, calendar.monthrange(year, month)[1])
+        return moment.replace(year=year, month=month, day=day)
+    if unit in 'wd':
+        return moment + timedelta(days=amount * (7 if unit == 'w' else 1))
+    utc = moment.astimezone(timezone.utc) + timedelta(seconds=amount * SECONDS[unit])
+    return utc.astimezone(moment.tzinfo)
+
+
+def round_down(moment, unit):
+    """
+    :returns: ``moment`` rounded down to the start of its ``unit``. Weeks start on
+        Monday.
+    :rtype: :py:class:`~.datetime.datetime`
+    """
+    if unit == 'w':
+        moment -= timedelta(days=moment.weekday())
+    fields = {'microsecond': 0}
+    if unit in 'yMwdhHm':
+        fields['second'] = 0
+    if unit in 'yMwdhH':
+        fields['minute'] = 0
+    if unit in 'yMwd':
+        fields['hour'] = 0
+    if unit in 'yM':
+        fields['day'] = 1
+    if unit == 'y':
+        fields['month'] = 1
+    return moment.replace(**fields)
+
+
+def render_expression(expression, now):
+    """
+    :param expression: What is between the braces of one date math expression,
+        e.g. ``now-1d/d{yyyy.MM|+01:00}``
+    :param now: The current time
+
+    :type expression: str
+    :type now: :py:class:`~.datetime.datetime`
+
+    :returns: The rendered date
+    :rtype: str
+    """
+    match = EXPRESSION.fullmatch(expression)
+    if not match:
+        raise ValueError(f'Unsupported date math expression "{expression}"')
+    math, pattern, zonename = match.groups()
+    zone = get_zone(zonename)
+    tokens = tokenize(DEFAULT_FORMAT if pattern is None else pattern)
+    if math.startswith('now'):
+        moment = now.astimezone(zone)
+        math = math[3:]
+    else:
+        anchor, separator, math = math.partition('||')
+        if not separator:
+            raise ValueError(f'Date math "{expression}" has no anchor')
+        moment = parse_date(anchor, tokens, zone)
+    pos = 0
+    while pos < len(math):
+        step = MATH.match(math, pos)
+        if not step:
+            raise ValueError(f'Unsupported date math "{math}"')
+        sign, number, unit, rounding = step.groups()
+        if rounding:
+            moment = round_down(moment, rounding)
+        else:
+            amount = int(number or 1)
+            moment = add(moment, -amount if sign == '-' else amount, unit)
+        pos = step.end()
+    return format_date(moment, tokens)
+
+
+def render(template, now=None):
+    """
+    Render each ``{...}`` date math expression in ``template`` and keep the rest.
+    ``\\`` escapes the next character.
+
+    :param template: A date math index name without its ``<`` and ``>``, e.g.
+        ``logs-{now/d}``
+    :param now: The current time. Defaults to the current UTC time.
+
+    :type template: str
+    :type now: :py:class:`~.datetime.datetime`
+
+    :returns: The rendered name
+    :rtype: str
+    """
+    now = now or datetime.now(timezone.utc)
+    rendered = []
+    pos = 0
+    while pos < len(template):
+        char = template[pos]
+        if char == '\\':
+            if pos + 1 == len(template):
+                raise ValueError(f'Dangling escape in "{template}"')
+            rendered.append(template[pos + 1])
+            pos += 2
+        elif char == '{':
+            depth, end = 0, pos
+            for end in range(pos, len(template)):
+                depth += {'{': 1, '}': -1}.get(template[end], 0)
+                if depth == 0:
+                    break
+            if depth:
+                raise ValueError(f'Unbalanced braces in "{template}"')
+            rendered.append(render_expression(template[pos + 1 : end], now))
+            pos = end + 1
+        elif char == '}':
+            raise ValueError(f'Unbalanced braces in "{template}"')
+        else:
+            rendered.append(char)
+            pos += 1
+    return ''.join(rendered)
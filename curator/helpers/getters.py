@@ -2,13 +2,18 @@
 
 import logging
 from opensearchpy import exceptions as opensearch_exceptions
-from curator.defaults.settings import EXCLUDE_SYSTEM
+from curator.defaults.settings import (
+    EXCLUDE_SYSTEM,
+    FILTER_PATHS,
+    SNAPSHOT_PAGE_SIZE,
+)
 from curator.exceptions import (
     ConfigurationError,
     CuratorException,
     FailedExecution,
     MissingArgument,
 )
+from curator.helpers.utils import chunk_index_list
 
 
 def byte_size(num, suffix='B'):
@@ -46,6 +51,25 @@ def escape_dots(stringval):
     return stringval.replace('.', r'\.')
 
 
+def routing_filter_path(idx, fields):
+    """
+    Build a ``filter_path`` for :py:meth:`~.OpenSearch.client.ClusterClient.state`
+    which only returns ``fields`` for each shard copy of index ``idx`` in the
+    ``routing_table``
+
+    :param idx: An index name
+    :param fields: The shard copy fields to return, e.g. ``state`` or ``node``
+
+    :type idx: str
+    :type fields: list
+
+    :returns: A comma-separated ``filter_path``
+    :rtype: str
+    """
+    prefix = f'routing_table.indices.{escape_dots(idx)}.shards.*'
+    return ','.join(f'{prefix}.{field}' for field in fields)
+
+
 def get_alias_actions(oldidx, newidx, aliases):
     """
     :param oldidx: The old index name
@@ -85,7 +109,7 @@ def get_data_tiers(client):
             return True
         return False
 
-    info = client.nodes.info()['nodes']
+    info = client.nodes.info(filter_path=FILTER_PATHS['node_roles'])['nodes']
     retval = {
         'data_hot': False,
         'data_warm': False,
@@ -145,6 +169,37 @@ def get_indices(client, search_pattern='*', include_hidden=False):
     return indices
 
 
+def get_existing_indices(client, indices):
+    """
+    Calls :py:meth:`~.OpenSearch.client.CatClient.indices` for ``indices`` only, one
+    :py:func:`~.curator.helpers.utils.chunk_index_list` chunk at a time, skipping
+    names that do not exist.
+
+    :param client: A client connection object
+    :param indices: The index names to look for
+
+    :type client: :py:class:`~.OpenSearch.OpenSearch`
+    :type indices: list
+
+    :returns: The names in ``indices`` that exist as open or closed indices
+    :rtype: set
+    """
+    wanted = set(indices)
+    existing = set()
+    if not wanted:
+        return existing
+    for chunk in chunk_index_list(indices):
+        resp = client.cat.indices(
+            index=','.join(chunk),
+            expand_wildcards='open,closed',
+            h='index',
+            format='json',
+            params={'ignore_unavailable': 'true'},
+        )
+        existing.update(entry['index'] for entry in resp or [])
+    return existing & wanted
+
+
 def get_repository(client, repository=''):
     """
     Calls :py:meth:`~.OpenSearch.client.SnapshotClient.get_repository`
@@ -234,7 +289,9 @@ def get_snapshot_data(client, repository=None):
     if not repository:
         raise MissingArgument('No value for "repository" provided')
     try:
-        return client.snapshot.get(repository=repository, snapshot="*")['snapshots']
+        return client.snapshot.get(
+            repository=repository, snapshot="*", filter_path=FILTER_PATHS['snapshots']
+        ).get('snapshots', [])
     except (
         opensearch_exceptions.TransportError,
         opensearch_exceptions.NotFoundError,
@@ -252,6 +309,117 @@ def get_snapshot_data(client, repository=None):
         raise FailedExecution(msg) from err
 
 
+def get_snapshot_names(client, repository=None):
+    """
+    Get the names of all snapshots in a repository, without any other snapshot
+    metadata. Calls :py:meth:`~.OpenSearch.client.CatClient.snapshots`
+
+    :param client: A client connection object
+    :param repository: The OpenSearch snapshot repository to use
+
+    :type client: :py:class:`~.OpenSearch.OpenSearch`
+    :type repository: str
+
+    :returns: The list of snapshot names in ``repository``
+    :rtype: list
+    """
+    if not repository:
+        raise MissingArgument('No value for "repository" provided')
+    try:
+        resp = client.cat.snapshots(repository=repository, h='id', format='json')
+    except Exception as err:
+        raise FailedExecution(
+            f'Unable to list snapshot names in repository: {repository}. '
+            f'Error: {err}'
+        ) from err
+    return [entry['id'] for entry in resp or []]
+
+
+def get_snapshot_states(client, repository=None):
+    """
+    Get the name, state and end time of all snapshots in a repository. Calls
+    :py:meth:`~.OpenSearch.client.CatClient.snapshots`
+
+    :param client: A client connection object
+    :param repository: The OpenSearch snapshot repository to use
+
+    :type client: :py:class:`~.OpenSearch.OpenSearch`
+    :type repository: str
+
+    :returns: A :py:class:`dict` of ``_cat/snapshots`` rows with the ``status`` and
+        ``end_epoch`` of each snapshot, keyed by snapshot name, in listing order
+    :rtype: dict
+    """
+    if not repository:
+        raise MissingArgument('No value for "repository" provided')
+    try:
+        resp = client.cat.snapshots(
+            repository=repository, h='id,status,end_epoch', format='json'
+        )
+    except Exception as err:
+        raise FailedExecution(
+            f'Unable to list snapshots in repository: {repository}. Error: {err}'
+        ) from err
+    return {entry['id']: entry for entry in resp or []}
+
+
+def iter_snapshot_data(
+    client, repository=None, page_size=SNAPSHOT_PAGE_SIZE, names=None
+):
+    """
+    Get compact snapshot records from repository, one page of at most ``page_size``
+    snapshots at a time. Each page is a separate call to
+    :py:meth:`~.OpenSearch.client.SnapshotClient.get` for an explicit list of
+    snapshot names (also kept under the URL length limit by
+    :py:func:`~.curator.helpers.utils.chunk_index_list`), filtered to
+    :py:const:`~.curator.defaults.settings.SNAPSHOT_COMPACT_FIELDS`, so neither the
+    cluster nor Curator ever holds the metadata of every snapshot at once.
+
+    :param client: A client connection object
+    :param repository: The OpenSearch snapshot repository to use
+    :param page_size: The number of snapshots to get per request
+    :param names: The snapshot names to get. If ``None``, get every snapshot from
+        :py:func:`get_snapshot_names`
+
+    :type client: :py:class:`~.OpenSearch.OpenSearch`
+    :type repository: str
+    :type page_size: int
+    :type names: list
+
+    :returns: A generator of compact snapshot :py:class:`dict` records
+    :rtype: generator
+    """
+    if not repository:
+        raise MissingArgument('No value for "repository" provided')
+    if names is None:
+        names = get_snapshot_names(client, repository=repository)
+    if not names:
+        return
+    pages = (
+        chunk[start : start + page_size]
+        for chunk in chunk_index_list(names)
+        for start in range(0, len(chunk), page_size)
+    )
+    for page in pages:
+        try:
+            resp = client.snapshot.get(
+                repository=repository,
+                snapshot=','.join(page),
+                ignore_unavailable=True,
+                filter_path=FILTER_PATHS['snapshots_compact'],
+            )
+        except (
+            opensearch_exceptions.TransportError,
+            opensearch_exceptions.NotFoundError,
+        ) as err:
+            msg = (
+                f'Unable to get snapshot information from repository: '
+                f'{repository}. Error: {err.__class__.__name__}'
+            )
+            raise FailedExecution(msg) from err
+        yield from resp.get('snapshots', [])
+
+
 def get_tier_preference(client, target_tier='data_frozen'):
     """Do the tier preference thing in reverse order from coldest to hottest
     Based on the value of ``target_tier``, build out the list to use.
@@ -0,0 +1,97 @@
+"""Sampled, lazily formatted logging for per-index and per-snapshot loops"""
+
+import logging
+import time
+
+#: Always log the per-item DEBUG records for this many items
+SAMPLE_FIRST = 10
+#: After :py:data:`SAMPLE_FIRST`, only log the per-item DEBUG records of every Nth
+#: item. Set to ``1`` to log every item.
+SAMPLE_EVERY = 100
+
+
+class LogSampler:
+    """
+    Per-item log records are only built when DEBUG is enabled, and then only for a
+    sample of the items: the first :py:data:`SAMPLE_FIRST`, then every
+    :py:data:`SAMPLE_EVERY`-th one. :py:meth:`summary` reports the outcome of the
+    whole loop in one INFO line, along with how many DEBUG records were skipped.
+
+    Messages use :py:mod:`logging` style ``%s`` placeholders and are never formatted
+    unless they are emitted.
+
+    :param logger: The logger to write to
+    :param name: What is being looped over, e.g. the filtertype
+    :param noun: What each item is, used in :py:meth:`summary`
+
+    :type logger: :py:class:`logging.Logger`
+    :type name: str
+    :type noun: str
+    """
+
+    def __init__(self, logger, name, noun='items'):
+        #: The :py:class:`logging.Logger` to write to
+        self.logger = logger
+        #: What is being looped over
+        self.name = name
+        #: What each item is
+        self.noun = noun
+        #: The number of items completed so far, via :py:meth:`done`
+        self.seen = 0
+        #: The number of DEBUG records skipped by sampling
+        self.skipped = 0
+        #: Whether DEBUG records will be emitted at all. Checked only once.
+        self.enabled = logger.isEnabledFor(logging.DEBUG)
+        self.start = time.perf_counter()
+
+    @property
+    def sampled(self):
+        """
+        :returns: Whether DEBUG records for the current item should be emitted
+        :rtype: bool
+        """
+        if not self.enabled:
+            return False
+        return self.seen < SAMPLE_FIRST or self.seen % SAMPLE_EVERY == 0
+
+    def debug(self, msg, *args):
+        """Log ``msg % args`` at DEBUG if the current item is sampled"""
+        if self.sampled:
+            self.logger.debug(msg, *args)
+        elif self.enabled:
+            self.skipped += 1
+
+    def done(self, msg=None, *args):
+        """
+        Mark the current item as complete, logging ``msg % args`` at DEBUG if the item
+        is sampled.
+        """
+        if msg:
+            self.debug(msg, *args)
+        self.seen += 1
+
+    def summary(self, before, after):
+        """
+        Log one INFO line with the outcome of the loop.
+
+        :param before: The number of items before the loop
+        :param after: The number of items remaining after the loop
+
+        :type before: int
+        :type after: int
+        """
+        self.logger.info(
+            '%s: %s of %s %s remain, %s removed (%.3fs)',
+            self.name,
+            after,
+            before,
+            self.noun,
+            before - after,
+            time.perf_counter() - self.start,
+        )
+        if self.skipped:
+            self.logger.debug(
+                '%s: %s per-item DEBUG records were not sampled',
+                self.name,
+                self.skipped,
+            )
@@ -0,0 +1,297 @@
+"""Run metrics in the Prometheus text exposition format"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from opensearch_client.accounting import LATENCY_BUCKETS
+
+#: The name prefix of every metric
+PREFIX = 'curator'
+#: ``(name, type, help)`` of each metric, in the order they are written
+DEFINITIONS = [
+    ('run_start_timestamp_seconds', 'gauge', 'When the last run started.'),
+    ('run_duration_seconds', 'gauge', 'Duration of the last run.'),
+    ('run_success', 'gauge', '1 if no action failed in the last run, otherwise 0.'),
+    ('action_duration_seconds', 'gauge', 'Duration of the action.'),
+    ('action_failed', 'gauge', '1 if the action failed, otherwise 0.'),
+    ('action_skipped', 'gauge', '1 if the action was skipped on an empty list.'),
+    ('action_selected', 'gauge', 'Items selected by the filters of the action.'),
+    ('action_acted', 'gauge', 'Items the action was performed on.'),
+    ('action_wait_polls', 'gauge', 'Completion checks made while waiting.'),
+    ('action_wait_seconds', 'gauge', 'Time spent waiting for completion.'),
+    ('api_request_errors', 'gauge', 'API requests which failed.'),
+    ('api_response_bytes', 'gauge', 'Response bytes returned by API requests.'),
+    ('api_request_duration_seconds', 'histogram', 'API request latency.'),
+]
+
+
+def escape(value):
+    """
+    :param value: A label value
+
+    :type value: str
+
+    :returns: ``value`` with backslashes, double quotes and newlines escaped
+    :rtype: str
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def sample(name, labels, value):
+    """
+    :param name: The sample name, without :py:data:`PREFIX`
+    :param labels: The label names and values
+    :param value: The sample value
+
+    :type name: str
+    :type labels: dict
+    :type value: int or float
+
+    :returns: One sample line
+    :rtype: str
+    """
+    pairs = ','.join(f'{key}="{escape(val)}"' for key, val in labels.items())
+    if isinstance(value, float):
+        value = repr(round(value, 6))
+    return (
+        f'{PREFIX}_{name}{{{pairs}}} {value}' if pairs else f'{PREFIX}_{name} {value}'
+    )
+
+
+class ActionMetrics:
+    """
+    What happened in one action
+
+    :param idx: The action ID
+    :param action: The action name
+
+    :type idx: int
+    :type action: str
+    """
+
+    def __init__(self, idx, action):
+        #: The action ID
+        self.idx = idx
+        #: The action name
+        self.action = action
+        #: ``indices`` or ``snapshots``, if the action works on a list
+        self.kind = None
+        #: The number of items left after filtering
+        self.selected = None
+        #: The number of items the action was performed on
+        self.acted = None
+        #: Duration of the action in seconds
+        self.seconds = 0.0
+        #: Whether the action failed
+        self.failed = False
+        #: Whether the action was skipped because its list was empty
+        self.skipped = False
+        #: The number of completion checks made by ``wait_for_it``
+        self.polls = 0
+        #: Time spent in ``wait_for_it``, in seconds
+        self.wait_seconds = 0.0
+
+
+class RunMetrics:
+    """
+    Collects :py:class:`ActionMetrics` for each action of a run, and writes them,
+    with the API request statistics of
+    :py:data:`~.opensearch_client.accounting.ACCOUNTING`, as a Prometheus text file.
+
+    Every sample is labeled with :py:attr:`cluster`, so that runs against different
+    clusters can be collected from the same textfile directory.
+    """
+
+    def __init__(self):
+        self.loggit = logging.getLogger('curator.helpers.metrics')
+        #: The cluster name added to every sample
+        self.cluster = ''
+        #: :py:class:`ActionMetrics` for each action, in the order they ran
+        self.actions = []
+        #: The :py:class:`ActionMetrics` of the action running now, if any
+        self.current = None
+        #: When the run started, in seconds since the epoch
+        self.started = time.time()
+
+    def reset(self):
+        """Discard everything recorded so far and restart the run clock"""
+        self.__init__()
+
+    @contextmanager
+    def action(self, idx, action):
+        """
+        Time the action in this context, and make it :py:attr:`current`
+
+        :param idx: The action ID
+        :param action: The action name
+
+        :type idx: int
+        :type action: str
+
+        :returns: The metrics of the action
+        :rtype: :py:class:`ActionMetrics`
+        """
+        record = ActionMetrics(idx, action)
+        self.actions.append(record)
+        self.current = record
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            self.current = None
+
+    def selected(self, kind, count):
+        """
+        Record the number of ``kind`` items selected by the filters of the current
+        action
+
+        :type kind: str
+        :type count: int
+        """
+        if self.current:
+            self.current.kind = kind
+            self.current.selected = count
+
+    def acted(self, kind, count):
+        """
+        Record the number of ``kind`` items the current action was performed on
+
+        :type kind: str
+        :type count: int
+        """
+        if self.current:
+            self.current.kind = kind
+            self.current.acted = count
+
+    def waited(self, polls, seconds):
+        """
+        Add a ``wait_for_it`` call to the current action
+
+        :param polls: The number of completion checks made
+        :param seconds: The time spent waiting
+
+        :type polls: int
+        :type seconds: float
+        """
+        if self.current:
+            self.current.polls += polls
+            self.current.wait_seconds += seconds
+
+    def lines(self, accounting=None):
+        """
+        :param accounting: API request statistics to include
+
+        :type accounting:
+            :py:class:`~.opensearch_client.accounting.RequestAccounting`
+
+        :returns: The lines of the text file
+        :rtype: list
+        """
+        samples = {name: [] for name, _, _ in DEFINITIONS}
+
+        def add(name, labels, value):
+            samples[name].append((name, labels, value))
+
+        run = {'cluster': self.cluster}
+        failed = any(record.failed for record in self.actions)
+        add('run_start_timestamp_seconds', run, float(self.started))
+        add('run_duration_seconds', run, time.time() - self.started)
+        add('run_success', run, 0 if failed else 1)
+        for record in self.actions:
+            labels = {**run, 'action_id': record.idx, 'action': record.action}
+            add('action_duration_seconds', labels, record.seconds)
+            add('action_failed', labels, int(record.failed))
+            add('action_skipped', labels, int(record.skipped))
+            counted = {**labels, 'kind': record.kind or ''}
+            if record.selected is not None:
+                add('action_selected', counted, record.selected)
+            if record.acted is not None:
+                add('action_acted', counted, record.acted)
+            if record.polls:
+                add('action_wait_polls', labels, record.polls)
+                add('action_wait_seconds', labels, record.wait_seconds)
+        if accounting is not None:
+            self.api_samples(samples, accounting)
+        lines = []
+        for name, kind, text in DEFINITIONS:
+            if not samples[name]:
+                continue
+            lines.append(f'# HELP {PREFIX}_{name} {text}')
+            lines.append(f'# TYPE {PREFIX}_{name} {kind}')
+            lines.extend(sample(*item) for item in samples[name])
+        return lines
+
+    def api_samples(self, samples, accounting):
+        """
+        Add the API request statistics in ``accounting`` to ``samples``, per action
+        and endpoint. Requests made by the filters of an action are included in the
+        action.
+
+        :type samples: dict
+        :type accounting:
+            :py:class:`~.opensearch_client.accounting.RequestAccounting`
+        """
+        totals = {}
+        for row in accounting.rows():
+            idx, _, action = row['action'].partition(':')
+            key = (idx, action, row['endpoint'])
+            total = totals.setdefault(
+                key, {'errors': 0, 'bytes': 0, 'seconds': 0.0, 'histogram': {}}
+            )
+            total['errors'] += row['errors']
+            total['bytes'] += row['bytes']
+            total['seconds'] += row['seconds']
+            for bound, count in row['histogram'].items():
+                total['histogram'][bound] = total['histogram'].get(bound, 0) + count
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ['+Inf']
+        name = 'api_request_duration_seconds'
+        for (idx, action, endpoint), total in totals.items():
+            labels = {
+                'cluster': self.cluster,
+                'action_id': idx,
+                'action': action,
+                'endpoint': endpoint,
+            }
+            samples['api_request_errors'].append(
+                ('api_request_errors', labels, total['errors'])
+            )
+            samples['api_response_bytes'].append(
+                ('api_response_bytes', labels, total['bytes'])
+            )
+            histogram = samples[name]
+            for bound in bounds:
+                count = total['histogram'].get(bound, 0)
+                histogram.append((f'{name}_bucket', {**labels, 'le': bound}, count))
+            histogram.append((f'{name}_sum', labels, total['seconds']))
+            histogram.append((f'{name}_count', labels, total['histogram']['+Inf']))
+
+    def write(self, path, accounting=None):
+        """
+        Write :py:meth:`lines` to ``path``. The file is written to a temporary file
+        first, then renamed, so a textfile collector never reads a partial file.
+        Failure to write is logged, not raised.
+
+        :param path: The file to write, e.g. ``/var/lib/node_exporter/curator.prom``
+        :param accounting: API request statistics to include
+
+        :type path: str
+        :type accounting:
+            :py:class:`~.opensearch_client.accounting.RequestAccounting`
+        """
+        tmpfile = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(tmpfile, 'w', encoding='utf-8') as fhandle:
+                fhandle.write('\n'.join(self.lines(accounting=accounting)) + '\n')
+            os.replace(tmpfile, path)
+        except OSError as err:
+            self.loggit.error('Unable to write metrics to %s: %s', path, err)
+            try:
+                os.remove(tmpfile)
+            except OSError:
+                pass
+
+
+#: The :py:class:`RunMetrics` of the current run
+METRICS = RunMetrics()
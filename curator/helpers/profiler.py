@@ -0,0 +1,187 @@
+"""Per-action cProfile profiles, with time split by category"""
+
+import cProfile
+import logging
+import os
+import pstats
+import re
+from contextlib import contextmanager
+import opensearch_client
+
+#: How many functions :py:func:`hot_functions` reports
+PROFILE_TOP = 15
+#: ``(category, paths, modules)``, checked in order. A function is in the first
+#: category with one of ``paths`` in its file path or, for a built-in function, one
+#: of ``modules`` as its module.
+CATEGORIES = [
+    (
+        'json',
+        ('/json/', '/simplejson/', '/opensearchpy/serializer.py'),
+        ('_json', 'orjson'),
+    ),
+    (
+        'network',
+        (
+            '/socket.py',
+            '/ssl.py',
+            '/selectors.py',
+            '/http/client.py',
+            '/urllib3/',
+            '/requests/',
+        ),
+        ('_socket', '_ssl', 'select'),
+    ),
+    (
+        'curator',
+        (
+            os.path.dirname(os.path.dirname(__file__)) + os.sep,
+            os.path.dirname(opensearch_client.__file__) + os.sep,
+        ),
+        (),
+    ),
+]
+#: The module of a built-in function, from its :py:mod:`pstats` name, e.g.
+#: ``<built-in method _json.scanstring>`` or
+#: ``<method 'recv_into' of '_socket.socket' objects>``
+BUILTIN_MODULE = re.compile(
+    r"^<(?:built-in (?:method|function) |method '\w+' of ')(\w+)\."
+)
+
+
+def category(func):
+    """
+    :param func: A :py:mod:`pstats` function key
+
+    :type func: tuple
+
+    :returns: ``json``, ``network``, ``curator`` or ``other``. See
+        :py:data:`CATEGORIES`
+    :rtype: str
+    """
+    filename, _, funcname = func
+    if filename == '~':
+        match = BUILTIN_MODULE.match(funcname)
+        module = match.group(1) if match else None
+        for label, _, modules in CATEGORIES:
+            if module in modules:
+                return label
+        return 'other'
+    path = filename.replace('\\', '/')
+    for label, paths, _ in CATEGORIES:
+        if any(marker.replace('\\', '/') in path for marker in paths):
+            return label
+    return 'other'
+
+
+def describe(func):
+    """
+    :param func: A :py:mod:`pstats` function key
+
+    :type func: tuple
+
+    :returns: A short name for ``func``, e.g. ``curator/indexlist.py:120(filter)``
+    :rtype: str
+    """
+    filename, lineno, funcname = func
+    if filename == '~':
+        return funcname
+    parts = filename.replace('\\', '/').split('/')
+    return f"{'/'.join(parts[-2:])}:{lineno}({funcname})"
+
+
+def category_totals(stats):
+    """
+    :param stats: A profile
+
+    :type stats: :py:class:`pstats.Stats`
+
+    :returns: Seconds spent in each category, counting the own time of each function
+        so that the categories add up to the total
+    :rtype: dict
+    """
+    totals = {label: 0.0 for label, _, _ in CATEGORIES}
+    totals['other'] = 0.0
+    for func, (_, _, tottime, _, _) in stats.stats.items():
+        totals[category(func)] += tottime
+    return totals
+
+
+def hot_functions(stats, top=PROFILE_TOP):
+    """
+    :param stats: A profile
+    :param top: How many functions to return
+
+    :type stats: :py:class:`pstats.Stats`
+    :type top: int
+
+    :returns: ``(own seconds, cumulative seconds, calls, category, name)`` for the
+        ``top`` functions with the most own time, slowest first
+    :rtype: list
+    """
+    rows = [
+        (tottime, cumtime, calls, category(func), describe(func))
+        for func, (_, calls, tottime, cumtime, _) in stats.stats.items()
+    ]
+    return sorted(rows, reverse=True)[:top]
+
+
+def log_profile(logger, name, stats):
+    """
+    Log the :py:func:`category_totals` and :py:func:`hot_functions` of ``stats``
+
+    :type logger: :py:class:`logging.Logger`
+    :type name: str
+    :type stats: :py:class:`pstats.Stats`
+    """
+    total = stats.total_tt or 1e-9
+    totals = category_totals(stats)
+    logger.info(
+        'Profile of %s: %.3fs total. %s',
+        name,
+        stats.total_tt,
+        ', '.join(
+            f'{label} {seconds:.3f}s ({100 * seconds / total:.0f}%)'
+            for label, seconds in totals.items()
+        ),
+    )
+    logger.info('Hottest functions by own time (own s, cumulative s, calls):')
+    for tottime, cumtime, calls, label, func in hot_functions(stats):
+        logger.info('%9.3f %9.3f %9d  %-8s %s', tottime, cumtime, calls, label, func)
+
+
+@contextmanager
+def profiled(name, directory=None):
+    """
+    Profile the code in this context with :py:mod:`cProfile`. The profile is written
+    to ``<directory>/<name>.prof``, which can be read with :py:mod:`pstats` or
+    tools such as ``snakeviz``, and summarized with :py:func:`log_profile`. The
+    profile is written even if the context exits with an exception, including
+    :py:exc:`SystemExit`.
+
+    Nothing is profiled if ``directory`` is not set.
+
+    :param name: The profile name, e.g. ``1-delete_indices``
+    :param directory: The directory to write the profile to
+
+    :type name: str
+    :type directory: str
+    """
+    if not directory:
+        yield
+        return
+    logger = logging.getLogger('curator.helpers.profiler')
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        stats = pstats.Stats(profiler)
+        path = os.path.join(directory, f'{name}.prof')
+        try:
+            os.makedirs(directory, exist_ok=True)
+            stats.dump_stats(path)
+            logger.info('Profile written to %s', path)
+        except OSError as err:
+            logger.error('Unable to write profile to %s: %s', path, err)
+        log_profile(logger, name, stats)
@@ -0,0 +1,144 @@
+"""Persistent local cache of completed snapshot metadata"""
+
+import json
+import logging
+import os
+from urllib.parse import quote
+
+#: Bump this when the layout of the cache file changes
+CACHE_FORMAT = 1
+#: Snapshots in these states will never change, so they can be cached
+COMPLETED_STATES = ['SUCCESS', 'PARTIAL', 'FAILED', 'INCOMPATIBLE']
+#: The snapshot fields that are cached
+CACHED_FIELDS = [
+    'snapshot',
+    'uuid',
+    'state',
+    'start_time_in_millis',
+    'end_time_in_millis',
+    'indices',
+]
+
+
+class SnapshotCache:
+    """
+    Completed snapshots are immutable, so their metadata can be kept between runs.
+    The cache for each repository is one JSON file in directory ``path``, with the
+    entries keyed by snapshot UUID.
+
+    A cached entry is only used if a fresh name-only listing still shows a snapshot
+    with that name, in the same state and with the same end time (see
+    :py:meth:`matches`). Entries for deleted snapshots are dropped on the next
+    :py:meth:`update`.
+
+    :param path: The directory to keep cache files in
+    :param repository: The snapshot repository name
+
+    :type path: str
+    :type repository: str
+    """
+
+    def __init__(self, path, repository):
+        self.loggit = logging.getLogger('curator.helpers.snapshotcache')
+        #: The snapshot repository name
+        self.repository = repository
+        #: The cache file for :py:attr:`repository`
+        self.filename = os.path.join(
+            path, f'{quote(repository, safe="")}.snapshots.json'
+        )
+        #: Cached snapshot metadata, keyed by snapshot UUID
+        self.entries = {}
+
+    def load(self):
+        """
+        Read :py:attr:`entries` from :py:attr:`filename`. A missing, unreadable or
+        mismatched cache file results in an empty cache, not an error.
+        """
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as fhandle:
+                cached = json.load(fhandle)
+            if (
+                cached['format'] != CACHE_FORMAT
+                or cached['repository'] != self.repository
+            ):
+                self.loggit.debug('Ignoring outdated cache file %s', self.filename)
+                return
+            self.entries = cached['snapshots']
+        except FileNotFoundError:
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            self.loggit.warning(
+                'Ignoring unreadable snapshot cache %s: %s', self.filename, err
+            )
+            return
+        self.loggit.debug(
+            'Loaded %s cached snapshots from %s', len(self.entries), self.filename
+        )
+
+    def by_name(self):
+        """
+        :returns: The cached entries, keyed by snapshot name
+        :rtype: dict
+        """
+        return {entry['snapshot']: entry for entry in self.entries.values()}
+
+    @staticmethod
+    def matches(entry, listing):
+        """
+        :param entry: A cached entry
+        :param listing: The ``_cat/snapshots`` row for the snapshot with the same name,
+            with ``status`` and ``end_epoch``
+
+        :type entry: dict
+        :type listing: dict
+
+        :returns: Whether ``entry`` describes the snapshot in ``listing``
+        :rtype: bool
+        """
+        try:
+            same_state = entry['state'] == listing['status']
+            end_epoch = entry['end_time_in_millis'] // 1000
+            return same_state and end_epoch == int(listing['end_epoch'])
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    def update(self, records):
+        """
+        Replace :py:attr:`entries` with the completed snapshots in ``records``
+
+        :param records: Snapshot records. Either :py:class:`dict` or
+            :py:class:`~.curator.snapshotlist.SnapshotRecord`
+
+        :type records: iterable
+        """
+        self.entries = {
+            record['uuid']: {field: record.get(field) for field in CACHED_FIELDS}
+            for record in records
+            if record.get('uuid') and record.get('state') in COMPLETED_STATES
+        }
+
+    def save(self):
+        """
+        Write :py:attr:`entries` to :py:attr:`filename`. Failure to write is not an
+        error.
+        """
+        payload = {
+            'format': CACHE_FORMAT,
+            'repository': self.repository,
+            'snapshots': self.entries,
+        }
+        tmpfile = f'{self.filename}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.filename), mode=0o700, exist_ok=True)
+            fdesc = os.open(tmpfile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fdesc, 'w', encoding='utf-8') as fhandle:
+                json.dump(payload, fhandle)
+            os.replace(tmpfile, self.filename)
+        except (OSError, TypeError, ValueError) as err:
+            self.loggit.warning(
+                'Unable to write snapshot cache %s: %s', self.filename, err
+            )
+            try:
+                os.remove(tmpfile)
+            except OSError:
+                pass
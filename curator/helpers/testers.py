@@ -1,6 +1,8 @@
 """Utility functions that get things"""
 
 import logging
+from copy import deepcopy
+from fnmatch import fnmatchcase
 from voluptuous import Schema
 from opensearchpy import OpenSearch
 from opensearchpy.exceptions import NotFoundError
@@ -20,7 +22,7 @@ from curator.defaults.settings import (
 )
 from curator.validators import actions, options
 from curator.validators.filter_functions import validfilters
-from curator.helpers.utils import report_failure
+from curator.helpers.utils import chunk_index_list, report_failure, to_csv
 
 
 def has_lifecycle_name(idx_settings):
@@ -85,6 +87,34 @@ def ilm_policy_check(client, alias):
     return False
 
 
+def ilm_policy_indices(client, indices):
+    """
+    Calls :py:meth:`~.OpenSearch.client.IndicesClient.get_settings` for
+    ``indices`` only, one :py:func:`~.curator.helpers.utils.chunk_index_list` chunk
+    at a time
+
+    :param client: A client connection object
+    :param indices: The index names to check
+
+    :type client: :py:class:`~.OpenSearch.OpenSearch`
+    :type indices: list
+
+    :returns: The indices in ``indices`` that are associated with an ILM policy
+    :rtype: set
+    """
+    managed = set()
+    for chunk in chunk_index_list(indices):
+        response = client.indices.get_settings(
+            index=to_csv(chunk), filter_path='*.settings.index.lifecycle.name'
+        )
+        managed.update(
+            index
+            for index, data in (response or {}).items()
+            if has_lifecycle_name(data.get('settings', {}).get('index', {}))
+        )
+    return managed
+
+
 def repository_exists(client, repository=None):
     """
     Calls :py:meth:`~.OpenSearch.client.SnapshotClient.get_repository`
@@ -137,6 +167,23 @@ def rollable_alias(client, alias):
     except NotFoundError:
         logger.error('Alias "%s" not found.', alias)
         return False
+    return rollover_index(alias, response) is not None
+
+
+def rollover_index(alias, response):
+    """
+    :param alias: An OpenSearch alias
+    :param response: The indices ``alias`` points to, in the layout of
+        :py:meth:`~.OpenSearch.client.IndicesClient.get_alias`
+
+    :type alias: str
+    :type response: dict
+
+    :returns: The index the ``_rollover`` API would roll over for ``alias``, or
+        ``None`` if ``alias`` cannot be rolled over
+    :rtype: str
+    """
+    logger = logging.getLogger(__name__)
     # Response should be like:
     # {'there_should_be_only_one': {'aliases': {'value of "alias" here': {}}}}
     # where 'there_should_be_only_one' is a single index name that ends in a number,
@@ -146,25 +193,61 @@ def rollable_alias(client, alias):
     for idx in response:
         if 'is_write_index' in response[idx]['aliases'][alias]:
             if response[idx]['aliases'][alias]['is_write_index']:
-                return True
+                return idx
     # implied ``else``: If not ``is_write_index``, it has to fit the following criteria:
     if len(response) > 1:
         logger.error(
             '"alias" must only reference one index, but points to %s', response
         )
-        return False
+        return None
     index = list(response.keys())[0]
-    rollable = False
-    # In order for `rollable` to be True, the last 2 digits of the index
+    # In order for the alias to be rollable, the last 2 digits of the index
     # must be digits, or a hyphen followed by a digit.
     # NOTE: This is not a guarantee that the rest of the index name is
     # necessarily correctly formatted.
     if index[-2:][1].isdigit():
-        if index[-2:][0].isdigit():
-            rollable = True
-        elif index[-2:][0] == '-':
-            rollable = True
-    return rollable
+        if index[-2:][0].isdigit() or index[-2:][0] == '-':
+            return index
+    return None
+
+
+def rollable_aliases(client, names):
+    """
+    Calls :py:meth:`~.OpenSearch.client.CatClient.aliases` once for all of
+    ``names``
+
+    :param client: A client connection object
+    :param names: Alias names or wildcard patterns
+
+    :type client: :py:class:`~.OpenSearch.OpenSearch`
+    :type names: list
+
+    :returns: The index the ``_rollover`` API would roll over for each alias that
+        matches ``names`` and can be rolled over, as :py:func:`rollable_alias` sees it
+    :rtype: dict
+    """
+    logger = logging.getLogger(__name__)
+    rows = client.cat.aliases(
+        name=','.join(names), format='json', h='alias,index,is_write_index'
+    )
+    responses = {}
+    for row in rows:
+        write = row.get('is_write_index')
+        flags = {} if write in (None, '-') else {'is_write_index': write == 'true'}
+        responses.setdefault(row['alias'], {})[row['index']] = {
+            'aliases': {row['alias']: flags}
+        }
+    for name in names:
+        if not any(fnmatchcase(alias, name) for alias in responses):
+            logger.error('Alias "%s" not found.', name)
+    targets = {}
+    for alias, response in responses.items():
+        index = rollover_index(alias, response)
+        if index is None:
+            logger.error('Unable to roll over alias "%s"', alias)
+        else:
+            targets[alias] = index
+    return targets
 
 
 def snapshot_running(client):
@@ -220,12 +303,16 @@ def validate_actions(data):
         current_action = valid_structure['action']
         # And let's update the location with the action.
         loc = f'Action ID "{action_id}", action "{current_action}"'
-        clean_options = SchemaCheck(
-            prune_nones(valid_structure['options']),
-            options.get_schema(current_action),
-            'options',
-            loc,
-        ).result()
+        # The options schema is memoized, so copy the result to avoid sharing its
+        # mutable defaults between actions.
+        clean_options = deepcopy(
+            SchemaCheck(
+                prune_nones(valid_structure['options']),
+                options.get_schema(current_action),
+                'options',
+                loc,
+            ).result()
+        )
         clean_config[action_id] = {
             'action': current_action,
             'description': valid_structure['description'],
@@ -1,12 +1,29 @@
 """Utility helper functions"""
 
+import contextvars
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from opensearch_client.utils import ensure_list
 from curator.exceptions import FailedExecution
 
 logger = logging.getLogger(__name__)
 
+#: Seconds in each unit of an OpenSearch time value
+TIME_UNITS = {
+    'nanos': 1e-9,
+    'micros': 1e-6,
+    'ms': 1e-3,
+    's': 1,
+    'm': 60,
+    'h': 3600,
+    'd': 86400,
+}
+TIME_VALUE = re.compile(r'(\d+(?:\.\d+)?)(nanos|micros|ms|s|m|h|d)')
+#: The first letter of each unit of an OpenSearch byte size, in powers of 1024
+BYTE_UNITS = 'bkmgtp'
+BYTE_SIZE = re.compile(r'(\d+(?:\.\d+)?)(b|kb?|mb?|gb?|tb?|pb?)')
+
 
 def chunk_index_list(indices):
     """
@@ -36,6 +53,41 @@ def chunk_index_list(indices):
     return chunks
 
 
+def run_concurrently(func, items, concurrency):
+    """
+    Call ``func`` with each of ``items``, with at most ``concurrency`` calls in
+    flight. Every item is tried, whether or not the others fail.
+
+    :param func: The function to call with each item
+    :param items: The items
+    :param concurrency: The maximum number of calls in flight
+
+    :type func: callable
+    :type items: list
+    :type concurrency: int
+
+    :returns: The ``(item, result)`` of each call that succeeded, and the
+        ``(item, exception)`` of each that failed, both in the order of ``items``
+    :rtype: tuple
+    """
+    items = list(items)
+    done = []
+    failed = []
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Each request gets a copy of the context, to trace it under the action
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, item)
+            for item in items
+        ]
+        for item, future in zip(items, futures):
+            try:
+                done.append((item, future.result()))
+            # pylint: disable=broad-except
+            except Exception as err:
+                failed.append((item, err))
+    return done, failed
+
+
 def report_failure(exception):
     """
     Raise a :py:exc:`~.curator.exceptions.FailedExecution` exception and include
@@ -103,6 +155,36 @@ def to_csv(indices):
     return None
 
 
+def parse_time_value(value):
+    """
+    :param value: An OpenSearch time value, e.g. ``7d`` or ``90m``
+
+    :type value: str
+
+    :returns: ``value`` in seconds
+    :rtype: float
+    """
+    match = TIME_VALUE.fullmatch(str(value).strip().lower())
+    if not match:
+        raise ValueError(f'Unsupported time value "{value}"')
+    return float(match.group(1)) * TIME_UNITS[match.group(2)]
+
+
+def parse_byte_size(value):
+    """
+    :param value: An OpenSearch byte size value, e.g. ``50gb`` or ``1g``
+
+    :type value: str
+
+    :returns: ``value`` in bytes
+    :rtype: int
+    """
+    match = BYTE_SIZE.fullmatch(str(value).strip().lower())
+    if not match:
+        raise ValueError(f'Unsupported byte size "{value}"')
+    return int(float(match.group(1)) * 1024 ** BYTE_UNITS.index(match.group(2)[:1]))
+
+
 def multitarget_fix(pattern: str) -> str:
     """
     If pattern only has '-' prefixed entries (excludes)
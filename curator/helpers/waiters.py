@@ -5,9 +5,10 @@
 
 import logging
 import warnings
-from time import localtime, sleep, strftime
-from datetime import datetime
+from time import localtime, monotonic, sleep, strftime
+from datetime import datetime, timedelta
 from opensearchpy.exceptions import OpenSearchWarning
+from opensearch_client.tracing import TRACER
 from curator.exceptions import (
     ActionTimeout,
     ConfigurationError,
@@ -15,7 +16,14 @@ from curator.exceptions import (
     FailedReindex,
     MissingArgument,
 )
-from curator.helpers.utils import chunk_index_list
+from curator.defaults.settings import FILTER_PATHS
+from curator.helpers.getters import (
+    byte_size,
+    get_existing_indices,
+    routing_filter_path,
+)
+from curator.helpers.metrics import METRICS
+from curator.helpers.utils import chunk_index_list, to_csv
 
 
 def health_check(client, **kwargs):
@@ -38,7 +46,7 @@ def health_check(client, **kwargs):
     klist = list(kwargs.keys())
     if not klist:
         raise MissingArgument('Must provide at least one keyword argument')
-    hc_data = client.cluster.health()
+    hc_data = client.cluster.health(filter_path=','.join(klist))
     response = True
 
     for k in klist:
@@ -78,9 +86,11 @@ def relocate_check(client, index):
     :rtype: bool
     """
     logger = logging.getLogger(__name__)
-    shard_state_data = client.cluster.state(index=index)['routing_table']['indices'][
-        index
-    ]['shards']
+    shard_state_data = client.cluster.state(
+        index=index,
+        metric='routing_table',
+        filter_path=routing_filter_path(index, ['state']),
+    )['routing_table']['indices'][index]['shards']
     finished_state = all(
         all(shard['state'] == "STARTED" for shard in shards)
         for shards in shard_state_data.values()
@@ -90,22 +100,100 @@ def relocate_check(client, index):
     return finished_state
 
 
-def restore_check(client, index_list):
+class RecoveryProgress:
+    """
+    Log how fast a restore is recovering, from the totals :py:func:`restore_check`
+    sees at each check, and estimate when it will finish.
+    """
+
+    def __init__(self):
+        #: ``(time, bytes, files)`` at the first check, or ``None``
+        self.first = None
+        #: ``(time, bytes, files)`` at the previous check, or ``None``
+        self.last = None
+
+    def eta(self, now, recovered, total):
+        """
+        :param now: The :py:func:`~.time.monotonic` time of this check
+        :param recovered: Bytes recovered so far
+        :param total: Bytes to recover
+
+        :type now: float
+        :type recovered: int
+        :type total: int
+
+        :returns: The seconds left at the average rate since the first check, or
+            ``None`` until there is a rate to go by
+        :rtype: float
+        """
+        if not self.first:
+            return None
+        elapsed = now - self.first[0]
+        rate = (recovered - self.first[1]) / elapsed if elapsed > 0 else 0
+        if rate <= 0:
+            return None
+        return max(total - recovered, 0) / rate
+
+    def update(self, recovered, total, files, total_files):
+        """
+        Log the progress, the rates since the previous call and the estimated time
+        left.
+
+        :param recovered: Bytes recovered so far
+        :param total: Bytes to recover
+        :param files: Files recovered so far
+        :param total_files: Files to recover
+
+        :type recovered: int
+        :type total: int
+        :type files: int
+        :type total_files: int
+        """
+        logger = logging.getLogger(__name__)
+        now = monotonic()
+        rates = ''
+        if self.last:
+            elapsed = max(now - self.last[0], 1e-9)
+            rates = (
+                f', {byte_size((recovered - self.last[1]) / elapsed)}/s, '
+                f'{(files - self.last[2]) / elapsed:.1f} files/s'
+            )
+        eta = self.eta(now, recovered, total)
+        if eta is not None:
+            rates += f', about {timedelta(seconds=round(eta))} left'
+        logger.info(
+            'Restore progress: %s of %s (%.1f%%), %s of %s files%s',
+            byte_size(recovered),
+            byte_size(total),
+            100 * recovered / total if total else 100.0,
+            files,
+            total_files,
+            rates,
+        )
+        self.last = (now, recovered, files)
+        if self.first is None:
+            self.first = self.last
+
+
+def restore_check(client, index_list, progress=None):
     """
     This function calls `client.indices.`
     :py:meth:`~.elasticsearch.client.IndicesClient.recovery`
     with the list of indices to check for complete recovery.  It will return ``True``
-    if recovery of those indices is complete, and ``False`` otherwise.  It is
-    designed to fail fast: if a single shard is encountered that is still recovering
-    (not in ``DONE`` stage), it will immediately return ``False``, rather than
-    complete iterating over the rest of the response.
+    if recovery of those indices is complete, and ``False`` otherwise.
+
+    Indices with no recovery information are looked up with
+    :py:func:`~.curator.helpers.getters.get_existing_indices`, and the check fails
+    fast if any of them does not exist yet.
 
     :param client: A client connection object
     :param index_list: The list of indices to verify having been restored.
-    :param kwargs: Any additional keyword arguments to pass to the function
+    :param progress: If set, report the bytes and files recovered, and the rates
+        since the previous check, to this
 
     :type client: :py:class:`~.opensearchpy.OpenSearch`
     :type index_list: list
+    :type progress: :py:class:`RecoveryProgress`
 
     :rtype: bool
     """
@@ -117,7 +205,9 @@ def restore_check(client, index_list):
         # chunk is a list of index names, join them for the API call
         chunk_str = ','.join(chunk)
         try:
-            chunk_response = client.indices.recovery(index=chunk_str, human=True)
+            chunk_response = client.indices.recovery(
+                index=chunk_str, filter_path=FILTER_PATHS['recovery']
+            )
         except Exception as err:
             msg = (
                 f'Unable to obtain recovery information for specified indices. '
@@ -134,37 +224,82 @@ def restore_check(client, index_list):
     # If we got empty recovery for some indices, check if they exist
     if empty_recovery_indices:
         logger.info('Some indices had empty recovery info: %s', empty_recovery_indices)
-        for index in empty_recovery_indices:
-            try:
-                exists = client.indices.exists(index=index)
-                if not exists:
-                    logger.info(
-                        'Index "%s" does not exist yet. Continuing wait.', index
-                    )
-                    return False
-                else:
-                    logger.warning(
-                        'Index "%s" exists but has no recovery info. '
-                        'This may indicate the index was restored but has no shards allocated. '
-                        'Treating as complete.',
-                        index,
-                    )
-            except Exception as err:
-                logger.error('Error checking if index "%s" exists: %s', index, err)
-                return False
+        try:
+            existing = get_existing_indices(client, empty_recovery_indices)
+        except Exception as err:
+            logger.error('Error checking if indices exist: %s', err)
+            return False
+        missing = [index for index in empty_recovery_indices if index not in existing]
+        if missing:
+            logger.info('Indices %s do not exist yet. Continuing wait.', missing)
+            return False
+        logger.warning(
+            'Indices %s exist but have no recovery info. This may indicate they were '
+            'restored but have no shards allocated. Treating as complete.',
+            empty_recovery_indices,
+        )
 
     logger.info('Provided indices: %s', index_list)
     logger.info('Found indices with recovery: %s', list(response.keys()))
-    # pylint: disable=consider-using-dict-items
-    for index in response:
-        for shard in range(0, len(response[index]['shards'])):
-            stage = response[index]['shards'][shard]['stage']
-            if stage != 'DONE':
-                logger.info('Index "%s" is still in stage "%s"', index, stage)
-                return False
+    complete = True
+    recovered = total = files = total_files = 0
+    for index, data in response.items():
+        for shard in data['shards']:
+            if complete and shard['stage'] != 'DONE':
+                logger.info('Index "%s" is still in stage "%s"', index, shard['stage'])
+                complete = False
+            size = shard.get('index', {}).get('size', {})
+            recovered += size.get('recovered_in_bytes', 0)
+            total += size.get('total_in_bytes', 0)
+            counts = shard.get('index', {}).get('files', {})
+            files += counts.get('recovered', 0)
+            total_files += counts.get('total', 0)
+    if progress is not None:
+        progress.update(recovered, total, files, total_files)
 
     # If we've gotten here, all of the indices have recovered (or exist with no recovery info)
-    return True
+    return complete
+
+
+def open_check(client, index_list):
+    """
+    This function calls `client.cluster.`
+    :py:meth:`~.elasticsearch.client.ClusterClient.health` for the indices in
+    ``index_list`` only, one :py:func:`~.curator.helpers.utils.chunk_index_list`
+    chunk at a time. It will return ``True`` if every chunk is ``green``, and
+    ``False`` otherwise.
+
+    :param client: A client connection object
+    :param index_list: The list of indices that were opened
+
+    :type client: :py:class:`~.opensearchpy.OpenSearch`
+    :type index_list: list
+
+    :rtype: bool
+    """
+    logger = logging.getLogger(__name__)
+    green = True
+    active = initializing = total = 0
+    for chunk in chunk_index_list(index_list):
+        health = client.cluster.health(
+            index=to_csv(chunk), filter_path=FILTER_PATHS['index_health']
+        )
+        if health.get('status') != 'green':
+            green = False
+        active += health.get('active_shards', 0)
+        initializing += health.get('initializing_shards', 0)
+        total += (
+            health.get('active_shards', 0)
+            + health.get('initializing_shards', 0)
+            + health.get('unassigned_shards', 0)
+        )
+    logger.info(
+        'Open progress: %s of %s shards active, %s initializing',
+        active,
+        total,
+        initializing,
+    )
+    return green
 
 
 def snapshot_check(client, snapshot=None, repository=None):
@@ -191,7 +326,11 @@ def snapshot_check(client, snapshot=None, repository=None):
     logger.debug('SNAPSHOT: %s', snapshot)
     logger.debug('REPOSITORY: %s', repository)
     try:
-        result = client.snapshot.get(repository=repository, snapshot=snapshot)
+        result = client.snapshot.get(
+            repository=repository,
+            snapshot=snapshot,
+            filter_path=FILTER_PATHS['snapshot_state'],
+        )
         logger.debug('RESULT: %s', result)
     except Exception as err:
         raise CuratorException(
@@ -317,9 +456,10 @@ def wait_for_it(
             'function': snapshot_check,
             'args': {'snapshot': snapshot, 'repository': repository},
         },
+        'open': {'function': open_check, 'args': {'index_list': index_list}},
         'restore': {
             'function': restore_check,
-            'args': {'index_list': index_list},
+            'args': {'index_list': index_list, 'progress': RecoveryProgress()},
         },
         'reindex': {'function': task_check, 'args': {'task_id': task_id}},
         'shrink': {'function': health_check, 'args': {'status': 'green'}},
@@ -336,7 +476,7 @@ def wait_for_it(
             f'A snapshot and repository must accompany "action" {action}. snapshot: '
             f'{snapshot}, repository: {repository}'
         )
-    if action == 'restore' and index_list is None:
+    if action in ['open', 'restore'] and index_list is None:
         raise MissingArgument(f'An index_list must accompany "action" {action}')
     if action == 'reindex':
         try:
@@ -352,17 +492,21 @@ def wait_for_it(
     # Now with this mapped, we can perform the wait as indicated.
     start_time = datetime.now()
     result = False
+    polls = 0
     while True:
+        polls += 1
         elapsed = int((datetime.now() - start_time).total_seconds())
         logger.debug('Elapsed time: %s seconds', elapsed)
-        if kwargs:
-            response = action_map[action]['function'](
-                client, **action_map[action]['args'], **kwargs
-            )
-        else:
-            response = action_map[action]['function'](
-                client, **action_map[action]['args']
-            )
+        with TRACER.span('wait_for_it.poll', action=action, poll=polls) as span:
+            if kwargs:
+                response = action_map[action]['function'](
+                    client, **action_map[action]['args'], **kwargs
+                )
+            else:
+                response = action_map[action]['function'](
+                    client, **action_map[action]['args']
+                )
+            span.set_attribute('complete', bool(response))
         logger.debug('Response: %s', response)
         # Success
         if response:
@@ -388,6 +532,7 @@ def wait_for_it(
         logger.debug(msg)
         sleep(wait_interval)
 
+    METRICS.waited(polls, (datetime.now() - start_time).total_seconds())
     logger.debug('Result: %s', result)
     if not result:
         raise ActionTimeout(
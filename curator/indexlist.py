@@ -5,9 +5,12 @@ import re
 import itertools
 import logging
 from opensearchpy.exceptions import NotFoundError, TransportError
+from opensearch_client.accounting import ACCOUNTING
+from opensearch_client.tracing import TRACER
 from opensearch_client.schemacheck import SchemaCheck
 from opensearch_client.utils import ensure_list
 from curator.defaults import settings
+from curator.defaults.settings import FILTER_PATHS
 from curator.exceptions import (
     ActionError,
     ConfigurationError,
@@ -24,6 +27,7 @@ from curator.helpers.date_ops import (
     TimestringSearch,
 )
 from curator.helpers.getters import byte_size, get_indices
+from curator.helpers.logsampler import LogSampler
 from curator.helpers.testers import verify_client_object
 from curator.helpers.utils import chunk_index_list, report_failure, to_csv
 from curator.validators.filter_functions import filterstructure
@@ -49,17 +53,30 @@ class IndexList:
         #: All indices in the cluster at instance creation time.
         #: **Type:** :py:class:`list`
         self.all_indices = []
+        #: The :py:class:`~.curator.helpers.logsampler.LogSampler` for per-index
+        #: DEBUG records. Replaced for each filter by :py:meth:`iterate_filters`
+        self.sampler = LogSampler(self.loggit, 'IndexList', noun='indices')
+        #: Whether each name in the cluster is an ``index`` or an ``alias``. Loaded
+        #: once by :py:meth:`resolve_names`. **Type:** :py:class:`dict`
+        self.name_kinds = None
+        #: The indices of each alias, loaded with :py:attr:`name_kinds`.
+        #: **Type:** :py:class:`dict`
+        self.alias_indices = {}
+        #: The index search pattern passed from param ``search_pattern``
+        self.search_pattern = search_pattern
+        #: Whether hidden indices are included, passed from param ``include_hidden``
+        self.include_hidden = include_hidden
         self.__get_indices(search_pattern, include_hidden)
         self.age_keyfield = None
 
     def __actionable(self, idx):
-        self.loggit.debug('Index %s is actionable and remains in the list.', idx)
+        self.sampler.debug('Index %s is actionable and remains in the list.', idx)
 
     def __not_actionable(self, idx):
-        self.loggit.debug('Index %s is not actionable, removing from list.', idx)
+        self.sampler.debug('Index %s is not actionable, removing from list.', idx)
         self.indices.remove(idx)
 
-    def __excludify(self, condition, exclude, index, msg=None):
+    def __excludify(self, condition, exclude, index, msg=None, *args):
         if condition is True:
             if exclude:
                 text = "Removed from actionable list"
@@ -74,8 +91,11 @@ class IndexList:
             else:
                 text = "Removed from actionable list"
                 self.__not_actionable(index)
-        if msg:
-            self.loggit.debug('%s: %s', text, msg)
+        if msg and args:
+            # Lazy formatting: msg is only formatted if this index is sampled
+            self.sampler.done('%s: ' + msg, text, *args)
+        else:
+            self.sampler.done('%s: %s' if msg else None, text, msg)
 
     def __get_indices(self, pattern, include_hidden):
         """
@@ -146,15 +166,32 @@ class IndexList:
         }
 
     def _get_indices_segments(self, data):
-        return self.client.indices.segments(index=to_csv(data))['indices'].copy()
+        return (
+            self.client.indices.segments(
+                index=to_csv(data), filter_path=FILTER_PATHS['index_segments']
+            )
+            .get('indices', {})
+            .copy()
+        )
+
+    def _get_indices_segment_stats(self, data):
+        return self.client.indices.stats(
+            index=to_csv(data),
+            metric='segments',
+            filter_path=FILTER_PATHS['index_segment_stats'],
+        ).get('indices', {})
 
     def _get_indices_settings(self, data):
-        return self.client.indices.get_settings(index=to_csv(data))
+        return self.client.indices.get_settings(
+            index=to_csv(data), filter_path=FILTER_PATHS['index_settings']
+        )
 
     def _get_indices_stats(self, data):
-        return self.client.indices.stats(index=to_csv(data), metric='store,docs')[
-            'indices'
-        ]
+        return self.client.indices.stats(
+            index=to_csv(data),
+            metric='store,docs',
+            filter_path=FILTER_PATHS['index_stats'],
+        ).get('indices', {})
 
     def _bulk_queries(self, data, exec_func):
         slice_number = 10
@@ -173,10 +210,44 @@ class IndexList:
             query_result.update(exec_func(data_sliced))
         return query_result
 
+    def resolve_names(self):
+        """
+        Find out which names are aliases, and which indices they point to, with a
+        single :py:meth:`~.opensearchpy.client.IndicesClient.get_alias` request
+        for the indices that match :py:attr:`search_pattern`. Aliases that only
+        point to other indices are not loaded. The result is kept in
+        :py:attr:`name_kinds` and :py:attr:`alias_indices`, and later calls make no
+        request.
+
+        :returns: :py:attr:`name_kinds`
+        :rtype: dict
+        """
+        if self.name_kinds is None:
+            self.loggit.debug('Resolving alias names')
+            self.name_kinds = dict.fromkeys(self.all_indices, 'index')
+            self.alias_indices = {}
+            expand = 'open,closed,hidden' if self.include_hidden else 'open,closed'
+            try:
+                response = self.client.indices.get_alias(
+                    index=f'{self.search_pattern},{settings.EXCLUDE_SYSTEM}',
+                    params={'expand_wildcards': expand},
+                )
+            except NotFoundError:
+                response = {}
+            for index, data in response.items():
+                self.name_kinds.setdefault(index, 'index')
+                for alias in data.get('aliases', {}):
+                    self.name_kinds[alias] = 'alias'
+                    self.alias_indices.setdefault(alias, []).append(index)
+        return self.name_kinds
+
     def mitigate_alias(self, index):
         """
         Mitigate when an alias is detected instead of an index name
 
+        The aliases of ``index`` are looked up in :py:attr:`alias_indices`, so no
+        request is made once :py:meth:`resolve_names` has run.
+
         :param index: The index name that is showing up *instead* of what was expected
 
         :type index: str
@@ -188,20 +259,19 @@ class IndexList:
         self.loggit.debug(
             'Correcting an instance where an alias name points to index "%s"', index
         )
-        data = self.client.indices.get(index=index)
-        aliases = list(data[index]['aliases'])
-        if aliases:
-            for alias in aliases:
-                if alias in self.indices:
-                    self.loggit.warning(
-                        'Removing alias "%s" from IndexList.indices', alias
-                    )
-                    self.indices.remove(alias)
-                if alias in list(self.index_info):
-                    self.loggit.warning(
-                        'Removing alias "%s" from IndexList.index_info', alias
-                    )
-                    del self.index_info[alias]
+        self.resolve_names()
+        aliases = [
+            alias for alias, members in self.alias_indices.items() if index in members
+        ]
+        for alias in aliases:
+            if alias in self.indices:
+                self.loggit.warning('Removing alias "%s" from IndexList.indices', alias)
+                self.indices.remove(alias)
+            if alias in self.index_info:
+                self.loggit.warning(
+                    'Removing alias "%s" from IndexList.index_info', alias
+                )
+                del self.index_info[alias]
         self.loggit.debug('Adding "%s" to IndexList.indices', index)
         self.indices.append(index)
         self.loggit.debug(
@@ -212,22 +282,21 @@ class IndexList:
 
     def alias_index_check(self, data):
         """
-        Check each index in data to see if it's an alias.
+        Check each index in data to see if it's an alias, using
+        :py:meth:`resolve_names`. An alias is replaced with the first index it
+        points to.
         """
-        # self.loggit.debug('BEGIN alias_index_check')
-        working_list = data[:]
-        for entry in working_list:
-            if self.client.indices.exists_alias(name=entry):
-                index = list(self.client.indices.get_alias(name=entry).keys())[0]
-                self.loggit.warning(
-                    '"%s" is actually an alias for index "%s"', entry, index
-                )
-                self.mitigate_alias(index)
-                # The mitigate_alias step ensures that the class ivars are handled
-                # properly. The following ensure that we pass back a modified list
-                data.remove(entry)
-                data.append(index)
-        # self.loggit.debug('END alias_index_check')
+        name_kinds = self.resolve_names()
+        for entry in [name for name in data if name_kinds.get(name) == 'alias']:
+            index = self.alias_indices[entry][0]
+            self.loggit.warning(
+                '"%s" is actually an alias for index "%s"', entry, index
+            )
+            self.mitigate_alias(index)
+            # The mitigate_alias step ensures that the class ivars are handled
+            # properly. The following ensure that we pass back a modified list
+            data.remove(entry)
+            data.append(index)
         return data
 
     def indices_exist(self, data, exec_func):
@@ -401,6 +470,7 @@ class IndexList:
             if self.index_info[index]['state'] == 'close':
                 working_list.remove(index)
         if working_list:
+            sampler = LogSampler(self.loggit, 'get_index_stats', noun='indices')
             index_lists = chunk_index_list(working_list)
             for lst in index_lists:
                 # This portion here is to ensure that we're not polling for data
@@ -418,11 +488,16 @@ class IndexList:
                         size = wli['total']['store']['size_in_bytes']
                         docs = wli['total']['docs']['count']
                         primary_size = wli['primaries']['store']['size_in_bytes']
-                        msg = (
-                            f'Index: {index}  Size: {byte_size(size)}  Docs: {docs} '
-                            f'PrimarySize: {byte_size(primary_size)}'
-                        )
-                        self.loggit.debug(msg)
+                        # Only format the sizes of the sampled indices
+                        if sampler.sampled:
+                            self.loggit.debug(
+                                'Index: %s  Size: %s  Docs: %s  PrimarySize: %s',
+                                index,
+                                byte_size(size),
+                                docs,
+                                byte_size(primary_size),
+                            )
+                        sampler.done()
                         sii['size_in_bytes'] = size
                         sii['docs'] = docs
                         sii['primary_size_in_bytes'] = primary_size
@@ -431,13 +506,32 @@ class IndexList:
                         self.loggit.warning(msg)
         # self.loggit.debug('Getting index stats -- END')
 
-    def get_segment_counts(self):
+    def get_segment_counts(self, use_stats=True):
         """
         Populate ``index_info`` with segment information for each index.
+
+        The count for each index is the ``segments.count`` total of the segments
+        metric of :py:meth:`~.opensearchpy.client.IndicesClient.stats`, which is one
+        number per index. Any index without that number falls back to summing the
+        ``num_search_segments`` of every shard copy from
+        :py:meth:`~.opensearchpy.client.IndicesClient.segments`, which returns every
+        segment of every shard copy.
+
+        :param use_stats: Use the index stats. If ``False``, always use the
+            per-segment response.
+
+        :type use_stats: bool
         """
         self.loggit.debug('Getting index segment counts')
         self.empty_list_check()
         for lst in chunk_index_list(self.indices):
+            if use_stats:
+                lst = self._segment_counts_from_stats(lst)
+            if not lst:
+                continue
+            self.loggit.debug(
+                'Getting segment counts for %s indices from the segments API', len(lst)
+            )
             for sii, wli, _ in self.data_getter(lst, self._get_indices_segments):
                 shards = wli['shards']
                 segmentcount = 0
@@ -446,6 +540,35 @@ class IndexList:
                         segmentcount += shards[shardnum][shard]['num_search_segments']
                 sii['segments'] = segmentcount
 
+    def _segment_counts_from_stats(self, data):
+        """
+        Populate the ``segments`` count of each index in ``data`` from the index
+        stats.
+
+        :param data: A list of index names
+
+        :type data: list
+
+        :returns: The indices in ``data`` which did not get a count from the stats
+        :rtype: list
+        """
+        counted = set()
+        try:
+            for sii, wli, index in self.data_getter(
+                data, self._get_indices_segment_stats
+            ):
+                try:
+                    sii['segments'] = int(wli['total']['segments']['count'])
+                    counted.add(index)
+                except (KeyError, TypeError, ValueError):
+                    pass
+        # pylint: disable=broad-except
+        except Exception as err:
+            self.loggit.warning(
+                'Unable to get segment counts from index stats: %s', err
+            )
+        return [idx for idx in data if idx not in counted]
+
     def empty_list_check(self):
         """Raise :py:exc:`~.curator.exceptions.NoIndices` if ``indices`` is empty"""
         self.loggit.debug('Checking for empty list')
@@ -480,11 +603,12 @@ class IndexList:
             if isinstance(epoch, int):
                 self.index_info[index]['age']['name'] = epoch
             else:
-                msg = (
-                    f'Timestring {timestring} was not found in index {index}. '
-                    f'Removing from actionable list'
+                self.sampler.debug(
+                    'Timestring %s was not found in index %s. Removing from '
+                    'actionable list',
+                    timestring,
+                    index,
                 )
-                self.loggit.debug(msg)
                 self.indices.remove(index)
 
     def _get_field_stats_dates(self, field='@timestamp'):
@@ -734,23 +858,21 @@ class IndexList:
                 #     self.loggit.debug(msg)
                 #     self.indices.remove(index)
                 #     continue
-                msg = (
-                    f'Index "{index}" age ({age}), direction: "{direction}", point of '
-                    f'reference, ({por})'
-                )
+                msg = 'Index "%s" age (%s), direction: "%s", point of reference, (%s)'
+                args = (index, age, direction, por)
                 # Because time adds to epoch, smaller numbers are actually older
                 # timestamps.
                 if unit_count_pattern:
-                    msg = (
-                        f'unit_count_pattern is set, trying to match pattern to '
-                        f'index "{index}"'
+                    self.sampler.debug(
+                        'unit_count_pattern is set, trying to match pattern to '
+                        'index "%s"',
+                        index,
                     )
-                    self.loggit.debug(msg)
                     unit_count_from_index = get_unit_count_from_name(
                         index, unit_count_matcher
                     )
                     if unit_count_from_index:
-                        self.loggit.debug(
+                        self.sampler.debug(
                             'Pattern matched, applying unit_count of  "%s"',
                             unit_count_from_index,
                         )
@@ -758,19 +880,18 @@ class IndexList:
                             unit, unit_count_from_index, epoch
                         )
                         msg = (
-                            f'Adjusting point of reference from {por} to {adjustedpor} '
-                            f'based on unit_count of {unit_count_from_index} from '
-                            f'index name'
+                            'Adjusting point of reference from %s to %s based on '
+                            'unit_count of %s from index name'
                         )
-                        self.loggit.debug(msg)
+                        args = (por, adjustedpor, unit_count_from_index)
                     elif unit_count == -1:
                         # Unable to match pattern and unit_count is -1, meaning no
                         # fallback, so this index is removed from the list
                         msg = (
-                            f'Unable to match pattern and no fallback value set. '
-                            f'Removing index "{index}" from actionable list'
+                            'Unable to match pattern and no fallback value set. '
+                            'Removing index "%s" from actionable list'
                         )
-                        self.loggit.debug(msg)
+                        args = (index,)
                         remove_this_index = True
                         adjustedpor = por
                         # necessary to avoid exception if the first index is excluded
@@ -778,7 +899,7 @@ class IndexList:
                         # Unable to match the pattern and unit_count is set, so
                         # fall back to using unit_count for determining whether
                         # to keep this index in the list
-                        self.loggit.debug(
+                        self.sampler.debug(
                             'Unable to match pattern using fallback value of "%s"',
                             unit_count,
                         )
@@ -789,13 +910,14 @@ class IndexList:
                     agetest = age < adjustedpor
                 else:
                     agetest = age > adjustedpor
-                self.__excludify(agetest and not remove_this_index, exclude, index, msg)
+                self.__excludify(
+                    agetest and not remove_this_index, exclude, index, msg, *args
+                )
             except KeyError:
-                msg = (
-                    f'Index "{index}" does not meet provided criteria. '
-                    f'Removing from list.'
+                self.sampler.done(
+                    'Index "%s" does not meet provided criteria. Removing from list.',
+                    index,
                 )
-                self.loggit.debug(msg)
                 self.indices.remove(index)
 
     def filter_by_space(
@@ -887,10 +1009,12 @@ class IndexList:
             sorted_indices = sorted(self.working_list(), reverse=reverse)
         for index in sorted_indices:
             disk_usage += self.index_info[index]['size_in_bytes']
-            msg = (
-                f'{index}, summed disk usage is {byte_size(disk_usage)} and disk limit '
-                f'is {byte_size(disk_limit)}.'
-            )
+            msg = None
+            if self.sampler.sampled:
+                msg = (
+                    f'{index}, summed disk usage is {byte_size(disk_usage)} and disk '
+                    f'limit is {byte_size(disk_limit)}.'
+                )
             if threshold_behavior == 'greater_than':
                 self.__excludify((disk_usage > disk_limit), exclude, index, msg)
             elif threshold_behavior == 'less_than':
@@ -961,7 +1085,7 @@ class IndexList:
         self.empty_list_check()
         for index in self.working_list():
             condition = self.index_info[index]['state'] == 'close'
-            self.loggit.debug(
+            self.sampler.debug(
                 'Index %s state: %s', index, self.index_info[index]['state']
             )
             self.__excludify(condition, exclude, index)
@@ -984,7 +1108,7 @@ class IndexList:
         self.empty_list_check()
         for index in self.working_list():
             condition = self.index_info[index]['docs'] == 0
-            self.loggit.debug(
+            self.sampler.debug(
                 'Index %s doc count: %s', index, self.index_info[index]['docs']
             )
             self.__excludify(condition, exclude, index)
@@ -1003,7 +1127,7 @@ class IndexList:
         self.empty_list_check()
         for index in self.working_list():
             condition = self.index_info[index]['state'] == 'open'
-            self.loggit.debug(
+            self.sampler.debug(
                 'Index %s state: %s', index, self.index_info[index]['state']
             )
             self.__excludify(condition, exclude, index)
@@ -1047,11 +1171,16 @@ class IndexList:
                     except KeyError:
                         has_routing = False
                     # if has_routing:
-                    msg = (
-                        f'{index}: Routing (mis)match: '
-                        f'index.routing.allocation.{allocation_type}.{key}={value}.'
+                    self.__excludify(
+                        has_routing,
+                        exclude,
+                        index,
+                        '%s: Routing (mis)match: index.routing.allocation.%s.%s=%s.',
+                        index,
+                        allocation_type,
+                        key,
+                        value,
                     )
-                    self.__excludify(has_routing, exclude, index, msg)
 
     def filter_none(self):
         """The legendary NULL filter"""
@@ -1093,8 +1222,15 @@ class IndexList:
                 else:
                     isness = 'is not'
                     condition = False
-                msg = f'{index} {isness} associated with aliases: {aliases}'
-                self.__excludify(condition, exclude, index, msg)
+                self.__excludify(
+                    condition,
+                    exclude,
+                    index,
+                    '%s %s associated with aliases: %s',
+                    index,
+                    isness,
+                    aliases,
+                )
 
     def filter_by_count(
         self,
@@ -1177,10 +1313,10 @@ class IndexList:
                 )
                 filtered_indices = working_list
                 for index in prune_these:
-                    msg = '{index} does not match regular expression {pattern}.'
+                    msg = '%s does not match regular expression %s.'
                     condition = True
                     exclude = True
-                    self.__excludify(condition, exclude, index, msg)
+                    self.__excludify(condition, exclude, index, msg, index, pattern)
                     # also remove it from filtered_indices
                     filtered_indices.remove(index)
                 # Presort these filtered_indices using the lambda
@@ -1224,9 +1360,9 @@ class IndexList:
                 sorted_indices = sorted(group, reverse=reverse)
             idx = 1
             for index in sorted_indices:
-                msg = f'{index} is {idx} of specified count of {count}.'
+                msg = '%s is %s of specified count of %s.'
                 condition = True if idx <= count else False
-                self.__excludify(condition, exclude, index, msg)
+                self.__excludify(condition, exclude, index, msg, index, idx, count)
                 idx += 1
 
     def filter_by_shards(
@@ -1397,25 +1533,23 @@ class IndexList:
                     min_age = int(self.index_info[index]['age']['min_value'])
                     max_age = int(self.index_info[index]['age']['max_value'])
                     msg = (
-                        f'Index "{index}", timestamp field "{field}", min_value '
-                        f'({min_age}), max_value ({max_age}), period start: '
-                        f'"{start}", period end, "{end}"'
+                        'Index "%s", timestamp field "%s", min_value (%s), max_value '
+                        '(%s), period start: "%s", period end, "%s"'
                     )
+                    args = (index, field, min_age, max_age, start, end)
                     # Because time adds to epoch, smaller numbers are actually older
                     # timestamps.
                     inrange = (min_age >= start) and (max_age <= end)
                 else:
                     age = int(self.index_info[index]['age'][self.age_keyfield])
-                    msg = (
-                        f'Index "{index}" age ({age}), period start: "{start}", period '
-                        f'end, "{end}"'
-                    )
+                    msg = 'Index "%s" age (%s), period start: "%s", period end, "%s"'
+                    args = (index, age, start, end)
                     # Because time adds to epoch, smaller numbers are actually older
                     # timestamps.
                     inrange = (age >= start) and (age <= end)
-                self.__excludify(inrange, exclude, index, msg)
+                self.__excludify(inrange, exclude, index, msg, *args)
             except KeyError:
-                self.loggit.debug(
+                self.sampler.done(
                     'Index "%s" does not meet provided criteria. Removing from list.',
                     index,
                 )
@@ -1474,26 +1608,32 @@ class IndexList:
             return
         self.loggit.debug('All filters: %s', filter_dict['filters'])
         for fil in filter_dict['filters']:
-            self.loggit.debug('Top of the loop: %s', self.indices)
+            self.loggit.debug('Top of the loop: %s indices', len(self.indices))
             self.loggit.debug('Un-parsed filter args: %s', fil)
             # Make sure we got at least this much in the configuration
             chk = SchemaCheck(
                 fil, filterstructure(), 'filter', 'IndexList.iterate_filters'
             ).result()
-            msg = f'Parsed filter args: {chk}'
-            self.loggit.debug(msg)
+            self.loggit.debug('Parsed filter args: %s', chk)
             method = self.__map_method(fil['filtertype'])
-            del fil['filtertype']
-            # If it's a filtertype with arguments, update the defaults with the
-            # provided settings.
-            if fil:
-                self.loggit.debug('Filter args: %s', fil)
-                self.loggit.debug('Pre-instance: %s', self.indices)
-                method(**fil)
-                self.loggit.debug('Post-instance: %s', self.indices)
-            else:
-                # Otherwise, it's a settingless filter.
-                method()
+            self.sampler = LogSampler(
+                self.loggit, f'Filter "{fil["filtertype"]}"', noun='indices'
+            )
+            before = len(self.indices)
+            filtertype = fil.pop('filtertype')
+            with ACCOUNTING.scope(filter=filtertype), TRACER.span(
+                'filter', filtertype=filtertype, **{'items.before': before}
+            ) as span:
+                # If it's a filtertype with arguments, update the defaults with the
+                # provided settings.
+                if fil:
+                    self.loggit.debug('Filter args: %s', fil)
+                    method(**fil)
+                else:
+                    # Otherwise, it's a settingless filter.
+                    method()
+                span.set_attribute('items.after', len(self.indices))
+            self.sampler.summary(before, len(self.indices))
 
     def filter_by_size(
         self,
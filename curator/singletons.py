@@ -10,8 +10,15 @@ from opensearch_client.config import (
     options_from_dict,
 )
 from opensearch_client.logging import configure_logging
+from opensearch_client.tracing import TRACER, JsonLinesExporter
 from opensearch_client.utils import option_wrapper
-from curator.defaults.settings import CLICK_DRYRUN, default_config_file, footer
+from curator.defaults.settings import (
+    CLICK_DRYRUN,
+    CLICK_PROFILE,
+    CLICK_TRACE,
+    default_config_file,
+    footer,
+)
 from curator._version import __version__
 from curator.cli_singletons import (
     alias,
@@ -39,6 +46,8 @@ click_opt_wrap = option_wrapper()
 )
 @options_from_dict(SHOW_EVERYTHING)
 @click_opt_wrap(*cli_opts('dry-run', settings=CLICK_DRYRUN))
+@click_opt_wrap(*cli_opts('profile', settings=CLICK_PROFILE))
+@click_opt_wrap(*cli_opts('trace', settings=CLICK_TRACE))
 @click.version_option(__version__, '-v', '--version', prog_name='curator_cli')
 @click.pass_context
 def curator_cli(
@@ -62,13 +71,21 @@ def curator_cli(
     ssl_assert_hostname,
     ssl_assert_fingerprint,
     ssl_version,
+    pool_maxsize,
+    connection_class,
+    keep_alive,
+    max_retries,
+    retry_on_timeout,
     master_only,
     skip_version_test,
     loglevel,
     logfile,
     logformat,
     blacklist,
+    logqueue,
     dry_run,
+    profile,
+    trace,
 ):
     """
     Curator CLI (Singleton Tool)
@@ -82,6 +99,10 @@ def curator_cli(
     """
     ctx.obj = {}
     ctx.obj['dry_run'] = dry_run
+    ctx.obj['profile'] = profile
+    if trace:
+        TRACER.add_exporter(JsonLinesExporter(trace))
+        ctx.call_on_close(TRACER.shutdown)
     ctx.obj['default_config'] = default_config_file()
     get_config(ctx)
     configure_logging(ctx)
@@ -2,6 +2,10 @@
 
 import re
 import logging
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from opensearch_client.accounting import ACCOUNTING
+from opensearch_client.tracing import TRACER
 from opensearch_client.schemacheck import SchemaCheck
 from curator.exceptions import (
     ConfigurationError,
@@ -17,17 +21,99 @@ from curator.helpers.date_ops import (
     get_point_of_reference,
     TimestringSearch,
 )
-from curator.helpers.getters import get_snapshot_data
+from curator.helpers.getters import (
+    get_snapshot,
+    get_snapshot_data,
+    get_snapshot_states,
+    iter_snapshot_data,
+)
+from curator.helpers.logsampler import LogSampler
+from curator.helpers.snapshotcache import SnapshotCache
 from curator.helpers.testers import repository_exists, verify_client_object
 from curator.helpers.utils import report_failure
 from curator.defaults import settings
 from curator.validators.filter_functions import filterstructure
 
 
-class SnapshotList:
-    """Snapshot list object"""
+class SnapshotRecord:
+    """
+    Compact snapshot metadata, used by :py:class:`SnapshotList` in paged or cached
+    mode in place of the full :py:class:`dict` from the snapshot API.
+
+    Only the fields the snapshot filters read are kept. Fields are read and written
+    with :py:class:`dict` style subscripts, so filters and actions work with either
+    kind of record. ``indices`` is ``None`` until
+    :py:meth:`SnapshotList.snapshot_indices` loads it.
+
+    :param data: A snapshot entry from the snapshot API
+
+    :type data: dict
+    """
+
+    __slots__ = (
+        'snapshot',
+        'uuid',
+        'state',
+        'start_time_in_millis',
+        'end_time_in_millis',
+        'age_by_name',
+        'indices',
+    )
+
+    def __init__(self, data):
+        for field in self.__slots__:
+            setattr(self, field, data.get(field))
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError as exc:
+            raise KeyError(key) from exc
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError as exc:
+            raise KeyError(key) from exc
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        """:returns: The value of field ``key``, or ``default`` if it is unset"""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def __repr__(self):
+        fields = ', '.join(
+            f'{field}={getattr(self, field)!r}' for field in self.__slots__
+        )
+        return f'SnapshotRecord({fields})'
 
-    def __init__(self, client, repository=None):
+
+class SnapshotList:
+    """
+    Snapshot list object
+
+    :param client: A client connection object
+    :param repository: The OpenSearch snapshot repository to use
+    :param page_size: If set, list the snapshots a page of this many at a time, and
+        keep only a compact :py:class:`SnapshotRecord` for each. Index lists are then
+        only fetched when :py:meth:`snapshot_indices` is called. If ``None``, the
+        whole repository is listed in one request.
+    :param snapshot_cache: If set, a directory in which to keep a
+        :py:class:`~.curator.helpers.snapshotcache.SnapshotCache` of completed
+        snapshots. Only snapshots which are new or not yet completed since the last
+        run are fetched, in pages of ``page_size`` (or
+        :py:const:`~.curator.defaults.settings.SNAPSHOT_PAGE_SIZE`).
+
+    :type client: :py:class:`~.opensearchpy.OpenSearch`
+    :type repository: str
+    :type page_size: int
+    :type snapshot_cache: str
+    """
+
+    def __init__(self, client, repository=None, page_size=None, snapshot_cache=None):
         verify_client_object(client)
         if not repository:
             raise MissingArgument('No value for "repository" provided')
@@ -41,6 +127,13 @@ class SnapshotList:
         self.client = client
         #: The value passed as ``delete_aliases``
         self.repository = repository
+        #: The value passed as ``page_size``
+        self.page_size = page_size
+        #: The :py:class:`~.curator.helpers.snapshotcache.SnapshotCache` if
+        #: ``snapshot_cache`` was set, otherwise ``None``
+        self.cache = (
+            SnapshotCache(snapshot_cache, repository) if snapshot_cache else None
+        )
         #: Information extracted from snapshots, such as age, etc.
         #: Populated by internal method ``__get_snapshots`` at instance creation
         #: time. **Type:** :py:class:`dict`
@@ -49,19 +142,25 @@ class SnapshotList:
         #: Populated by internal methods ``__get_snapshots`` at instance creation
         #: time. **Type:** :py:class:`list`
         self.snapshots = []
+        #: The :py:class:`~.curator.helpers.logsampler.LogSampler` for per-snapshot
+        #: DEBUG records. Replaced for each filter by :py:meth:`iterate_filters`
+        self.sampler = LogSampler(self.loggit, 'SnapshotList', noun='snapshots')
         #: Raw data dump of all snapshots in the repository at instance creation
         #: time.  **Type:** :py:class:`list` of :py:class:`dict` data.
         self.__get_snapshots()
         self.age_keyfield = None
+        #: Snapshot ages, loaded once per ``age_keyfield`` by :py:meth:`_age_index`.
+        #: **Type:** :py:class:`dict`
+        self.age_index = {}
 
     def __actionable(self, snap):
-        self.loggit.debug('Snapshot %s is actionable and remains in the list.', snap)
+        self.sampler.debug('Snapshot %s is actionable and remains in the list.', snap)
 
     def __not_actionable(self, snap):
-        self.loggit.debug('Snapshot %s is not actionable, removing from list.', snap)
+        self.sampler.debug('Snapshot %s is not actionable, removing from list.', snap)
         self.snapshots.remove(snap)
 
-    def __excludify(self, condition, exclude, snap, msg=None):
+    def __excludify(self, condition, exclude, snap, msg=None, *args):
         if condition:
             if exclude:
                 text = "Removed from actionable list"
@@ -76,13 +175,69 @@ class SnapshotList:
             else:
                 text = "Removed from actionable list"
                 self.__not_actionable(snap)
-        if msg:
-            self.loggit.debug('%s: %s', text, msg)
+        if msg and args:
+            # Lazy formatting: msg is only formatted if this snapshot is sampled
+            self.sampler.done('%s: ' + msg, text, *args)
+        else:
+            self.sampler.done('%s: %s' if msg else None, text, msg)
+
+    def __select(self, matches, exclude, msg, describe):
+        """
+        Keep or remove every snapshot in ``snapshots`` in one pass, as
+        ``__excludify`` would with ``condition=snap in matches``. ``describe(snap)``
+        returns the arguments for ``msg``, and is only called for sampled snapshots.
+        """
+        kept = []
+        for snap in self.snapshots:
+            if (snap in matches) != exclude:
+                kept.append(snap)
+                text = 'Remains in actionable list'
+            else:
+                text = 'Removed from actionable list'
+            if self.sampler.sampled:
+                self.sampler.done('%s: ' + msg, text, *describe(snap))
+            else:
+                self.sampler.done('%s', text)
+        self.snapshots = kept
+
+    def __age(self, snap):
+        """Return the age of ``snap`` in epoch seconds, for log messages"""
+        return fix_epoch(self.snapshot_info[snap][self.age_keyfield])
+
+    def __remove_ageless(self, ageless):
+        """Remove every snapshot in ``ageless`` from ``snapshots`` in one pass"""
+        kept = []
+        for snap in self.snapshots:
+            if snap in ageless:
+                self.sampler.done('Removing snapshot %s for having no age', snap)
+            else:
+                kept.append(snap)
+        self.snapshots = kept
 
     def __get_snapshots(self):
         """
         Pull all snapshots into `snapshots` and populate ``snapshot_info``
+
+        With :py:attr:`page_size` or :py:attr:`cache` set, ``all_snapshots`` stays
+        empty and each ``snapshot_info`` value is a :py:class:`SnapshotRecord`
         """
+        if self.cache or self.page_size:
+            self.all_snapshots = []
+            if self.cache:
+                records = self.__get_cached_records()
+            else:
+                records = (
+                    SnapshotRecord(list_item)
+                    for list_item in iter_snapshot_data(
+                        self.client, self.repository, page_size=self.page_size
+                    )
+                )
+            for record in records:
+                if record['snapshot']:
+                    self.snapshots.append(record['snapshot'])
+                    self.snapshot_info[record['snapshot']] = record
+            self.empty_list_check()
+            return
         self.all_snapshots = get_snapshot_data(self.client, self.repository)
         for list_item in self.all_snapshots:
             if 'snapshot' in list_item.keys():
@@ -90,6 +245,48 @@ class SnapshotList:
                 self.snapshot_info[list_item['snapshot']] = list_item
         self.empty_list_check()
 
+    def __get_cached_records(self):
+        """
+        Reconcile :py:attr:`cache` against a name-only listing of the repository,
+        fetch the metadata of every snapshot the cache cannot answer for, and save the
+        cache again.
+
+        :returns: A :py:class:`SnapshotRecord` for every snapshot, in listing order
+        :rtype: list
+        """
+        self.cache.load()
+        cached = self.cache.by_name()
+        listing = get_snapshot_states(self.client, self.repository)
+        delta = [
+            name
+            for name, row in listing.items()
+            if name not in cached or not self.cache.matches(cached[name], row)
+        ]
+        self.loggit.info(
+            'Snapshot cache for repository %s: %s of %s snapshots cached, fetching %s',
+            self.repository,
+            len(listing) - len(delta),
+            len(listing),
+            len(delta),
+        )
+        fetched = {}
+        for list_item in iter_snapshot_data(
+            self.client,
+            self.repository,
+            page_size=self.page_size or settings.SNAPSHOT_PAGE_SIZE,
+            names=delta,
+        ):
+            fetched[list_item['snapshot']] = SnapshotRecord(list_item)
+        records = []
+        for name in listing:
+            if name in fetched:
+                records.append(fetched[name])
+            elif name not in delta:
+                records.append(SnapshotRecord(cached[name]))
+        self.cache.update(records)
+        self.cache.save()
+        return records
+
     def __map_method(self, ftype):
         methods = {
             'age': self.filter_by_age,
@@ -101,6 +298,29 @@ class SnapshotList:
         }
         return methods[ftype]
 
+    def snapshot_indices(self, snapshot):
+        """
+        Return the list of indices in ``snapshot``, getting it from the repository if
+        ``snapshot_info`` does not have it yet.
+
+        :param snapshot: The snapshot name
+
+        :type snapshot: str
+
+        :returns: The indices in ``snapshot``
+        :rtype: list
+        """
+        info = self.snapshot_info[snapshot]
+        if info.get('indices') is None:
+            resp = get_snapshot(
+                self.client, repository=self.repository, snapshot=snapshot
+            )
+            info['indices'] = resp['snapshots'][0]['indices']
+            if self.cache:
+                self.cache.update(self.snapshot_info.values())
+                self.cache.save()
+        return info['indices']
+
     def empty_list_check(self):
         """Raise exception if ``snapshots`` is empty"""
         if not self.snapshots:
@@ -133,6 +353,7 @@ class SnapshotList:
                 self.snapshot_info[snapshot]['age_by_name'] = epoch
             else:
                 self.snapshot_info[snapshot]['age_by_name'] = None
+        self.age_index.pop('age_by_name', None)
 
     def _calculate_ages(self, source='creation_date', timestring=None):
         """
@@ -159,39 +380,55 @@ class SnapshotList:
                 f'Invalid source: {source}. Must be "name", or "creation_date".'
             )
 
+    def _age_index(self):
+        """
+        Load the age of every snapshot in ``snapshot_info`` by ``age_keyfield`` once,
+        sorted, so that age filters are binary searches and count filters are slices.
+        The result is kept in :py:attr:`age_index` for later filters.
+
+        :returns: ``(epochs, values, names, ageless)``. ``epochs`` are the ages in
+            epoch seconds, oldest first. ``values`` are the same ages as stored at
+            ``age_keyfield``, and ``names`` the snapshots, in the same order. Where
+            ages are equal, snapshots are in ``snapshot_info`` order. ``ageless`` is
+            the :py:class:`set` of snapshots with no age.
+        :rtype: tuple
+        """
+        if self.age_keyfield not in self.age_index:
+            aged = []
+            ageless = set()
+            for snap, info in self.snapshot_info.items():
+                # This fixes #1366. Catch None is a potential age value.
+                value = info.get(self.age_keyfield)
+                if value:
+                    aged.append((fix_epoch(value), value, snap))
+                else:
+                    ageless.add(snap)
+            aged.sort(key=lambda k: k[:2])
+            self.age_index[self.age_keyfield] = (
+                [epoch for epoch, _, _ in aged],
+                [value for _, value, _ in aged],
+                [snap for _, _, snap in aged],
+                ageless,
+            )
+        return self.age_index[self.age_keyfield]
+
     def _sort_by_age(self, snapshot_list, reverse=True):
         """
-        Take a list of snapshots and sort them by date.
+        Take a list of snapshots and sort them by date. Snapshots with no age are
+        removed from ``snapshots``.
 
         By default, the youngest are first with ``reverse=True``, but the oldest
         can be first by setting ``reverse=False``
         """
-        # Do the age-based sorting here.
-        # First, build an temporary dictionary with just snapshot and age
-        # as the key and value, respectively
-        temp = {}
-        for snap in snapshot_list:
-            if self.age_keyfield in self.snapshot_info[snap]:
-                # This fixes #1366. Catch None is a potential age value.
-                if self.snapshot_info[snap][self.age_keyfield]:
-                    temp[snap] = self.snapshot_info[snap][self.age_keyfield]
-                else:
-                    msg = f' snapshot {snap} has no age'
-                    self.__excludify(True, True, snap, msg)
-            else:
-                msg = (
-                    f'{snap} does not have age key "{self.age_keyfield}" '
-                    f'in SnapshotList metadata'
-                )
-                self.__excludify(True, True, snap, msg)
-
-        # If reverse is True, this will sort so the youngest snapshots are
-        # first.  However, if you want oldest first, set reverse to False.
-        # Effectively, this should set us up to act on everything older than
-        # meets the other set criteria.
-        # It starts as a tuple, but then becomes a list.
-        sorted_tuple = sorted(temp.items(), key=lambda k: k[1], reverse=reverse)
-        return [x[0] for x in sorted_tuple]
+        _, values, names, ageless = self._age_index()
+        self.__remove_ageless(ageless.intersection(snapshot_list))
+        wanted = set(snapshot_list)
+        if not reverse:
+            return [snap for snap in names if snap in wanted]
+        # Youngest first. The pairs are already sorted, which makes this linear, and
+        # a stable sort keeps snapshots of equal age in their listed order.
+        pairs = [(value, snap) for value, snap in zip(values, names) if snap in wanted]
+        return [snap for _, snap in sorted(pairs, key=itemgetter(0), reverse=True)]
 
     def most_recent(self):
         """
@@ -288,24 +525,21 @@ class SnapshotList:
         if direction not in ['older', 'younger']:
             raise ValueError(f'Invalid value for "direction": {direction}')
         self._calculate_ages(source=source, timestring=timestring)
-        for snapshot in self.working_list():
-            if not self.snapshot_info[snapshot][self.age_keyfield]:
-                self.loggit.debug('Removing snapshot %s for having no age', snapshot)
-                self.snapshots.remove(snapshot)
-                continue
-            age = fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
-            msg = (
-                f'Snapshot "{snapshot}" age ({age}), direction: "{direction}", '
-                f'point of reference, ({por})'
-            )
-            # Because time adds to epoch, smaller numbers are actually older
-            # timestamps.
-            snapshot_age = fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
-            if direction == 'older':
-                agetest = snapshot_age < por
-            else:  # 'younger'
-                agetest = snapshot_age > por
-            self.__excludify(agetest, exclude, snapshot, msg)
+        epochs, _, names, ageless = self._age_index()
+        self.__remove_ageless(ageless)
+        # Because time adds to epoch, smaller numbers are actually older
+        # timestamps.
+        if direction == 'older':
+            matches = set(names[: bisect_left(epochs, por)])
+        else:  # 'younger'
+            matches = set(names[bisect_right(epochs, por) :])
+        msg = 'Snapshot "%s" age (%s), direction: "%s", point of reference, (%s)'
+        self.__select(
+            matches,
+            exclude,
+            msg,
+            lambda snap: (snap, self.__age(snap), direction, por),
+        )
 
     def filter_by_state(self, state=None, exclude=False):
         """
@@ -382,12 +616,14 @@ class SnapshotList:
         else:
             # Default to sorting by snapshot name
             sorted_snapshots = sorted(working_list, reverse=reverse)
-        idx = 1
-        for snap in sorted_snapshots:
-            msg = f'{snap} is {idx} of specified count of {count}.'
-            condition = True if idx <= count else False
-            self.__excludify(condition, exclude, snap, msg)
-            idx += 1
+        rank = {snap: idx for idx, snap in enumerate(sorted_snapshots, 1)}
+        msg = '%s is %s of specified count of %s.'
+        self.__select(
+            set(sorted_snapshots[:count]),
+            exclude,
+            msg,
+            lambda snap: (snap, rank[snap], count),
+        )
 
     def filter_period(
         self,
@@ -473,20 +709,18 @@ class SnapshotList:
         except Exception as err:
             report_failure(err)
         self._calculate_ages(source=source, timestring=timestring)
-        for snapshot in self.working_list():
-            if not self.snapshot_info[snapshot][self.age_keyfield]:
-                self.loggit.debug('Removing snapshot {0} for having no age')
-                self.snapshots.remove(snapshot)
-                continue
-            age = fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
-            msg = (
-                f'Snapshot "{snapshot}" age ({age}), period start: "{start}", period '
-                f'end, ({end})'
-            )
-            # Because time adds to epoch, smaller numbers are actually older
-            # timestamps.
-            inrange = (age >= start) and (age <= end)
-            self.__excludify(inrange, exclude, snapshot, msg)
+        epochs, _, names, ageless = self._age_index()
+        self.__remove_ageless(ageless)
+        # Because time adds to epoch, smaller numbers are actually older
+        # timestamps.
+        matches = set(names[bisect_left(epochs, start) : bisect_right(epochs, end)])
+        msg = 'Snapshot "%s" age (%s), period start: "%s", period end, (%s)'
+        self.__select(
+            matches,
+            exclude,
+            msg,
+            lambda snap: (snap, self.__age(snap), start, end),
+        )
 
     def iterate_filters(self, config):
         """
@@ -515,18 +749,25 @@ class SnapshotList:
             return
         self.loggit.debug('All filters: %s', config['filters'])
         for fltr in config['filters']:
-            self.loggit.debug('Top of the loop: %s', self.snapshots)
+            self.loggit.debug('Top of the loop: %s snapshots', len(self.snapshots))
             self.loggit.debug('Un-parsed filter args: %s', fltr)
             filter_result = SchemaCheck(
                 fltr, filterstructure(), 'filter', 'SnapshotList.iterate_filters'
             ).result()
             self.loggit.debug('Parsed filter args: %s', filter_result)
             method = self.__map_method(fltr['filtertype'])
+            self.sampler = LogSampler(
+                self.loggit, f'Filter "{fltr["filtertype"]}"', noun='snapshots'
+            )
+            before = len(self.snapshots)
             # Remove key 'filtertype' from dictionary 'fltr'
-            del fltr['filtertype']
+            filtertype = fltr.pop('filtertype')
             # If it's a filtertype with arguments, update the defaults with the
             # provided settings.
             self.loggit.debug('Filter args: %s', fltr)
-            self.loggit.debug('Pre-instance: %s', self.snapshots)
-            method(**fltr)
-            self.loggit.debug('Post-instance: %s', self.snapshots)
+            with ACCOUNTING.scope(filter=filtertype), TRACER.span(
+                'filter', filtertype=filtertype, **{'items.before': before}
+            ) as span:
+                method(**fltr)
+                span.set_attribute('items.after', len(self.snapshots))
+            self.sampler.summary(before, len(self.snapshots))
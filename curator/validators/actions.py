@@ -1,10 +1,12 @@
 """Validate root ``actions`` and individual ``action`` Schemas"""
 
+from functools import lru_cache
 from voluptuous import Any, In, Schema, Optional, Required
 from opensearch_client.schemacheck import SchemaCheck
 from curator.defaults import settings
 
 
+@lru_cache(maxsize=None)
 def root():
     """
     Return a valid :py:class:`~.voluptuous.schema_builder.Schema` definition which
@@ -52,10 +54,23 @@ def structure(data, location):
         location,
     ).result()
     # Build a valid schema knowing that the action has already been validated
+    return _structure_schema(data['action'])
+
+
+@lru_cache(maxsize=None)
+def _structure_schema(action):
+    """
+    Build and memoize the :py:class:`~.voluptuous.schema_builder.Schema` used by
+    :py:func:`structure` for ``action``. The ``options`` and ``filters`` defaults are
+    passed as factories so that each validated action gets its own copy.
+
+    :param action: The name of an action
+    :type action: str
+    :returns: A :py:class:`~.voluptuous.schema_builder.Schema` object
+    """
     retval = valid_action()
     retval.update({Optional('description', default='No description given'): Any(str)})
-    retval.update({Optional('options', default=settings.default_options()): dict})
-    action = data['action']
+    retval.update({Optional('options', default=settings.default_options): dict})
     if action in ['cluster_routing', 'create_index', 'rollover']:
         # The cluster_routing, create_index, and rollover actions should not
         # have a 'filters' block
@@ -70,5 +85,5 @@ def structure(data, location):
             }
         )
     else:
-        retval.update({Optional('filters', default=settings.default_filters()): list})
+        retval.update({Optional('filters', default=settings.default_filters): list})
     return Schema(retval)
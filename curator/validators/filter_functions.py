@@ -1,6 +1,7 @@
 """Functions validating the ``filter`` Schema of an ``action``"""
 
 import logging
+from functools import lru_cache
 from voluptuous import Any, In, Required, Schema
 from opensearch_client.schemacheck import SchemaCheck
 from opensearch_client.utils import prune_nones
@@ -25,6 +26,7 @@ def filtertype():
     }
 
 
+@lru_cache(maxsize=None)
 def filterstructure():
     """
     Return a :py:class:`~.voluptuous.schema_builder.Schema` object that uses the
@@ -32,6 +34,8 @@ def filterstructure():
     to populate acceptable values and updates/merges the Schema object with the
     return value from :py:func:`filtertype`
 
+    The result is memoized, as it never changes during the life of the process.
+
     :returns: A :py:class:`~.voluptuous.schema_builder.Schema` object
     """
     # This is to first ensure that only the possible keys/filter elements are
@@ -62,8 +66,42 @@ def singlefilter(action, data):
         ftdata = data['filtertype']
     except KeyError as exc:
         raise ConfigurationError('Missing key "filtertype"') from exc
+    return _singlefilter_schema(action, ftdata, *_schema_inputs(data))
+
+
+def _schema_inputs(data):
+    """
+    The only values in a filter block that alter the schema built by the functions
+    in :py:mod:`~.curator.defaults.filtertypes` are ``use_age`` and ``source``.
+    Return them in hashable form so the built schema can be memoized.
+
+    :param data: The filter block of the action
+    :type data: dict
+
+    :rtype: tuple
+    """
+    use_age = bool('use_age' in data and data['use_age'])
+    source = data['source'] if 'source' in data else None
+    if not isinstance(source, str):
+        # Let the schema itself complain about a bogus value
+        source = None if source is None else repr(source)
+    return use_age, source
+
+
+@lru_cache(maxsize=None)
+def _singlefilter_schema(action, ftdata, use_age, source):
+    """
+    Build and memoize the :py:class:`~.voluptuous.schema_builder.Schema` for one
+    combination of ``action``, filtertype, and the schema-altering values returned by
+    :py:func:`_schema_inputs`.
+
+    :returns: A :py:class:`~.voluptuous.schema_builder.Schema` object
+    """
+    config = {'filtertype': ftdata, 'use_age': use_age}
+    if source is not None:
+        config['source'] = source
     ftype = filtertype()
-    for each in getattr(filtertypes, ftdata)(action, data):
+    for each in getattr(filtertypes, ftdata)(action, config):
         ftype.update(each)
     return Schema(ftype)
 
@@ -1,5 +1,6 @@
 """Set up voluptuous Schema defaults for various actions"""
 
+from functools import lru_cache
 from voluptuous import Schema
 from curator.defaults import option_defaults
 
@@ -36,6 +37,7 @@ def action_specific(action):
             option_defaults.search_pattern(),
             option_defaults.delete_aliases(),
             option_defaults.skip_flush(),
+            option_defaults.concurrency(action),
         ],
         'cluster_routing': [
             option_defaults.routing_type(),
@@ -75,12 +77,15 @@ def action_specific(action):
             option_defaults.name(action),
             option_defaults.ignore_existing(),
             option_defaults.extra_settings(),
+            option_defaults.concurrency(action),
         ],
         'delete_indices': [
             option_defaults.search_pattern(),
         ],
         'delete_snapshots': [
             option_defaults.repository(),
+            option_defaults.page_size(),
+            option_defaults.snapshot_cache(),
             option_defaults.retry_interval(),
             option_defaults.retry_count(),
         ],
@@ -99,9 +104,14 @@ def action_specific(action):
             option_defaults.index_settings(),
             option_defaults.ignore_unavailable(),
             option_defaults.preserve_existing(),
+            option_defaults.skip_unchanged(),
         ],
         'open': [
             option_defaults.search_pattern(),
+            option_defaults.wait_for_completion(action),
+            option_defaults.wait_interval(action),
+            option_defaults.max_wait(action),
+            option_defaults.wave_size(),
         ],
         'reindex': [
             option_defaults.request_body(),
@@ -133,9 +143,12 @@ def action_specific(action):
             option_defaults.conditions(),
             option_defaults.extra_settings(),
             option_defaults.wait_for_active_shards(action),
+            option_defaults.concurrency(action),
         ],
         'restore': [
             option_defaults.repository(),
+            option_defaults.page_size(),
+            option_defaults.snapshot_cache(),
             option_defaults.name(action),
             option_defaults.indices(),
             option_defaults.ignore_unavailable(),
@@ -149,6 +162,9 @@ def action_specific(action):
             option_defaults.wait_interval(action),
             option_defaults.max_wait(action),
             option_defaults.skip_repo_fs_check(),
+            option_defaults.max_bytes_per_sec(),
+            option_defaults.concurrent_recoveries(),
+            option_defaults.wave_size(),
         ],
         'snapshot': [
             option_defaults.search_pattern(),
@@ -184,12 +200,17 @@ def action_specific(action):
     return options[action]
 
 
+@lru_cache(maxsize=None)
 def get_schema(action):
     """
     Return a :py:class:`~.voluptuous.schema_builder.Schema` of acceptable options
     and their default values as returned by :py:func:`action_specific`, passing
     along the value of ``action``.
 
+    The result is memoized per ``action``. Some defaults are mutable (e.g.
+    ``extra_settings``), so callers should copy the validated result before changing
+    it in place.
+
     :param action: The name of an action
     :type action: str
 
@@ -0,0 +1,288 @@
+"""API call accounting
+
+Every request made through one of the timed connection classes of
+:mod:`~opensearch_client.connection` is recorded in :data:`ACCOUNTING`, per API
+endpoint and per set of labels. Callers attach labels, such as the action or filter
+being run, with :meth:`RequestAccounting.scope`.
+
+Classes:
+    EndpointStats: Request count, errors, bytes and latency histogram of one endpoint.
+    RequestAccounting: Thread-safe collection of :class:`EndpointStats`.
+
+Functions:
+    endpoint_name: Reduce a request to its API endpoint.
+"""
+
+# The __future__ annotations line allows support for Python 3.8 and 3.9
+from __future__ import annotations
+import bisect
+import contextvars
+import json
+import threading
+import typing as t
+from contextlib import contextmanager
+
+LATENCY_BUCKETS: t.Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Upper bounds, in seconds, of the latency histogram buckets"""
+
+LABELS: t.Tuple[str, ...] = ("action", "filter")
+"""The labels requests are attributed to"""
+
+NAMESPACES: t.FrozenSet[str] = frozenset(("_cat", "_cluster", "_ingest", "_nodes"))
+"""APIs whose next path segment also names the API, e.g. ``_cat/indices``"""
+
+_LABELS: contextvars.ContextVar[t.Dict[str, str]] = contextvars.ContextVar(
+    "opensearch_client_labels", default={}
+)
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """
+    Reduce a request to its API endpoint.
+
+    Path segments which start with ``_`` name the API, and are kept, as is the
+    segment after any of :data:`NAMESPACES`. Every other segment (index, alias,
+    repository or snapshot names, metrics) is replaced by ``*``, and the query string
+    is dropped.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The request path.
+
+    Returns:
+        str: The method and endpoint.
+
+    Example:
+        >>> endpoint_name('GET', '/logs-1%2Clogs-2/_settings')
+        'GET /*/_settings'
+        >>> endpoint_name('HEAD', '/_alias/my_alias')
+        'HEAD /_alias/*'
+        >>> endpoint_name('GET', '/_cat/indices/logs-*')
+        'GET /_cat/indices/*'
+        >>> endpoint_name('GET', '/')
+        'GET /'
+    """
+    parts = []
+    previous = ""
+    for part in url.split("?", 1)[0].split("/"):
+        if not part:
+            continue
+        keep = part.startswith("_") or previous in NAMESPACES
+        parts.append(part if keep else "*")
+        previous = part
+    return f"{method} /{'/'.join(parts)}"
+
+
+class EndpointStats:
+    """
+    Request count, errors, response bytes and latency histogram of one endpoint.
+
+    :attr:`buckets` holds one count per bound in :data:`LATENCY_BUCKETS`, plus one
+    for requests slower than the last bound. Counts are not cumulative.
+
+    Example:
+        >>> stats = EndpointStats()
+        >>> stats.add(0.02, size=100)
+        >>> stats.as_dict()['histogram']['0.025']
+        1
+    """
+
+    __slots__ = ("requests", "errors", "bytes", "seconds", "max_seconds", "buckets")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, elapsed: float, error: bool = False, size: int = 0) -> None:
+        """Record one request which took `elapsed` seconds and returned `size` bytes."""
+        self.requests += 1
+        self.bytes += size
+        self.seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        if error:
+            self.errors += 1
+
+    def as_dict(self) -> t.Dict[str, t.Any]:
+        """
+        Return the values as a dictionary.
+
+        The ``histogram`` is cumulative, keyed by upper bound, with ``+Inf`` last.
+        """
+        histogram = {}
+        total = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), self.buckets):
+            total += count
+            histogram["+Inf" if bound == float("inf") else str(bound)] = total
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 6),
+            "max_seconds": round(self.max_seconds, 6),
+            "histogram": histogram,
+        }
+
+
+class RequestAccounting:
+    """
+    Thread-safe collection of :class:`EndpointStats`, keyed by the current labels
+    and the endpoint.
+
+    Example:
+        >>> accounting = RequestAccounting()
+        >>> with accounting.scope(action='1:delete_indices'):
+        ...     accounting.record('GET', '/_cat/indices', 0.01, size=512)
+        >>> row = accounting.as_dict()['endpoints'][0]
+        >>> row['action'], row['endpoint'], row['requests']
+        ('1:delete_indices', 'GET /_cat/indices', 1)
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.stats: t.Dict[t.Tuple[t.Tuple[str, ...], str], EndpointStats] = {}
+
+    @staticmethod
+    def labels() -> t.Dict[str, str]:
+        """Return the labels in effect for the current context."""
+        return _LABELS.get()
+
+    @staticmethod
+    @contextmanager
+    def scope(**labels: str) -> t.Iterator[None]:
+        """
+        Attribute the requests made within this context to `labels`.
+
+        Scopes nest: labels set by an outer scope remain in effect unless overridden.
+
+        Args:
+            **labels (str): Values for any of :data:`LABELS`.
+        """
+        token = _LABELS.set({**_LABELS.get(), **labels})
+        try:
+            yield
+        finally:
+            _LABELS.reset(token)
+
+    def record(
+        self, method: str, url: str, elapsed: float, error: bool = False, size: int = 0
+    ) -> None:
+        """
+        Record one request under the current labels.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request path.
+            elapsed (float): The request duration in seconds.
+            error (bool): Whether the request failed.
+            size (int): The response body size.
+        """
+        current = _LABELS.get()
+        key = (
+            tuple(current.get(label, "") for label in LABELS),
+            endpoint_name(method, url),
+        )
+        with self.lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = EndpointStats()
+            stats.add(elapsed, error=error, size=size)
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self.lock:
+            self.stats = {}
+
+    def rows(self) -> t.List[t.Dict[str, t.Any]]:
+        """
+        Return one dictionary per set of labels and endpoint, with the labels, the
+        ``endpoint`` and the values from :meth:`EndpointStats.as_dict`, in the order
+        first recorded.
+        """
+        with self.lock:
+            items = list(self.stats.items())
+        return [
+            {**dict(zip(LABELS, labels)), "endpoint": endpoint, **stats.as_dict()}
+            for (labels, endpoint), stats in items
+        ]
+
+    def as_dict(self) -> t.Dict[str, t.Any]:
+        """Return the histogram bounds, the :meth:`rows` and their totals."""
+        rows = self.rows()
+        totals = {
+            key: sum(row[key] for row in rows)
+            for key in ("requests", "errors", "bytes")
+        }
+        totals["seconds"] = round(sum(row["seconds"] for row in rows), 6)
+        return {"buckets": list(LATENCY_BUCKETS), "endpoints": rows, "totals": totals}
+
+    def summary(self) -> t.List[str]:
+        """
+        Return the :meth:`rows` as the lines of a text table, followed by a totals
+        line. Empty labels are shown as ``-``.
+        """
+        headers = [*(label.capitalize() for label in LABELS), "Endpoint"]
+        headers += ["Calls", "Errors", "KiB", "Total s", "Mean ms", "Max ms"]
+        table = [headers]
+        data = self.as_dict()
+        for row in data["endpoints"]:
+            table.append(
+                [
+                    *(row[label] or "-" for label in LABELS),
+                    row["endpoint"],
+                    str(row["requests"]),
+                    str(row["errors"]),
+                    f"{row['bytes'] / 1024:.1f}",
+                    f"{row['seconds']:.3f}",
+                    f"{1000 * row['seconds'] / row['requests']:.1f}",
+                    f"{1000 * row['max_seconds']:.1f}",
+                ]
+            )
+        totals = data["totals"]
+        table.append(
+            ["Total", *([""] * len(LABELS)), str(totals["requests"])]
+            + [str(totals["errors"]), f"{totals['bytes'] / 1024:.1f}"]
+            + [f"{totals['seconds']:.3f}", "", ""]
+        )
+        widths = [max(len(line[col]) for line in table) for col in range(len(headers))]
+        numeric = len(LABELS) + 1
+        return [
+            "  ".join(
+                cell.ljust(width) if col < numeric else cell.rjust(width)
+                for col, (cell, width) in enumerate(zip(line, widths))
+            ).rstrip()
+            for line in table
+        ]
+
+    def write_json(self, path: str) -> None:
+        """
+        Write :meth:`as_dict` to `path` as JSON.
+
+        Args:
+            path (str): The file to write.
+
+        Raises:
+            OSError: If `path` cannot be written.
+        """
+        with open(path, "w", encoding="utf-8") as fhandle:
+            json.dump(self.as_dict(), fhandle, indent=2)
+
+
+ACCOUNTING = RequestAccounting()
+"""The :class:`RequestAccounting` that the timed connection classes record to"""
@@ -18,6 +18,7 @@ from dotmap import DotMap  # type: ignore
 from cryptography.fernet import Fernet
 from elastic_transport import ObjectApiResponse
 from opensearchpy import OpenSearch
+from .connection import get_connection_class
 from .debug import debug, begin_end
 from .defaults import (
     VERSION_MIN,
@@ -753,8 +754,18 @@ class Builder:
         Creates client with pruned configuration arguments using
         :func:`~es_client.utils.prune_nones`, including sensitive fields from
         the secure store.
+
+        ``connection_class`` is mapped to a connection class from
+        :mod:`~opensearch_client.connection`, which times every request, and
+        ``connections_per_node`` is used as ``pool_maxsize`` if that is unset.
         """
         client_args = prune_nones(self.client_args.toDict())
+        per_node = client_args.pop('connections_per_node', None)
+        if per_node and 'pool_maxsize' not in client_args:
+            client_args['pool_maxsize'] = per_node
+        client_args['connection_class'] = get_connection_class(
+            client_args.pop('connection_class', None)
+        )
         # Add sensitive fields from SecretStore
         # Note: opensearch-py uses 'http_auth' parameter, not 'basic_auth'
         for field in ['basic_auth', 'api_key', 'bearer_auth']:
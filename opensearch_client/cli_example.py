@@ -84,12 +84,18 @@ def run(
     ssl_assert_hostname,
     ssl_assert_fingerprint,
     ssl_version,
+    pool_maxsize,
+    connection_class,
+    keep_alive,
+    max_retries,
+    retry_on_timeout,
     master_only,
     skip_version_test,
     loglevel,
     logfile,
     logformat,
     blacklist,
+    logqueue,
 ):
     """
     CLI Example
@@ -104,12 +104,18 @@ def show_all_options(
     ssl_assert_hostname,
     ssl_assert_fingerprint,
     ssl_version,
+    pool_maxsize,
+    connection_class,
+    keep_alive,
+    max_retries,
+    retry_on_timeout,
     master_only,
     skip_version_test,
     loglevel,
     logfile,
     logformat,
     blacklist,
+    logqueue,
 ) -> None:
     """
     Display all client configuration options and environment variables.
@@ -138,12 +144,18 @@ def show_all_options(
         ssl_assert_hostname (str): SSL hostname to verify.
         ssl_assert_fingerprint (str): SSL certificate fingerprint.
         ssl_version (str): SSL version to use.
+        pool_maxsize (int): Maximum pooled connections per host.
+        connection_class (str): HTTP library, urllib3 or requests.
+        keep_alive (bool): Enable TCP keep-alive on pooled connections.
+        max_retries (int): Maximum retries for a failed request.
+        retry_on_timeout (bool): Retry requests which time out.
         master_only (bool): Connect only to the master node.
         skip_version_test (bool): Skip OpenSearch version check.
         loglevel (str): Logging level (e.g., DEBUG, INFO).
         logfile (str): Path to log file.
         logformat (str): Log format (e.g., default, json).
         blacklist (tuple): Logger names to exclude.
+        logqueue (bool): Write log records from a background thread.
 
     Returns:
         None: Outputs help text and exits.
@@ -152,8 +164,8 @@ def show_all_options(
         >>> from click import Context, Command
         >>> ctx = Context(Command('show_all_options'), obj={})
         >>> show_all_options(ctx, None, (), None, None, None, None, None, None,
-        None, None, None, False, True, None, None, None, None, None, None, False,
-        False, None, None, None, ())
+        None, None, None, False, True, None, None, None, None, None, None, None,
+        None, None, None, None, False, False, None, None, None, (), False)
         ... # Outputs help text and exits
     """
     ctx = click.get_current_context()
@@ -0,0 +1,221 @@
+"""Timed HTTP connection classes
+
+This module provides subclasses of the :mod:`opensearchpy` HTTP connection classes
+which time every request, and optionally enable TCP keep-alive on their sockets.
+Every request is also recorded in :data:`~opensearch_client.accounting.ACCOUNTING`,
+and traced by :data:`~opensearch_client.tracing.TRACER`.
+
+Classes:
+    RequestTimer: Thread-safe accumulator of request counts and durations.
+    TimedUrllib3HttpConnection: :class:`~opensearchpy.Urllib3HttpConnection` with a
+        :class:`RequestTimer`.
+    TimedRequestsHttpConnection: :class:`~opensearchpy.RequestsHttpConnection` with a
+        :class:`RequestTimer`.
+
+Functions:
+    get_connection_class: Map a ``connection_class`` setting to a class.
+    request_stats: Return the request timers of every connection of a client.
+"""
+
+# The __future__ annotations line allows support for Python 3.8 and 3.9
+from __future__ import annotations
+import socket
+import threading
+import time
+import typing as t
+from opensearchpy import RequestsHttpConnection, Urllib3HttpConnection
+from urllib3.connection import HTTPConnection
+from .accounting import ACCOUNTING, RequestAccounting, endpoint_name
+from .exceptions import ConfigurationError
+from .tracing import TRACER, Tracer
+
+KEEPALIVE_OPTIONS: t.List[t.Tuple[int, int, int]] = [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+"""Socket options added to the defaults when ``keep_alive`` is enabled"""
+
+
+class RequestTimer:
+    """
+    Thread-safe accumulator of request counts, durations and response sizes.
+
+    Example:
+        >>> timer = RequestTimer()
+        >>> timer.add(0.5, size=100)
+        >>> timer.add(1.5)
+        >>> timer.as_dict()
+        {'requests': 2, 'errors': 0, 'seconds': 2.0, 'max_seconds': 1.5, 'bytes': 100}
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes = 0
+
+    def add(self, elapsed: float, error: bool = False, size: int = 0) -> None:
+        """Record one request which took `elapsed` seconds and returned `size` bytes."""
+        with self.lock:
+            self.requests += 1
+            self.bytes += size
+            self.seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+            if error:
+                self.errors += 1
+
+    def as_dict(self) -> t.Dict[str, t.Any]:
+        """Return the accumulated values as a dictionary."""
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'errors': self.errors,
+                'seconds': round(self.seconds, 6),
+                'max_seconds': round(self.max_seconds, 6),
+                'bytes': self.bytes,
+            }
+
+    def __repr__(self) -> str:
+        """Return a string representation of the timer."""
+        return f"<RequestTimer {self.as_dict()}>"
+
+
+class TimedMixin:
+    """
+    Time every :meth:`perform_request` call in :attr:`timer`, along with the size of
+    each response body, record it per endpoint in :attr:`accounting`, and trace it as
+    an ``opensearch.request`` span of :attr:`tracer`.
+
+    Must come before the connection class in the list of bases.
+    """
+
+    timer: RequestTimer
+    accounting: RequestAccounting = ACCOUNTING
+    tracer: Tracer = TRACER
+
+    def perform_request(
+        self, method: str, url: str, *args: t.Any, **kwargs: t.Any
+    ) -> t.Any:
+        """Perform the request, recording its duration in :attr:`timer`."""
+        with self.tracer.span(
+            "opensearch.request",
+            **{"http.method": method, "endpoint": endpoint_name(method, url)},
+        ) as span:
+            start = time.perf_counter()
+            error = True
+            size = 0
+            try:
+                retval = super().perform_request(  # type: ignore[misc]
+                    method, url, *args, **kwargs
+                )
+                error = False
+                # retval is (status, headers, body)
+                size = len(retval[2] or '')
+                span.set_attribute("http.status_code", retval[0])
+                return retval
+            finally:
+                elapsed = time.perf_counter() - start
+                self.timer.add(elapsed, error=error, size=size)
+                self.accounting.record(method, url, elapsed, error=error, size=size)
+                span.set_attribute("response.bytes", size)
+
+
+class TimedUrllib3HttpConnection(TimedMixin, Urllib3HttpConnection):
+    """
+    :class:`~opensearchpy.Urllib3HttpConnection` with a :class:`RequestTimer`.
+
+    Args:
+        keep_alive (bool): Enable TCP keep-alive on the pooled sockets.
+        **kwargs: Passed to :class:`~opensearchpy.Urllib3HttpConnection`.
+    """
+
+    def __init__(self, *args: t.Any, keep_alive: bool = False, **kwargs: t.Any):
+        super().__init__(*args, **kwargs)
+        self.timer = RequestTimer()
+        if keep_alive:
+            self.pool.conn_kw['socket_options'] = (
+                HTTPConnection.default_socket_options + KEEPALIVE_OPTIONS
+            )
+
+
+class TimedRequestsHttpConnection(TimedMixin, RequestsHttpConnection):
+    """
+    :class:`~opensearchpy.RequestsHttpConnection` with a :class:`RequestTimer`.
+
+    Each connection keeps a persistent :class:`requests.Session`.
+
+    Args:
+        keep_alive (bool): Enable TCP keep-alive on the pooled sockets.
+        **kwargs: Passed to :class:`~opensearchpy.RequestsHttpConnection`.
+    """
+
+    def __init__(self, *args: t.Any, keep_alive: bool = False, **kwargs: t.Any):
+        super().__init__(*args, **kwargs)
+        self.timer = RequestTimer()
+        if keep_alive:
+            for adapter in self.session.adapters.values():
+                adapter.poolmanager.connection_pool_kw['socket_options'] = (
+                    HTTPConnection.default_socket_options + KEEPALIVE_OPTIONS
+                )
+
+
+CONNECTION_CLASSES: t.Dict[str, t.Type] = {
+    'urllib3': TimedUrllib3HttpConnection,
+    'requests': TimedRequestsHttpConnection,
+}
+"""Map of acceptable ``connection_class`` settings to connection classes"""
+
+
+def get_connection_class(name: t.Optional[str]) -> t.Type:
+    """
+    Map a ``connection_class`` setting to a connection class.
+
+    Args:
+        name (str): One of the keys of :data:`CONNECTION_CLASSES`, or ``None`` for the
+            default, ``urllib3``.
+
+    Returns:
+        type: The connection class.
+
+    Raises:
+        :exc:`~opensearch_client.exceptions.ConfigurationError`: If `name` is unknown.
+
+    Example:
+        >>> get_connection_class(None).__name__
+        'TimedUrllib3HttpConnection'
+        >>> get_connection_class('requests').__name__
+        'TimedRequestsHttpConnection'
+    """
+    try:
+        return CONNECTION_CLASSES[name or 'urllib3']
+    except KeyError as exc:
+        raise ConfigurationError(
+            f'Invalid connection_class "{name}". '
+            f'Must be one of {list(CONNECTION_CLASSES)}'
+        ) from exc
+
+
+def request_stats(client: t.Any) -> t.List[t.Dict[str, t.Any]]:
+    """
+    Return the request timers of every connection of `client`.
+
+    Connections without a :class:`RequestTimer` are skipped.
+
+    Args:
+        client (:class:`~opensearchpy.OpenSearch`): The client.
+
+    Returns:
+        list: One dictionary per connection, with the ``host`` and the values from
+            :meth:`RequestTimer.as_dict`.
+    """
+    retval = []
+    try:
+        connections = client.transport.connection_pool.connections
+    except AttributeError:
+        return retval
+    for conn in connections:
+        timer = getattr(conn, 'timer', None)
+        if isinstance(timer, RequestTimer):
+            retval.append({'host': getattr(conn, 'host', None), **timer.as_dict()})
+    return retval
@@ -4,7 +4,7 @@
 import typing as t
 from copy import deepcopy
 from click import Choice, Path
-from voluptuous import All, Any, Boolean, Coerce, Optional, Range, Schema
+from voluptuous import All, Any, Boolean, Coerce, In, Optional, Range, Schema
 
 VERSION_MIN: t.Tuple = (2, 0, 0)
 """Minimum supported OpenSearch version."""
@@ -35,6 +35,9 @@ CLIENT_SETTINGS: t.List[str] = [
     "opaque_id",
     "headers",
     "connections_per_node",
+    "pool_maxsize",
+    "connection_class",
+    "keep_alive",
     "http_compress",
     "verify_certs",
     "ca_certs",
@@ -123,6 +126,31 @@ CLICK_SETTINGS: t.Dict[str, t.Dict] = {
         "type": str,
         "hidden": True,
     },
+    "pool_maxsize": {
+        "help": "Maximum number of pooled connections per host",
+        "type": int,
+        "hidden": True,
+    },
+    "connection_class": {
+        "help": "HTTP library used for connections",
+        "type": Choice(["urllib3", "requests"]),
+        "hidden": True,
+    },
+    "keep_alive": {
+        "help": "Enable TCP keep-alive on pooled connections",
+        "default": None,
+        "hidden": True,
+    },
+    "max_retries": {
+        "help": "Maximum number of retries for a failed request",
+        "type": int,
+        "hidden": True,
+    },
+    "retry_on_timeout": {
+        "help": "Retry requests which time out",
+        "default": None,
+        "hidden": True,
+    },
     "master-only": {
         "help": "Only run if the single host provided is the elected master",
         "default": None,
@@ -154,11 +182,15 @@ LOGFORMAT: t.Literal['default', 'ecs', 'json'] = 'default'
 BLACKLIST: None = None
 """Default value for logging blacklist"""
 
+LOGQUEUE: bool = False
+"""Default value for logqueue"""
+
 LOGDEFAULTS: t.Dict = {
     "loglevel": LOGLEVEL,
     "logfile": LOGFILE,
     "logformat": LOGFORMAT,
     "blacklist": BLACKLIST,
+    "logqueue": LOGQUEUE,
 }
 """All logging defaults in a single combined dictionary"""
 
@@ -180,6 +212,11 @@ LOGGING_SETTINGS: t.Dict[str, t.Dict] = {
         "default": None,
         "hidden": True,
     },
+    "logqueue": {
+        "help": "Write log records from a background thread",
+        "default": None,
+        "hidden": True,
+    },
 }
 """
 Default logging settings used for building :py:class:`click.Option`. Too large to show.
@@ -218,12 +255,18 @@ OPTION_DEFAULTS: t.Dict[str, t.Dict] = {
     "ssl_assert_hostname": {},
     "ssl_assert_fingerprint": {},
     "ssl_version": {},
+    "pool_maxsize": {},
+    "connection_class": {},
+    "keep_alive": {"onoff": ONOFF},
+    "max_retries": {},
+    "retry_on_timeout": {"onoff": ONOFF},
     "master-only": {"onoff": ONOFF},
     "skip_version_test": {"onoff": ONOFF},
     "loglevel": {"settings": LOGGING_SETTINGS["loglevel"]},
     "logfile": {"settings": LOGGING_SETTINGS["logfile"]},
     "logformat": {"settings": LOGGING_SETTINGS["logformat"]},
     "blacklist": {"settings": LOGGING_SETTINGS["blacklist"]},
+    "logqueue": {"settings": LOGGING_SETTINGS["logqueue"], "onoff": ONOFF},
 }
 """Default options for iteratively building Click decorators"""
 
@@ -259,6 +302,7 @@ def config_logging() -> Schema:
           logfile: None
           logformat: default
           blacklist: ['elastic_transport', 'urllib3']
+          logqueue: False
 
     """
     return Schema(
@@ -280,6 +324,7 @@ def config_logging() -> Schema:
             Optional("blacklist", default=["elastic_transport", "urllib3"]): Any(
                 None, list
             ),
+            Optional("logqueue", default=False): Any(None, bool),
         }
     )
 
@@ -316,9 +361,18 @@ def config_schema() -> Schema:
                 Optional("bearer_auth"): Any(None, str),
                 Optional("opaque_id"): Any(None, str),
                 Optional("headers"): Any(None, dict),
+                # connections_per_node is the elastic_transport name for
+                # pool_maxsize, and is used as such if pool_maxsize is unset.
                 Optional("connections_per_node"): Any(
                     None, All(Coerce(int), Range(min=1, max=100))
                 ),
+                Optional("pool_maxsize"): Any(
+                    None, All(Coerce(int), Range(min=1, max=1000))
+                ),
+                # urllib3 (default) or requests
+                Optional("connection_class"): Any(None, In(["urllib3", "requests"])),
+                # TCP keep-alive on pooled sockets
+                Optional("keep_alive"): Boolean(),
                 Optional("http_compress"): Boolean(),
                 Optional("verify_certs"): Boolean(),
                 Optional("ca_certs"): Any(None, str),
@@ -385,7 +439,7 @@ def config_schema() -> Schema:
                 Optional("serializers"): Any(None, dict),
                 Optional("default_mimetype"): Any(None, str),
                 Optional("max_retries"): Any(
-                    None, All(Coerce(int), Range(min=1, max=100))
+                    None, All(Coerce(int), Range(min=0, max=100))
                 ),
                 # retry_on_status: Collection[int] = (429, 502, 503, 504),
                 Optional("retry_on_status"): Any(None, tuple),
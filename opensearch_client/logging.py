@@ -10,6 +10,10 @@ Classes:
     Blacklist: Logging filter to block specific logger names.
     JSONFormatter: Custom formatter for JSON log output.
 
+Log records can optionally be written from a background thread (``logqueue``), so
+that slow log I/O never blocks the caller. If :mod:`orjson` is installed,
+:class:`JSONFormatter` uses it to serialize records.
+
 Functions:
     check_logging_config: Validate logging configuration using SchemaCheck.
     configure_logging: Configure logging from a click context.
@@ -21,6 +25,8 @@ Functions:
     override_logging: Merge CLI and config file logging settings.
     check_log_opts: Apply default logging options.
     set_logging: Configure global logging with handlers and filters.
+    start_queue: Run logging handlers in a background thread.
+    stop_queue: Stop the background logging thread, flushing queued records.
 """
 
 # The __future__ annotations line allows support for Python 3.8 and 3.9
@@ -29,8 +35,11 @@ import typing as t
 import sys
 import json
 import time
+import atexit
 import logging
+import queue
 from logging import FileHandler, StreamHandler
+from logging.handlers import QueueHandler, QueueListener
 from click import Context, echo as clicho
 import ecs_logging
 from .exceptions import LoggingException
@@ -38,10 +47,18 @@ from .defaults import config_logging, LOGDEFAULTS
 from .schemacheck import SchemaCheck
 from .utils import ensure_list, prune_nones
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 # pylint: disable=R0903
 
 logger = logging.getLogger('')  # Root logger for this module
 
+_LISTENER: t.Optional[QueueListener] = None
+"""The active :class:`logging.handlers.QueueListener`, if ``logqueue`` is enabled"""
+
 
 def check_logging_config(config: t.Dict) -> t.Dict:
     """
@@ -218,9 +235,14 @@ def get_logger(log_opts: t.Dict) -> None:
     (up to INFO) and stderr (WARNING and above). Applies formatters and filters based
     on `logformat` and `blacklist`.
 
+    If `logqueue` is set, the root logger only gets a
+    :class:`logging.handlers.QueueHandler`, and the handlers above are run by a
+    :class:`logging.handlers.QueueListener` in a background thread. See
+    :func:`start_queue`.
+
     Args:
         log_opts (dict): Logging configuration with keys: loglevel, logfile, logformat,
-            blacklist.
+            blacklist, logqueue.
 
     Raises:
         OSError: If `logfile` cannot be opened.
@@ -240,6 +262,7 @@ def get_logger(log_opts: t.Dict) -> None:
     logfile = log_opts.get("logfile", None)
     kind = log_opts.get("logformat", "default")
     nll = get_numeric_loglevel(log_opts.get("loglevel", "INFO"))
+    handlers: t.List[logging.Handler] = []
 
     logger.setLevel(nll)
 
@@ -269,7 +292,7 @@ def get_logger(log_opts: t.Dict) -> None:
             for entry in ensure_list(log_opts["blacklist"]):
                 handler.addFilter(Blacklist(entry))
 
-        logger.addHandler(handler)
+        handlers.append(handler)
 
     if logfile:
         add_handler('logfile')
@@ -277,6 +300,55 @@ def get_logger(log_opts: t.Dict) -> None:
         add_handler('stdout')
         add_handler('stderr')
 
+    if log_opts.get("logqueue", False):
+        logger.addHandler(start_queue(handlers))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+
+
+def start_queue(handlers: t.List[logging.Handler]) -> QueueHandler:
+    """
+    Run `handlers` in a background thread.
+
+    Starts a :class:`logging.handlers.QueueListener` for `handlers`, stopping any
+    listener started previously. The listener is stopped, flushing any queued records,
+    at interpreter exit.
+
+    Args:
+        handlers (list): The :class:`logging.Handler` objects to run.
+
+    Returns:
+        :class:`logging.handlers.QueueHandler`: The handler to attach to a logger.
+
+    Example:
+        >>> qhandler = start_queue([logging.StreamHandler()])
+        >>> isinstance(qhandler, QueueHandler)
+        True
+        >>> stop_queue()
+    """
+    global _LISTENER  # pylint: disable=global-statement
+    stop_queue()
+    logq: queue.SimpleQueue = queue.SimpleQueue()
+    _LISTENER = QueueListener(logq, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+    return QueueHandler(logq)
+
+
+@atexit.register
+def stop_queue() -> None:
+    """
+    Stop the active :class:`logging.handlers.QueueListener`, if any, after it has
+    written all queued records.
+
+    Example:
+        >>> stop_queue()  # Safe to call even if no listener is running
+    """
+    global _LISTENER  # pylint: disable=global-statement
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
+
 
 def get_numeric_loglevel(level: str) -> int:
     """
@@ -365,7 +437,7 @@ def override_logging(ctx: Context) -> t.Dict:
     if "loglevel" in ctx.params and ctx.params["loglevel"] is not None:
         debug = ctx.params["loglevel"] == "DEBUG"
 
-    paramlist = ["loglevel", "logfile", "logformat", "blacklist"]
+    paramlist = ["loglevel", "logfile", "logformat", "blacklist", "logqueue"]
     for entry in paramlist:
         if entry in ctx.params:
             if not ctx.params[entry]:
@@ -421,7 +493,7 @@ def set_logging(options: t.Dict) -> None:
 
     Args:
         options (dict): Logging configuration with keys: loglevel, logfile, logformat,
-            blacklist.
+            blacklist, logqueue.
 
     Raises:
         OSError: If `logfile` cannot be opened.
@@ -520,6 +592,10 @@ class JSONFormatter(logging.Formatter):
     Formats log records as JSON objects with timestamp, log level, logger name,
     function, line number, and message.
 
+    The field layout is fixed, so each record is built directly as a flat dictionary
+    whose keys are already in sorted order. :mod:`orjson` is used to serialize it if
+    installed (compact separators), otherwise :func:`json.dumps`.
+
     Example:
         >>> import logging
         >>> record = logging.makeLogRecord({
@@ -541,22 +617,33 @@ class JSONFormatter(logging.Formatter):
         "name": "name",
     }
 
+    converter = time.gmtime
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.dumps: t.Callable[[t.Dict], str] = (
+            self._orjson_dumps if orjson is not None else json.dumps
+        )
+
+    @staticmethod
+    def _orjson_dumps(result: t.Dict) -> str:
+        """Serialize `result` using :mod:`orjson`"""
+        return orjson.dumps(result).decode("utf-8")
+
     def format(self, record: logging.LogRecord) -> str:
         """Format a log record as a JSON string."""
-        self.converter = time.gmtime
-        fmt = "%Y-%m-%dT%H:%M:%S"
-        mil = f"{int(record.msecs):03d}"
-        timestamp = f"{self.formatTime(record, datefmt=fmt)}.{mil}Z"
-        result = {"@timestamp": timestamp}
-        available = record.__dict__
-        available["message"] = record.getMessage()
-        for attribute in set(self.WANTED_ATTRS).intersection(available):
-            result = deepmerge(
-                de_dot(self.WANTED_ATTRS[attribute], getattr(record, attribute)), result
-            )
-        if "message" not in result:
-            result["message"] = available["message"]
-        return json.dumps(result, sort_keys=True)
+        record.message = record.getMessage()
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%S", self.converter(record.created))
+        # The keys are in sorted order to match the historical output
+        result = {
+            "@timestamp": f"{stamp}.{int(record.msecs):03d}Z",
+            "function": record.funcName,
+            "linenum": record.lineno,
+            "loglevel": record.levelname,
+            "message": record.message,
+            "name": record.name,
+        }
+        return self.dumps(result)
 
     def __repr__(self) -> str:
         """Return a string representation of the formatter."""
@@ -0,0 +1,99 @@
+"""Test accounting module"""
+
+from unittest import TestCase
+from opensearch_client.accounting import (
+    LATENCY_BUCKETS,
+    EndpointStats,
+    RequestAccounting,
+    endpoint_name,
+)
+
+
+class TestEndpointName(TestCase):
+    """Test endpoint_name function"""
+
+    def test_names_replaced(self):
+        """Index, alias and snapshot names are replaced"""
+        assert 'GET /*/_stats/*' == endpoint_name('GET', '/a,b/_stats/store,docs')
+        assert 'GET /_snapshot/*/*' == endpoint_name('GET', '/_snapshot/repo/snap')
+
+    def test_namespaces(self):
+        """The API after a namespace is kept"""
+        assert 'GET /_cluster/health' == endpoint_name('GET', '/_cluster/health')
+        assert 'GET /_nodes/stats' == endpoint_name('GET', '/_nodes/stats')
+
+    def test_query_string(self):
+        """The query string is dropped"""
+        assert 'GET /_cat/indices' == endpoint_name('GET', '/_cat/indices?format=json')
+
+
+class TestEndpointStats(TestCase):
+    """Test EndpointStats class"""
+
+    def test_histogram(self):
+        """The histogram is cumulative, with +Inf last"""
+        stats = EndpointStats()
+        stats.add(0.001)
+        stats.add(0.3, error=True, size=10)
+        stats.add(60)
+        histogram = stats.as_dict()['histogram']
+        assert len(LATENCY_BUCKETS) + 1 == len(histogram)
+        assert 1 == histogram['0.005']
+        assert 1 == histogram['0.25']
+        assert 2 == histogram['0.5']
+        assert 2 == histogram['10.0']
+        assert 3 == histogram['+Inf']
+        assert 1 == stats.errors
+        assert 10 == stats.bytes
+
+
+class TestRequestAccounting(TestCase):
+    """Test RequestAccounting class"""
+
+    def test_scopes(self):
+        """Requests are attributed to the labels of the innermost scope"""
+        accounting = RequestAccounting()
+        with accounting.scope(action='1:close'):
+            accounting.record('GET', '/_cat/indices', 0.01)
+            with accounting.scope(filter='age'):
+                accounting.record('HEAD', '/_alias/a', 0.01)
+                accounting.record('HEAD', '/_alias/b', 0.01)
+        assert not accounting.labels()
+        rows = accounting.rows()
+        assert 2 == len(rows)
+        assert ('1:close', '', 1) == (
+            rows[0]['action'],
+            rows[0]['filter'],
+            rows[0]['requests'],
+        )
+        assert ('age', 'HEAD /_alias/*', 2) == (
+            rows[1]['filter'],
+            rows[1]['endpoint'],
+            rows[1]['requests'],
+        )
+
+    def test_totals(self):
+        """as_dict adds up every row"""
+        accounting = RequestAccounting()
+        accounting.record('GET', '/', 0.5, size=100)
+        accounting.record('GET', '/_cat/indices', 0.25, error=True, size=50)
+        totals = accounting.as_dict()['totals']
+        assert {'requests': 2, 'errors': 1, 'bytes': 150, 'seconds': 0.75} == totals
+
+    def test_summary(self):
+        """The summary has a header, one line per row and a totals line"""
+        accounting = RequestAccounting()
+        with accounting.scope(action='1:close', filter='age'):
+            accounting.record('GET', '/_cat/indices', 0.01, size=2048)
+        lines = accounting.summary()
+        assert 3 == len(lines)
+        assert lines[0].startswith('Action')
+        assert '1:close' in lines[1] and 'age' in lines[1]
+        assert lines[2].startswith('Total')
+
+    def test_reset(self):
+        """reset discards all rows"""
+        accounting = RequestAccounting()
+        accounting.record('GET', '/', 0.1)
+        accounting.reset()
+        assert not accounting.rows()
@@ -0,0 +1,171 @@
+"""Test connection module"""
+
+from unittest import TestCase
+from unittest.mock import Mock, patch
+import pytest
+from opensearchpy import Urllib3HttpConnection
+from opensearch_client.accounting import RequestAccounting
+from opensearch_client.builder import Builder
+from opensearch_client.connection import (
+    RequestTimer,
+    TimedRequestsHttpConnection,
+    TimedUrllib3HttpConnection,
+    get_connection_class,
+    request_stats,
+)
+from opensearch_client.exceptions import ConfigurationError, FailedValidation
+from opensearch_client.tracing import Exporter, Tracer
+
+HOST = 'http://127.0.0.1:9200'
+
+
+def built_client(**client):
+    """Return the client built by a Builder from ``client`` settings"""
+    client['hosts'] = [HOST]
+    builder = Builder(configdict={'opensearch': {'client': client}})
+    builder._get_client()  # pylint: disable=protected-access
+    return builder.client
+
+
+class TestRequestTimer(TestCase):
+    """Test RequestTimer class"""
+
+    def test_add(self):
+        """Requests, errors and durations are accumulated"""
+        timer = RequestTimer()
+        timer.add(0.25, size=512)
+        timer.add(0.75, error=True)
+        expected = {
+            'requests': 2,
+            'errors': 1,
+            'seconds': 1.0,
+            'max_seconds': 0.75,
+            'bytes': 512,
+        }
+        assert expected == timer.as_dict()
+
+
+class TestTimedConnection(TestCase):
+    """Test the timing of perform_request"""
+
+    def test_records_size(self):
+        """The response body size is recorded"""
+        conn = TimedUrllib3HttpConnection(host='127.0.0.1')
+        body = '{"acknowledged":true}'
+        with patch.object(
+            Urllib3HttpConnection, 'perform_request', return_value=(200, {}, body)
+        ):
+            conn.perform_request('GET', '/')
+        assert len(body) == conn.timer.bytes
+        assert 0 == conn.timer.errors
+
+    def test_records_endpoint(self):
+        """The request is recorded in the connection's accounting"""
+        conn = TimedUrllib3HttpConnection(host='127.0.0.1')
+        conn.accounting = RequestAccounting()
+        with patch.object(
+            Urllib3HttpConnection, 'perform_request', return_value=(200, {}, '[]')
+        ):
+            conn.perform_request('GET', '/_cat/indices/logs-1')
+        row = conn.accounting.rows()[0]
+        assert 'GET /_cat/indices/*' == row['endpoint']
+        assert 2 == row['bytes']
+
+    def test_traces_request(self):
+        """The request is traced as a span of the connection's tracer"""
+        conn = TimedUrllib3HttpConnection(host='127.0.0.1')
+        conn.tracer = Tracer()
+        exporter = Mock(spec=Exporter)
+        conn.tracer.add_exporter(exporter)
+        with patch.object(
+            Urllib3HttpConnection, 'perform_request', return_value=(200, {}, '[]')
+        ):
+            conn.perform_request('GET', '/_cat/indices/logs-1')
+        span = exporter.export.call_args[0][0]
+        assert 'opensearch.request' == span.name
+        assert 'GET /_cat/indices/*' == span.attributes['endpoint']
+        assert 200 == span.attributes['http.status_code']
+
+    def test_records_error(self):
+        """A failed request is counted as an error"""
+        conn = TimedUrllib3HttpConnection(host='127.0.0.1')
+        with patch.object(
+            Urllib3HttpConnection, 'perform_request', side_effect=ValueError
+        ):
+            with pytest.raises(ValueError):
+                conn.perform_request('GET', '/')
+        assert 1 == conn.timer.errors
+
+
+class TestGetConnectionClass(TestCase):
+    """Test get_connection_class function"""
+
+    def test_default(self):
+        """urllib3 is the default"""
+        assert get_connection_class(None) is TimedUrllib3HttpConnection
+
+    def test_requests(self):
+        """requests maps to the requests connection class"""
+        assert get_connection_class('requests') is TimedRequestsHttpConnection
+
+    def test_invalid(self):
+        """An unknown name raises ConfigurationError"""
+        with pytest.raises(ConfigurationError):
+            get_connection_class('pycurl')
+
+
+class TestBuilderTransport(TestCase):
+    """Test the transport settings applied by Builder"""
+
+    def test_pool_settings(self):
+        """pool_maxsize, retries and keep_alive reach the transport"""
+        client = built_client(
+            pool_maxsize=8, max_retries=0, retry_on_timeout=True, keep_alive=True
+        )
+        conn = client.transport.connection_pool.connections[0]
+        assert isinstance(conn, TimedUrllib3HttpConnection)
+        assert 8 == conn.pool.pool.maxsize
+        assert 'socket_options' in conn.pool.conn_kw
+        assert 0 == client.transport.max_retries
+        assert client.transport.retry_on_timeout is True
+
+    def test_connections_per_node(self):
+        """connections_per_node is used as pool_maxsize"""
+        client = built_client(connections_per_node=5)
+        conn = client.transport.connection_pool.connections[0]
+        assert 5 == conn.pool.pool.maxsize
+
+    def test_requests_class(self):
+        """connection_class selects the requests connection"""
+        client = built_client(connection_class='requests')
+        conn = client.transport.connection_pool.connections[0]
+        assert isinstance(conn, TimedRequestsHttpConnection)
+
+    def test_invalid_connection_class(self):
+        """An invalid connection_class fails validation"""
+        with pytest.raises(FailedValidation):
+            Builder(
+                configdict={
+                    'opensearch': {
+                        'client': {'hosts': [HOST], 'connection_class': 'pycurl'}
+                    }
+                }
+            )
+
+
+class TestRequestStats(TestCase):
+    """Test request_stats function"""
+
+    def test_stats(self):
+        """Each timed connection reports its host and timer values"""
+        client = built_client()
+        conn = client.transport.connection_pool.connections[0]
+        conn.timer.add(0.5)
+        stats = request_stats(client)
+        assert 1 == len(stats)
+        assert 1 == stats[0]['requests']
+        assert 'host' in stats[0]
+
+    def test_no_transport(self):
+        """Objects without a connection pool yield an empty list"""
+        assert not request_stats(Mock(spec=[]))
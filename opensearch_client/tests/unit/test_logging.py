@@ -6,6 +6,7 @@ import json
 import re
 import tempfile
 import unittest
+from logging.handlers import QueueHandler
 from unittest.mock import MagicMock
 from unittest import TestCase
 import pytest
@@ -23,6 +24,7 @@ from opensearch_client.logging import (
     check_log_opts,
     de_dot,
     deepmerge,
+    stop_queue,
 )
 from . import FileTestObj
 
@@ -40,6 +42,7 @@ class TestCheckLoggingConfig(TestCase):
         "blacklist": ["elastic_transport", "urllib3"],
         "logfile": None,
         "logformat": "default",
+        "logqueue": False,
     }
 
     def test_non_dict(self):
@@ -136,6 +139,33 @@ class TestJSONFormatter(unittest.TestCase):
             re.match(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z', data['@timestamp'])
         )
 
+    def test_fixed_layout(self):
+        """Test that the fields and their order match the historical output."""
+        formatter = JSONFormatter()
+        record = logging.makeLogRecord(
+            {
+                'name': 'a.b',
+                'levelname': 'DEBUG',
+                'msg': 'Value %s',
+                'args': (1,),
+                'funcName': 'func',
+                'lineno': 42,
+                'created': 1625097600.0,
+                'msecs': 123.456,
+            }
+        )
+        data = json.loads(formatter.format(record))
+        expected = {
+            '@timestamp': '2021-07-01T00:00:00.123Z',
+            'function': 'func',
+            'linenum': 42,
+            'loglevel': 'DEBUG',
+            'message': 'Value 1',
+            'name': 'a.b',
+        }
+        self.assertEqual(expected, data)
+        self.assertEqual(sorted(data), list(data))
+
 
 # Test configuration-related functions
 class TestConfigurationFunctions(unittest.TestCase):
@@ -233,6 +263,35 @@ class TestLoggerSetup(unittest.TestCase):
         self.assertIn('Test info message', stdout.getvalue())
         self.assertIn('Test error message', stderr.getvalue())
 
+    def test_get_logger_with_logqueue(self):
+        """Test get_logger writes from a background thread with logqueue."""
+        with tempfile.NamedTemporaryFile(delete=False) as tmpfile:
+            tmpfile_name = tmpfile.name
+        try:
+            log_opts = {
+                'loglevel': 'INFO',
+                'logfile': tmpfile_name,
+                'logformat': 'json',
+                'blacklist': [],
+                'logqueue': True,
+            }
+            get_logger(log_opts)
+            self.assertIsInstance(logging.root.handlers[0], QueueHandler)
+            logging.getLogger('test_logger_with_logqueue').info('Queued message')
+            # Stopping the listener flushes the queue
+            stop_queue()
+            for handler in logging.root.handlers[:]:
+                handler.close()
+            with open(tmpfile_name, 'r', encoding='utf8') as f:
+                self.assertIn('Queued message', f.read())
+        finally:
+            import os
+
+            try:
+                os.unlink(tmpfile_name)
+            except OSError:
+                pass
+
     def test_get_numeric_loglevel(self):
         """Test conversion of string log levels to numeric values."""
         self.assertEqual(get_numeric_loglevel('DEBUG'), 10)
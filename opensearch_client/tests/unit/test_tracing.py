@@ -0,0 +1,89 @@
+"""Test tracing module"""
+
+import json
+import os
+import tempfile
+from unittest import TestCase
+import pytest
+from opensearch_client.tracing import (
+    NOOP_SPAN,
+    Exporter,
+    JsonLinesExporter,
+    Tracer,
+)
+
+
+class Collect(Exporter):
+    """Keep every exported span"""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+class TestTracer(TestCase):
+    """Test Tracer class"""
+
+    def test_disabled(self):
+        """Without an exporter, spans are not created"""
+        tracer = Tracer()
+        with tracer.span('action') as span:
+            assert span is NOOP_SPAN
+            assert tracer.current_span() is NOOP_SPAN
+
+    def test_nesting(self):
+        """Child spans share the trace of their parent"""
+        tracer = Tracer()
+        collect = Collect()
+        tracer.add_exporter(collect)
+        with tracer.span('curator.run'):
+            with tracer.span('action') as action:
+                assert tracer.current_span() is action
+                with tracer.span('filter'):
+                    pass
+        fltr, action, run = collect.spans
+        assert run.parent_id is None
+        assert action.parent_id == run.span_id
+        assert fltr.parent_id == action.span_id
+        assert 1 == len({span.trace_id for span in collect.spans})
+
+    def test_error(self):
+        """A span which raises is marked as failed"""
+        tracer = Tracer()
+        collect = Collect()
+        tracer.add_exporter(collect)
+        with pytest.raises(ValueError):
+            with tracer.span('action'):
+                raise ValueError('boom')
+        assert 'ERROR' == collect.spans[0].status
+        assert 'ValueError: boom' == collect.spans[0].status_message
+
+    def test_shutdown(self):
+        """shutdown disables tracing"""
+        tracer = Tracer()
+        tracer.add_exporter(Collect())
+        tracer.shutdown()
+        assert not tracer.enabled
+
+
+class TestJsonLinesExporter(TestCase):
+    """Test JsonLinesExporter class"""
+
+    def test_lines(self):
+        """Each span is appended as one line of JSON"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'trace.jsonl')
+            for _ in range(2):
+                tracer = Tracer()
+                tracer.add_exporter(JsonLinesExporter(path))
+                with tracer.span('filter', filtertype='age') as span:
+                    span.set_attribute('items.after', 3)
+                tracer.shutdown()
+            with open(path, encoding='utf-8') as fhandle:
+                lines = [json.loads(line) for line in fhandle]
+        assert 2 == len(lines)
+        assert 'filter' == lines[0]['name']
+        assert {'filtertype': 'age', 'items.after': 3} == lines[0]['attributes']
+        assert lines[0]['trace_id'] != lines[1]['trace_id']
@@ -0,0 +1,254 @@
+"""Tracing spans
+
+A lightweight, OpenTelemetry-style tracer. Spans nest through a context variable, so
+a span opened inside another becomes its child and shares its trace. Finished spans
+are handed to every registered exporter. Nothing is recorded while no exporter is
+registered, which is the default.
+
+Every request made through one of the timed connection classes of
+:mod:`~opensearch_client.connection` is traced as an ``opensearch.request`` span.
+
+Classes:
+    Span: One timed operation, with attributes and a status.
+    Exporter: Base class for span exporters.
+    JsonLinesExporter: Append each finished span to a file as one line of JSON.
+    Tracer: Create spans and export them when they end.
+"""
+
+# The __future__ annotations line allows support for Python 3.8 and 3.9
+from __future__ import annotations
+import contextvars
+import json
+import os
+import threading
+import time
+import typing as t
+from contextlib import contextmanager
+
+_CURRENT: contextvars.ContextVar[t.Optional[Span]] = contextvars.ContextVar(
+    "opensearch_client_span", default=None
+)
+
+
+class Span:
+    """
+    One timed operation, with attributes and a status.
+
+    Args:
+        name (str): What the span measures, e.g. ``filter``.
+        parent (Span): The enclosing span, if any. The span joins its trace.
+        attributes (dict): Initial attributes.
+
+    Example:
+        >>> span = Span('action', attributes={'action.name': 'close'})
+        >>> span.set_attribute('items.after', 3)
+        >>> span.end()
+        >>> data = span.as_dict()
+        >>> data['name'], data['status'], data['attributes']['items.after']
+        ('action', 'OK', 3)
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status",
+        "status_message",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent: t.Optional[Span] = None,
+        attributes: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> None:
+        self.name = name
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.start_ns = time.time_ns()
+        self.end_ns: t.Optional[int] = None
+        self.attributes: t.Dict[str, t.Any] = dict(attributes or {})
+        self.status = "OK"
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: t.Any) -> None:
+        """Set attribute `key` to `value`."""
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        """Mark the span as failed, with `message`."""
+        self.status = "ERROR"
+        self.status_message = message
+
+    def end(self) -> None:
+        """Record the end time of the span."""
+        self.end_ns = time.time_ns()
+
+    def as_dict(self) -> t.Dict[str, t.Any]:
+        """Return the span as a dictionary, in the layout written by exporters."""
+        end_ns = self.end_ns or time.time_ns()
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": end_ns,
+            "duration_ms": round((end_ns - self.start_ns) / 1e6, 3),
+            "status": self.status,
+            "status_message": self.status_message,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Stands in for a :class:`Span` while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: t.Any) -> None:
+        """Do nothing."""
+
+    def set_error(self, message: str) -> None:
+        """Do nothing."""
+
+
+NOOP_SPAN = _NoopSpan()
+"""Returned in place of a :class:`Span` while tracing is disabled"""
+
+
+class Exporter:
+    """
+    Base class for span exporters.
+
+    Subclasses implement :meth:`export`, and :meth:`shutdown` if they hold resources.
+    """
+
+    def export(self, span: Span) -> None:
+        """Export one finished span."""
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Release any resources. No spans are exported after this."""
+
+
+class JsonLinesExporter(Exporter):
+    """
+    Append each finished span to a file as one line of JSON.
+
+    Spans are written when they end, so children come before their parents. Each
+    line is flushed as it is written.
+
+    Args:
+        path (str): The file to append to. It is opened on the first span.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.fhandle: t.Optional[t.TextIO] = None
+
+    def export(self, span: Span) -> None:
+        """Append `span` to :attr:`path`."""
+        line = json.dumps(span.as_dict(), default=str)
+        with self.lock:
+            if self.fhandle is None:
+                self.fhandle = open(  # pylint: disable=consider-using-with
+                    self.path, "a", encoding="utf-8"
+                )
+            self.fhandle.write(line + "\n")
+            self.fhandle.flush()
+
+    def shutdown(self) -> None:
+        """Close the file."""
+        with self.lock:
+            if self.fhandle is not None:
+                self.fhandle.close()
+                self.fhandle = None
+
+
+class Tracer:
+    """
+    Create spans and hand them to :attr:`exporters` when they end.
+
+    Example:
+        >>> class Collect(Exporter):
+        ...     def __init__(self):
+        ...         self.spans = []
+        ...     def export(self, span):
+        ...         self.spans.append(span)
+        >>> tracer = Tracer()
+        >>> collect = Collect()
+        >>> tracer.add_exporter(collect)
+        >>> with tracer.span('action', **{'action.name': 'close'}):
+        ...     with tracer.span('filter') as child:
+        ...         child.set_attribute('items.after', 2)
+        >>> [span.name for span in collect.spans]
+        ['filter', 'action']
+        >>> collect.spans[0].parent_id == collect.spans[1].span_id
+        True
+    """
+
+    def __init__(self) -> None:
+        self.exporters: t.List[Exporter] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any exporter is registered."""
+        return bool(self.exporters)
+
+    def add_exporter(self, exporter: Exporter) -> None:
+        """Register `exporter`, enabling tracing."""
+        self.exporters.append(exporter)
+
+    def shutdown(self) -> None:
+        """Shut down and remove every exporter, disabling tracing."""
+        exporters, self.exporters = self.exporters, []
+        for exporter in exporters:
+            exporter.shutdown()
+
+    @staticmethod
+    def current_span() -> t.Union[Span, _NoopSpan]:
+        """Return the innermost open span, or :data:`NOOP_SPAN` if there is none."""
+        return _CURRENT.get() or NOOP_SPAN
+
+    @contextmanager
+    def span(self, name: str, **attributes: t.Any) -> t.Iterator[t.Any]:
+        """
+        Time the code in this context as a child of the current span.
+
+        If the context exits with an exception, the span is marked as failed. The
+        span is exported when the context exits. While tracing is disabled, this
+        yields :data:`NOOP_SPAN` and records nothing.
+
+        Args:
+            name (str): The span name.
+            **attributes: Initial attributes.
+
+        Yields:
+            Span: The new span.
+        """
+        if not self.exporters:
+            yield NOOP_SPAN
+            return
+        span = Span(name, parent=_CURRENT.get(), attributes=attributes)
+        token = _CURRENT.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.set_error(f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            _CURRENT.reset(token)
+            span.end()
+            for exporter in self.exporters:
+                exporter.export(span)
+
+
+TRACER = Tracer()
+"""The :class:`Tracer` that the timed connection classes and Curator report to"""
@@ -2,7 +2,7 @@
 
 # pylint: disable=missing-function-docstring, missing-class-docstring, invalid-name, line-too-long, attribute-defined-outside-init
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from curator import IndexList
 from curator.exceptions import ActionError, FailedExecution, MissingArgument, NoIndices
 from curator.actions.alias import Alias
@@ -18,7 +18,7 @@ class TestActionAlias(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def builder2(self):
@@ -27,7 +27,7 @@ class TestActionAlias(TestCase):
         self.client.cat.indices.return_value = testvars.state_two
         self.client.indices.get_settings.return_value = testvars.settings_two
         self.client.indices.stats.return_value = testvars.stats_two
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_init_raise(self):
@@ -112,3 +112,46 @@ class TestActionAlias(TestCase):
         ao = Alias(name='alias')
         ao.add(self.ilo)
         self.assertRaises(FailedExecution, ao.do_action)
+
+    def test_remove_targeted(self):
+        self.builder2()
+        self.client.indices.get_alias.return_value = {
+            'index-2016.03.04': {'aliases': {'my_alias': {}}}
+        }
+        ao = Alias(name='my_alias')
+        ao.remove(self.ilo)
+        self.client.indices.get_alias.assert_called_once_with(
+            index='index-2016.03.03,index-2016.03.04',
+            name='my_alias',
+            params={'expand_wildcards': 'open,closed'},
+        )
+        self.assertEqual(
+            [{'remove': {'index': 'index-2016.03.04', 'alias': 'my_alias'}}],
+            ao.actions,
+        )
+
+    def test_remove_alias_missing(self):
+        self.builder()
+        self.client.indices.get_alias.side_effect = testvars.get_alias_fail
+        ao = Alias(name='my_alias')
+        ao.remove(self.ilo)
+        self.assertEqual([], ao.actions)
+
+    def test_remove_chunked(self):
+        self.builder()
+        ao = Alias(name='my_alias')
+        ao.client = self.client
+        self.client.indices.get_alias.return_value = {}
+        ao.get_aliases([f'index-{num:04}-{"x" * 100}' for num in range(100)])
+        self.assertLess(1, self.client.indices.get_alias.call_count)
+
+    def test_do_action_batches(self):
+        self.builder2()
+        ao = Alias(name='alias')
+        ao.add(self.ilo)
+        with patch('curator.actions.alias.ALIAS_BATCH_BYTES', 60):
+            self.assertEqual(2, len(ao.batches()))
+            with self.assertLogs('curator.actions.alias', level='WARNING'):
+                ao.do_action()
+        self.assertEqual(2, self.client.indices.update_aliases.call_count)
+        self.assertEqual([ao.actions], ao.batches())
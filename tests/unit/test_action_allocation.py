@@ -18,7 +18,7 @@ class TestActionAllocation(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.client.indices.put_settings.return_value = None
         self.ilo = IndexList(self.client)
 
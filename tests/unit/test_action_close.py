@@ -19,7 +19,7 @@ class TestActionClose(TestCase):
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
         self.client.indices.flush_synced.return_value = testvars.synced_pass
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.client.indices.close.return_value = None
         self.ilo = IndexList(self.client)
 
@@ -71,3 +71,95 @@ class TestActionClose(TestCase):
         self.client.indices.delete_alias.side_effect = testvars.fake_fail
         clo = Close(self.ilo, delete_aliases=True)
         self.assertIsNone(clo.do_action())
+
+
+class TestActionClosePhases(TestCase):
+    VERSION = {'version': {'number': '5.0.0'}}
+    ALIASES = {
+        'index-2016.03.03': {'aliases': {'my_alias': {}}},
+        'index-2016.03.04': {'aliases': {'my_alias': {}, 'other': {}}},
+    }
+
+    def builder(self):
+        self.client = Mock()
+        self.client.info.return_value = self.VERSION
+        self.client.cat.indices.return_value = testvars.state_two
+        self.client.indices.get_settings.return_value = testvars.settings_two
+        self.client.indices.stats.return_value = testvars.stats_two
+        self.client.indices.get_alias.return_value = self.ALIASES
+        self.client.indices.close.return_value = None
+        self.ilo = IndexList(self.client)
+
+    def test_default_is_sequential(self):
+        self.builder()
+        clo = Close(self.ilo, delete_aliases=True)
+        clo.do_action()
+        self.client.indices.delete_alias.assert_called_once()
+        self.client.indices.update_aliases.assert_not_called()
+
+    def test_do_action(self):
+        self.builder()
+        clo = Close(self.ilo, delete_aliases=True, concurrency=4)
+        with self.assertLogs('curator.actions.close') as logs:
+            clo.do_action()
+        self.client.indices.delete_alias.assert_not_called()
+        self.client.indices.update_aliases.assert_called_once_with(
+            body={
+                'actions': [
+                    {
+                        'remove': {
+                            'indices': ['index-2016.03.03', 'index-2016.03.04'],
+                            'alias': 'my_alias',
+                        }
+                    },
+                    {'remove': {'indices': ['index-2016.03.04'], 'alias': 'other'}},
+                ]
+            }
+        )
+        self.client.indices.flush.assert_called_once_with(
+            index='index-2016.03.03,index-2016.03.04',
+            ignore_unavailable=True,
+            force=True,
+        )
+        self.client.indices.close.assert_called_once_with(
+            index='index-2016.03.03,index-2016.03.04', ignore_unavailable=True
+        )
+        self.assertIn('Close phases: aliases ', logs.output[-1])
+        self.assertIn(', flush ', logs.output[-1])
+
+    def test_skip_flush(self):
+        self.builder()
+        clo = Close(self.ilo, skip_flush=True, concurrency=4)
+        clo.do_action()
+        self.client.indices.update_aliases.assert_not_called()
+        self.client.indices.flush.assert_not_called()
+        self.client.indices.close.assert_called_once()
+
+    def test_alias_failure_is_not_fatal(self):
+        self.builder()
+        self.client.indices.update_aliases.side_effect = testvars.fake_fail
+        clo = Close(self.ilo, delete_aliases=True, concurrency=4)
+        clo.do_action()
+        self.client.indices.close.assert_called_once()
+
+    def test_failed_flush_is_not_closed(self):
+        self.builder()
+        clo = Close(self.ilo, concurrency=4)
+
+        def flush(index, **kwargs):
+            if 'bad' in index:
+                raise testvars.fake_fail
+
+        self.client.indices.flush.side_effect = flush
+        done, failed = clo.run_chunks(
+            self.client.indices.flush, [['good-1', 'good-2'], ['bad-1'], ['good-3']]
+        )
+        self.assertEqual([['good-1', 'good-2'], ['good-3']], done)
+        self.assertEqual(['bad-1'], list(failed))
+
+    def test_raises_after_every_chunk(self):
+        self.builder()
+        self.client.indices.close.side_effect = testvars.fake_fail
+        clo = Close(self.ilo, concurrency=4)
+        self.assertRaises(FailedExecution, clo.do_action)
+        self.client.indices.flush.assert_called_once()
@@ -1,9 +1,11 @@
 """Unit tests for create_index action"""
 
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from opensearchpy.exceptions import RequestError
 from curator.actions import CreateIndex
 from curator.exceptions import ConfigurationError, FailedExecution
+from curator.helpers.date_ops import DATEMATH
 
 # Get test variables and constants from a single source
 from . import testvars
@@ -40,3 +42,86 @@ class TestActionCreate_index(TestCase):
         client.indices.create.side_effect = testvars.fake_fail
         co = CreateIndex(client, name='name')
         self.assertRaises(FailedExecution, co.do_action)
+
+
+class TestActionCreateIndexBulk(TestCase):
+    NAMES = ['tenant-a', 'tenant-b', 'tenant-c']
+
+    def builder(self, existing=None):
+        self.client = Mock()
+        self.client.cat.indices.return_value = [
+            {'index': name} for name in existing or []
+        ]
+        self.client.indices.create.return_value = {'acknowledged': True}
+
+    def created(self):
+        return sorted(
+            call.kwargs['index'] for call in self.client.indices.create.mock_calls
+        )
+
+    def test_names(self):
+        self.builder()
+        co = CreateIndex(self.client, name=self.NAMES + ['tenant-a'])
+        self.assertEqual(self.NAMES, co.names)
+        self.assertIsNone(co.name)
+
+    def test_datemath(self):
+        self.builder()
+        # Rendered locally, without asking OpenSearch
+        with patch.object(DATEMATH, 'verified', True):
+            co = CreateIndex(self.client, name=['<tenant-a-{2024.03.01||+1d}>'])
+        self.assertEqual(['tenant-a-2024.03.02'], co.names)
+        self.client.indices.get.assert_not_called()
+
+    def test_create_all(self):
+        self.builder(existing=['tenant-b'])
+        co = CreateIndex(
+            self.client,
+            name=self.NAMES,
+            extra_settings={'settings': {'number_of_shards': 1}},
+            ignore_existing=True,
+        )
+        with self.assertLogs('curator.actions.create_index', level='INFO') as logs:
+            co.do_action()
+        self.assertEqual(['tenant-a', 'tenant-c'], self.created())
+        self.assertEqual(
+            {'settings': {'number_of_shards': 1}},
+            self.client.indices.create.call_args.kwargs['body'],
+        )
+        # One existence lookup for every name
+        self.client.cat.indices.assert_called_once()
+        self.assertIn('Created 2, already existing 1, failed 0 of 3', logs.output[0])
+
+    def test_existing(self):
+        self.builder(existing=['tenant-b'])
+        co = CreateIndex(self.client, name=self.NAMES)
+        self.assertRaises(FailedExecution, co.do_action)
+        # The others are created anyway
+        self.assertEqual(['tenant-a', 'tenant-c'], self.created())
+
+    def test_race(self):
+        self.builder()
+        self.client.indices.create.side_effect = RequestError(
+            400, 'resource_already_exists_exception', {}
+        )
+        co = CreateIndex(self.client, name=self.NAMES, ignore_existing=True)
+        result = co.create_all()
+        self.assertEqual(self.NAMES, result['existing'])
+        self.assertEqual({}, result['failed'])
+
+    def test_failed(self):
+        self.builder()
+        self.client.indices.create.side_effect = testvars.fake_fail
+        co = CreateIndex(self.client, name=self.NAMES, concurrency=2)
+        with self.assertLogs('curator.actions.create_index', level='ERROR') as logs:
+            self.assertRaises(FailedExecution, co.do_action)
+        self.assertEqual(3, len(logs.output))
+        self.assertEqual(self.NAMES, self.created())
+
+    def test_do_dry_run(self):
+        self.builder(existing=['tenant-b'])
+        co = CreateIndex(self.client, name=self.NAMES)
+        with self.assertLogs('curator.actions.create_index', level='INFO') as logs:
+            co.do_dry_run()
+        self.assertIn('"tenant-b" (already exists)', logs.output[2])
+        self.client.indices.create.assert_not_called()
@@ -20,7 +20,7 @@ class TestActionDeleteIndices(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def builder4(self):
@@ -29,7 +29,7 @@ class TestActionDeleteIndices(TestCase):
         self.client.cat.indices.return_value = testvars.state_four
         self.client.indices.get_settings.return_value = testvars.settings_four
         self.client.indices.stats.return_value = testvars.stats_four
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.client.indices.delete.return_value = None
         self.ilo = IndexList(self.client)
 
@@ -71,3 +71,14 @@ class TestActionDeleteIndices(TestCase):
         self.builder4()
         dio = DeleteIndices(self.ilo)
         self.assertTrue(dio._verify_result([], 2))
+
+    def test_do_action_logs_names_at_info(self):
+        self.builder4()
+        dio = DeleteIndices(self.ilo)
+        with self.assertLogs('curator.actions.delete_indices', level='INFO') as logs:
+            dio.do_action()
+        deleting = [line for line in logs.output if '---deleting' in line]
+        self.assertTrue(deleting)
+        self.assertTrue(deleting[0].startswith('INFO'))
+        for index in self.ilo.indices:
+            self.assertIn(index, deleting[0])
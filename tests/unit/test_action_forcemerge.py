@@ -20,7 +20,7 @@ class TestActionForceMerge(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.client.indices.segments.return_value = testvars.shards
         self.ilo = IndexList(self.client)
 
@@ -20,7 +20,7 @@ class TestActionIndexSettings(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_init_raise_bad_index_list(self):
@@ -110,3 +110,117 @@ class TestActionIndexSettings(TestCase):
         self.client.indices.put_settings.side_effect = testvars.fake_fail
         iso = IndexSettings(self.ilo, {'index': {'refresh_interval': '1s'}})
         self.assertRaises(Exception, iso.do_action)
+
+
+class TestActionIndexSettingsSkipUnchanged(TestCase):
+    VERSION = {'version': {'number': '8.0.0'}}
+    BODY = {'index': {'refresh_interval': '5s', 'blocks': {'write': True}}}
+    CURRENT = {
+        'index-2016.03.03': {
+            'settings': {
+                'index': {'refresh_interval': '5s', 'blocks': {'write': 'true'}}
+            }
+        },
+        'index-2016.03.04': {'settings': {'index': {'refresh_interval': '1s'}}},
+    }
+
+    def builder(self, current=None):
+        self.client = Mock()
+        self.client.info.return_value = self.VERSION
+        self.client.cat.indices.return_value = testvars.state_two
+        self.client.indices.get_alias.return_value = {}
+        self.current = self.CURRENT if current is None else current
+
+        def get_settings(**kwargs):
+            # Only the comparison asks for refresh_interval
+            if 'refresh_interval' in kwargs.get('filter_path', ''):
+                return self.current
+            return testvars.settings_two
+
+        self.client.indices.get_settings.side_effect = get_settings
+        self.client.indices.stats.return_value = testvars.stats_two
+        self.ilo = IndexList(self.client)
+
+    def put_calls(self):
+        return [
+            (call.kwargs['index'], call.kwargs['body'])
+            for call in self.client.indices.put_settings.call_args_list
+        ]
+
+    def test_get_changes(self):
+        self.builder()
+        iso = IndexSettings(self.ilo, self.BODY, skip_unchanged=True)
+        changes, unchanged = iso.get_changes()
+        self.assertEqual(
+            [
+                (
+                    {'index.refresh_interval': '5s', 'index.blocks.write': True},
+                    ['index-2016.03.04'],
+                )
+            ],
+            changes,
+        )
+        self.assertEqual(['index-2016.03.03'], unchanged)
+        self.assertEqual(
+            '*.settings.index.refresh_interval,*.settings.index.blocks.write',
+            self.client.indices.get_settings.call_args.kwargs['filter_path'],
+        )
+
+    def test_preserve_existing(self):
+        self.builder()
+        iso = IndexSettings(
+            self.ilo, self.BODY, preserve_existing=True, skip_unchanged=True
+        )
+        changes, _ = iso.get_changes()
+        self.assertEqual(
+            [({'index.blocks.write': True}, ['index-2016.03.04'])], changes
+        )
+
+    def test_groups(self):
+        self.builder(current={})
+        iso = IndexSettings(self.ilo, self.BODY, skip_unchanged=True)
+        iso.do_action()
+        self.assertEqual(
+            [
+                (
+                    'index-2016.03.03,index-2016.03.04',
+                    {'index.refresh_interval': '5s', 'index.blocks.write': True},
+                )
+            ],
+            self.put_calls(),
+        )
+
+    def test_do_action_skips_unchanged(self):
+        self.builder()
+        iso = IndexSettings(self.ilo, self.BODY, skip_unchanged=True)
+        iso.do_action()
+        self.assertEqual(1, self.client.indices.put_settings.call_count)
+        self.assertEqual('index-2016.03.04', self.put_calls()[0][0])
+        self.assertEqual(['index-2016.03.04'], self.ilo.indices)
+
+    def test_do_action_nothing_to_change(self):
+        current = {
+            idx: {'settings': {'index': {'refresh_interval': '5s'}}}
+            for idx in self.CURRENT
+        }
+        self.builder(current=current)
+        iso = IndexSettings(
+            self.ilo, {'index': {'refresh_interval': '5s'}}, skip_unchanged=True
+        )
+        iso.do_action()
+        self.client.indices.put_settings.assert_not_called()
+        self.assertEqual([], self.ilo.indices)
+
+    def test_dry_run(self):
+        self.builder()
+        iso = IndexSettings(self.ilo, self.BODY, skip_unchanged=True)
+        with self.assertLogs('curator.actions.index_settings') as logs:
+            iso.do_dry_run()
+        self.assertIn('1 of 2 indices already have the settings', logs.output[-1])
+        self.client.indices.put_settings.assert_not_called()
+
+    def test_do_action_raises(self):
+        self.builder(current={})
+        self.client.indices.put_settings.side_effect = testvars.fake_fail
+        iso = IndexSettings(self.ilo, self.BODY, skip_unchanged=True)
+        self.assertRaises(Exception, iso.do_action)
@@ -20,7 +20,7 @@ class TestActionOpen(TestCase):
         self.client.cat.indices.return_value = testvars.state_four
         self.client.indices.get_settings.return_value = testvars.settings_four
         self.client.indices.stats.return_value = testvars.stats_four
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.client.indices.open.return_value = None
         self.ilo = IndexList(self.client)
 
@@ -52,3 +52,108 @@ class TestActionOpen(TestCase):
         self.client.indices.open.side_effect = testvars.fake_fail
         opn = Open(self.ilo)
         self.assertRaises(FailedExecution, opn.do_action)
+
+
+class TestActionOpenWaves(TestCase):
+    VERSION = {'version': {'number': '8.0.0'}}
+    GREEN = {
+        'status': 'green',
+        'active_shards': 10,
+        'initializing_shards': 0,
+        'unassigned_shards': 0,
+    }
+
+    def builder(self, cluster_settings=None):
+        self.client = Mock()
+        self.client.info.return_value = self.VERSION
+        self.client.cat.indices.return_value = testvars.state_four
+        self.client.indices.get_settings.return_value = testvars.settings_four
+        self.client.indices.stats.return_value = testvars.stats_four
+        self.client.indices.get_alias.return_value = {}
+        self.client.indices.open.return_value = None
+        self.client.cluster.get_settings.return_value = cluster_settings or {}
+
+        def health(**kwargs):
+            if kwargs.get('filter_path') == 'number_of_data_nodes':
+                return {'number_of_data_nodes': 2}
+            return self.GREEN
+
+        self.client.cluster.health.side_effect = health
+        self.ilo = IndexList(self.client)
+
+    def opened(self):
+        return [
+            call.kwargs['index'] for call in self.client.indices.open.call_args_list
+        ]
+
+    def test_default_is_one_wave(self):
+        self.builder()
+        opn = Open(self.ilo)
+        self.assertEqual([self.ilo.indices], opn.waves())
+        opn.do_action()
+        self.assertEqual(1, self.client.indices.open.call_count)
+        self.client.cluster.health.assert_not_called()
+
+    def test_recovery_capacity(self):
+        self.builder()
+        self.assertEqual(8, Open(self.ilo).recovery_capacity())
+
+    def test_recovery_capacity_setting(self):
+        setting = 'cluster.routing.allocation.node_initial_primaries_recoveries'
+        self.builder(
+            {'persistent': {setting: '6'}, 'transient': {setting: '10'}},
+        )
+        self.assertEqual(20, Open(self.ilo).recovery_capacity())
+
+    def test_waves_by_capacity(self):
+        # 5 primaries per index, and 8 primaries at once
+        self.builder()
+        opn = Open(self.ilo, wait_for_completion=True)
+        self.assertEqual([[index] for index in self.ilo.indices], opn.waves())
+
+    def test_waves_by_size(self):
+        self.builder()
+        opn = Open(self.ilo, wave_size=3)
+        self.assertEqual([self.ilo.indices[:3], self.ilo.indices[3:]], opn.waves())
+        self.client.cluster.get_settings.assert_not_called()
+
+    def test_do_action_waits_per_wave(self):
+        setting = 'cluster.routing.allocation.node_initial_primaries_recoveries'
+        self.builder({'transient': {setting: '5'}})
+        opn = Open(self.ilo, wait_for_completion=True, wait_interval=1)
+        with self.assertLogs('curator.actions.open') as logs:
+            opn.do_action()
+        self.assertEqual(
+            [
+                'a-2016.03.03,b-2016.03.04',
+                'c-2016.03.05,d-2016.03.06',
+            ],
+            self.opened(),
+        )
+        health = [
+            call.kwargs['index']
+            for call in self.client.cluster.health.call_args_list
+            if 'index' in call.kwargs
+        ]
+        self.assertEqual(self.opened(), health)
+        self.assertIn('Opened 4 indices in 2 waves, 40 shards', logs.output[-1])
+
+    def test_last_wave_not_waited_without_wfc(self):
+        self.builder()
+        opn = Open(self.ilo, wave_size=2, wait_interval=1)
+        opn.do_action()
+        health = [
+            call.kwargs['index']
+            for call in self.client.cluster.health.call_args_list
+            if 'index' in call.kwargs
+        ]
+        self.assertEqual(['a-2016.03.03,b-2016.03.04'], health)
+        self.assertEqual(2, self.client.indices.open.call_count)
+
+    def test_dry_run(self):
+        self.builder()
+        opn = Open(self.ilo, wave_size=3)
+        with self.assertLogs('curator.actions.open') as logs:
+            opn.do_dry_run()
+        self.assertIn('4 indices in 2 waves of at most 3 indices', logs.output[-1])
+        self.client.indices.open.assert_not_called()
@@ -26,6 +26,7 @@ class TestActionReindex(TestCase):
         self.client.indices.get_settings.return_value = testvars.settings_four
         self.client.indices.stats.return_value = testvars.stats_four
         self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_init_bad_ilo(self):
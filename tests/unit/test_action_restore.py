@@ -122,6 +122,10 @@ class TestActionRestore(TestCase):
         slo = SnapshotList(client, repository=testvars.repo_name)
         ro = Restore(slo)
         self.assertIsNone(ro.report_state())
+        # Only the expected indices are asked about
+        self.assertEqual(
+            ','.join(ro.expected_output), client.cat.indices.call_args.kwargs['index']
+        )
 
     def test_report_state_not_all(self):
         client = Mock()
@@ -181,3 +185,125 @@ class TestActionRestore(TestCase):
         slo = SnapshotList(client, repository=testvars.repo_name)
         ro = Restore(slo)
         self.assertRaises(FailedExecution, ro.do_action)
+
+
+class TestActionRestoreThroughput(TestCase):
+    def builder(self):
+        self.client = Mock()
+        self.client.snapshot.get.return_value = testvars.snapshots
+        self.client.snapshot.get_repository.return_value = testvars.test_repo
+        self.client.snapshot.status.return_value = testvars.nosnap_running
+        self.client.cat.indices.return_value = testvars.state_named
+        self.client.indices.recovery.return_value = testvars.recovery_output
+        self.client.cluster.get_settings.return_value = {
+            'transient': {'indices.recovery.max_bytes_per_sec': '40mb'}
+        }
+        self.slo = SnapshotList(self.client, repository=testvars.repo_name)
+
+    def test_one_wave(self):
+        self.builder()
+        ro = Restore(self.slo, wave_size=2)
+        self.assertEqual([(ro.indices, ro.expected_output)], ro.waves())
+
+    def test_waves(self):
+        self.builder()
+        ro = Restore(
+            self.slo,
+            include_global_state=True,
+            rename_pattern='(.+)',
+            rename_replacement='new_$1',
+            wave_size=1,
+            wait_interval=0.5,
+            max_wait=1,
+        )
+        self.assertEqual(
+            [
+                (['index-2015.01.01'], ['new_index-2015.01.01']),
+                (['index-2015.02.01'], ['new_index-2015.02.01']),
+            ],
+            ro.waves(),
+        )
+        self.client.cat.indices.return_value = [
+            {'index': 'new_index-2015.01.01'},
+            {'index': 'new_index-2015.02.01'},
+        ]
+        ro.do_action()
+        bodies = [
+            call.kwargs['body'] for call in self.client.snapshot.restore.mock_calls
+        ]
+        self.assertEqual(
+            [['index-2015.01.01'], ['index-2015.02.01']],
+            [body['indices'] for body in bodies],
+        )
+        # The global state is only restored once
+        self.assertEqual([True, False], [b['include_global_state'] for b in bodies])
+        # Each wave is waited for
+        recovered = [
+            call.kwargs['index'] for call in self.client.indices.recovery.mock_calls
+        ]
+        self.assertEqual(['new_index-2015.01.01', 'new_index-2015.02.01'], recovered)
+
+    def test_waves_no_wfc(self):
+        self.builder()
+        ro = Restore(self.slo, wave_size=1, wait_for_completion=False)
+        ro.do_action()
+        self.assertEqual(2, self.client.snapshot.restore.call_count)
+        # Only the first wave is waited for, so that the second can start
+        self.assertEqual(1, self.client.indices.recovery.call_count)
+
+    def test_recovery_settings(self):
+        self.builder()
+        ro = Restore(
+            self.slo,
+            max_bytes_per_sec='500mb',
+            concurrent_recoveries=4,
+            wait_interval=0.5,
+            max_wait=1,
+        )
+        ro.do_action()
+        self.assertEqual(
+            [
+                {
+                    'transient': {
+                        'indices.recovery.max_bytes_per_sec': '500mb',
+                        'cluster.routing.allocation.node_concurrent_recoveries': '4',
+                    }
+                },
+                {
+                    'transient': {
+                        'indices.recovery.max_bytes_per_sec': '40mb',
+                        'cluster.routing.allocation.node_concurrent_recoveries': None,
+                    }
+                },
+            ],
+            [
+                call.kwargs['body']
+                for call in self.client.cluster.put_settings.mock_calls
+            ],
+        )
+
+    def test_recovery_settings_reset_on_failure(self):
+        self.builder()
+        self.client.snapshot.restore.side_effect = testvars.fake_fail
+        ro = Restore(self.slo, concurrent_recoveries=4)
+        self.assertRaises(FailedExecution, ro.do_action)
+        self.assertEqual(2, self.client.cluster.put_settings.call_count)
+        self.assertEqual(
+            {'cluster.routing.allocation.node_concurrent_recoveries': None},
+            self.client.cluster.put_settings.call_args.kwargs['body']['transient'],
+        )
+
+    def test_no_recovery_settings(self):
+        self.builder()
+        Restore(self.slo, wait_interval=0.5, max_wait=1).do_action()
+        self.client.cluster.get_settings.assert_not_called()
+        self.client.cluster.put_settings.assert_not_called()
+
+    def test_dry_run(self):
+        self.builder()
+        ro = Restore(self.slo, max_bytes_per_sec='500mb', wave_size=1)
+        with self.assertLogs('curator.actions.snapshot', level='INFO') as logs:
+            ro.do_dry_run()
+        self.assertIn('2 indices in 2 waves of at most 1', logs.output[-1])
+        self.client.snapshot.restore.assert_not_called()
+        self.client.cluster.put_settings.assert_not_called()
@@ -1,10 +1,11 @@
 """test_action_rollover"""
 
 # pylint: disable=missing-function-docstring, missing-class-docstring, protected-access, attribute-defined-outside-init
+import time
 from unittest import TestCase
 from unittest.mock import Mock
 from curator.actions import Rollover
-from curator.exceptions import ConfigurationError
+from curator.exceptions import ConfigurationError, FailedExecution
 
 # Get test variables and constants from a single source
 from . import testvars
@@ -56,3 +57,125 @@ class TestActionRollover(TestCase):
         conditions = {'max_size': '1g'}
         rlo = Rollover(self.client, testvars.named_alias, conditions)
         self.assertEqual(conditions, rlo.conditions)
+
+
+class TestActionRolloverAliases(TestCase):
+    NOW = int(time.time())
+    ALIASES = [
+        {'alias': 'logs-a', 'index': 'logs-a-000001', 'is_write_index': 'true'},
+        {'alias': 'logs-b', 'index': 'logs-b-000001', 'is_write_index': 'true'},
+        {'alias': 'logs-c', 'index': 'logs-c-000001', 'is_write_index': 'true'},
+    ]
+
+    def builder(self, conditions=None):
+        self.client = Mock()
+        self.client.info.return_value = {'version': {'number': '8.0.0'}}
+        self.client.cat.aliases.return_value = self.ALIASES
+        self.client.cat.indices.return_value = [
+            {
+                'index': 'logs-a-000001',
+                'creation.date': str((self.NOW - 2 * 86400) * 1000),
+                'docs.count': '10',
+                'pri.store.size': '100',
+            },
+            {
+                'index': 'logs-b-000001',
+                'creation.date': str(self.NOW * 1000),
+                'docs.count': '5000',
+                'pri.store.size': str(2 * 1024**3),
+            },
+            {
+                'index': 'logs-c-000001',
+                'creation.date': str(self.NOW * 1000),
+                'docs.count': '10',
+                'pri.store.size': '100',
+            },
+        ]
+        self.client.indices.rollover.side_effect = lambda alias, **kwargs: {
+            'old_index': f'{alias}-000001',
+            'new_index': f'{alias}-000002',
+            'rolled_over': True,
+            'dry_run': kwargs['dry_run'],
+            'conditions': {},
+        }
+        self.rlo = Rollover(
+            self.client, ['logs-*'], conditions or {'max_age': '1d', 'max_size': '1g'}
+        )
+
+    def rolled(self):
+        return sorted(
+            call.kwargs['alias'] for call in self.client.indices.rollover.mock_calls
+        )
+
+    def test_targets(self):
+        self.builder()
+        self.assertEqual(
+            {alias['alias']: alias['index'] for alias in self.ALIASES},
+            self.rlo.targets,
+        )
+        self.client.indices.get_alias.assert_not_called()
+
+    def test_new_index(self):
+        self.client = Mock()
+        self.assertRaises(
+            ConfigurationError,
+            Rollover,
+            self.client,
+            ['logs-*'],
+            {'max_age': '1d'},
+            'new-index',
+        )
+
+    def test_none_rollable(self):
+        self.builder()
+        self.client.cat.aliases.return_value = []
+        with self.assertLogs('curator.helpers.testers', level='ERROR'):
+            self.assertRaises(
+                ValueError, Rollover, self.client, 'logs-*', {'max_age': '1d'}
+            )
+
+    def test_conditions_met(self):
+        self.builder()
+        stats = self.rlo.index_stats(
+            ['logs-a-000001', 'logs-b-000001', 'logs-c-000001']
+        )
+        self.assertTrue(self.rlo.conditions_met(stats['logs-a-000001'], self.NOW))
+        self.assertTrue(self.rlo.conditions_met(stats['logs-b-000001'], self.NOW))
+        self.assertFalse(self.rlo.conditions_met(stats['logs-c-000001'], self.NOW))
+        self.rlo.conditions = {'max_docs': '5000'}
+        self.assertTrue(self.rlo.conditions_met(stats['logs-b-000001'], self.NOW))
+        self.assertFalse(self.rlo.conditions_met(stats['logs-c-000001'], self.NOW))
+
+    def test_conditions_unknown(self):
+        self.builder({'max_primary_shard_size': '1g'})
+        self.assertIsNone(self.rlo.conditions_met({'docs': 1}, self.NOW))
+        self.rlo.conditions = {'max_age': '1 fortnight'}
+        self.assertIsNone(self.rlo.conditions_met({'creation_date': 0}, self.NOW))
+        self.assertIsNone(self.rlo.conditions_met(None, self.NOW))
+
+    def test_do_action(self):
+        self.builder()
+        self.rlo.do_action()
+        # logs-c meets neither condition, and is not asked about
+        self.assertEqual(['logs-a', 'logs-b'], self.rolled())
+        self.client.cat.indices.assert_called_once()
+        self.assertFalse(self.client.indices.rollover.call_args.kwargs['dry_run'])
+
+    def test_do_action_unknown_conditions(self):
+        self.builder({'max_primary_shard_docs': 100})
+        self.rlo.do_action()
+        self.assertEqual(['logs-a', 'logs-b', 'logs-c'], self.rolled())
+
+    def test_do_dry_run(self):
+        self.builder()
+        self.rlo.do_dry_run()
+        self.assertEqual(['logs-a', 'logs-b'], self.rolled())
+        self.assertTrue(self.client.indices.rollover.call_args.kwargs['dry_run'])
+
+    def test_failure(self):
+        self.builder({'max_docs': 1})
+        self.client.indices.rollover.side_effect = testvars.fake_fail
+        with self.assertLogs('curator.actions.rollover', level='ERROR') as logs:
+            self.assertRaises(FailedExecution, self.rlo.do_action)
+        # Every alias is tried
+        self.assertEqual(3, len(logs.output))
@@ -23,7 +23,7 @@ class TestActionShrink_extra_settings(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_extra_settings_1(self):
@@ -49,7 +49,7 @@ class TestActionShrink_data_node(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.node_name = 'node_name'
         self.node_id = 'my_node'
         self.client.nodes.info.return_value = {
@@ -80,7 +80,7 @@ class TestActionShrink_exclude_node(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.node_name = 'node_name'
         self.ilo = IndexList(self.client)
 
@@ -104,7 +104,7 @@ class TestActionShrink_qualify_single_node(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.node_name = 'node_name'
         self.node_id = 'my_node'
         self.client.nodes.info.return_value = {
@@ -160,7 +160,7 @@ class TestActionShrink_most_available_node(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.node_name = 'node_name'
         self.node_id = 'my_node'
         self.byte_count = 123456
@@ -198,7 +198,7 @@ class TestActionShrink_route_index(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
         self.shrink = Shrink(self.ilo)
 
@@ -222,7 +222,7 @@ class TestActionShrink_dry_run(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.node_name = 'node_name'
         self.node_id = 'my_node'
         self.byte_count = 123456
@@ -275,7 +275,7 @@ class TestActionShrink_various(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.node_name = 'node_name'
         self.node_id = 'my_node'
         self.byte_count = 1239132959
@@ -27,7 +27,7 @@ class TestActionSnapshot(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.client.snapshot.get_repository.return_value = testvars.test_repo
         self.client.snapshot.get.return_value = testvars.snapshots
         self.client.tasks.get.return_value = testvars.no_snap_tasks
@@ -0,0 +1,93 @@
+"""Test the ActionsFile class"""
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+from curator.classdef import ActionsFile, schema_hash
+from curator.helpers.testers import validate_actions
+
+ACTIONS = """---
+actions:
+  1:
+    action: delete_indices
+    options:
+      continue_if_exception: False
+    filters:
+    - filtertype: pattern
+      kind: prefix
+      value: logstash-
+  2:
+    action: create_index
+    options:
+      name: myindex
+"""
+
+
+class TestActionsFileCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.action_file = os.path.join(self.tmpdir, 'actions.yml')
+        self.cache_dir = os.path.join(self.tmpdir, 'cache')
+        self.write(ACTIONS)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, text):
+        with open(self.action_file, 'w', encoding='utf-8') as fhandle:
+            fhandle.write(text)
+
+    def test_writes_cache(self):
+        afo = ActionsFile(self.action_file, cache_dir=self.cache_dir)
+        self.assertTrue(os.path.isfile(afo.cache_file(self.action_file)))
+
+    def test_uses_cache(self):
+        first = ActionsFile(self.action_file, cache_dir=self.cache_dir)
+        with patch('curator.classdef.validate_actions') as mock:
+            second = ActionsFile(self.action_file, cache_dir=self.cache_dir)
+            mock.assert_not_called()
+        self.assertEqual(first.fullconfig, second.fullconfig)
+        self.assertEqual([1, 2], sorted(second.actions.keys()))
+
+    def test_content_change_revalidates(self):
+        _ = ActionsFile(self.action_file, cache_dir=self.cache_dir)
+        self.write(ACTIONS.replace('myindex', 'otherindex'))
+        afo = ActionsFile(self.action_file, cache_dir=self.cache_dir)
+        self.assertEqual('otherindex', afo.actions[2].options['name'])
+
+    def test_envvars_not_cached(self):
+        self.write(ACTIONS.replace('myindex', '${INDEXNAME:myindex}'))
+        afo = ActionsFile(self.action_file, cache_dir=self.cache_dir)
+        self.assertFalse(os.path.exists(afo.cache_file(self.action_file)))
+
+    def test_cache_disabled_by_default(self):
+        _ = ActionsFile(self.action_file)
+        self.assertEqual([os.path.basename(self.action_file)], os.listdir(self.tmpdir))
+
+    def test_schema_change_revalidates(self):
+        _ = ActionsFile(self.action_file, cache_dir=self.cache_dir)
+        with patch('curator.classdef.schema_hash', return_value='changed'):
+            with patch(
+                'curator.classdef.validate_actions', wraps=validate_actions
+            ) as mock:
+                _ = ActionsFile(self.action_file, cache_dir=self.cache_dir)
+                mock.assert_called_once()
+
+    def test_no_schema_source_not_cached(self):
+        with patch('curator.classdef.schema_hash', return_value=None):
+            afo = ActionsFile(self.action_file, cache_dir=self.cache_dir)
+        self.assertFalse(os.path.exists(afo.cache_file(self.action_file)))
+
+    def test_write_failure_is_logged(self):
+        # A file where the cache directory should be
+        with open(self.cache_dir, 'w', encoding='utf-8') as fhandle:
+            fhandle.write('')
+        with self.assertLogs('curator.classdef', level='WARNING') as logs:
+            afo = ActionsFile(self.action_file, cache_dir=self.cache_dir)
+        self.assertIn('Unable to cache validated configuration', logs.output[0])
+        self.assertEqual('myindex', afo.actions[2].options['name'])
+
+    def test_schema_hash(self):
+        self.assertEqual(64, len(schema_hash()))
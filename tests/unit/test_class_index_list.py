@@ -5,7 +5,9 @@ from copy import deepcopy
 from unittest import TestCase
 from unittest.mock import Mock
 import yaml
+from opensearch_client.accounting import ACCOUNTING
 from opensearch_client.exceptions import FailedValidation
+from opensearch_client.tracing import TRACER, Exporter
 from curator.exceptions import (
     ActionError,
     ConfigurationError,
@@ -56,7 +58,7 @@ class TestIndexListClientAndInit(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_init_bad_client(self):
@@ -102,12 +104,12 @@ class TestIndexListOtherMethods(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_empty_list(self):
         self.builder()
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.assertEqual(2, len(self.ilo.indices))
         self.ilo.indices = []
         self.assertRaises(NoIndices, self.ilo.empty_list_check)
@@ -121,6 +123,24 @@ class TestIndexListOtherMethods(TestCase):
         self.ilo.get_segment_counts()
         self.assertEqual(71, self.ilo.index_info[testvars.named_index]['segments'])
 
+    def test_get_segmentcount_from_stats(self):
+        self.builder(key='1')
+        self.client.indices.stats.return_value = {
+            'indices': {testvars.named_index: {'total': {'segments': {'count': 12}}}}
+        }
+        self.ilo.get_index_state()
+        self.ilo.get_segment_counts()
+        self.assertEqual(12, self.ilo.index_info[testvars.named_index]['segments'])
+        self.client.indices.segments.assert_not_called()
+
+    def test_get_segmentcount_stats_error(self):
+        self.builder(key='1')
+        self.client.indices.stats.side_effect = ValueError('simulated')
+        self.client.indices.segments.return_value = testvars.shards
+        self.ilo.get_index_state()
+        self.ilo.get_segment_counts()
+        self.assertEqual(71, self.ilo.index_info[testvars.named_index]['segments'])
+
 
 class TestIndexListAgeFilterName(TestCase):
     def builder(self, key='2'):
@@ -129,7 +149,7 @@ class TestIndexListAgeFilterName(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_get_name_based_ages_match(self):
@@ -162,7 +182,7 @@ class TestIndexListAgeFilterStatsAPI(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_get_field_stats_dates_negative(self):
@@ -187,7 +207,7 @@ class TestIndexListRegexFilters(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_filter_by_regex_prefix(self):
@@ -267,7 +287,7 @@ class TestIndexListFilterByAge(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_missing_direction(self):
@@ -475,7 +495,7 @@ class TestIndexListFilterBySpace(TestCase):
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
         self.client.search.return_value = get_testvals(key, 'fieldstats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_missing_disk_space_value(self):
@@ -607,7 +627,7 @@ class TestIndexListFilterKibana(TestCase):
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
         self.client.search.return_value = get_testvals(key, 'fieldstats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_filter_kibana_positive(self):
@@ -660,7 +680,7 @@ class TestIndexListFilterForceMerged(TestCase):
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
         self.client.indices.segments.return_value = testvars.shards
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_filter_forcemerge_raise(self):
@@ -687,7 +707,7 @@ class TestIndexListFilterOpened(TestCase):
         client.indices.get_settings.return_value = testvars.settings_four
         client.indices.stats.return_value = testvars.stats_four
         client.field_stats.return_value = testvars.fieldstats_four
-        client.indices.exists_alias.return_value = False
+        client.indices.get_alias.return_value = {}
         ilo = IndexList(client)
         ilo.filter_opened()
         self.assertEqual(['c-2016.03.05'], ilo.indices)
@@ -700,7 +720,7 @@ class TestIndexListFilterAllocated(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_missing_key(self):
@@ -751,7 +771,7 @@ class TestIterateFiltersIndex(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_no_filters(self):
@@ -804,6 +824,36 @@ class TestIterateFiltersIndex(TestCase):
         self.ilo.iterate_filters(config)
         self.assertEqual(['index-2016.03.04'], self.ilo.indices)
 
+    def test_filter_requests_are_labeled(self):
+        self.builder()
+        labels = []
+
+        def get_settings(**kwargs):
+            labels.append(ACCOUNTING.labels().get('filter'))
+            return get_testvals('2', 'settings')
+
+        self.client.indices.get_settings.side_effect = get_settings
+        config = yaml.load(testvars.allocated_ft, Loader=yaml.FullLoader)['actions'][1]
+        self.ilo.iterate_filters(config)
+        self.assertEqual({'allocated'}, set(labels))
+        self.assertNotIn('filter', ACCOUNTING.labels())
+
+    def test_filter_spans(self):
+        self.builder()
+        exporter = Mock(spec=Exporter)
+        TRACER.add_exporter(exporter)
+        try:
+            config = yaml.load(testvars.kibana_ft, Loader=yaml.FullLoader)
+            self.ilo.iterate_filters(config['actions'][1])
+        finally:
+            TRACER.shutdown()
+        span = exporter.export.call_args[0][0]
+        self.assertEqual('filter', span.name)
+        self.assertEqual(
+            {'filtertype': 'kibana', 'items.before': 2, 'items.after': 2},
+            span.attributes,
+        )
+
     def test_kibana_filtertype(self):
         self.builder()
         self.client.field_stats.return_value = testvars.fieldstats_two
@@ -876,7 +926,7 @@ class TestIndexListFilterAlias(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_raise(self):
@@ -912,7 +962,7 @@ class TestIndexListFilterCount(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.client.indices.get_alias.return_value = testvars.settings_2_get_aliases
         self.ilo = IndexList(self.client)
 
@@ -981,7 +1031,7 @@ class TestIndexListFilterShards(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_filter_shards_raise(self):
@@ -1087,7 +1137,7 @@ class TestIndexListPeriodFilterName(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
         self.timestring = '%Y.%m.%d'
         self.epoch = 1456963201
@@ -1170,7 +1220,7 @@ class TestPeriodFilterAbsolute(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_bad_period_type(self):
@@ -1214,7 +1264,7 @@ class TestIndexListFilterBySize(TestCase):
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
         self.client.field_stats.return_value = get_testvals(key, 'fieldstats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.get_alias.return_value = {}
         self.ilo = IndexList(self.client)
 
     def test_missing_size_value(self):
@@ -1247,3 +1297,80 @@ class TestIndexListFilterBySize(TestCase):
             size_threshold=1.04, size_behavior='total', threshold_behavior='less_than'
         )
         self.assertEqual(['index-2016.03.03'], self.ilo.indices)
+
+
+class TestIndexListAliasNames(TestCase):
+    def setUp(self):
+        self.client = Mock()
+        self.client.info.return_value = get_es_ver()
+        self.client.cat.indices.return_value = get_testvals('2', 'state')
+        self.client.indices.get_settings.return_value = get_testvals('2', 'settings')
+        self.client.indices.stats.return_value = get_testvals('2', 'stats')
+        self.client.indices.get_alias.return_value = {
+            'index-2016.03.03': {'aliases': {'my_alias': {}}},
+            'index-2016.03.04': {'aliases': {'other': {}}},
+        }
+        self.ilo = IndexList(self.client)
+
+    def test_resolved_once(self):
+        self.ilo.get_index_settings()
+        self.ilo.get_index_stats()
+        self.assertEqual(1, self.client.indices.get_alias.call_count)
+        self.assertTrue(
+            self.client.indices.get_alias.call_args.kwargs['index'].startswith('*,')
+        )
+        self.client.cat.aliases.assert_not_called()
+        self.assertEqual('alias', self.ilo.name_kinds['my_alias'])
+        self.assertEqual('index', self.ilo.name_kinds['index-2016.03.04'])
+        self.client.indices.exists_alias.assert_not_called()
+
+    def test_alias_replaced(self):
+        with self.assertLogs('curator.indexlist', level='WARNING'):
+            data = self.ilo.alias_index_check(['my_alias', 'index-2016.03.04'])
+        self.assertEqual(['index-2016.03.04', 'index-2016.03.03'], data)
+        self.client.indices.get.assert_not_called()
+
+    def test_mitigate_alias(self):
+        self.ilo.indices.append('my_alias')
+        self.ilo.index_info['my_alias'] = {}
+        with self.assertLogs('curator.indexlist', level='WARNING'):
+            self.ilo.mitigate_alias('index-2016.03.03')
+        self.assertNotIn('my_alias', self.ilo.indices)
+        self.assertNotIn('my_alias', self.ilo.index_info)
+        self.assertIn('index-2016.03.03', self.ilo.index_info)
+        self.client.indices.get.assert_not_called()
+
+
+class TestIndexListStatsLogging(TestCase):
+    NAMES = [f'index-{num:03d}' for num in range(25)]
+
+    def test_debug_is_sampled(self):
+        stats = {'total': {'store': {'size_in_bytes': 1}, 'docs': {'count': 1}}}
+        stats['primaries'] = {'store': {'size_in_bytes': 1}}
+        client = Mock()
+        client.info.return_value = get_es_ver()
+        client.cat.indices.return_value = [
+            {'index': name, 'status': 'open'} for name in self.NAMES
+        ]
+        client.indices.get_alias.return_value = {}
+        settings = {
+            'index': {
+                'creation_date': '1456963200172',
+                'number_of_replicas': '1',
+                'number_of_shards': '1',
+            }
+        }
+        client.indices.get_settings.return_value = {
+            name: {'settings': settings} for name in self.NAMES
+        }
+        client.indices.stats.return_value = {
+            'indices': {name: stats for name in self.NAMES}
+        }
+        ilo = IndexList(client)
+        with self.assertLogs('curator.indexlist', level='DEBUG') as logs:
+            ilo.get_index_stats()
+        lines = [line for line in logs.output if 'PrimarySize' in line]
+        # The first ten indices only
+        self.assertEqual(10, len(lines))
+        self.assertIn('index-000', lines[0])
+        self.assertIn('index-009', lines[-1])
@@ -1,10 +1,14 @@
 """test_class_snapshot_list"""
 
+import shutil
+import tempfile
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import yaml
 from opensearch_client.exceptions import FailedValidation
 from curator import SnapshotList
+from curator.defaults.settings import FILTER_PATHS, SNAPSHOT_COMPACT_FIELDS
+from curator.snapshotlist import SnapshotRecord
 from curator.exceptions import (
     ConfigurationError,
     FailedExecution,
@@ -43,6 +47,144 @@ class TestSnapshotListClientAndInit(TestCase):
         self.assertEqual(['snap_name', 'snapshot-2015.03.01'], sorted(sl.snapshots))
 
 
+def paged_client():
+    """Return a Mock client which lists testvars.snapshots by name, then by page"""
+    client = Mock()
+    client.snapshot.get_repository.return_value = testvars.test_repo
+    client.cat.snapshots.return_value = [
+        {'id': snap['snapshot']} for snap in testvars.snapshots['snapshots']
+    ]
+
+    def get_page(repository=None, snapshot=None, **kwargs):
+        names = snapshot.split(',')
+        snaps = [
+            snap
+            for snap in testvars.snapshots['snapshots']
+            if snap['snapshot'] in names
+        ]
+        if kwargs.get('filter_path') == FILTER_PATHS['snapshots_compact']:
+            snaps = [
+                {key: snap[key] for key in SNAPSHOT_COMPACT_FIELDS if key in snap}
+                for snap in snaps
+            ]
+        return {'snapshots': snaps}
+
+    client.snapshot.get.side_effect = get_page
+    return client
+
+
+class TestSnapshotListPaged(TestCase):
+    def test_init(self):
+        client = paged_client()
+        sl = SnapshotList(client, repository=testvars.repo_name, page_size=1)
+        self.assertEqual(['snap_name', 'snapshot-2015.03.01'], sorted(sl.snapshots))
+        self.assertEqual([], sl.all_snapshots)
+        self.assertEqual(2, client.snapshot.get.call_count)
+        self.assertIsInstance(sl.snapshot_info['snap_name'], SnapshotRecord)
+        self.assertIsNone(sl.snapshot_info['snap_name']['indices'])
+
+    def test_snapshot_indices(self):
+        client = paged_client()
+        sl = SnapshotList(client, repository=testvars.repo_name, page_size=10)
+        self.assertEqual(
+            testvars.named_indices, sl.snapshot_indices('snapshot-2015.03.01')
+        )
+        # Fetched once, then kept in the record
+        sl.snapshot_indices('snapshot-2015.03.01')
+        self.assertEqual(2, client.snapshot.get.call_count)
+
+    def test_filters(self):
+        client = paged_client()
+        sl = SnapshotList(client, repository=testvars.repo_name, page_size=10)
+        sl.filter_by_age(
+            source='name',
+            direction='older',
+            timestring='%Y.%m.%d',
+            unit='days',
+            unit_count=1,
+            epoch=1425168000 + 2 * 86400,
+        )
+        self.assertEqual(['snapshot-2015.03.01'], sl.snapshots)
+        self.assertEqual('snapshot-2015.03.01', sl.most_recent())
+
+
+class TestSnapshotListCached(TestCase):
+    def setUp(self):
+        self.cachedir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cachedir)
+
+    def client(self):
+        client = paged_client()
+        client.cat.snapshots.return_value = [
+            {
+                'id': snap['snapshot'],
+                'status': snap['state'],
+                'end_epoch': str(snap['end_time_in_millis'] // 1000),
+            }
+            for snap in testvars.snapshots['snapshots']
+        ]
+        return client
+
+    def test_second_run_uses_cache(self):
+        snapshots = [
+            dict(snap, uuid=f'uuid-{num}')
+            for num, snap in enumerate(testvars.snapshots['snapshots'])
+        ]
+        with patch.dict(testvars.snapshots, {'snapshots': snapshots}):
+            first = self.client()
+            SnapshotList(
+                first, repository=testvars.repo_name, snapshot_cache=self.cachedir
+            )
+            self.assertEqual(1, first.snapshot.get.call_count)
+            second = self.client()
+            sl = SnapshotList(
+                second, repository=testvars.repo_name, snapshot_cache=self.cachedir
+            )
+        second.snapshot.get.assert_not_called()
+        self.assertEqual(['snap_name', 'snapshot-2015.03.01'], sl.snapshots)
+        self.assertEqual('SUCCESS', sl.snapshot_info['snap_name']['state'])
+
+    def test_deleted_snapshot_dropped(self):
+        snapshots = [
+            dict(snap, uuid=f'uuid-{num}')
+            for num, snap in enumerate(testvars.snapshots['snapshots'])
+        ]
+        with patch.dict(testvars.snapshots, {'snapshots': snapshots}):
+            SnapshotList(
+                self.client(),
+                repository=testvars.repo_name,
+                snapshot_cache=self.cachedir,
+            )
+            client = self.client()
+            client.cat.snapshots.return_value = client.cat.snapshots.return_value[1:]
+            sl = SnapshotList(
+                client, repository=testvars.repo_name, snapshot_cache=self.cachedir
+            )
+        self.assertEqual(['snapshot-2015.03.01'], sl.snapshots)
+        self.assertEqual(['uuid-1'], list(sl.cache.entries))
+
+
+class TestSnapshotRecord(TestCase):
+    def test_mapping_access(self):
+        record = SnapshotRecord({'snapshot': 'snap_name', 'state': 'SUCCESS'})
+        self.assertEqual('SUCCESS', record['state'])
+        self.assertIn('age_by_name', record)
+        self.assertIsNone(record['age_by_name'])
+        record['age_by_name'] = 1
+        self.assertEqual(1, record.get('age_by_name'))
+        self.assertEqual('x', record.get('indices', 'x'))
+
+    def test_unknown_field(self):
+        record = SnapshotRecord({})
+        self.assertNotIn('failures', record)
+        with self.assertRaises(KeyError):
+            _ = record['failures']
+        with self.assertRaises(KeyError):
+            record['failures'] = []
+
+
 class TestSnapshotListOtherMethods(TestCase):
     def test_empty_list(self):
         client = Mock()
@@ -431,9 +573,9 @@ class TestSnapshotListFilterCount(TestCase):
         slo = SnapshotList(client, repository=testvars.repo_name)
         slo._calculate_ages()
         slo.age_keyfield = 'invalid'
-        snaps = slo.snapshots
-        slo._sort_by_age(snaps)
-        self.assertEqual(['snapshot-2015.03.01'], slo.snapshots)
+        snaps = slo.working_list()
+        self.assertEqual([], slo._sort_by_age(snaps))
+        self.assertEqual([], slo.snapshots)
 
 
 class TestSnapshotListPeriodFilter(TestCase):
@@ -588,3 +730,86 @@ class TestSnapshotListPeriodFilter(TestCase):
             timestring=timestring,
             epoch=epoch,
         )
+
+
+class TestSnapshotListAgeIndex(TestCase):
+    """The age index filters select what a per-snapshot comparison would"""
+
+    EPOCH = 1456963200
+
+    def setUp(self):
+        # Ages in milliseconds, one day apart, with a tie and two missing ages
+        self.ages = {}
+        for num in range(40):
+            self.ages[f'snap-{num:02}'] = (self.EPOCH - (num % 20) * 86400) * 1000
+        self.ages['snap-07'] = None
+        self.ages['snap-33'] = 0
+        client = Mock()
+        client.snapshot.get.return_value = {
+            'snapshots': [
+                {'snapshot': name, 'state': 'SUCCESS', 'start_time_in_millis': age}
+                for name, age in self.ages.items()
+            ]
+        }
+        client.snapshot.get_repository.return_value = testvars.test_repo
+        self.slo = SnapshotList(client, repository=testvars.repo_name)
+
+    def aged(self):
+        return [name for name, age in self.ages.items() if age]
+
+    def test_loaded_once(self):
+        self.slo._calculate_ages()
+        index = self.slo._age_index()
+        self.assertIs(index, self.slo._age_index())
+        epochs, _, names, ageless = index
+        self.assertEqual(sorted(epochs), epochs)
+        self.assertEqual({'snap-07', 'snap-33'}, ageless)
+        self.assertEqual(38, len(names))
+
+    def test_older(self):
+        self.slo.filter_by_age(
+            direction='older', unit='days', unit_count=5, epoch=self.EPOCH
+        )
+        por = self.EPOCH - 5 * 86400
+        expected = [name for name in self.aged() if self.ages[name] / 1000 < por]
+        self.assertEqual(expected, self.slo.snapshots)
+
+    def test_younger_exclude(self):
+        self.slo.filter_by_age(
+            direction='younger',
+            unit='days',
+            unit_count=5,
+            epoch=self.EPOCH,
+            exclude=True,
+        )
+        por = self.EPOCH - 5 * 86400
+        expected = [name for name in self.aged() if self.ages[name] / 1000 <= por]
+        self.assertEqual(expected, self.slo.snapshots)
+
+    def test_period(self):
+        self.slo.filter_period(
+            source='creation_date',
+            range_from=-3,
+            range_to=-1,
+            unit='days',
+            epoch=self.EPOCH,
+        )
+        start, end = self.EPOCH - 3 * 86400, self.EPOCH - 1
+        expected = [
+            name for name in self.aged() if start <= self.ages[name] / 1000 <= end
+        ]
+        self.assertEqual(expected, self.slo.snapshots)
+
+    def test_count_ties(self):
+        # snap-00 and snap-20 are the same age, and keep their listed order
+        self.slo.filter_by_count(count=3, use_age=True, exclude=False)
+        self.assertEqual(['snap-00', 'snap-01', 'snap-20'], self.slo.snapshots)
+        sorted_snaps = self.slo._sort_by_age(self.slo.working_list())
+        self.assertEqual(['snap-00', 'snap-20', 'snap-01'], sorted_snaps)
+
+    def test_name_ages_reloaded(self):
+        self.slo._calculate_ages(source='name', timestring='%Y.%m.%d')
+        index = self.slo._age_index()
+        self.assertEqual(40, len(index[3]))
+        self.slo._calculate_ages(source='name', timestring='%Y.%m.%d')
+        self.assertIsNot(index, self.slo._age_index())
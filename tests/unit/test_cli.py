@@ -0,0 +1,84 @@
+"""Test the action file runner in curator.cli"""
+
+# pylint: disable=missing-function-docstring, missing-class-docstring, attribute-defined-outside-init
+from unittest import TestCase
+from fnmatch import fnmatchcase
+from unittest.mock import Mock
+from curator.classdef import ActionDef
+from curator.cli import ilm_action_skip, process_action
+
+ALIASES = [
+    {'alias': 'logs-a', 'index': 'logs-a-000001', 'is_write_index': 'true'},
+    {'alias': 'logs-b', 'index': 'logs-b-000001', 'is_write_index': 'true'},
+]
+POLICY = {'logs-a-000001': {'settings': {'index': {'lifecycle': {'name': 'hot'}}}}}
+
+
+class TestIlmActionSkip(TestCase):
+    def builder(self, name, policy=None):
+        self.client = Mock()
+        self.client.cat.aliases.side_effect = lambda name, **_: [
+            row
+            for row in ALIASES
+            if any(fnmatchcase(row['alias'], item) for item in name.split(','))
+        ]
+        self.client.indices.get_settings.return_value = (
+            POLICY if policy is None else policy
+        )
+        self.client.cat.indices.return_value = []
+        self.client.indices.rollover.return_value = {
+            'old_index': 'logs-b-000001',
+            'new_index': 'logs-b-000002',
+            'rolled_over': False,
+            'dry_run': True,
+            'conditions': {'[max_age: 1d]': True},
+        }
+        self.action_def = ActionDef(
+            {
+                'action': 'rollover',
+                'description': 'Roll over several aliases',
+                'options': {
+                    'name': name,
+                    'conditions': {'max_age': '1d'},
+                    'concurrency': 4,
+                    'allow_ilm_indices': False,
+                },
+            }
+        )
+
+    def test_list_drops_managed_aliases(self):
+        self.builder(['logs-a', 'logs-b'])
+        self.assertFalse(ilm_action_skip(self.client, self.action_def))
+        self.assertEqual(['logs-b'], self.action_def.options['name'])
+        self.client.indices.get_alias.assert_not_called()
+
+    def test_pattern_drops_managed_aliases(self):
+        self.builder('logs-*')
+        self.assertFalse(ilm_action_skip(self.client, self.action_def))
+        self.assertEqual(['logs-b'], self.action_def.options['name'])
+        self.assertEqual('logs-*', self.client.cat.aliases.call_args.kwargs['name'])
+
+    def test_every_alias_managed(self):
+        policy = {
+            index: {'settings': {'index': {'lifecycle': {'name': 'hot'}}}}
+            for index in ['logs-a-000001', 'logs-b-000001']
+        }
+        self.builder(['logs-a', 'logs-b'], policy=policy)
+        self.assertTrue(ilm_action_skip(self.client, self.action_def))
+
+    def test_none_managed(self):
+        self.builder(['logs-a', 'logs-b'], policy={})
+        self.assertFalse(ilm_action_skip(self.client, self.action_def))
+        self.assertEqual(['logs-a', 'logs-b'], self.action_def.options['name'])
+
+    def test_process_action(self):
+        self.builder(['logs-a', 'logs-b'])
+        self.assertFalse(ilm_action_skip(self.client, self.action_def))
+        process_action(self.client, self.action_def, dry_run=True)
+        self.assertEqual(
+            {'logs-b': 'logs-b-000001'}, self.action_def.action_cls.targets
+        )
+        self.client.indices.rollover.assert_called_once()
+        self.assertEqual(
+            'logs-b', self.client.indices.rollover.call_args.kwargs['alias']
+        )
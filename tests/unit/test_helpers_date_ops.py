@@ -1,6 +1,6 @@
 """test_helpers_date_ops"""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest import TestCase
 from unittest.mock import Mock
 import pytest
@@ -8,6 +8,7 @@ from opensearchpy import NotFoundError
 from elastic_transport import ApiResponseMeta
 from curator.exceptions import ConfigurationError
 from curator.helpers.date_ops import (
+    DateMath,
     absolute_date_range,
     date_range,
     datetime_to_epoch,
@@ -761,3 +762,60 @@ class TestGetDateMath(TestCase):
         effect = NotFoundError(msg, meta, body)
         client.indices.get.side_effect = effect
         self.assertRaises(ConfigurationError, get_datemath, client, datemath)
+
+
+class TestDateMath(TestCase):
+    """TestDateMath
+
+    Test helpers.date_ops.DateMath functionality.
+    """
+
+    def client(self, rendered):
+        """Return a client that renders date math as ``rendered``"""
+        client = Mock()
+
+        def effect(index):
+            prefix = index[1:].split('-{', 1)[0]
+            meta = ApiResponseMeta(404, '1.1', {}, 0.01, None)
+            body = {'error': {'index': f'{prefix}-{rendered}'}}
+            raise NotFoundError('index_not_found_exception', meta, body)
+
+        client.indices.get.side_effect = effect
+        return client
+
+    def test_verified_once(self):
+        """test_verified_once
+
+        The server is only asked on first use, if it agrees
+        """
+        today = datetime.now(timezone.utc).strftime('%Y.%m.%d')
+        client = self.client(today)
+        datemath = DateMath()
+        self.assertEqual(today, datemath.render(client, '{now/d}'))
+        self.assertEqual(today, datemath.render(client, '{now/d}'))
+        self.assertTrue(datemath.verified)
+        self.assertEqual(1, client.indices.get.call_count)
+
+    def test_mismatch(self):
+        """test_mismatch
+
+        The server renders for the rest of the run if it disagrees
+        """
+        client = self.client('1999.01.01')
+        datemath = DateMath()
+        with self.assertLogs('curator.helpers.date_ops', level='WARNING'):
+            self.assertEqual('1999.01.01', datemath.render(client, '{now/d}'))
+        self.assertEqual('1999.01.01', datemath.render(client, '{now/d}'))
+        self.assertEqual(2, client.indices.get.call_count)
+        datemath.reset()
+        self.assertIsNone(datemath.verified)
+
+    def test_unsupported(self):
+        """test_unsupported
+
+        Formats the local renderer does not support go to the server
+        """
+        client = self.client('oct')
+        datemath = DateMath()
+        self.assertEqual('oct', datemath.render(client, '{now{MMM}}'))
+        self.assertIsNone(datemath.verified)
@@ -0,0 +1,62 @@
+"""Test the local date math renderer"""
+
+from datetime import datetime, timezone
+from unittest import TestCase
+from curator.helpers.datemath import render
+
+NOW = datetime(2026, 10, 21, 5, 30, 12, 345678, tzinfo=timezone.utc)
+
+
+class TestRender(TestCase):
+    def check(self, expected, template):
+        self.assertEqual(expected, render(template, now=NOW))
+
+    def test_default_format(self):
+        self.check('prefix-2026.10.21-suffix', 'prefix-{now}-suffix')
+
+    def test_arithmetic(self):
+        self.check('2026.10.20', '{now-1d/d}')
+        self.check('2026-10', '{now+10d/d{yyyy-MM}}')
+        self.check('2026.09', '{now-1M/M{uuuu.MM}}')
+
+    def test_rounding(self):
+        self.check('2026.10.19', '{now/w}')
+        self.check('26.01.01', '{now/y{yy.MM.dd}}')
+        self.check('05:30:00.000', '{now/m{HH:mm:ss.SSS}}')
+
+    def test_month_end(self):
+        self.check('2024-02-29', '{2024-03-31||-1M{yyyy-MM-dd}}')
+
+    def test_offset(self):
+        self.check('2026-10-30-22', '{now+10d/h{yyyy-MM-dd-HH|-07:00}}')
+
+    def test_anchor(self):
+        self.check(
+            '.prefix-2001-01-01-14-suffix',
+            '.prefix-{2001-01-01-13||+1h/h{yyyy-MM-dd-HH|-07:00}}-suffix',
+        )
+
+    def test_named_zone(self):
+        # The day before the 2024 daylight saving change in New York
+        template = '{2024-03-09-12||%s{yyyy-MM-dd-HH|America/New_York}}'
+        self.check('2024-03-10-12', template % '+1d')
+        self.check('2024-03-10-13', template % '+24h')
+
+    def test_literals(self):
+        self.check("2026-10-21T05", "{now{yyyy-MM-dd'T'HH}}")
+        self.check('{x}-2026.10.21', '\\{x\\}-{now}')
+        self.check('a-2026.10.21-2026.10', 'a-{now/d}-{now/M{uuuu.MM}}')
+
+    def test_unsupported(self):
+        for template in [
+            '{hasthemath}',
+            '{now{MMM}}',
+            '{now{ww}}',
+            '{now{date}}',
+            '{now{yyyy|Nowhere/Zone}}',
+            '{now}}',
+            '{now{}}',
+        ]:
+            with self.subTest(template=template):
+                with self.assertRaises(ValueError):
+                    render(template, now=NOW)
@@ -5,7 +5,7 @@ from unittest.mock import Mock
 import pytest
 from elastic_transport import ApiResponseMeta
 from opensearchpy import NotFoundError, TransportError
-from curator.defaults.settings import EXCLUDE_SYSTEM
+from curator.defaults.settings import EXCLUDE_SYSTEM, FILTER_PATHS
 from curator.exceptions import CuratorException, FailedExecution, MissingArgument
 from curator.helpers import getters
 
@@ -99,6 +99,49 @@ class TestGetIndices(TestCase):
         assert '-top_queries*' in EXCLUDE_SYSTEM
 
 
+class TestGetExistingIndices(TestCase):
+    """TestGetExistingIndices
+
+    Test helpers.getters.get_existing_indices functionality.
+    """
+
+    def test_only_asks_for_names(self):
+        """test_only_asks_for_names
+
+        Only the given names are requested, and missing ones are skipped
+        """
+        client = Mock()
+        client.cat.indices.return_value = [{'index': 'a'}, {'index': 'c'}]
+        self.assertEqual({'a'}, getters.get_existing_indices(client, ['a', 'b']))
+        client.cat.indices.assert_called_once_with(
+            index='a,b',
+            expand_wildcards='open,closed',
+            h='index',
+            format='json',
+            params={'ignore_unavailable': 'true'},
+        )
+
+    def test_chunked(self):
+        """test_chunked
+
+        Long lists are requested in chunks
+        """
+        client = Mock()
+        client.cat.indices.return_value = []
+        names = [f'index-{num:04}-{"x" * 100}' for num in range(100)]
+        self.assertEqual(set(), getters.get_existing_indices(client, names))
+        self.assertLess(1, client.cat.indices.call_count)
+
+    def test_empty(self):
+        """test_empty
+
+        No request is made for an empty list
+        """
+        client = Mock()
+        self.assertEqual(set(), getters.get_existing_indices(client, []))
+        client.cat.indices.assert_not_called()
+
+
 class TestGetRepository(TestCase):
     """TestGetRepository
 
@@ -260,6 +303,110 @@ class TestGetSnapshotData(TestCase):
         with pytest.raises(FailedExecution, match=r'Error: 401'):
             getters.get_snapshot_data(client, repository=REPO_NAME)
 
+    def test_filter_path(self):
+        """test_filter_path
+
+        Only the snapshot fields Curator reads should be requested
+        """
+        client = Mock()
+        client.snapshot.get.return_value = SNAPSHOTS
+        getters.get_snapshot_data(client, repository=REPO_NAME)
+        kwargs = client.snapshot.get.call_args[1]
+        assert FILTER_PATHS['snapshots'] == kwargs['filter_path']
+
+    def test_empty_filtered_response(self):
+        """test_empty_filtered_response
+
+        A filtered response for an empty repository has no snapshots key at all
+        """
+        client = Mock()
+        client.snapshot.get.return_value = {}
+        assert not getters.get_snapshot_data(client, repository=REPO_NAME)
+
+
+class TestGetSnapshotNames(TestCase):
+    """TestGetSnapshotNames
+
+    Test helpers.getters.get_snapshot_names functionality.
+    """
+
+    def test_names(self):
+        """test_names
+
+        Output should match expected
+        """
+        client = Mock()
+        client.cat.snapshots.return_value = [{'id': SNAP_NAME}, {'id': 'other'}]
+        assert [SNAP_NAME, 'other'] == getters.get_snapshot_names(
+            client, repository=REPO_NAME
+        )
+
+    def test_raises_exception_onfail(self):
+        """test_raises_exception_onfail
+
+        Should raise a FailedExecution exception if the cat call fails
+        """
+        client = Mock()
+        client.cat.snapshots.side_effect = FAKE_FAIL
+        with pytest.raises(FailedExecution):
+            getters.get_snapshot_names(client, repository=REPO_NAME)
+
+
+class TestIterSnapshotData(TestCase):
+    """TestIterSnapshotData
+
+    Test helpers.getters.iter_snapshot_data functionality.
+    """
+
+    def test_pages(self):
+        """test_pages
+
+        Each page of names is a separate request for the compact fields only
+        """
+        client = Mock()
+        client.snapshot.get.return_value = SNAPSHOT
+        names = [f'snap-{num}' for num in range(5)]
+        result = list(
+            getters.iter_snapshot_data(
+                client, repository=REPO_NAME, page_size=2, names=names
+            )
+        )
+        assert 3 == client.snapshot.get.call_count
+        assert [SINGLE] * 3 == result
+        kwargs = client.snapshot.get.call_args[1]
+        assert 'snap-4' == kwargs['snapshot']
+        assert FILTER_PATHS['snapshots_compact'] == kwargs['filter_path']
+
+    def test_empty_repository(self):
+        """test_empty_repository
+
+        No snapshot requests are made when there are no names
+        """
+        client = Mock()
+        client.cat.snapshots.return_value = []
+        assert not list(getters.iter_snapshot_data(client, repository=REPO_NAME))
+        client.snapshot.get.assert_not_called()
+
+
+class TestRoutingFilterPath(TestCase):
+    """TestRoutingFilterPath
+
+    Test helpers.getters.routing_filter_path functionality.
+    """
+
+    def test_escapes_dots(self):
+        """test_escapes_dots
+
+        Dots in the index name are escaped and each field gets its own path
+        """
+        expected = (
+            r'routing_table.indices.index-2015\.01\.01.shards.*.node,'
+            r'routing_table.indices.index-2015\.01\.01.shards.*.primary'
+        )
+        assert expected == getters.routing_filter_path(
+            NAMED_INDICES[0], ['node', 'primary']
+        )
+
 
 class TestNodeRoles(TestCase):
     """TestNodeRoles
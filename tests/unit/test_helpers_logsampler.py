@@ -0,0 +1,42 @@
+"""Test the LogSampler helper"""
+
+import logging
+from unittest import TestCase
+from unittest.mock import Mock
+from curator.helpers import logsampler
+from curator.helpers.logsampler import LogSampler
+
+
+def mock_logger(level):
+    """Return a Mock logger enabled at ``level``"""
+    logger = Mock()
+    logger.isEnabledFor.side_effect = lambda lvl: lvl >= level
+    return logger
+
+
+class TestLogSampler(TestCase):
+    def test_not_enabled(self):
+        logger = mock_logger(logging.INFO)
+        sampler = LogSampler(logger, 'test')
+        for idx in range(50):
+            sampler.done('item %s', idx)
+        logger.debug.assert_not_called()
+        self.assertEqual(0, sampler.skipped)
+
+    def test_sampling(self):
+        logger = mock_logger(logging.DEBUG)
+        sampler = LogSampler(logger, 'test')
+        total = logsampler.SAMPLE_FIRST + 2 * logsampler.SAMPLE_EVERY
+        for idx in range(total):
+            sampler.done('item %s', idx)
+        # The first SAMPLE_FIRST, then every SAMPLE_EVERY-th item (100 and 200 here)
+        expected = logsampler.SAMPLE_FIRST + 2
+        self.assertEqual(expected, logger.debug.call_count)
+        self.assertEqual(total - expected, sampler.skipped)
+
+    def test_summary(self):
+        logger = mock_logger(logging.INFO)
+        sampler = LogSampler(logger, 'Filter "age"', noun='indices')
+        sampler.summary(10, 4)
+        args = logger.info.call_args[0]
+        self.assertEqual(('Filter "age"', 4, 10, 'indices', 6), args[1:6])
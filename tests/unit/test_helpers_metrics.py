@@ -0,0 +1,82 @@
+"""Test the run metrics helper"""
+
+import os
+import tempfile
+from unittest import TestCase
+from opensearch_client.accounting import RequestAccounting
+from curator.helpers.metrics import RunMetrics, escape, sample
+
+
+class TestSample(TestCase):
+    def test_escape(self):
+        self.assertEqual('a\\"b\\\\c\\nd', escape('a"b\\c\nd'))
+
+    def test_no_labels(self):
+        self.assertEqual('curator_run_success 1', sample('run_success', {}, 1))
+
+    def test_labels(self):
+        line = sample('action_duration_seconds', {'cluster': 'c', 'action': 'x'}, 0.5)
+        self.assertEqual(
+            'curator_action_duration_seconds{cluster="c",action="x"} 0.5', line
+        )
+
+
+class TestRunMetrics(TestCase):
+    def setUp(self):
+        self.metrics = RunMetrics()
+        self.metrics.cluster = 'prod'
+
+    def test_action(self):
+        with self.metrics.action(1, 'delete_indices') as record:
+            self.metrics.selected('indices', 10)
+            self.metrics.acted('indices', 8)
+            self.metrics.waited(3, 2.5)
+            record.failed = True
+        self.assertIsNone(self.metrics.current)
+        lines = self.metrics.lines()
+        labels = 'cluster="prod",action_id="1",action="delete_indices"'
+        self.assertIn('curator_run_success{cluster="prod"} 0', lines)
+        self.assertIn(f'curator_action_failed{{{labels}}} 1', lines)
+        self.assertIn(f'curator_action_selected{{{labels},kind="indices"}} 10', lines)
+        self.assertIn(f'curator_action_acted{{{labels},kind="indices"}} 8', lines)
+        self.assertIn(f'curator_action_wait_polls{{{labels}}} 3', lines)
+        self.assertIn(f'curator_action_wait_seconds{{{labels}}} 2.5', lines)
+
+    def test_outside_action(self):
+        self.metrics.selected('indices', 10)
+        self.metrics.waited(1, 1.0)
+        lines = self.metrics.lines()
+        self.assertIn('curator_run_success{cluster="prod"} 1', lines)
+        self.assertFalse([line for line in lines if 'action_' in line])
+
+    def test_api_histogram(self):
+        accounting = RequestAccounting()
+        with accounting.scope(action='2:close'):
+            with accounting.scope(filter='age'):
+                accounting.record('GET', '/_cat/indices', 0.02)
+            accounting.record('GET', '/_cat/indices', 0.3, error=True, size=100)
+        lines = self.metrics.lines(accounting=accounting)
+        labels = (
+            'cluster="prod",action_id="2",action="close",endpoint="GET /_cat/indices"'
+        )
+        name = 'curator_api_request_duration_seconds'
+        self.assertIn(f'# TYPE {name} histogram', lines)
+        self.assertIn(f'{name}_bucket{{{labels},le="0.025"}} 1', lines)
+        self.assertIn(f'{name}_bucket{{{labels},le="+Inf"}} 2', lines)
+        self.assertIn(f'{name}_count{{{labels}}} 2', lines)
+        self.assertIn(f'curator_api_request_errors{{{labels}}} 1', lines)
+        self.assertIn(f'curator_api_response_bytes{{{labels}}} 100', lines)
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'curator.prom')
+            self.metrics.write(path)
+            self.assertEqual(
+                [path], [os.path.join(tmpdir, f) for f in os.listdir(tmpdir)]
+            )
+            with open(path, encoding='utf-8') as fhandle:
+                self.assertIn('# TYPE curator_run_success gauge\n', fhandle.read())
+
+    def test_write_failure(self):
+        with self.assertLogs('curator.helpers.metrics', level='ERROR'):
+            self.metrics.write('/nonexistent/dir/curator.prom')
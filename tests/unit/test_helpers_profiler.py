@@ -0,0 +1,67 @@
+"""Test the profiler helper"""
+
+import json
+import os
+import pstats
+import tempfile
+from unittest import TestCase
+from curator.helpers import profiler
+from curator.helpers.profiler import category, describe, profiled
+
+
+class TestCategory(TestCase):
+    def test_json(self):
+        self.assertEqual('json', category(('/usr/lib/json/decoder.py', 1, 'decode')))
+        self.assertEqual('json', category(('~', 0, '<built-in method _json.x>')))
+
+    def test_network(self):
+        func = ('~', 0, "<method 'recv_into' of '_socket.socket' objects>")
+        self.assertEqual('network', category(func))
+        self.assertEqual('other', category(('~', 0, '<built-in method openssl_md5>')))
+
+    def test_curator(self):
+        self.assertEqual('curator', category((profiler.__file__, 1, 'category')))
+
+    def test_curator_names_are_not_markers(self):
+        for funcname in ['selected', 'select_indices', 'write_json', 'to_json']:
+            self.assertEqual('curator', category((profiler.__file__, 1, funcname)))
+        func = ('~', 0, "<method 'select' of 'list' objects>")
+        self.assertEqual('other', category(func))
+        func = ('/site/myjson_utils/socket_tools.py', 1, 'select')
+        self.assertEqual('other', category(func))
+
+    def test_other(self):
+        self.assertEqual('other', category(('/usr/lib/re/__init__.py', 1, 'match')))
+
+    def test_describe(self):
+        self.assertEqual(
+            'curator/indexlist.py:12(filter)',
+            describe(('/site/curator/indexlist.py', 12, 'filter')),
+        )
+
+
+class TestProfiled(TestCase):
+    def test_no_directory(self):
+        with self.assertNoLogs('curator.helpers.profiler'):
+            with profiled('1-close'):
+                pass
+
+    def test_profile_written(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = os.path.join(tmpdir, 'profiles')
+            with self.assertLogs('curator.helpers.profiler', level='INFO') as logs:
+                with profiled('1-close', directory):
+                    json.loads(json.dumps({'a': list(range(100))}))
+            path = os.path.join(directory, '1-close.prof')
+            stats = pstats.Stats(path)
+            self.assertTrue(stats.stats)
+        self.assertIn('Profile of 1-close', logs.output[1])
+        self.assertIn('json', logs.output[1])
+
+    def test_written_on_exit(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertLogs('curator.helpers.profiler', level='INFO'):
+                with self.assertRaises(SystemExit):
+                    with profiled('close', tmpdir):
+                        raise SystemExit(1)
+            self.assertTrue(os.path.isfile(os.path.join(tmpdir, 'close.prof')))
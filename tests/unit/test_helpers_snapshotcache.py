@@ -0,0 +1,66 @@
+"""Test the SnapshotCache helper"""
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from curator.helpers.snapshotcache import SnapshotCache
+
+REPO = 'my/repo'
+DONE = {
+    'snapshot': 'snap-1',
+    'uuid': 'uuid-1',
+    'state': 'SUCCESS',
+    'start_time_in_millis': 1000,
+    'end_time_in_millis': 61000,
+    'indices': None,
+}
+RUNNING = dict(DONE, snapshot='snap-2', uuid='uuid-2', state='IN_PROGRESS')
+
+
+class TestSnapshotCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cachedir = os.path.join(self.tmpdir, 'cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_round_trip(self):
+        cache = SnapshotCache(self.cachedir, REPO)
+        cache.update([DONE, RUNNING])
+        cache.save()
+        self.assertEqual(self.cachedir, os.path.dirname(cache.filename))
+        loaded = SnapshotCache(self.cachedir, REPO)
+        loaded.load()
+        # Only completed snapshots are cached
+        self.assertEqual({'uuid-1': DONE}, loaded.entries)
+        self.assertEqual({'snap-1': DONE}, loaded.by_name())
+
+    def test_other_repository(self):
+        cache = SnapshotCache(self.cachedir, REPO)
+        cache.update([DONE])
+        cache.save()
+        other = SnapshotCache(self.cachedir, 'other')
+        other.load()
+        self.assertEqual({}, other.entries)
+
+    def test_unreadable(self):
+        cache = SnapshotCache(self.cachedir, REPO)
+        os.makedirs(self.cachedir)
+        with open(cache.filename, 'w', encoding='utf-8') as fhandle:
+            fhandle.write('not json')
+        cache.load()
+        self.assertEqual({}, cache.entries)
+
+    def test_matches(self):
+        self.assertTrue(
+            SnapshotCache.matches(DONE, {'status': 'SUCCESS', 'end_epoch': '61'})
+        )
+        self.assertFalse(
+            SnapshotCache.matches(DONE, {'status': 'SUCCESS', 'end_epoch': '99'})
+        )
+        self.assertFalse(
+            SnapshotCache.matches(DONE, {'status': 'PARTIAL', 'end_epoch': '61'})
+        )
+        self.assertFalse(SnapshotCache.matches(DONE, {}))
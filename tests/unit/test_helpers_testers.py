@@ -18,6 +18,7 @@ from curator.helpers.testers import (
     is_idx_partial,
     repository_exists,
     rollable_alias,
+    rollable_aliases,
     snapshot_running,
     validate_filters,
     verify_client_object,
@@ -129,6 +130,37 @@ class TestRollableAlias(TestCase):
         assert rollable_alias(client, 'foo')
 
 
+class TestRollableAliases(TestCase):
+    """TestRollableAliases
+
+    Test helpers.testers.rollable_aliases functionality.
+    """
+
+    def test_one_request(self):
+        """test_one_request
+
+        Should find the index to roll over for every matching alias at once, and
+        leave out aliases that cannot be rolled over
+        """
+        client = Mock()
+        client.cat.aliases.return_value = [
+            {'alias': 'logs-a', 'index': 'logs-a-000001', 'is_write_index': '-'},
+            {'alias': 'logs-b', 'index': 'logs-b-000001', 'is_write_index': 'false'},
+            {'alias': 'logs-b', 'index': 'logs-b-000002', 'is_write_index': 'true'},
+            {'alias': 'logs-c', 'index': 'logs-c-x', 'is_write_index': '-'},
+            {'alias': 'logs-d', 'index': 'logs-d-1', 'is_write_index': '-'},
+            {'alias': 'logs-d', 'index': 'logs-d-2', 'is_write_index': '-'},
+        ]
+        with self.assertLogs('curator.helpers.testers', level='ERROR') as logs:
+            targets = rollable_aliases(client, ['logs-*', 'missing'])
+        self.assertEqual(
+            {'logs-a': 'logs-a-000001', 'logs-b': 'logs-b-000002'}, targets
+        )
+        self.assertEqual('logs-*,missing', client.cat.aliases.call_args.kwargs['name'])
+        self.assertIn('"missing" not found', logs.output[0])
+        self.assertEqual(4, len(logs.output))
+
+
 class TestSnapshotRunning(TestCase):
     """TestSnapshotRunning
 
@@ -13,6 +13,9 @@ from curator.helpers.utils import (
     to_csv,
     multitarget_fix,
     multitarget_match,
+    parse_byte_size,
+    parse_time_value,
+    run_concurrently,
 )
 from . import testvars
 
@@ -38,7 +41,7 @@ class TestShowDryRun(TestCase):
         client.cat.indices.return_value = testvars.state_two
         client.indices.get_settings.return_value = testvars.settings_two
         client.indices.stats.return_value = testvars.stats_two
-        client.indices.exists_alias.return_value = False
+        client.indices.get_alias.return_value = {}
         client.field_stats.return_value = testvars.fieldstats_two
         ilst = IndexList(client)
         assert None is show_dry_run(ilst, 'test_action')
@@ -196,3 +199,54 @@ class TestMultiTarget(TestCase):
         that contains a wildcard
         """
         assert ['index2', 'not-index2'] == multitarget_match('*2', self.COMPLEX)
+
+
+class TestParseValues(TestCase):
+    """TestParseValues
+
+    Test helpers.utils.parse_time_value and parse_byte_size functionality.
+    """
+
+    def test_time_value(self):
+        """test_time_value"""
+        self.assertEqual(604800, parse_time_value('7d'))
+        self.assertEqual(5400, parse_time_value('1.5h'))
+        self.assertEqual(0.25, parse_time_value('250ms'))
+        self.assertEqual(60, parse_time_value('1m'))
+
+    def test_byte_size(self):
+        """test_byte_size"""
+        self.assertEqual(1024**3, parse_byte_size('1g'))
+        self.assertEqual(50 * 1024**3, parse_byte_size('50GB'))
+        self.assertEqual(1536, parse_byte_size('1.5kb'))
+        self.assertEqual(100, parse_byte_size('100b'))
+
+    def test_unsupported(self):
+        """test_unsupported"""
+        self.assertRaises(ValueError, parse_time_value, '7 weeks')
+        self.assertRaises(ValueError, parse_byte_size, '1xb')
+
+
+class TestRunConcurrently(TestCase):
+    """TestRunConcurrently
+
+    Test helpers.utils.run_concurrently functionality.
+    """
+
+    def test_results_in_order(self):
+        """test_results_in_order"""
+        done, failed = run_concurrently(lambda num: num * 2, [3, 1, 2], 2)
+        self.assertEqual([(3, 6), (1, 2), (2, 4)], done)
+        self.assertEqual([], failed)
+
+    def test_every_item_is_tried(self):
+        """test_every_item_is_tried"""
+
+        def func(name):
+            if name.startswith('bad'):
+                raise FAKE_FAIL
+            return name
+
+        done, failed = run_concurrently(func, ['bad-1', 'good', 'bad-2'], 4)
+        self.assertEqual([('good', 'good')], done)
+        self.assertEqual([('bad-1', FAKE_FAIL), ('bad-2', FAKE_FAIL)], failed)
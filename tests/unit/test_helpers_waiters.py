@@ -10,7 +10,9 @@ from curator.exceptions import (
     MissingArgument,
 )
 from curator.helpers.waiters import (
+    RecoveryProgress,
     health_check,
+    open_check,
     restore_check,
     snapshot_check,
     task_check,
@@ -140,10 +142,99 @@ class TestRestoreCheck(TestCase):
         """
         client = Mock()
         client.indices.recovery.return_value = {}
-        client.indices.exists.return_value = (
-            False  # Mock indices.exists() for empty recovery check
-        )
+        client.cat.indices.return_value = [{'index': 'index-2015.01.01'}]
         assert not restore_check(client, self.NAMED_INDICES)
+        client.indices.exists.assert_not_called()
+
+    def test_empty_recovery_exists(self):
+        """test_empty_recovery_exists
+
+        Should return ``True`` when indices with no recovery info all exist
+        """
+        client = Mock()
+        client.indices.recovery.return_value = {}
+        client.cat.indices.return_value = [
+            {'index': index} for index in self.NAMED_INDICES
+        ]
+        with self.assertLogs('curator.helpers.waiters', level='WARNING'):
+            assert restore_check(client, self.NAMED_INDICES)
+        client.cat.indices.assert_called_once()
+
+    def test_progress(self):
+        """test_progress
+
+        Bytes and files recovered, and their rates, are reported to ``progress``
+        """
+
+        def shard(stage, recovered, files):
+            size = {'recovered_in_bytes': recovered, 'total_in_bytes': 2048}
+            return {
+                'stage': stage,
+                'index': {'size': size, 'files': {'recovered': files, 'total': 4}},
+            }
+
+        client = Mock()
+        client.indices.recovery.return_value = {
+            'index-2015.01.01': {'shards': [shard('DONE', 2048, 4)]},
+            'index-2015.02.01': {'shards': [shard('INDEX', 1024, 1)]},
+        }
+        progress = RecoveryProgress()
+        with self.assertLogs('curator.helpers.waiters', level='INFO') as logs:
+            assert not restore_check(client, self.NAMED_INDICES, progress=progress)
+        self.assertIn('3.0KB of 4.0KB (75.0%), 5 of 8 files', logs.output[-1])
+        client.indices.recovery.return_value['index-2015.02.01'] = {
+            'shards': [shard('DONE', 2048, 4)]
+        }
+        with self.assertLogs('curator.helpers.waiters', level='INFO') as logs:
+            assert restore_check(client, self.NAMED_INDICES, progress=progress)
+        self.assertIn('files/s', logs.output[-1])
+        self.assertEqual((4096, 8), progress.last[1:])
+
+    def test_eta(self):
+        """test_eta
+
+        The time left is estimated from the average rate since the first check
+        """
+        progress = RecoveryProgress()
+        self.assertIsNone(progress.eta(10.0, 100, 1000))
+        progress.first = (0.0, 0, 0)
+        self.assertEqual(90.0, progress.eta(10.0, 100, 1000))
+        self.assertEqual(0.0, progress.eta(10.0, 1000, 1000))
+        # No bytes recovered since the first check
+        self.assertIsNone(progress.eta(10.0, 0, 1000))
+
+
+class TestOpenCheck(TestCase):
+    def test_green(self):
+        client = Mock()
+        client.cluster.health.return_value = {
+            'status': 'green',
+            'active_shards': 4,
+            'initializing_shards': 0,
+            'unassigned_shards': 0,
+        }
+        with self.assertLogs('curator.helpers.waiters') as logs:
+            self.assertTrue(open_check(client, ['index-1', 'index-2']))
+        self.assertEqual(
+            'index-1,index-2', client.cluster.health.call_args.kwargs['index']
+        )
+        self.assertIn('4 of 4 shards active, 0 initializing', logs.output[-1])
+
+    def test_not_green(self):
+        client = Mock()
+        client.cluster.health.return_value = {
+            'status': 'red',
+            'active_shards': 1,
+            'initializing_shards': 2,
+            'unassigned_shards': 3,
+        }
+        with self.assertLogs('curator.helpers.waiters') as logs:
+            self.assertFalse(open_check(client, ['index-1']))
+        self.assertIn('1 of 6 shards active, 2 initializing', logs.output[-1])
+
+    def test_wait_for_it_needs_index_list(self):
+        with pytest.raises(MissingArgument, match=r'An index_list must accompany'):
+            wait_for_it(Mock(), 'open')
 
 
 class TestSnapshotCheck(TestCase):
@@ -0,0 +1,152 @@
+"""Test the show_indices and show_snapshots output helpers"""
+
+import json
+from unittest import TestCase
+from unittest.mock import Mock
+import click
+from click.testing import CliRunner
+from curator.cli_singletons.show import (
+    INDEX_COLUMNS,
+    get_columns,
+    index_rows,
+    snapshot_rows,
+    timestamp,
+    write_rows,
+)
+
+ROWS = [
+    {'index': 'index-1', 'size': 2048, 'creation_date': 1456963200},
+    {'index': 'index-22', 'size': 0, 'creation_date': None},
+]
+COLUMNS = ['index', 'size', 'creation_date']
+
+
+def output(*args, **kwargs):
+    """Return what write_rows writes to stdout"""
+    with CliRunner().isolation() as (stdout, _, _):
+        write_rows(*args, **kwargs)
+        return stdout.getvalue().decode('utf-8')
+
+
+def index_list(indices):
+    """Return a Mock IndexList with settings for ``indices``"""
+    ilo = Mock()
+    ilo.indices = list(indices)
+    ilo.index_info = {
+        idx: {
+            'age': {'creation_date': 1456963200},
+            'number_of_shards': '2',
+            'number_of_replicas': '1',
+        }
+        for idx in indices
+    }
+    return ilo
+
+
+class TestGetColumns(TestCase):
+    def test_default(self):
+        self.assertEqual(['index'], get_columns(None, INDEX_COLUMNS, ['index']))
+
+    def test_columns(self):
+        self.assertEqual(
+            ['docs', 'index'], get_columns('docs, index', INDEX_COLUMNS, ['index'])
+        )
+
+    def test_unknown(self):
+        with self.assertRaises(click.BadParameter):
+            get_columns('index,bogus', INDEX_COLUMNS, ['index'])
+
+
+class TestTimestamp(TestCase):
+    def test_iso(self):
+        self.assertEqual('2016-03-03T00:00:00Z', timestamp(1456963200))
+
+    def test_epoch(self):
+        self.assertEqual(1456963200, timestamp(1456963200, as_epoch=True))
+
+    def test_unknown(self):
+        self.assertIsNone(timestamp(0))
+
+
+class TestIndexRows(TestCase):
+    def test_names_only(self):
+        ilo = index_list(['b', 'a'])
+        rows = list(index_rows(ilo, ['index']))
+        self.assertEqual([{'index': 'a'}, {'index': 'b'}], rows)
+        ilo.get_index_stats.assert_not_called()
+        ilo.get_index_settings.assert_not_called()
+        ilo.get_index_state.assert_not_called()
+
+    def test_settings_only(self):
+        ilo = index_list(['a'])
+        rows = list(index_rows(ilo, ['index', 'pri', 'creation_date'], epoch=True))
+        self.assertEqual([{'index': 'a', 'pri': 2, 'creation_date': 1456963200}], rows)
+        ilo.get_index_settings.assert_called_once()
+        ilo.get_index_stats.assert_not_called()
+        self.assertEqual(['a'], ilo.indices)
+
+    def test_chunked(self):
+        names = [f'index-{num:04}-{"x" * 100}' for num in range(100)]
+        ilo = index_list(names)
+        rows = index_rows(ilo, ['index', 'docs'])
+        self.assertEqual(names[0], next(rows)['index'])
+        # Only the first chunk has been fetched so far
+        self.assertEqual(1, ilo.get_index_stats.call_count)
+        self.assertEqual(99, len(list(rows)))
+        self.assertLess(1, ilo.get_index_stats.call_count)
+        self.assertEqual(names, ilo.indices)
+
+
+class TestSnapshotRows(TestCase):
+    def test_rows(self):
+        slo = Mock()
+        slo.snapshots = ['snap']
+        slo.snapshot_info = {
+            'snap': {'state': 'SUCCESS', 'start_time_in_millis': 1456963200000}
+        }
+        slo.snapshot_indices.return_value = ['a', 'b']
+        rows = list(snapshot_rows(slo, ['snapshot', 'start_time', 'indices']))
+        self.assertEqual(
+            [{'snapshot': 'snap', 'start_time': '2016-03-03T00:00:00Z', 'indices': 2}],
+            rows,
+        )
+
+    def test_indices_not_loaded(self):
+        slo = Mock()
+        slo.snapshots = ['snap']
+        slo.snapshot_info = {'snap': {'state': 'SUCCESS'}}
+        list(snapshot_rows(slo, ['snapshot', 'state']))
+        slo.snapshot_indices.assert_not_called()
+
+
+class TestWriteRows(TestCase):
+    def test_json(self):
+        self.assertEqual(ROWS, json.loads(output(iter(ROWS), COLUMNS, 'json')))
+
+    def test_json_empty(self):
+        self.assertEqual([], json.loads(output(iter([]), COLUMNS, 'json')))
+
+    def test_ndjson(self):
+        lines = output(iter(ROWS), COLUMNS, 'ndjson').splitlines()
+        self.assertEqual(ROWS, [json.loads(line) for line in lines])
+
+    def test_csv(self):
+        self.assertEqual(
+            'index,size,creation_date\nindex-1,2048,1456963200\nindex-22,0,\n',
+            output(iter(ROWS), COLUMNS, 'csv'),
+        )
+
+    def test_text_names(self):
+        self.assertEqual(
+            'a\nb\n', output(iter([{'index': 'a'}, {'index': 'b'}]), ['index'], 'text')
+        )
+
+    def test_text_table(self):
+        lines = output(iter(ROWS), COLUMNS, 'text', header=True).splitlines()
+        self.assertEqual('Index     Size Creation Timestamp', lines[0])
+        self.assertEqual('index-1  2.0KB         1456963200', lines[1])
+        self.assertEqual('index-22  0.0B            unknown', lines[2])
+
+    def test_text_epoch_title(self):
+        lines = output(iter(ROWS), COLUMNS, 'text', header=True, epoch=True)
+        self.assertTrue(lines.startswith('Index     Size creation_date\n'))
@@ -5,7 +5,12 @@ from voluptuous import Schema
 from opensearch_client.exceptions import FailedValidation
 from opensearch_client.schemacheck import SchemaCheck
 from curator.exceptions import ConfigurationError
-from curator.validators.filter_functions import validfilters, singlefilter
+from curator.validators import options
+from curator.validators.filter_functions import (
+    filterstructure,
+    singlefilter,
+    validfilters,
+)
 
 
 def shared_result(config, action):
@@ -20,6 +25,26 @@ class TestFilters(TestCase):
         data = {'max_num_segments': 1, 'exclude': True}
         self.assertRaises(ConfigurationError, singlefilter, 'forcemerge', data)
 
+    def test_single_is_memoized(self):
+        one = {'filtertype': 'age', 'source': 'name', 'unit_count': 1}
+        two = {'filtertype': 'age', 'source': 'name', 'unit_count': 5}
+        self.assertIs(
+            singlefilter('delete_indices', one), singlefilter('delete_indices', two)
+        )
+
+    def test_single_source_changes_schema(self):
+        name = {'filtertype': 'age', 'source': 'name'}
+        field = {'filtertype': 'age', 'source': 'field_stats'}
+        self.assertIsNot(
+            singlefilter('delete_indices', name), singlefilter('delete_indices', field)
+        )
+
+    def test_filterstructure_is_memoized(self):
+        self.assertIs(filterstructure(), filterstructure())
+
+    def test_options_schema_is_memoized(self):
+        self.assertIs(options.get_schema('close'), options.get_schema('close'))
+
 
 class TestFilterTypes(TestCase):
     def test_alias(self):